@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Synthetic geometry trees for the benchmarks.
+
+data/HL-31.yaml cannot be fully loaded from the repository (several ring and
+profile files are missing), so the benchmarks build an HL-31-like Insert on
+disk instead: 14 helices with 20-section ModelAxi, 13 rings and the inner and
+outer current leads, all satisfying Insert validation.
+"""
+
+import os
+
+
+def _write(directory: str, name: str, text: str) -> None:
+    with open(os.path.join(directory, f"{name}.yaml"), "w") as ostream:
+        ostream.write(text)
+
+
+def _modelaxi(name: str, h: float, nsections: int, offset: float = 0.0) -> str:
+    # each section contributes 2h/n so that sum(pitch * turns) == 2h
+    turns = [1.0 + 0.05 * k + offset for k in range(nsections)]
+    pitch = [2.0 * h / nsections / t for t in turns]
+    lines = [f"  name: {name}", f"  h: {h}", "  turns:"]
+    lines += [f"    - {t!r}" for t in turns]
+    lines += ["  pitch:"]
+    lines += [f"    - {p!r}" for p in pitch]
+    return "\n".join(lines)
+
+
+def write_insert_tree(
+    directory: str,
+    name: str = "HL-31",
+    nhelices: int = 14,
+    nsections: int = 20,
+    shared_definitions: bool = False,
+) -> str:
+    """
+    Write an HL-31-like Insert and all the files it references.
+
+    Args:
+        directory: Target directory (must exist)
+        name: Insert name (the Insert is written to {name}.yaml)
+        nhelices: Number of helices
+        nsections: Number of ModelAxi sections per helix
+        shared_definitions: Use the same ModelAxi and Model3D definition in
+                            every helix instead of per-helix ones
+
+    Returns:
+        Path of the Insert YAML file
+    """
+    radii = [(20.0 + 12.0 * i, 30.0 + 12.0 * i) for i in range(nhelices)]
+    helices = []
+    for i, (r0, r1) in enumerate(radii):
+        hname = f"{name}_H{i + 1}"
+        offset = 0.0 if shared_definitions else 0.01 * i
+        cad = f"{name}-MC" if shared_definitions else f"{name}-{200 + 2 * i:03d}MC"
+        _write(
+            directory,
+            hname,
+            f"""!<Helix>
+name: {hname}
+odd: {str(i % 2 == 0).lower()}
+r: [{r0}, {r1}]
+z: [-150.0, 150.0]
+dble: true
+cutwidth: 0.22
+modelaxi: !<ModelAxi>
+{_modelaxi(f"{name}.d", 100.0, nsections, offset)}
+model3d: !<Model3D>
+  cad: "{cad}"
+  with_shapes: false
+  with_channels: false
+""",
+        )
+        helices.append(hname)
+
+    rings = []
+    for i in range(nhelices - 1):
+        rname = f"{name}_R{i + 1}"
+        r = [radii[i][0], radii[i][1], radii[i + 1][0], radii[i + 1][1]]
+        _write(
+            directory,
+            rname,
+            f"""!<Ring>
+name: {rname}
+r: {r}
+z: [0, 20]
+n: 6
+angle: 46
+bpside: {str(i % 2 == 0).lower()}
+fillets: false
+""",
+        )
+        rings.append(rname)
+
+    _write(
+        directory,
+        f"{name}_inner",
+        f"""!<InnerCurrentLead>
+name: {name}_inner
+r: [{radii[0][0] - 1.0}, {radii[0][1]}]
+h: 480.0
+holes: [123, 12, 90, 60, 45, 3]
+support: [{radii[0][1]}, 0]
+fillet: false
+""",
+    )
+    _write(
+        directory,
+        f"{name}_outer",
+        f"""!<OuterCurrentLead>
+name: {name}_outer
+r: [{radii[-1][1] + 10.0}, {radii[-1][1] + 25.0}]
+h: 452.0
+bar: [10, 18, 15, 496]
+support: [48.2, 10, 18, 45]
+""",
+    )
+
+    helices_list = "\n".join(f"  - {h}" for h in helices)
+    rings_list = "\n".join(f"  - {r}" for r in rings)
+    _write(
+        directory,
+        name,
+        f"""!<Insert>
+name: {name}
+helices:
+{helices_list}
+rings:
+{rings_list}
+currentleads:
+  - {name}_inner
+  - {name}_outer
+hangles: []
+rangles: []
+innerbore: {radii[0][0] - 1.5}
+outerbore: {radii[-1][1] + 1.5}
+""",
+    )
+    return os.path.join(directory, f"{name}.yaml")
+
+
+def write_bitters_tree(
+    directory: str,
+    name: str = "M10",
+    ndisks: int = 500,
+    nsections: int = 20,
+    inline: bool = False,
+) -> str:
+    """
+    Write a Bitters stack of ndisks Bitter disks.
+
+    Every disk carries its own ModelAxi and a cooling slit with an inline
+    Contour2D, so that the tree holds many numeric lists.
+
+    Args:
+        directory: Target directory (must exist)
+        name: Bitters name (the stack is written to {name}.yaml)
+        ndisks: Number of Bitter disks
+        nsections: Number of ModelAxi sections per disk
+        inline: Write the disks inline in the Bitters file instead of one
+                file per disk
+
+    Returns:
+        Path of the Bitters YAML file
+    """
+    height = 2.0
+    contour = "\n".join(
+        f"        - [{0.5 * k!r}, {0.1 * (k % 4)!r}]" for k in range(nsections)
+    )
+    disks = []
+    for i in range(ndisks):
+        dname = f"{name}_B{i + 1}"
+        z0 = -ndisks * height / 2.0 + i * height
+        text = f"""!<Bitter>
+name: {dname}
+r: [200.0, 340.0]
+z: [{z0}, {z0 + height * 0.9}]
+odd: {str(i % 2 == 0).lower()}
+modelaxi: !<ModelAxi>
+{_modelaxi(f"{dname}.d", height * 0.45, nsections, 0.001 * (i % 10))}
+coolingslits:
+  - !<CoolingSlit>
+    name: {dname}_slit
+    r: 260.0
+    angle: 4.5
+    n: 40
+    dh: 2.0
+    sh: 10.0
+    contour2d: !<Contour2D>
+      name: {dname}_slit_contour
+      points:
+{contour}
+innerbore: 0
+outerbore: 0
+"""
+        if inline:
+            disks.append(text.replace("\n", "\n    ").rstrip())
+        else:
+            _write(directory, dname, text)
+            disks.append(dname)
+
+    magnets_list = "\n".join(f"  - {d}" for d in disks)
+    _write(
+        directory,
+        name,
+        f"""!<Bitters>
+name: {name}
+magnets:
+{magnets_list}
+innerbore: 190.0
+outerbore: 350.0
+""",
+    )
+    return os.path.join(directory, f"{name}.yaml")
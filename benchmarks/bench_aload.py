@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Load many MSite trees: sequential pmg.load versus pmg.aload_many.
+
+Each site holds its own HL-31-like Insert (30 files). Network filesystems
+are emulated by adding a fixed delay to every file open within the
+generated trees (--latency, in milliseconds).
+
+Usage:
+    python benchmarks/bench_aload.py [--sites 16] [--latency 5] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import builtins
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+
+from _synthetic import write_insert_tree  # noqa: E402
+
+
+def write_sites(directory: str, nsites: int) -> list[str]:
+    sites = []
+    for i in range(nsites):
+        subdir = os.path.join(directory, f"site{i}")
+        os.makedirs(subdir)
+        write_insert_tree(subdir, name=f"HL-{i}")
+        path = os.path.join(subdir, f"M{i}.yaml")
+        with open(path, "w") as ostream:
+            ostream.write(f"!<MSite>\nname: M{i}\nmagnets: [HL-{i}]\nscreens: null\n")
+        sites.append(path)
+    return sites
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sites", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=5.0, help="delay per open (ms)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    pmg.disable_logging()
+    pmg.verify_class_registration()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sites = write_sites(tmpdir, args.sites)
+
+        builtin_open = builtins.open
+
+        def slow_open(file, *a, **kw):
+            if isinstance(file, str) and file.startswith(tmpdir):
+                time.sleep(args.latency / 1000.0)
+            return builtin_open(file, *a, **kw)
+
+        builtins.open = slow_open
+        try:
+            start = time.perf_counter()
+            expected = [pmg.load(site) for site in sites]
+            t_seq = time.perf_counter() - start
+
+            start = time.perf_counter()
+            objects = asyncio.run(pmg.aload_many(sites, max_concurrency=args.concurrency))
+            t_async = time.perf_counter() - start
+        finally:
+            builtins.open = builtin_open
+
+    identical = all(a.to_yaml() == b.to_yaml() for a, b in zip(objects, expected))
+    print(f"{args.sites} MSite trees, latency {args.latency} ms/open")
+    print(f"sequential load {t_seq * 1000:8.1f} ms")
+    print(f"aload_many      {t_async * 1000:8.1f} ms  x{t_seq / t_async:5.2f}")
+    print(f"identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Measure constructor validation of large Bitters stacks, immediate and deferred.
+
+Builds --ndisks Bitter disks and their Bitters stack, with every check run
+by each constructor (immediate) and inside pmg.deferred_validation(), where
+the checks are run in one vectorized pass when the scope exits.
+
+Usage:
+    python benchmarks/bench_deferred.py [--ndisks 5000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo.Bitter import Bitter  # noqa: E402
+from python_magnetgeo.Bitters import Bitters  # noqa: E402
+
+
+def build(bounds):
+    disks = [Bitter(f"B{i}", r, z, True, None) for i, (r, z) in enumerate(bounds)]
+    return Bitters("M10", disks, 0, 0)
+
+
+def best(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ndisks", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    pmg.disable_logging()
+
+    bounds = [([115.0, 172.0], [0.2 * i, 0.2 * i + 0.15]) for i in range(args.ndisks)]
+
+    def deferred():
+        with pmg.deferred_validation():
+            build(bounds)
+
+    immediate = best(lambda: build(bounds), args.repeat)
+    batched = best(deferred, args.repeat)
+    print(f"{args.ndisks} disks")
+    print(f"  immediate: {immediate * 1e3:8.1f} ms")
+    print(f"  deferred:  {batched * 1e3:8.1f} ms  ({immediate / batched:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Measure repeated to_yaml/to_json of an Insert with memoized fragments.
+
+Uses a synthetic HL-31-like Insert (see _synthetic.py) and times, for YAML
+and JSON: a full dump (the former to_yaml/to_json), to_yaml/to_json of the
+unchanged Insert, and of the Insert with one helix changed before each call.
+
+Usage:
+    python benchmarks/bench_fragments.py [--nhelices 14] [--number 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo import deserialize  # noqa: E402
+from python_magnetgeo.Insert import Insert  # noqa: E402, F401
+from python_magnetgeo.utils import YamlDumper  # noqa: E402
+
+from _synthetic import write_insert_tree  # noqa: E402
+
+
+def rate(function, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nhelices", type=int, default=14)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+    pmg.disable_logging()
+
+    with tempfile.TemporaryDirectory() as directory:
+        insert = pmg.load(write_insert_tree(directory, nhelices=args.nhelices))
+    helix = insert.helices[len(insert.helices) // 2]
+    full = {
+        "yaml": lambda: yaml.dump(
+            insert, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+        ),
+        "json": lambda: json.dumps(
+            insert, default=deserialize.serialize_instance, sort_keys=True, indent=4
+        ),
+    }
+    memoized = {"yaml": insert.to_yaml, "json": insert.to_json}
+
+    def edited(dump):
+        def function():
+            helix.cutwidth = 0.22 if helix.cutwidth != 0.22 else 0.23
+            dump()
+
+        return function
+
+    print(f"Insert with {len(insert.helices)} helices")
+    for kind in ("yaml", "json"):
+        assert memoized[kind]() == full[kind]()
+        reference = None
+        for label, function in (
+            ("full dump", full[kind]),
+            ("unchanged", memoized[kind]),
+            ("one helix changed", edited(memoized[kind])),
+        ):
+            seconds = rate(function, args.number)
+            reference = reference or seconds
+            print(f"  {kind} {label:18} {seconds * 1e6:9.1f} us  ({reference / seconds:7.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Report the memory saved by interning identical nested objects.
+
+Loads the HL-31 helix, ring and lead fixtures of data/ (the full HL-31 Insert
+references files missing from the repository) and a synthetic HL-31-like
+Insert, with and without an interning() scope, and prints the measured sizes.
+
+Usage:
+    python benchmarks/bench_interning.py [data_directory]
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo.interning import deep_sizeof  # noqa: E402
+
+from _synthetic import write_insert_tree  # noqa: E402
+
+HL31_FILES = [f"HL-31_H{i}.yaml" for i in range(1, 15)] + [
+    "Ring-H1H2.yaml",
+    "inner.yaml",
+    "outer-H14.yaml",
+]
+
+
+def report(label: str, load):
+    plain = load()
+    with pmg.interning() as stats:
+        interned = load()
+    before, after = deep_sizeof(plain), deep_sizeof(interned)
+    print(
+        f"{label:<32} unique={stats.unique:4d} shared={stats.shared:4d} "
+        f"bytes_saved={stats.bytes_saved:8d}  size {before:8d} -> {after:8d}"
+    )
+
+
+def main():
+    pmg.disable_logging()
+    pmg.verify_class_registration()
+    data = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else "data")
+
+    report("HL-31 fixtures (data/)", lambda: [pmg.load(os.path.join(data, f)) for f in HL31_FILES])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for shared in (False, True):
+            directory = os.path.join(tmpdir, str(shared))
+            os.makedirs(directory)
+            insert = write_insert_tree(directory, shared_definitions=shared)
+            label = "synthetic HL-31" + (" (shared defs)" if shared else "")
+            report(label, lambda: pmg.load(insert))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Measure the cost of disabled log statements on validator and deserializer hot paths.
+
+Three configurations are compared, all with handlers at INFO (DEBUG is
+never emitted):
+
+- eager: package logger at DEBUG, handlers filtering (the former
+  configure_logging behavior: a LogRecord is built for every debug call)
+- level-checked: configure_logging() default, disabled calls return after
+  a cached level check
+- production: set_production_mode(), DEBUG/INFO calls are no-ops
+
+Usage:
+    python benchmarks/bench_logging.py [--number 20000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo import deserialize  # noqa: E402
+from python_magnetgeo.logging_config import PACKAGE_NAME, set_production_mode  # noqa: E402
+from python_magnetgeo.validation import GeometryValidator  # noqa: E402
+
+HELIX = {
+    "__classname__": "Helix",
+    "name": "H1",
+    "odd": True,
+    "r": [19.3, 24.2],
+    "z": [-226.0, 108.0],
+    "cutwidth": 0.22,
+    "dble": True,
+    "modelaxi": {
+        "__classname__": "ModelAxi",
+        "name": "HL-31.d",
+        "h": 86.51,
+        "turns": [0.292, 0.287, 0.283, 0.284, 0.289, 0.299],
+        "pitch": [29.59, 30.12, 30.54, 30.37, 29.9, 28.85],
+    },
+}
+
+
+def validate():
+    GeometryValidator.validate_name("HL-31_H1")
+    GeometryValidator.validate_numeric_list([19.3, 24.2], "r", expected_length=2)
+    GeometryValidator.validate_ascending_order([19.3, 24.2], "r")
+    GeometryValidator.validate_numeric_list([-226.0, 108.0], "z", expected_length=2)
+    GeometryValidator.validate_ascending_order([-226.0, 108.0], "z")
+    GeometryValidator.validate_positive(0.22, "cutwidth")
+
+
+def rate(function, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return number / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    text = json.dumps(HELIX)
+
+    def unserialize():
+        json.loads(text, object_hook=deserialize.unserialize_object)
+
+    def eager():
+        pmg.configure_logging(level="INFO")
+        logging.getLogger(PACKAGE_NAME).setLevel(logging.DEBUG)
+
+    def level_checked():
+        pmg.configure_logging(level="INFO")
+
+    print(f"{'':16} {'validate (calls/s)':>20} {'unserialize (objs/s)':>22}")
+    for label, setup, production in (
+        ("eager", eager, False),
+        ("level-checked", level_checked, False),
+        ("production", level_checked, True),
+    ):
+        setup()
+        set_production_mode(production)
+        try:
+            validated = rate(validate, args.number)
+            unserialized = rate(unserialize, args.number)
+        finally:
+            set_production_mode(False)
+        print(f"{label:16} {validated:20.0f} {unserialized:22.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Compare sequential and prefetched loading of an HL-31-like Insert.
+
+Network filesystems are emulated by adding a fixed delay to every file open
+within the generated tree (--latency, in milliseconds).
+
+Usage:
+    python benchmarks/bench_prefetch.py [--latency 5] [--workers 8] [--repeat 5]
+"""
+
+import argparse
+import builtins
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+
+from _synthetic import write_insert_tree  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=5.0, help="delay per open (ms)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pmg.disable_logging()
+    pmg.verify_class_registration()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        insert = write_insert_tree(tmpdir)
+
+        builtin_open = builtins.open
+
+        def slow_open(file, *a, **kw):
+            if isinstance(file, str) and file.startswith(tmpdir):
+                time.sleep(args.latency / 1000.0)
+            return builtin_open(file, *a, **kw)
+
+        builtins.open = slow_open
+        try:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                expected = pmg.load(insert)
+            t_seq = (time.perf_counter() - start) / args.repeat
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                with pmg.prefetching(max_workers=args.workers) as prefetcher:
+                    obj = pmg.load(insert)
+            t_pre = (time.perf_counter() - start) / args.repeat
+        finally:
+            builtins.open = builtin_open
+
+    print(f"files: {prefetcher.fetched}, latency {args.latency} ms/open, {args.workers} workers")
+    print(f"sequential {t_seq * 1000:8.1f} ms")
+    print(f"prefetched {t_pre * 1000:8.1f} ms  x{t_seq / t_pre:5.2f}")
+    print(f"identical: {obj.to_yaml() == expected.to_yaml()}")
+
+
+if __name__ == "__main__":
+    main()
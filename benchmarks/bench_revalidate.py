@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Compare revalidating an edited Insert with rebuilding it.
+
+Uses a synthetic HL-31-like Insert (see _synthetic.py) and times, per edit
+of one helix: building a new Insert from the same components (the former
+way to revalidate), insert.revalidate() of all rules, and
+insert.revalidate(helix) of the rules reading that helix only.
+
+Usage:
+    python benchmarks/bench_revalidate.py [--nhelices 14] [--number 2000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo.Insert import Insert  # noqa: E402
+
+from _synthetic import write_insert_tree  # noqa: E402
+
+
+def rate(function, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nhelices", type=int, default=14)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+    pmg.disable_logging()
+
+    with tempfile.TemporaryDirectory() as directory:
+        insert = pmg.load(write_insert_tree(directory, nhelices=args.nhelices))
+
+    def rebuild():
+        Insert(
+            insert.name,
+            list(insert.helices),
+            list(insert.rings),
+            list(insert.currentleads),
+            insert.hangles,
+            insert.rangles,
+            insert.innerbore,
+            insert.outerbore,
+            insert.probes,
+        )
+
+    helix = insert.helices[len(insert.helices) // 2]
+    print(f"Insert with {len(insert.helices)} helices, {len(insert.rings)} rings")
+    for label, function in (
+        ("rebuild Insert", rebuild),
+        ("revalidate()", insert.revalidate),
+        ("revalidate(helix)", lambda: insert.revalidate(helix)),
+    ):
+        print(f"  {label:18} {rate(function, args.number) * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
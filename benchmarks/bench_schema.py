@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Compare generated from_dict constructors with the former hand-written ones.
+
+The hand-written versions below are copies of the from_dict methods the
+_fields schemas replaced; both are timed on the same dictionaries, nested
+objects given inline (dict) and already constructed (as the YAML loader
+passes them).
+
+Usage:
+    python benchmarks/bench_schema.py [--number 10000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo.Bitter import Bitter  # noqa: E402
+from python_magnetgeo.Chamfer import Chamfer  # noqa: E402
+from python_magnetgeo.coolingslit import CoolingSlit  # noqa: E402
+from python_magnetgeo.Groove import Groove  # noqa: E402
+from python_magnetgeo.Helix import Helix  # noqa: E402
+from python_magnetgeo.Model3D import Model3D  # noqa: E402
+from python_magnetgeo.ModelAxi import ModelAxi  # noqa: E402
+from python_magnetgeo.Ring import Ring  # noqa: E402
+from python_magnetgeo.Shape import Shape  # noqa: E402
+from python_magnetgeo.tierod import Tierod  # noqa: E402
+
+MODELAXI = {"name": "H1.d", "h": 10.0, "turns": [2.0, 3.0], "pitch": [4.0, 4.0]}
+RING = {"name": "R1", "r": [19.3, 24.2, 25.1, 30.7], "z": [0.0, 20.0], "n": 6, "angle": 46}
+HELIX = {
+    "name": "H1",
+    "r": [19.3, 24.2],
+    "z": [-226.0, 108.0],
+    "cutwidth": 0.22,
+    "odd": True,
+    "dble": True,
+    "modelaxi": MODELAXI,
+}
+BITTER = {
+    "name": "B1",
+    "r": [115.0, 172.0],
+    "z": [-10.0, 10.0],
+    "odd": True,
+    "modelaxi": MODELAXI,
+    "innerbore": 110.0,
+    "outerbore": 180.0,
+}
+
+
+def ring_from_dict(cls, values, debug=False):
+    return cls(
+        name=values["name"],
+        r=values["r"],
+        z=values["z"],
+        n=values.get("n", 0),
+        angle=values.get("angle", 0),
+        bpside=values.get("bpside", True),
+        fillets=values.get("fillets", False),
+        cad=values.get("cad", ""),
+    )
+
+
+def modelaxi_from_dict(cls, values, debug=False):
+    return cls(values["name"], values["h"], values["turns"], values["pitch"])
+
+
+def helix_from_dict(cls, values, debug=False):
+    modelaxi = cls._load_nested_single(values.get("modelaxi"), ModelAxi, debug=debug)
+    model3d = cls._load_nested_single(values.get("model3d"), Model3D, debug=debug)
+    shape = cls._load_nested_single(values.get("shape"), Shape, debug=debug)
+    chamfers = cls._load_nested_list(values.get("chamfers"), Chamfer, debug=debug)
+    grooves = cls._load_nested_single(values.get("grooves"), Groove, debug=debug)
+    return cls(
+        values["name"],
+        values["r"],
+        values["z"],
+        values["cutwidth"],
+        values["odd"],
+        values["dble"],
+        modelaxi,
+        model3d,
+        shape,
+        chamfers,
+        grooves,
+        values.get("start_diameter_hole", 0.0),
+    )
+
+
+def bitter_from_dict(cls, values, debug=False):
+    modelaxi = cls._load_nested_single(values.get("modelaxi"), ModelAxi, debug=debug)
+    coolingslits = cls._load_nested_list(values.get("coolingslits"), CoolingSlit, debug=debug)
+    tierod = cls._load_nested_single(values.get("tierod"), Tierod, debug=debug)
+    return cls(
+        values["name"],
+        values["r"],
+        values["z"],
+        values["odd"],
+        modelaxi,
+        coolingslits,
+        tierod,
+        values.get("innerbore", 0),
+        values.get("outerbore", 0),
+    )
+
+
+def rate(function, values, number: int, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function(values)
+        best = min(best, time.perf_counter() - start)
+    return number / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+    pmg.disable_logging()
+
+    modelaxi = ModelAxi.from_dict(MODELAXI)
+    cases = [
+        ("Ring", Ring, ring_from_dict, RING),
+        ("ModelAxi", ModelAxi, modelaxi_from_dict, MODELAXI),
+        ("Helix (inline)", Helix, helix_from_dict, HELIX),
+        ("Helix (objects)", Helix, helix_from_dict, dict(HELIX, modelaxi=modelaxi)),
+        ("Bitter (inline)", Bitter, bitter_from_dict, BITTER),
+        ("Bitter (objects)", Bitter, bitter_from_dict, dict(BITTER, modelaxi=modelaxi)),
+    ]
+
+    print(f"{'':18} {'hand-written (objs/s)':>22} {'generated (objs/s)':>20} {'speedup':>8}")
+    for label, cls, handwritten, values in cases:
+        before = rate(classmethod(handwritten).__get__(None, cls), values, args.number)
+        after = rate(cls.from_dict, values, args.number)
+        print(f"{label:18} {before:22.0f} {after:20.0f} {after / before:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
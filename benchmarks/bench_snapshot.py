@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Compare loading from YAML and from a binary snapshot.
+
+Uses a synthetic HL-31-like Insert and a synthetic 500-disk Bitters stack
+(see _synthetic.py), and reports the time of loadYaml (parse + validation),
+load_snapshot with and without the source freshness check, and the
+snapshot size.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--ndisks 500] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+
+from _synthetic import write_bitters_tree, write_insert_tree  # noqa: E402
+
+
+def timed(repeat: int, load):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        obj = load()
+    return obj, (time.perf_counter() - start) / repeat
+
+
+def report(label: str, path: str, repeat: int):
+    expected, t_yaml = timed(repeat, lambda: pmg.load(path))
+    snapshot = pmg.save_snapshot(expected, path + ".mgsnap")
+    obj, t_snap = timed(repeat, lambda: pmg.load_snapshot(snapshot))
+    _, t_fast = timed(repeat, lambda: pmg.load_snapshot(snapshot, verify=False))
+
+    print(f"{label} ({os.path.getsize(snapshot) // 1024} KiB snapshot)")
+    print(f"  loadYaml           {t_yaml * 1000:8.1f} ms")
+    print(f"  snapshot           {t_snap * 1000:8.1f} ms  x{t_yaml / t_snap:6.1f}")
+    print(f"  snapshot, no check {t_fast * 1000:8.1f} ms  x{t_yaml / t_fast:6.1f}")
+    print(f"  identical: {obj.to_yaml() == expected.to_yaml()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ndisks", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pmg.disable_logging()
+    pmg.verify_class_registration()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        report("synthetic HL-31", write_insert_tree(tmpdir), args.repeat)
+        report(
+            f"synthetic Bitters ({args.ndisks} disks)",
+            write_bitters_tree(tmpdir, ndisks=args.ndisks),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Compare peak memory of loadYaml and of the streaming loaders.
+
+Uses a synthetic Bitters stack with all its disks inline in a single file
+(see _synthetic.py) and reports, for each loader, the time and the peak of
+Python allocations (tracemalloc) while loading.
+
+Usage:
+    python benchmarks/bench_streaming.py [--ndisks 1000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+
+from _synthetic import write_bitters_tree  # noqa: E402
+
+
+def measure(label: str, load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<36} {elapsed * 1000:8.1f} ms  peak {peak / 2**20:8.1f} MiB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ndisks", type=int, default=1000)
+    args = parser.parse_args()
+
+    pmg.disable_logging()
+    pmg.verify_class_registration()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = write_bitters_tree(tmpdir, ndisks=args.ndisks, inline=True)
+        print(f"{args.ndisks} inline disks, {os.path.getsize(path) / 2**20:.1f} MiB of YAML")
+
+        expected = measure("loadYaml", lambda: pmg.load(path))
+        streamed = measure("load_streaming", lambda: pmg.load_streaming(path))
+
+        def consume():
+            count = 0
+            for _, magnet in pmg.iter_components(path, fields=("magnets",)):
+                count += 1
+            return count
+
+        count = measure("iter_components (one disk at a time)", consume)
+        print(f"identical: {streamed.to_yaml() == expected.to_yaml()}, {count} disks yielded")
+
+
+if __name__ == "__main__":
+    main()
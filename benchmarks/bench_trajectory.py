@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Measure sampling the helical cut paths of an Insert.
+
+Uses a synthetic HL-31-like Insert (see _synthetic.py) and times
+Insert.sample_cuts, the streaming mode of Helix.iter_cut over all helices,
+and a per-point Python loop over the sections of one helix for reference.
+
+Usage:
+    python benchmarks/bench_trajectory.py [--points-per-turn 3600] [--repeat 5]
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+
+from _synthetic import write_insert_tree  # noqa: E402
+
+
+def best(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def python_loop(helix, points_per_turn: int) -> list:
+    """Per-point reference: (theta, z, x, y) tuples walking the sections."""
+    modelaxi = helix.modelaxi
+    radius = (helix.r[0] + helix.r[1]) / 2
+    sign = -1.0 if helix.odd else 1.0
+    points = []
+    z = -modelaxi.h
+    theta = 0.0
+    for turns, pitch in zip(modelaxi.turns, modelaxi.pitch):
+        n = math.ceil(turns * points_per_turn)
+        for k in range(n):
+            t = theta + 2 * math.pi * turns * k / n
+            points.append((sign * t, z + pitch * turns * k / n, 0.0, 0.0))
+        theta += 2 * math.pi * turns
+        z += turns * pitch
+    return [(t, z, radius * math.cos(t), radius * math.sin(t)) for t, z, _, _ in points]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points-per-turn", type=int, default=3600)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    pmg.disable_logging()
+    ppt = args.points_per_turn
+
+    with tempfile.TemporaryDirectory() as directory:
+        insert = pmg.load(write_insert_tree(directory))
+        helices = list(insert.helices)
+        npoints = sum(len(cut.z) for cut in insert.sample_cuts(ppt).values())
+        print(f"Insert with {len(helices)} helices, {npoints:,} points at {ppt} points/turn")
+
+        batch = best(lambda: insert.sample_cuts(ppt), args.repeat)
+
+        def stream():
+            for helix in helices:
+                for _ in helix.iter_cut(ppt):
+                    pass
+
+        streamed = best(stream, args.repeat)
+        loop = best(lambda: python_loop(helices[0], ppt), 1) * len(helices)
+        print(f"  sample_cuts      {batch * 1e3:8.1f} ms")
+        print(f"  iter_cut         {streamed * 1e3:8.1f} ms")
+        print(f"  Python loop      {loop * 1e3:8.1f} ms (one helix x {len(helices)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Compare the hot reload of one edited file with reloading the whole tree.
+
+Uses synthetic Bitters stacks of growing size, one file per disk (see
+_synthetic.py), and times pmg.load of the stack against the reload of one
+disk by a GeometryWatcher: rebuilding the disk, splicing it in and
+re-running the intersection check of the stack.
+
+Usage:
+    python benchmarks/bench_watch.py [--ndisks 100 500 2000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo.Bitters import Bitters  # noqa: E402, F401
+
+from _synthetic import write_bitters_tree  # noqa: E402
+
+
+def best(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ndisks", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    pmg.disable_logging()
+
+    print(f"{'disks':>6} {'full load':>12} {'reload 1 disk':>14}")
+    for ndisks in args.ndisks:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_bitters_tree(directory, ndisks=ndisks)
+            stack = pmg.load(path)
+            watcher = pmg.GeometryWatcher(stack, backend="polling")
+            disk = stack.magnets[ndisks // 2]._source
+
+            full = best(lambda: pmg.load(path), args.repeat)
+            reload = best(lambda: watcher.reload([disk]), args.repeat)
+            assert stack.magnets[ndisks // 2]._source == disk
+            watcher.stop()
+        print(f"{ndisks:>6} {full * 1e3:9.1f} ms {reload * 1e3:11.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Measure writing a large stack as one file per disk with write_tree.
+
+Uses a synthetic Bitters stack (see _synthetic.py) and times write_tree
+into an empty directory, rewriting the unchanged stack (memoized texts,
+every file skipped) and rewriting it after editing one disk, with 1 and
+with the default number of writer threads.
+
+Usage:
+    python benchmarks/bench_write_tree.py [--ndisks 500] [--repeat 5]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo.Bitters import Bitters  # noqa: E402, F401
+from python_magnetgeo.layout import DEFAULT_MAX_WORKERS  # noqa: E402
+
+from _synthetic import write_bitters_tree  # noqa: E402
+
+
+def best(function, repeat: int, setup=None) -> float:
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ndisks", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    pmg.disable_logging()
+
+    with tempfile.TemporaryDirectory() as directory:
+        stack = pmg.load(write_bitters_tree(directory, ndisks=args.ndisks))
+        disk = stack.magnets[args.ndisks // 2]
+        out = os.path.join(directory, "out")
+
+        def edit():
+            disk.odd = not disk.odd
+
+        def clear():
+            shutil.rmtree(out, ignore_errors=True)
+            for obj in [stack, *stack.magnets]:
+                obj.mark_modified()
+
+        print(f"Bitters with {len(stack.magnets)} disks")
+        for workers in (1, DEFAULT_MAX_WORKERS):
+
+            def write():
+                return stack.write_tree(out, policy=["Bitter"], max_workers=workers)
+
+            new = best(write, args.repeat, clear)
+            unchanged = best(write, args.repeat)
+            assert write().written == []
+            edited = best(write, args.repeat, edit)
+            edit()
+            assert len(write().written) == 1
+            print(
+                f"  {workers} threads: new {new * 1e3:8.1f} ms"
+                f"   unchanged {unchanged * 1e3:8.1f} ms   one disk edited {edited * 1e3:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Benchmark the libyaml (C) YAML backend against the pure-Python one.
+
+Loads and dumps every parsable YAML file of a directory (``data/`` by default)
+with both backends and reports the timings and the speed-up.
+Dumps are also compared to check that both backends write identical text.
+
+Usage:
+    python benchmarks/bench_yaml_backend.py [directory] [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_magnetgeo as pmg  # noqa: E402
+from python_magnetgeo.utils import YamlDumper, YamlLoader  # noqa: E402
+
+
+def _collect(directory: str) -> dict:
+    """Return {filename: text} for the files both backends can construct."""
+    documents = {}
+    for filename in sorted(glob.glob(os.path.join(directory, "*.yaml"))):
+        with open(filename) as istream:
+            text = istream.read()
+        try:
+            yaml.load(text, Loader=YamlLoader)
+        except Exception:
+            continue
+        documents[filename] = text
+    return documents
+
+
+def _time(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", nargs="?", default="data")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pmg.disable_logging()
+    pmg.verify_class_registration()
+
+    directory = os.path.abspath(args.directory)
+    cwd = os.getcwd()
+    os.chdir(directory)  # nested references are relative to the data directory
+    try:
+        documents = _collect(directory)
+        texts = list(documents.values())
+
+        def load(loader):
+            return [yaml.load(text, Loader=loader) for text in texts]
+
+        objects = load(YamlLoader)
+
+        def dump(dumper):
+            return [yaml.dump(obj, Dumper=dumper, default_flow_style=False) for obj in objects]
+
+        identical = dump(yaml.Dumper) == dump(YamlDumper)
+
+        t_load_py = _time(lambda: load(yaml.FullLoader), args.repeat)
+        t_load_c = _time(lambda: load(YamlLoader), args.repeat)
+        t_dump_py = _time(lambda: dump(yaml.Dumper), args.repeat)
+        t_dump_c = _time(lambda: dump(YamlDumper), args.repeat)
+    finally:
+        os.chdir(cwd)
+
+    print(f"files: {len(documents)} from {directory} (x{args.repeat})")
+    print(f"backend: {YamlLoader.__name__}/{YamlDumper.__name__}")
+    print(f"load  pure-python {t_load_py:8.3f}s  backend {t_load_c:8.3f}s  x{t_load_py / t_load_c:5.2f}")
+    print(f"dump  pure-python {t_dump_py:8.3f}s  backend {t_dump_c:8.3f}s  x{t_dump_py / t_dump_c:5.2f}")
+    print(f"dumps byte-identical: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,13 +9,14 @@ Provides definition for Bitter:
 * Model 3D: actual 3D CAD
 
 """
-import os
 
 from .base import YAMLObjectBase
+from .schema import Field, is_ascending, is_name, is_non_negative_inner, numeric_list
 from .coolingslit import CoolingSlit
 from .ModelAxi import ModelAxi
 from .tierod import Tierod
-from .validation import GeometryValidator, ValidationError
+from .lazy import load_reference
+from .utils import get_basedir
 
 from .logging_config import get_logger
 logger = get_logger(__name__)
@@ -32,6 +33,17 @@ class Bitter(YAMLObjectBase):
     """
 
     yaml_tag = "Bitter"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("r", list, validators=(numeric_list(2), is_ascending, is_non_negative_inner)),
+        Field("z", list, validators=(numeric_list(2), is_ascending)),
+        Field("odd", bool),
+        Field("modelaxi", nested=ModelAxi, default=None),
+        Field("coolingslits", nested=CoolingSlit, many=True, default=None),
+        Field("tierod", nested=Tierod, default=None),
+        Field("innerbore", float, default=0),
+        Field("outerbore", float, default=0),
+    )
 
     def __init__(
         self,
@@ -115,23 +127,14 @@ class Bitter(YAMLObjectBase):
         """
 
         # Validate inputs
-        GeometryValidator.validate_name(name)
-        GeometryValidator.validate_numeric_list(r, "r", expected_length=2)
-        GeometryValidator.validate_ascending_order(r, "r")
-
-        GeometryValidator.validate_numeric_list(z, "z", expected_length=2)
-        GeometryValidator.validate_ascending_order(z, "z")
-
-        # Additional Ring-specific checks
-        if r[0] < 0:
-            raise ValidationError("Inner radius cannot be negative")
+        self._validate_fields(name=name, r=r, z=z)
 
         self.name = name
         self.r = r
         self.z = z
         self.odd = odd
         if modelaxi is not None and isinstance(modelaxi, str):
-            self.modelaxi = ModelAxi.from_yaml(f"{modelaxi}.yaml")
+            self.modelaxi = load_reference(f"{modelaxi}.yaml", ModelAxi)
         else:
             self.modelaxi = modelaxi
 
@@ -142,17 +145,17 @@ class Bitter(YAMLObjectBase):
         if coolingslits is not None:
             for coolingslit in coolingslits:
                 if isinstance(coolingslit, str):
-                    self.coolingslits.append(CoolingSlit.from_yaml(f"{coolingslit}.yaml"))
+                    self.coolingslits.append(load_reference(f"{coolingslit}.yaml", CoolingSlit))
                 else:
                     self.coolingslits.append(coolingslit)
 
         if tierod is not None and isinstance(tierod, str):
-            self.tireod = Tierod.from_yaml(f"{tierod}.yaml")
+            self.tierod = load_reference(f"{tierod}.yaml", Tierod)
         else:
             self.tierod = tierod
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
 
     def __repr__(self):
         """
@@ -165,65 +168,24 @@ class Bitter(YAMLObjectBase):
         )
 
     @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
-        Create Bitter instance from dictionary representation.
+        Analyze nested dependencies specific to Bitter class.
 
-        Supports flexible input formats for nested objects (modelaxi, cooling slits,
-        tierod), allowing mixed specifications of inline definitions and file references.
+        Identifies files that would be loaded for modelaxi, cooling slits and tierod.
 
         Args:
-            values: Dictionary containing Bitter configuration with keys:
-                - name (str): Bitter disk name
-                - r (list[float]): Radial extent [inner, outer]
-                - z (list[float]): Axial extent [bottom, top]
-                - odd (bool): Helix handedness
-                - modelaxi: ModelAxi specification (string/dict/object/None)
-                - coolingslits (list, optional): List of CoolingSlit specs (default: [])
-                - tierod (optional): Tierod specification (string/dict/object/None)
-                - innerbore (float, optional): Inner bore radius (default: 0)
-                - outerbore (float, optional): Outer bore radius (default: 0)
-            debug: Enable debug output showing object loading process
-
-        Returns:
-            Bitter: New Bitter instance created from dictionary
-
-        Raises:
-            KeyError: If required keys are missing from dictionary
-            ValidationError: If any nested object data is malformed
-
-        Example:
-            >>> data = {
-            ...     "name": "B1",
-            ...     "r": [100, 150],
-            ...     "z": [0, 50],
-            ...     "odd": True,
-            ...     "modelaxi": "helix",  # Load from file
-            ...     "coolingslits": [
-            ...         {"name": "s1", "r": 120, "angle": 4.5, "n": 10, ...}  # Inline
-            ...     ],
-            ...     "tierod": None,
-            ...     "innerbore": 80,
-            ...     "outerbore": 160
-            ... }
-            >>> bitter = Bitter.from_dict(data)
+            values: Dictionary containing bitter parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
         """
-        modelaxi = cls._load_nested_single(values.get("modelaxi"), ModelAxi, debug=debug)
-        coolingslits = cls._load_nested_list(values.get("coolingslits"), CoolingSlit, debug=debug)
-        tierod = cls._load_nested_single(values.get("tierod"), Tierod, debug=debug)
-
-        name = values["name"]
-        r = values["r"]
-        z = values["z"]
-        odd = values["odd"]
-        # modelaxi = values["modelaxi"]
-        # coolingslits = values.get("coolingslits", [])
-        # tierod = values.get("tierod", None)
-        innerbore = values.get("innerbore", 0)
-        outerbore = values.get("outerbore", 0)
-
-        object = cls(name, r, z, odd, modelaxi, coolingslits, tierod, innerbore, outerbore)
-        return object
+        cls._analyze_single_dependency(
+            values.get("modelaxi"), ModelAxi, required_files, debug=debug
+        )
+        cls._analyze_list_dependency(
+            values.get("coolingslits"), CoolingSlit, required_files, debug=debug
+        )
+        cls._analyze_single_dependency(values.get("tierod"), Tierod, required_files, debug=debug)
 
     def equivalent_eps(self, i: int):
         """
@@ -592,14 +554,12 @@ class Bitter(YAMLObjectBase):
         Dh += [2 * (self.outerbore - self.r[1])]
         Sh += [pi * (self.outerbore - self.r[1]) * (self.outerbore + self.r[1])]
 
+        breakpoints = self.modelaxi.sections().z.tolist()
         Zh = [self.z[0]]
-        z = -self.modelaxi.h
-        if abs(self.z[0] - z) >= tol:
-            Zh.append(z)
-        for n, p in zip(self.modelaxi.turns, self.modelaxi.pitch, strict=True):
-            z += n * p
-            Zh.append(z)
-        if abs(self.z[1] - z) >= tol:
+        if abs(self.z[0] - breakpoints[0]) >= tol:
+            Zh.append(breakpoints[0])
+        Zh += breakpoints[1:]
+        if abs(self.z[1] - breakpoints[-1]) >= tol:
             Zh.append(self.z[1])
         logger.debug(f"Zh={Zh}")
 
@@ -643,3 +603,47 @@ class Bitter(YAMLObjectBase):
         from .hcuts import create_cut
 
         create_cut(self, format, self.name)
+
+    def sample_cut(self, points_per_turn: int = 360, radius: float | None = None, edge: int = 0):
+        """
+        Sample the helical cut path as numpy arrays (theta, z, x, y).
+
+        Args:
+            points_per_turn: Angular resolution (points per turn). Default: 360
+            radius: Radius of the samples. Default: mean radius (r[0] + r[1]) / 2
+            edge: 0 for the centre line of the cut, -1/+1 for its lower/upper edge
+
+        Returns:
+            CutSamples: theta, z, x and y of every point, from z = -h to z = h
+            (see trajectory module for the conventions)
+
+        Raises:
+            ValueError: If there is no modelaxi, or on invalid arguments
+
+        Example:
+            >>> samples = bitter.sample_cut(points_per_turn=3600)
+            >>> samples.theta[-1], samples.z[-1]
+        """
+        from .trajectory import sample_cut
+
+        return sample_cut(self, points_per_turn, radius, edge)
+
+    def iter_cut(
+        self,
+        points_per_turn: int = 360,
+        radius: float | None = None,
+        edge: int = 0,
+        chunk: int | None = None,
+    ):
+        """
+        Stream the samples of sample_cut by chunks of at most chunk points.
+
+        Meant for resolutions whose samples do not fit in memory at once.
+        chunk defaults to trajectory.DEFAULT_CHUNK.
+
+        Yields:
+            CutSamples: Consecutive chunks of the path, from z = -h to z = h
+        """
+        from .trajectory import iter_cut
+
+        return iter_cut(self, points_per_turn, radius, edge, chunk)
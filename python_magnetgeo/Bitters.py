@@ -2,14 +2,16 @@
 # encoding: UTF-8
 
 """defines Bitter Insert structure"""
-import os
 
 from .base import YAMLObjectBase
+from .schema import Field, is_name
 
 # Add import at the top
 from .Bitter import Bitter
 from .Probe import Probe
-from .utils import getObject
+from .deferred import validate_or_defer
+from .lazy import load_reference
+from .utils import get_basedir
 from .validation import GeometryValidator, ValidationError
 
 # Module logger
@@ -27,6 +29,13 @@ class Bitters(YAMLObjectBase):
     """
 
     yaml_tag = "Bitters"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("magnets", nested=Bitter, many=True, default=None),
+        Field("innerbore", float, default=0),
+        Field("outerbore", float, default=0),
+        Field("probes", nested=Probe, many=True, default=None),
+    )
 
     def __init__(
         self,
@@ -84,7 +93,7 @@ class Bitters(YAMLObjectBase):
             ... )
         """
         # General validation
-        GeometryValidator.validate_name(name)
+        self._validate_fields(name=name)
 
         # Validate bore dimensions if not zero (zero means not specified)
         if innerbore != 0 and outerbore != 0:
@@ -97,7 +106,7 @@ class Bitters(YAMLObjectBase):
         self.magnets = []
         for magnet in magnets:
             if isinstance(magnet, str):
-                self.magnets.append(getObject(f"{magnet}.yaml"))
+                self.magnets.append(load_reference(f"{magnet}.yaml"))
             else:
                 self.magnets.append(magnet)
 
@@ -108,7 +117,7 @@ class Bitters(YAMLObjectBase):
         if probes is not None:
             for probe in probes:
                 if isinstance(probe, str):
-                    self.probes.append(Probe.from_yaml(f"{probe}.yaml"))
+                    self.probes.append(load_reference(f"{probe}.yaml", Probe))
                 else:
                     self.probes.append(probe)
 
@@ -145,16 +154,28 @@ class Bitters(YAMLObjectBase):
             )
 
         # check that magnets are not intersecting
-        for i in range(1, len(self.magnets)):
-            rb, zb = self.magnets[i - 1].boundingBox()
-            for j in range(i + 1, len(self.magnets)):
-                if self.magnets[j].intersect(rb, zb):
-                    raise ValidationError(
-                        f"magnets intersect: magnet[{i}] intersect magnet[{i-1}]: /n{self.magnets[i]} /n{self.magnets[i-1]}"
-                    )
+        validate_or_defer(self, lambda: GeometryValidator.validate_no_intersection(self.magnets))
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
+
+    def revalidate(self, *components) -> int:
+        """
+        Re-run the intersection check of the magnets after an edit.
+
+        Only the pairs of magnets involving an edited magnet are checked.
+
+        Args:
+            *components: Edited magnets (objects of this assembly) or keys
+                         such as ("magnets", 3); none to check all pairs
+
+        Returns:
+            int: Number of consistency rules run
+
+        Raises:
+            ValidationError: If two magnets intersect
+        """
+        return GeometryValidator.revalidate_no_intersection(self.magnets, components)
 
     def __repr__(self):
         """
@@ -319,60 +340,25 @@ class Bitters(YAMLObjectBase):
             print(f"Bitters/get_names: solid_names {len(solid_names)}")
         return solid_names
 
+    ###################################################################
+    #
+    #
+    ###################################################################
+
     @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
-        Create Bitters instance from dictionary representation.
+        Analyze nested dependencies specific to Bitters class.
 
-        Supports flexible input formats for nested Bitter magnet objects,
-        allowing mixed specifications of inline definitions and external references.
+        Identifies files that would be loaded for Bitter magnets and probes.
 
         Args:
-            values: Dictionary containing Bitters configuration with keys:
-                - name (str): Bitters assembly name
-                - magnets (list): List of Bitter magnets (strings/dicts/objects)
-                - innerbore (float, optional): Inner bore radius (default: 0)
-                - outerbore (float, optional): Outer bore radius (default: 0)
-                - probes (list, optional): List of probes (default: empty list)
-            debug: Enable debug output showing object loading process
-
-        Returns:
-            Bitters: New Bitters instance created from dictionary
-
-        Raises:
-            KeyError: If required 'name' or 'magnets' keys are missing
-            ValidationError: If magnet data is malformed
-            ValidationError: If magnets intersect
-
-        Example:
-            >>> data = {
-            ...     "name": "M10_Bitters",
-            ...     "magnets": [
-            ...         "B1",  # Load from file
-            ...         {"name": "B2", "r": [100, 150], "z": [60, 110], ...}  # Inline
-            ...     ],
-            ...     "innerbore": 80,
-            ...     "outerbore": 160,
-            ...     "probes": []
-            ... }
-            >>> bitters = Bitters.from_dict(data)
+            values: Dictionary containing bitters parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
         """
-        magnets = cls._load_nested_list(values.get("magnets"), Bitter, debug=debug)
-        probes = cls._load_nested_list(values.get("probes"), Probe, debug=debug)  # NEW: Load probes
-
-        name = values["name"]
-        # magnets = values["magnets"]
-        innerbore = values.get("innerbore", 0)
-        outerbore = values.get("outerbore", 0)
-        # probes = values.get("probes", [])  # NEW: Optional with default empty list
-
-        object = cls(name, magnets, innerbore, outerbore, probes)
-        return object
-
-    ###################################################################
-    #
-    #
-    ###################################################################
+        cls._analyze_list_dependency(values.get("magnets"), Bitter, required_files, debug=debug)
+        cls._analyze_list_dependency(values.get("probes"), Probe, required_files, debug=debug)
 
     def boundingBox(self) -> tuple:
         """
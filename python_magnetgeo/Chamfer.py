@@ -18,6 +18,7 @@ low-pressure (BP) side, and on either the inner (rint) or outer (rext) radius.
 import math
 
 from .base import YAMLObjectBase
+from .schema import Field
 
 
 class Chamfer(YAMLObjectBase):
@@ -66,6 +67,14 @@ class Chamfer(YAMLObjectBase):
     """
 
     yaml_tag = "Chamfer"
+    _fields = (
+        Field("name", str, default=""),
+        Field("side", str),
+        Field("rside", str),
+        Field("alpha", float, default=None),
+        Field("dr", float, default=None),
+        Field("l", float),
+    )
 
     def __init__(
         self,
@@ -154,63 +163,6 @@ class Chamfer(YAMLObjectBase):
         msg += f",l={self.l})"
         return msg
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create a Chamfer object from a dictionary.
-
-        This method is used for deserialization from YAML/JSON formats.
-        Alpha and dr are optional fields in the dictionary.
-
-        Args:
-            values: Dictionary containing chamfer specification with keys:
-                    - 'name': str
-                    - 'side': str ("BP" or "HP")
-                    - 'rside': str ("rint" or "rext")
-                    - 'alpha': float (optional)
-                    - 'dr': float (optional)
-                    - 'l': float (required)
-            debug: Enable debug output (default: False)
-
-        Returns:
-            Chamfer: New instance created from the dictionary data
-
-        Raises:
-            KeyError: If required keys are missing ('name', 'side', 'rside', 'l')
-            ValidationError: If name or other values are invalid
-
-        Example:
-            >>> data = {
-            ...     "name": "top_chamfer",
-            ...     "side": "HP",
-            ...     "rside": "rext",
-            ...     "alpha": 30.0,
-            ...     "l": 5.0
-            ... }
-            >>> chamfer = Chamfer.from_dict(data)
-            >>>
-            >>> # With dr instead of alpha
-            >>> data2 = {
-            ...     "name": "bot_chamfer",
-            ...     "side": "BP",
-            ...     "rside": "rint",
-            ...     "dr": 4.0,
-            ...     "l": 8.0
-            ... }
-            >>> chamfer2 = Chamfer.from_dict(data2)
-        """
-        name = values.get("name", "")
-        side = values["side"]
-        rside = values["rside"]
-
-        # Make alpha and dr optional
-        alpha = values.get("alpha", None)
-        dr = values.get("dr", None)
-
-        l = values["l"]
-
-        return cls(name, side, rside, alpha, dr, l)
-
     def getDr(self):
         """
         Calculate and return the radial offset of the chamfer.
@@ -19,7 +19,7 @@ Functions:
 
 
 from .base import YAMLObjectBase
-from .validation import GeometryValidator
+from .schema import Field, is_name
 
 
 class Contour2D(YAMLObjectBase):
@@ -47,6 +47,10 @@ class Contour2D(YAMLObjectBase):
     """
 
     yaml_tag = "Contour2D"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("points", list),
+    )
 
     def __init__(self, name: str, points: list[list[float]]):
         """
@@ -65,7 +69,7 @@ class Contour2D(YAMLObjectBase):
             >>> contour = Contour2D("my_shape", [[0, 0], [10, 0], [10, 10], [0, 10]])
         """
         # General validation
-        GeometryValidator.validate_name(name)
+        self._validate_fields(name=name)
 
         self.name = name
         self.points = points
@@ -84,37 +88,6 @@ class Contour2D(YAMLObjectBase):
         """
         return f"{self.__class__.__name__}(name={self.name!r}, points={self.points!r})"
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create a Contour2D object from a dictionary.
-
-        This method is used for deserialization from YAML/JSON formats.
-
-        Args:
-            values: Dictionary containing 'name' and 'points' keys
-            debug: Enable debug output (default: False)
-
-        Returns:
-            Contour2D: New instance created from the dictionary data
-
-        Raises:
-            KeyError: If required keys ('name', 'points') are missing
-            ValidationError: If name or points data is invalid
-
-        Example:
-            >>> data = {
-            ...     "name": "profile",
-            ...     "points": [[0, 0], [5, 0], [5, 5], [0, 5]]
-            ... }
-            >>> contour = Contour2D.from_dict(data)
-        """
-        name = values["name"]
-        points = values["points"]
-
-        object = cls(name, points)
-        return object
-
 
 def create_circle(r: float, n: int = 20) -> Contour2D:
     """
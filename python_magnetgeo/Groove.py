@@ -17,6 +17,7 @@ Notes:
 """
 
 from .base import YAMLObjectBase
+from .schema import Field
 
 
 class Groove(YAMLObjectBase):
@@ -51,6 +52,12 @@ class Groove(YAMLObjectBase):
     """
 
     yaml_tag = "Groove"
+    _fields = (
+        Field("name", str, default=""),
+        Field("gtype", str),
+        Field("n", int),
+        Field("eps", float),
+    )
 
     def __init__(self, name: str = "", gtype: str = None, n: int = 0, eps: float = 0) -> None:
         """
@@ -105,50 +112,3 @@ class Groove(YAMLObjectBase):
             "Groove(name=test, gtype=rint, n=4, eps=2)"
         """
         return f"{self.__class__.__name__}(name={self.name}, gtype={self.gtype}, n={self.n}, eps={self.eps:g})"
-
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create a Groove object from a dictionary.
-
-        This method is used for deserialization from YAML/JSON formats.
-        The 'name' field is optional and defaults to empty string if not present.
-
-        Args:
-            values: Dictionary containing groove specification with keys:
-                    - 'name': str (optional, defaults to '')
-                    - 'gtype': str ("rint" or "rext")
-                    - 'n': int (number of grooves)
-                    - 'eps': float (groove depth in mm)
-            debug: Enable debug output (default: False)
-
-        Returns:
-            Groove: New instance created from the dictionary data
-
-        Raises:
-            KeyError: If required keys are missing ('gtype', 'n', 'eps')
-
-        Example:
-            >>> # Full specification
-            >>> data = {
-            ...     "name": "inner_grooves",
-            ...     "gtype": "rint",
-            ...     "n": 8,
-            ...     "eps": 2.5
-            ... }
-            >>> groove = Groove.from_dict(data)
-            >>>
-            >>> # Without name (uses default empty string)
-            >>> data2 = {
-            ...     "gtype": "rext",
-            ...     "n": 4,
-            ...     "eps": 1.5
-            ... }
-            >>> groove2 = Groove.from_dict(data2)
-            >>> print(groove2.name)  # ''
-        """
-        name = values.get("name", "")
-        gtype = values["gtype"]
-        n = values["n"]
-        eps = values["eps"]
-        return Groove(name, gtype, n, eps)
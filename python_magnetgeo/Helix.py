@@ -12,16 +12,18 @@ Provides definition for Helix:
 """
 
 import math
-import os
 
 from .base import YAMLObjectBase
+from .schema import Field, is_ascending, is_name, numeric_list
 from .Chamfer import Chamfer
 from .Groove import Groove
 from .hcuts import create_cut
 from .Model3D import Model3D
 from .ModelAxi import ModelAxi
 from .Shape import Shape
-from .validation import GeometryValidator, ValidationError
+from .lazy import load_reference
+from .utils import get_basedir
+from .validation import ValidationError
 
 from .logging_config import get_logger
 
@@ -48,6 +50,20 @@ class Helix(YAMLObjectBase):
     """
 
     yaml_tag = "Helix"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("r", list, validators=(numeric_list(2), is_ascending)),
+        Field("z", list, validators=(numeric_list(2), is_ascending)),
+        Field("cutwidth", float),
+        Field("odd", bool),
+        Field("dble", bool),
+        Field("modelaxi", nested=ModelAxi, default=None),
+        Field("model3d", nested=Model3D, default=None),
+        Field("shape", nested=Shape, default=None),
+        Field("chamfers", nested=Chamfer, many=True, default=None),
+        Field("grooves", nested=Groove, default=None),
+        Field("start_hole_diameter", float, default=0.0, key="start_diameter_hole"),
+    )
 
     def __init__(
         self,
@@ -84,12 +100,7 @@ class Helix(YAMLObjectBase):
             ValidationError: If validation fails for name, r, z, or modelaxi.h constraint
         """
         # General validation
-        GeometryValidator.validate_name(name)
-        GeometryValidator.validate_numeric_list(r, "r", expected_length=2)
-        GeometryValidator.validate_ascending_order(r, "r")
-
-        GeometryValidator.validate_numeric_list(z, "z", expected_length=2)
-        GeometryValidator.validate_ascending_order(z, "z")
+        self._validate_fields(name=name, r=r, z=z)
 
         self.name = name
         self.dble = dble
@@ -100,17 +111,17 @@ class Helix(YAMLObjectBase):
         self.start_diameter_hole = start_hole_diameter
 
         if modelaxi is not None and isinstance(modelaxi, str):
-            self.modelaxi = ModelAxi.from_yaml(f"{modelaxi}.yaml")
+            self.modelaxi = load_reference(f"{modelaxi}.yaml", ModelAxi)
         else:
             self.modelaxi = modelaxi
 
         if model3d is not None and isinstance(model3d, str):
-            self.model3d = Model3D.from_yaml(f"{model3d}.yaml")
+            self.model3d = load_reference(f"{model3d}.yaml", Model3D)
         else:
             self.model3d = model3d
 
         if shape is not None and isinstance(shape, str) and shape.strip():
-            self.shape = Shape.from_yaml(f"{shape}.yaml")
+            self.shape = load_reference(f"{shape}.yaml", Shape)
         elif isinstance(shape, str) and not shape.strip():
             self.shape = None
         else:
@@ -120,13 +131,13 @@ class Helix(YAMLObjectBase):
         if chamfers is not None:
             for chamfer in chamfers:
                 if isinstance(chamfer, str):
-                    self.chamfers.append(Chamfer.from_yaml(f"{chamfer}.yaml"))
+                    self.chamfers.append(load_reference(f"{chamfer}.yaml", Chamfer))
                 else:
                     self.chamfers.append(chamfer)
 
         if grooves is not None and isinstance(grooves, str):
             if isinstance(grooves, str):
-                self.grooves = Groove.from_yaml(f"{grooves}.yaml")
+                self.grooves = load_reference(f"{grooves}.yaml", Groove)
         else:
             self.grooves = grooves
 
@@ -152,7 +163,7 @@ class Helix(YAMLObjectBase):
             )
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
 
     def get_type(self) -> str:
         """
@@ -262,54 +273,6 @@ class Helix(YAMLObjectBase):
         msg += ")"
         return msg
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create Helix instance from dictionary representation.
-
-        Args:
-            values: Dictionary containing helix parameters
-            debug: Enable debug output during deserialization
-
-        Returns:
-            Helix: New Helix instance
-
-        Notes:
-            Handles nested objects (modelaxi, model3d, shape, chamfers, grooves)
-            by loading from files or instantiating from dicts
-        """
-        logger.debug(f"Helix.from_dict: values keys={list(values.keys())}")
-        modelaxi = cls._load_nested_single(values.get("modelaxi"), ModelAxi, debug=debug)
-        model3d = cls._load_nested_single(values.get("model3d"), Model3D, debug=debug)
-        shape = cls._load_nested_single(values.get("shape"), Shape, debug=debug)
-        chamfers = cls._load_nested_list(values.get("chamfers"), Chamfer, debug=debug)
-        grooves = cls._load_nested_single(values.get("grooves"), Groove, debug=debug)
-
-        name = values["name"]
-        r = values["r"]
-        z = values["z"]
-        odd = values["odd"]
-        dble = values["dble"]
-        cutwidth = values["cutwidth"]
-        start_diameter_hole = values.get("start_diameter_hole", 0.0)
-
-        object = cls(
-            name,
-            r,
-            z,
-            cutwidth,
-            odd,
-            dble,
-            modelaxi,
-            model3d,
-            shape,
-            chamfers,
-            grooves,
-            start_diameter_hole,
-        )
-        # object.update()
-        return object
-
     @classmethod
     def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
@@ -404,6 +367,50 @@ class Helix(YAMLObjectBase):
             except RuntimeError as e:
                 raise Exception(f"cannot run add_shape properly: {e}") from e
 
+    def sample_cut(self, points_per_turn: int = 360, radius: float | None = None, edge: int = 0):
+        """
+        Sample the helical cut path as numpy arrays (theta, z, x, y).
+
+        Args:
+            points_per_turn: Angular resolution (points per turn). Default: 360
+            radius: Radius of the samples. Default: mean radius (r[0] + r[1]) / 2
+            edge: 0 for the centre line of the cut, -1/+1 for its lower/upper edge
+
+        Returns:
+            CutSamples: theta, z, x and y of every point, from z = -h to z = h
+            (see trajectory module for the conventions)
+
+        Raises:
+            ValueError: If there is no modelaxi, or on invalid arguments
+
+        Example:
+            >>> samples = helix.sample_cut(points_per_turn=3600)
+            >>> samples.theta[-1], samples.z[-1]
+        """
+        from .trajectory import sample_cut
+
+        return sample_cut(self, points_per_turn, radius, edge)
+
+    def iter_cut(
+        self,
+        points_per_turn: int = 360,
+        radius: float | None = None,
+        edge: int = 0,
+        chunk: int | None = None,
+    ):
+        """
+        Stream the samples of sample_cut by chunks of at most chunk points.
+
+        Meant for resolutions whose samples do not fit in memory at once.
+        chunk defaults to trajectory.DEFAULT_CHUNK.
+
+        Yields:
+            CutSamples: Consecutive chunks of the path, from z = -h to z = h
+        """
+        from .trajectory import iter_cut
+
+        return iter_cut(self, points_per_turn, radius, edge, chunk)
+
     def intersect(self, r: list[float], z: list[float]) -> bool:
         """
         Check if this helix intersects with a given rectangular region.
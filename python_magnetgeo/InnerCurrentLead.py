@@ -6,6 +6,7 @@ Provides Inner and OuterCurrentLead class
 """
 
 from .base import YAMLObjectBase
+from .schema import Field, is_ascending, is_name, is_positive, numeric_list
 from .validation import GeometryValidator, ValidationError
 
 
@@ -67,6 +68,14 @@ class InnerCurrentLead(YAMLObjectBase):
     """
 
     yaml_tag = "InnerCurrentLead"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("r", list, validators=(numeric_list(2), is_ascending)),
+        Field("h", float, validators=(is_positive,)),
+        Field("holes", list),
+        Field("support", list),
+        Field("fillet", bool),
+    )
 
     def __init__(
         self,
@@ -129,10 +138,7 @@ class InnerCurrentLead(YAMLObjectBase):
             - Validation is comprehensive and provides clear error messages
         """
         # General validation
-        GeometryValidator.validate_name(name)
-        GeometryValidator.validate_numeric_list(r, "r", expected_length=2)
-        GeometryValidator.validate_ascending_order(r, "r")
-        GeometryValidator.validate_positive(h, "h")
+        self._validate_fields(name=name, r=r, h=h)
 
         if holes:
             GeometryValidator.validate_numeric_list(holes, "holes", expected_length=6)
@@ -173,45 +179,3 @@ class InnerCurrentLead(YAMLObjectBase):
             "InnerCurrentLead(name='test', r=[10.0, 20.0], h=50.0, holes=[], support=[], fillet=False)"
         """
         return f"{self.__class__.__name__}(name={self.name!r}, r={self.r!r}, h={self.h!r}, holes={self.holes!r}, support={self.support!r}, fillet={self.fillet!r})"
-
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create InnerCurrentLead from dictionary representation.
-
-        Args:
-            values: Dictionary with keys matching constructor parameters:
-                - name: Lead identifier (required)
-                - r: Radial bounds (required)
-                - h: Height (required)
-                - holes: Hole pattern (required)
-                - support: Support structure (required)
-                - fillet: Edge filleting flag (required)
-            debug: Enable debug output during construction
-
-        Returns:
-            InnerCurrentLead: New instance constructed from dictionary
-
-        Example:
-            >>> data = {
-            ...     'name': 'lead_from_dict',
-            ...     'r': [12.0, 22.0],
-            ...     'h': 55.0,
-            ...     'holes': [5.5, 10.0, 0.0, 60.0, 0.0, 6],
-            ...     'support': [26.0, 5.0],
-            ...     'fillet': True
-            ... }
-            >>> lead = InnerCurrentLead.from_dict(data)
-
-        Notes:
-            - All keys shown in example are expected in the dictionary
-            - Uses standard constructor, so all validation applies
-            - Part of the serialization/deserialization infrastructure
-        """
-        name = values["name"]
-        r = values["r"]
-        h = values["h"]
-        holes = values["holes"]
-        support = values["support"]
-        fillet = values["fillet"]
-        return cls(name, r, h, holes, support, fillet)
@@ -4,16 +4,20 @@
 """defines Insert structure"""
 
 import math
-import os
+from functools import partial
 
 from .base import YAMLObjectBase
+from .schema import Field, is_name
 from .Helix import Helix
 from .InnerCurrentLead import InnerCurrentLead
 from .OuterCurrentLead import OuterCurrentLead
 from .Probe import Probe
 from .Ring import Ring
-from .utils import flatten, getObject
-from .validation import GeometryValidator, ValidationError
+from .deferred import validate_or_defer
+from .lazy import load_reference
+from .rules import Rule, RuleSet
+from .utils import flatten, get_basedir
+from .validation import ValidationError
 
 # Module logger
 from .logging_config import get_logger
@@ -70,6 +74,17 @@ class Insert(YAMLObjectBase):
     """
 
     yaml_tag = "Insert"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("helices", nested=Helix, many=True, default=None),
+        Field("rings", nested=Ring, many=True, default=None),
+        Field("currentleads", nested=(InnerCurrentLead, OuterCurrentLead), many=True, default=None),
+        Field("hangles", list),
+        Field("rangles", list),
+        Field("innerbore", float),
+        Field("outerbore", float),
+        Field("probes", nested=Probe, many=True, default=None),
+    )
 
     def __init__(
         self,
@@ -122,54 +137,29 @@ class Insert(YAMLObjectBase):
             ... )
         """
         # Validate inputs
-        GeometryValidator.validate_name(name)
+        self._validate_fields(name=name)
 
-        # Validate bore dimensions if not zero (zero means not specified)
-        if innerbore != 0 and outerbore != 0:
-            if innerbore >= outerbore:
-                raise ValidationError(
-                    f"innerbore ({innerbore}) must be less than outerbore ({outerbore})"
-                )
-
-        if rings and len(rings) > 0:
-            if len(rings) != len(helices) - 1:
-                raise ValidationError(
-                    f"Number of rings ({len(rings)}) must be equal to number of helices ({len(helices)}) minus one"
-                )
-
-        if hangles and len(hangles) > 0:
-            if len(hangles) > 0:
-                if len(hangles) != len(helices):
-                    raise ValidationError(
-                        f"Number of hangles ({len(hangles)}) must match number of helices ({len(helices)})"
-                    )
-
-        if rangles and len(rangles) > 0:
-            if len(rangles) > 0:
-                if len(rangles) != len(rings):
-                    raise ValidationError(
-                        f"Number of rangles ({len(rangles)}) must match number of rings ({len(rings)})"
-                    )
+        self._check_layout(helices, rings, hangles, rangles, innerbore, outerbore)
 
         self.name = name
         self.helices = []
         for helix in helices:
             if isinstance(helix, str):
-                self.helices.append(Helix.from_yaml(f"{helix}.yaml"))
+                self.helices.append(load_reference(f"{helix}.yaml", Helix))
             else:
                 self.helices.append(helix)
 
         self.rings = []
         for ring in rings:
             if isinstance(ring, str):
-                self.rings.append(Ring.from_yaml(f"{ring}.yaml"))
+                self.rings.append(load_reference(f"{ring}.yaml", Ring))
             else:
                 self.rings.append(ring)
 
         self.currentleads = []
         for lead in currentleads:
             if isinstance(lead, str):
-                self.currentleads.append(getObject(f"{lead}.yaml"))
+                self.currentleads.append(load_reference(f"{lead}.yaml"))
             else:
                 self.currentleads.append(lead)
 
@@ -182,7 +172,7 @@ class Insert(YAMLObjectBase):
         if probes is not None:
             for probe in probes:
                 if isinstance(probe, str):
-                    self.probes.append(Probe.from_yaml(f"{probe}.yaml"))
+                    self.probes.append(load_reference(f"{probe}.yaml", Probe))
                 else:
                     self.probes.append(probe)
 
@@ -201,11 +191,6 @@ class Insert(YAMLObjectBase):
                 f"{innerbore:.3f} mm (= {self.helices[0].r[0]:.3f} - {eps})"
             )
 
-        if self.helices and innerbore > self.helices[0].r[0]:
-            raise ValidationError(
-                f"innerbore ({innerbore}) must be less than first helix inner radius ({self.helices[0].r[0]})"
-            )
-
         # Handle case where outerbore is not specified (0)
         if self.helices and outerbore == 0:
             outerbore = self.helices[-1].r[1] + eps
@@ -215,96 +200,295 @@ class Insert(YAMLObjectBase):
                 f"{outerbore:.3f} mm (= {self.helices[-1].r[1]:.3f} + {eps})"
             )
 
-        if self.helices and outerbore < self.helices[-1].r[1]:
-            raise ValidationError(
-                f"outerbore ({outerbore}) must be greater than last helix outer radius ({self.helices[-1].r[1]})"
-            )
+        # Consistency of the assembly (see consistency_rules)
+        validate_or_defer(self, self.consistency_rules().check)
 
-        # check that helices are stored in ascending order of radius
-        for i in range(1, len(self.helices)):
-            if self.helices[i].r[0] <= self.helices[i - 1].r[0]:
+        # Store the directory context for resolving struct paths
+        self._basedir = get_basedir()
+
+    @staticmethod
+    def _check_layout(helices, rings, hangles, rangles, innerbore, outerbore) -> None:
+        """Check bores and the number of rings and angles against the number of helices."""
+        # Validate bore dimensions if not zero (zero means not specified)
+        if innerbore != 0 and outerbore != 0:
+            if innerbore >= outerbore:
                 raise ValidationError(
-                    f"Helices must be ordered by ascending inner radius: helix {i} has inner radius {self.helices[i].r[0]} which is not greater than previous helix inner radius {self.helices[i - 1].r[0]}"
+                    f"innerbore ({innerbore}) must be less than outerbore ({outerbore})"
                 )
 
-        # check that rings are stored in ascending order of radius
-        for i in range(len(self.rings)):
-            ring_side = "BP" if self.rings[i].bpside else "HP"
-            if i >= 1 and self.rings[i].r[0] <= self.rings[i - 1].r[0]:
+        if rings and len(rings) > 0:
+            if len(rings) != len(helices) - 1:
+                raise ValidationError(
+                    f"Number of rings ({len(rings)}) must be equal to number of helices ({len(helices)}) minus one"
+                )
+
+        if hangles and len(hangles) > 0:
+            if len(hangles) != len(helices):
                 raise ValidationError(
-                    f"Rings must be ordered by ascending inner radius: ring {i} ({self.rings[i].name}) has inner radius {self.rings[i].r[0]} which is not greater than previous ring inner radius {self.rings[i - 1].r[0]}"
+                    f"Number of hangles ({len(hangles)}) must match number of helices ({len(helices)})"
                 )
 
-            # check that rings radius matches with helices[i] and helices[i+1] radius only valid when helix has not chamfer
-            helix0 = self.helices[i]
-            helix1 = self.helices[i + 1]
-            helices_radius = flatten([helix.r for helix in (helix0, helix1)])
-
-            if helix0.chamfers:
-                # select chamfer that are on same side as ring
-                chamfers = [
-                    chamfer for chamfer in helix0.chamfers if chamfer.side == ring_side
-                ]
-                for chamfer in chamfers:
-                    if chamfer.rside == "rext":
-                        helices_radius[1] -= chamfer.getDr()
-                    else:
-                        helices_radius[0] += chamfer.getDr()
-
-            if helix1.chamfers:
-                # select chamfer that are on same side as ring
-                chamfers = [
-                    chamfer for chamfer in helix1.chamfers if chamfer.side == ring_side
-                ] # for chamfer in helix1.chamfers:
-                for chamfer in chamfers:
-                    if chamfer.rside == "rext":
-                        helices_radius[3] -= chamfer.getDr()
-                    else:
-                        helices_radius[2] += chamfer.getDr()
-            import numpy as np
-
-            r_rings = np.array(self.rings[i].r)
-            r_helices = np.array(flatten(helices_radius))
-            norm = np.linalg.norm(r_rings - r_helices)
-            bound = 1.0e-5 * max(abs(np.max(r_rings)), abs(np.max(r_helices)))
-            # logger.debug(f"norm: {norm}, bound: {bound}")
-            if norm > bound:
+        if rangles and len(rangles) > 0:
+            if len(rangles) != len(rings):
                 raise ValidationError(
-                    f"Ring[{i}] ({self.rings[i].name}) radius {r_rings} does not match with adjacent helices radii {r_helices}"
+                    f"Number of rangles ({len(rangles)}) must match number of rings ({len(rings)})"
                 )
 
-        for helix in self.helices:
-            logger.debug(helix)
+    def consistency_rules(self) -> RuleSet:
+        """
+        Consistency rules of the assembly, with the components each one reads.
 
-        # check leads radius
-        if self.currentleads is not None:
-            for lead in self.currentleads:
-                logger.debug(f"{lead} {type(lead)}")
-                zinf_inner = None
-                if isinstance(lead, InnerCurrentLead):
-                    rext = lead.r[1]
-                    zinf_inner = self.helices[0].z[0] - lead.h
-                    if lead.support is not None and lead.support:
-                        if lead.support[1] != 0:
-                            rext = lead.support[0]
-                        zinf_inner -= lead.support[1]
-                    if rext != self.helices[0].r[1]:
-                        raise ValidationError(
-                            f"{lead.name}: InnerCurrentLead outer radius ({rext}) must be egal to first helix outer radius ({self.helices[0].r[1]})"
-                        )
+        Rules, in validation order:
+            - innerbore below the first helix, outerbore above the last one
+            - helix i inner radius above helix i-1 inner radius
+            - ring i inner radius above ring i-1 inner radius, ring i radii
+              matching helices i and i+1 (chamfers on the ring side included)
+            - current leads against the first helix
+
+        Components are keyed ("helices", i), ("rings", i), ("currentleads", i),
+        "innerbore" and "outerbore" (see rules.RuleSet).
+
+        Returns:
+            RuleSet: Rules of the current helices, rings and leads (cached
+                     while their numbers do not change)
+        """
+        n = len(self.helices)
+        layout = (n, len(self.rings), len(self.currentleads))
+        cached = self.__dict__.get("_rules")
+        if cached is not None and cached[0] == layout:
+            return cached[1]
+
+        rules = []
+        if self.helices:
+            rules.append(Rule("innerbore", {"innerbore", ("helices", 0)}, self._check_innerbore))
+            rules.append(
+                Rule("outerbore", {"outerbore", ("helices", n - 1)}, self._check_outerbore)
+            )
+        for i in range(1, n):
+            rules.append(
+                Rule(
+                    f"helix {i} order",
+                    {("helices", i - 1), ("helices", i)},
+                    partial(self._check_helix_order, i),
+                )
+            )
+        for i in range(len(self.rings)):
+            if i >= 1:
+                rules.append(
+                    Rule(
+                        f"ring {i} order",
+                        {("rings", i - 1), ("rings", i)},
+                        partial(self._check_ring_order, i),
+                    )
+                )
+            rules.append(
+                Rule(
+                    f"ring {i} radius",
+                    {("rings", i), ("helices", i), ("helices", i + 1)},
+                    partial(self._check_ring_radius, i),
+                )
+            )
+        if self.currentleads:
+            leads = {("currentleads", k) for k in range(len(self.currentleads))}
+            leads |= {("helices", 0), ("helices", n - 1)}
+            rules.append(Rule("current leads", leads, self._check_leads))
+        self._rules = (layout, RuleSet(rules))
+        return self._rules[1]
+
+    def _check_innerbore(self) -> None:
+        if self.helices and self.innerbore > self.helices[0].r[0]:
+            raise ValidationError(
+                f"innerbore ({self.innerbore}) must be less than first helix inner radius ({self.helices[0].r[0]})"
+            )
+
+    def _check_outerbore(self) -> None:
+        if self.helices and self.outerbore < self.helices[-1].r[1]:
+            raise ValidationError(
+                f"outerbore ({self.outerbore}) must be greater than last helix outer radius ({self.helices[-1].r[1]})"
+            )
+
+    def _check_helix_order(self, i: int) -> None:
+        # check that helices are stored in ascending order of radius
+        if self.helices[i].r[0] <= self.helices[i - 1].r[0]:
+            raise ValidationError(
+                f"Helices must be ordered by ascending inner radius: helix {i} has inner radius {self.helices[i].r[0]} which is not greater than previous helix inner radius {self.helices[i - 1].r[0]}"
+            )
+
+    def _check_ring_order(self, i: int) -> None:
+        # check that rings are stored in ascending order of radius
+        if self.rings[i].r[0] <= self.rings[i - 1].r[0]:
+            raise ValidationError(
+                f"Rings must be ordered by ascending inner radius: ring {i} ({self.rings[i].name}) has inner radius {self.rings[i].r[0]} which is not greater than previous ring inner radius {self.rings[i - 1].r[0]}"
+            )
+
+    def _check_ring_radius(self, i: int) -> None:
+        # check that rings radius matches with helices[i] and helices[i+1] radius
+        ring_side = "BP" if self.rings[i].bpside else "HP"
+        helix0 = self.helices[i]
+        helix1 = self.helices[i + 1]
+        helices_radius = flatten([helix.r for helix in (helix0, helix1)])
+        if helix0.chamfers:
+            # select chamfer that are on same side as ring
+            chamfers = [chamfer for chamfer in helix0.chamfers if chamfer.side == ring_side]
+            for chamfer in chamfers:
+                if chamfer.rside == "rext":
+                    helices_radius[1] -= chamfer.getDr()
                 else:
-                    zinf_outer = self.helices[-1].z[0] - lead.h
-                    if lead.bar is not None and lead.bar:
-                        zinf_outer -= lead.bar[1]
-                    if lead.support is not None and lead.support:
-                        zinf_outer -= lead.support[1]
-                    if zinf_inner is not None and zinf_inner != zinf_outer:
-                        raise ValidationError(
-                            f"Insert: zinf_inner ({zinf_inner}) and zinf_outer ({zinf_outer}) must be egal"
-                        )
+                    helices_radius[0] += chamfer.getDr()
+        if helix1.chamfers:
+            # select chamfer that are on same side as ring
+            chamfers = [chamfer for chamfer in helix1.chamfers if chamfer.side == ring_side]
+            for chamfer in chamfers:
+                if chamfer.rside == "rext":
+                    helices_radius[3] -= chamfer.getDr()
+                else:
+                    helices_radius[2] += chamfer.getDr()
 
-        # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        import numpy as np
+
+        r_rings = np.array(self.rings[i].r)
+        r_helices = np.array(flatten(helices_radius))
+        norm = np.linalg.norm(r_rings - r_helices)
+        bound = 1.0e-5 * max(abs(np.max(r_rings)), abs(np.max(r_helices)))
+        if norm > bound:
+            raise ValidationError(
+                f"Ring[{i}] ({self.rings[i].name}) radius {r_rings} does not match with adjacent helices radii {r_helices}"
+            )
+
+    def _check_leads(self) -> None:
+        # check leads radius
+        for lead in self.currentleads:
+            logger.debug("%s %s", lead, type(lead))
+            zinf_inner = None
+            if isinstance(lead, InnerCurrentLead):
+                rext = lead.r[1]
+                zinf_inner = self.helices[0].z[0] - lead.h
+                if lead.support is not None and lead.support:
+                    if lead.support[1] != 0:
+                        rext = lead.support[0]
+                    zinf_inner -= lead.support[1]
+                if rext != self.helices[0].r[1]:
+                    raise ValidationError(
+                        f"{lead.name}: InnerCurrentLead outer radius ({rext}) must be egal to first helix outer radius ({self.helices[0].r[1]})"
+                    )
+            else:
+                zinf_outer = self.helices[-1].z[0] - lead.h
+                if lead.bar is not None and lead.bar:
+                    zinf_outer -= lead.bar[1]
+                if lead.support is not None and lead.support:
+                    zinf_outer -= lead.support[1]
+                if zinf_inner is not None and zinf_inner != zinf_outer:
+                    raise ValidationError(
+                        f"Insert: zinf_inner ({zinf_inner}) and zinf_outer ({zinf_outer}) must be egal"
+                    )
+
+    def _component_keys(self, component) -> list:
+        """Rule keys of a component given as key, attribute name or object."""
+        if isinstance(component, (str, tuple)):
+            return [component]
+        keys = [
+            (field, i)
+            for field in ("helices", "rings", "currentleads")
+            for i, item in enumerate(getattr(self, field))
+            if item is component
+        ]
+        if not keys:
+            raise ValueError(f"{component!r} is not a component of Insert {self.name}")
+        return keys
+
+    def revalidate(self, *components) -> int:
+        """
+        Re-run the validation affected by edited components.
+
+        Only the rules reading the given components are run (for helix i:
+        the ordering of helices i-1/i/i+1, rings i-1 and i, and the bores
+        or the current leads for the first and last helices), raising the
+        same errors as the constructor would. The own fields of edited
+        objects are validated again.
+
+        Args:
+            *components: Edited helices, rings or current leads (objects of
+                         this insert), rule keys such as ("helices", 3), or
+                         "innerbore"/"outerbore"; none to validate everything
+
+        Returns:
+            int: Number of consistency rules run
+
+        Raises:
+            ValidationError: If the edited assembly is not consistent
+
+        Example:
+            >>> insert.helices[3].r = [31.0, 35.5]
+            >>> insert.revalidate(insert.helices[3])
+        """
+        if components:
+            keys = []
+            for component in components:
+                keys.extend(self._component_keys(component))
+                if hasattr(component, "_validate_fields"):
+                    component._validate_fields(
+                        **{name: getattr(component, name, None) for name in component._field_names}
+                    )
+        else:
+            self._validate_fields(name=self.name)
+            self._check_layout(
+                self.helices, self.rings, self.hangles, self.rangles, self.innerbore, self.outerbore
+            )
+            keys = None
+
+        count = self.consistency_rules().check(keys)
+        self.r, self.z = self.boundingBox()
+        return count
+
+    def _replace(self, field: str, index: int, component) -> int:
+        components = getattr(self, field)
+        index = range(len(components))[index]
+        previous = components[index]
+        components[index] = component
+        try:
+            return self.revalidate((field, index))
+        except ValidationError:
+            components[index] = previous
+            self.r, self.z = self.boundingBox()
+            raise
+
+    def replace_helix(self, index: int, helix: Helix | str) -> int:
+        """
+        Replace one helix, re-running only the validation it affects.
+
+        Args:
+            index: Position of the helix
+            helix: New Helix, or name of its YAML file
+
+        Returns:
+            int: Number of consistency rules run
+
+        Raises:
+            ValidationError: If the assembly is not consistent with the new
+                             helix, which is then not replaced
+        """
+        if isinstance(helix, str):
+            helix = load_reference(f"{helix}.yaml", Helix)
+        return self._replace("helices", index, helix)
+
+    def replace_ring(self, index: int, ring: Ring | str) -> int:
+        """
+        Replace one ring, re-running only the validation it affects.
+
+        Args:
+            index: Position of the ring
+            ring: New Ring, or name of its YAML file
+
+        Returns:
+            int: Number of consistency rules run
+
+        Raises:
+            ValidationError: If the assembly is not consistent with the new
+                             ring, which is then not replaced
+        """
+        if isinstance(ring, str):
+            ring = load_reference(f"{ring}.yaml", Ring)
+        return self._replace("rings", index, ring)
 
     def get_channels(self, mname: str, hideIsolant: bool = True, debug: bool = False) -> list[list]:
         """
@@ -493,6 +677,26 @@ class Insert(YAMLObjectBase):
 
         return len(self.helices)
 
+    def sample_cuts(self, points_per_turn: int = 360, edge: int = 0) -> dict:
+        """
+        Sample the helical cut paths of all helices (see Helix.sample_cut).
+
+        Args:
+            points_per_turn: Angular resolution (points per turn). Default: 360
+            edge: 0 for the centre line of the cuts, -1/+1 for their lower/upper edge
+
+        Returns:
+            dict: CutSamples (theta, z, x, y arrays) by helix name, for the
+                  helices with a helical cut
+
+        Example:
+            >>> cuts = insert.sample_cuts(points_per_turn=720)
+            >>> cuts["H1"].x.shape
+        """
+        from .trajectory import sample_cuts
+
+        return sample_cuts(self.helices, points_per_turn, edge)
+
     def __repr__(self):
         """
         Return string representation of Insert instance.
@@ -515,79 +719,32 @@ class Insert(YAMLObjectBase):
             f"innerbore={self.innerbore!r}, outerbore={self.outerbore!r}, probes={self.probes!r})"
         )
 
+    ###################################################################
+    #
+    #
+    ###################################################################
+
     @classmethod
-    def from_dict(cls, data: dict, debug: bool = False):
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
-        Create Insert instance from dictionary representation.
+        Analyze nested dependencies specific to Insert class.
 
-        Supports multiple input formats for nested objects:
-        - String: loads object from "{string}.yaml" file
-        - Dict: creates object inline from dictionary
-        - Object: uses already instantiated object
+        Identifies files that would be loaded for helices, rings, current leads and probes.
 
         Args:
-            data: Dictionary containing insert configuration with keys:
-                - name (str): Insert name
-                - helices (list): List of helices (strings/dicts/objects)
-                - rings (list): List of rings (strings/dicts/objects)
-                - currentleads (list, optional): List of current leads
-                - hangles (list[float]): Helix angular positions
-                - rangles (list[float]): Ring angular positions
-                - innerbore (float): Inner bore radius
-                - outerbore (float): Outer bore radius
-                - probes (list, optional): List of probes
-            debug: Enable debug output showing object loading process
-
-        Returns:
-            Insert: New Insert instance created from dictionary
-
-        Raises:
-            KeyError: If required keys are missing from dictionary
-            TypeError: If nested object lists contain invalid types
-            ValidationError: If any validation rules are violated
-
-        Example:
-            >>> data = {
-            ...     "name": "HL-31",
-            ...     "helices": ["H1", "H2"],  # Load from files
-            ...     "rings": [{"name": "R1", "r": [8, 22], "z": [40, 60]}],  # Inline
-            ...     "currentleads": [],
-            ...     "hangles": [0.0, 180.0],
-            ...     "rangles": [0.0],
-            ...     "innerbore": 5.0,
-            ...     "outerbore": 25.0
-            ... }
-            >>> insert = Insert.from_dict(data)
-        """
-        helices = cls._load_nested_list(data.get("helices"), Helix, debug=debug)
-
-        rings = cls._load_nested_list(data.get("rings"), Ring, debug=debug)
-
-        currentleads = cls._load_nested_list(
-            data.get("currentleads"), (InnerCurrentLead, OuterCurrentLead), debug=debug
-        )
-        probes = cls._load_nested_list(data.get("probes"), Probe, debug=debug)
-
-        name = data["name"]
-
-        # helices = data["helices"]
-        # rings = data["rings"]
-        # currentleads = data.get("currentleads", [])
-        innerbore = data["innerbore"]
-        outerbore = data["outerbore"]
-        hangles = data["hangles"]
-        rangles = data["rangles"]
-        # probes = data.get("probes", [])  # NEW: Optional with default empty list
-
-        object = cls(
-            name, helices, rings, currentleads, hangles, rangles, innerbore, outerbore, probes
+            values: Dictionary containing insert parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
+        """
+        cls._analyze_list_dependency(values.get("helices"), Helix, required_files, debug=debug)
+        cls._analyze_list_dependency(values.get("rings"), Ring, required_files, debug=debug)
+        cls._analyze_list_dependency(
+            values.get("currentleads"),
+            (InnerCurrentLead, OuterCurrentLead),
+            required_files,
+            debug=debug,
         )
-        return object
-
-    ###################################################################
-    #
-    #
-    ###################################################################
+        cls._analyze_list_dependency(values.get("probes"), Probe, required_files, debug=debug)
 
     def boundingBox(self) -> tuple:
         """
@@ -723,24 +880,15 @@ class Insert(YAMLObjectBase):
 
         Zh = []
         for helix in self.helices:
-            n_sections = len(helix.modelaxi.turns)
-            Nsections.append(n_sections)
+            sections = helix.modelaxi.sections()
+            Nsections.append(sections.nsections)
             Nturns_h.append(helix.modelaxi.turns)
 
             R1.append(helix.r[0])
             R2.append(helix.r[1])
 
-            z = -helix.modelaxi.h
-            (turns, pitch) = helix.modelaxi.compact()
-
-            tZh = []
-            tZh.append(helix.z[0])
-            tZh.append(z)
-            for n, p in zip(turns, pitch, strict=True):
-                z += n * p
-                tZh.append(z)
-            tZh.append(helix.z[1])
-            Zh.append(tZh)
+            # breakpoints of the compacted sections (see ModelAxi.compact)
+            Zh.append([helix.z[0], *sections.boundaries(), helix.z[1]])
             # logger.debug(f"Zh[{i}]: {Zh[-1]}")
 
         Rint = self.innerbore
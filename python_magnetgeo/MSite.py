@@ -5,17 +5,19 @@
 Provides definition for Site:
 
 """
-import os
 from typing import Optional
 
 from .base import YAMLObjectBase
+from .schema import Field, is_name
 from .Bitter import Bitter
 from .Bitters import Bitters
 from .Insert import Insert
 from .Screen import Screen
 from .Supra import Supra
 from .Supras import Supras
-from .utils import getObject
+from .deferred import validate_or_defer
+from .lazy import load_reference
+from .utils import get_basedir
 from .validation import GeometryValidator, ValidationError
 
 
@@ -27,6 +29,14 @@ class MSite(YAMLObjectBase):
     """
 
     yaml_tag = "MSite"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("magnets", nested=(Insert, Bitters, Supras), many=True, default=None),
+        Field("screens", nested=Screen, many=True, default=None),
+        Field("z_offset", list, default=None),
+        Field("r_offset", list, default=None),
+        Field("paralax", list, default=None),
+    )
 
     def __init__(
         self,
@@ -97,14 +107,14 @@ class MSite(YAMLObjectBase):
             ... )
         """
         # Validate inputs
-        GeometryValidator.validate_name(name)
+        self._validate_fields(name=name)
 
         self.name = name
 
         self.magnets = []
         for magnet in magnets:
             if isinstance(magnet, str):
-                magnets.append(getObject(f"{magnet}.yaml"))
+                self.magnets.append(load_reference(f"{magnet}.yaml"))
             else:
                 self.magnets.append(magnet)
 
@@ -113,7 +123,7 @@ class MSite(YAMLObjectBase):
         if screens is not None:
             for screen in screens:
                 if isinstance(screen, str):
-                    self.screens.append(getObject(f"{screen}.yaml"))
+                    self.screens.append(load_reference(f"{screen}.yaml"))
                 else:
                     self.screens.append(screen)
 
@@ -122,16 +132,28 @@ class MSite(YAMLObjectBase):
         self.paralax = paralax
 
         # check that magnets are not intersecting
-        for i in range(1, len(self.magnets)):
-            rb, zb = self.magnets[i - 1].boundingBox()
-            for j in range(i + 1, len(self.magnets)):
-                if self.magnets[j].intersect(rb, zb):
-                    raise ValidationError(
-                        f"magnets intersect: magnet[{i}] intersect magnet[{i-1}]: /n{self.magnets[i]} /n{self.magnets[i-1]}"
-                    )
+        validate_or_defer(self, lambda: GeometryValidator.validate_no_intersection(self.magnets))
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
+
+    def revalidate(self, *components) -> int:
+        """
+        Re-run the intersection check of the magnets after an edit.
+
+        Only the pairs of magnets involving an edited magnet are checked.
+
+        Args:
+            *components: Edited magnets (objects of this assembly) or keys
+                         such as ("magnets", 3); none to check all pairs
+
+        Returns:
+            int: Number of consistency rules run
+
+        Raises:
+            ValidationError: If two magnets intersect
+        """
+        return GeometryValidator.revalidate_no_intersection(self.magnets, components)
 
     def __repr__(self):
         """
@@ -312,60 +334,21 @@ class MSite(YAMLObjectBase):
         return None
 
     @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
-        Create MSite instance from dictionary representation.
+        Analyze nested dependencies specific to MSite class.
 
-        Supports flexible input formats for nested magnet and screen objects,
-        allowing mixed specifications of inline definitions and external references.
+        Identifies files that would be loaded for magnets (Insert, Bitters, Supras) and screens.
 
         Args:
-            values: Dictionary containing MSite configuration with keys:
-                - name (str): Site name
-                - magnets (list/dict): List of magnets (strings/dicts/objects)
-                - screens (list/dict/None, optional): List of screens
-                - z_offset (list[float]/None, optional): Axial offsets
-                - r_offset (list[float]/None, optional): Radial offsets
-                - paralax (list[float]/None, optional): Parallax corrections
-            debug: Enable debug output showing object loading process
-
-        Returns:
-            MSite: New MSite instance created from dictionary
-
-        Raises:
-            KeyError: If required 'name' or 'magnets' keys are missing
-            ValidationError: If magnet or screen data is malformed
-            ValidationError: If magnets intersect
-
-        Example:
-            >>> data = {
-            ...     "name": "M9",
-            ...     "magnets": [
-            ...         "HL-31",  # Load from file
-            ...         {"name": "B1", "r": [...], ...}  # Inline definition
-            ...     ],
-            ...     "screens": None,
-            ...     "z_offset": [0.0, 150.0],
-            ...     "r_offset": [0.0, 0.0],
-            ...     "paralax": None
-            ... }
-            >>> msite = MSite.from_dict(data)
+            values: Dictionary containing msite parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
         """
-        magnets = cls._load_nested_list(
-            values.get("magnets"), (Insert, Bitters, Supras), debug=debug
+        cls._analyze_list_dependency(
+            values.get("magnets"), (Insert, Bitters, Supras), required_files, debug=debug
         )
-        screens = cls._load_nested_list(
-            values.get("screens"), Screen, debug=debug
-        )  # NEW: Load screens
-
-        name = values["name"]
-        magnets = values["magnets"]
-        # FIX: Use get() with None default instead of empty list default
-        screens = values.get("screens", None)
-        z_offset = values.get("z_offset", None)
-        r_offset = values.get("r_offset", None)
-        paralax = values.get("paralax", None)
-        return cls(name, magnets, screens, z_offset, r_offset, paralax)
+        cls._analyze_list_dependency(values.get("screens"), Screen, required_files, debug=debug)
 
     @classmethod
     def _load_nested_magnets(cls, magnets_data, debug=False):
@@ -10,6 +10,7 @@ Provides definiton for Helix:
 """
 
 from .base import YAMLObjectBase
+from .schema import Field
 
 
 class Model3D(YAMLObjectBase):
@@ -21,6 +22,12 @@ class Model3D(YAMLObjectBase):
     """
 
     yaml_tag = "Model3D"
+    _fields = (
+        Field("name", str, default=""),
+        Field("cad", str),
+        Field("with_shapes", bool, default=False),
+        Field("with_channels", bool, default=False),
+    )
 
     def __init__(
         self, name: str, cad: str, with_shapes: bool = False, with_channels: bool = False
@@ -93,46 +100,3 @@ class Model3D(YAMLObjectBase):
 
         """
         return f"{self.__class__.__name__}(name={self.name!r}, cad={self.cad!r}, with_shapes={self.with_shapes!r}, with_channels={self.with_channels!r})"
-
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create Model3D instance from dictionary representation.
-
-        Standard deserialization method with default values for optional parameters.
-
-        Args:
-            values: Dictionary containing Model3D configuration with keys:
-                - name (str, optional): Model identifier. Default: ""
-                - cad (str): Catia/SmarTeam CAD identifier (required)
-                - with_shapes (bool, optional): Include shapes flag. Default: False
-                - with_channels (bool, optional): Include channels flag. Default: False
-            debug: Enable debug output (currently unused)
-
-        Returns:
-            Model3D: New Model3D instance created from dictionary
-
-        Raises:
-            KeyError: If required 'cad' key is missing from dictionary
-
-        Notes:
-            - Name defaults to empty string if not provided
-            - Boolean flags default to False if not provided
-            - CAD identifier is the only required field
-
-        Example:
-            >>> # Full specification
-            >>> data = {
-            ...     "name": "helix_model",
-            ...     "cad": "SALOME",
-            ...     "with_shapes": True,
-            ...     "with_channels": True
-            ... }
-            >>> model = Model3D.from_dict(data)
-        """
-        name = values.get("name", "")
-        cad = values["cad"]
-        with_shapes = values.get("with_shapes", False)
-        with_channels = values.get("with_channels", False)
-
-        return cls(name, cad, with_shapes, with_channels)
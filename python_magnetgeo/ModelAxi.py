@@ -12,7 +12,8 @@ Provides definiton for Helix:
 
 
 from .base import YAMLObjectBase
-from .validation import GeometryValidator, ValidationError
+from .schema import Field, is_name
+from .validation import ValidationError
 
 
 class ModelAxi(YAMLObjectBase):
@@ -24,6 +25,12 @@ class ModelAxi(YAMLObjectBase):
     """
 
     yaml_tag = "ModelAxi"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("h", float),
+        Field("turns", list),
+        Field("pitch", list),
+    )
 
     def __init__(
         self,
@@ -98,7 +105,7 @@ class ModelAxi(YAMLObjectBase):
             ...     pitch=[]
             ... )
         """
-        GeometryValidator.validate_name(name)
+        self._validate_fields(name=name)
         if pitch and turns:
             if len(pitch) != len(turns):
                 raise ValidationError(
@@ -162,46 +169,6 @@ class ModelAxi(YAMLObjectBase):
             self.pitch,
         )
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create ModelAxi instance from dictionary representation.
-
-        Standard deserialization method for creating ModelAxi from configuration data.
-
-        Args:
-            values: Dictionary containing ModelAxi configuration with keys:
-                - name (str): Model identifier
-                - h (float): Half-height in mm
-                - turns (list[float]): Turn counts for each section
-                - pitch (list[float]): Pitch values for each section in mm
-            debug: Enable debug output (currently unused)
-
-        Returns:
-            ModelAxi: New ModelAxi instance created from dictionary
-
-        Raises:
-            KeyError: If required keys are missing from dictionary
-            ValidationError: If validation constraints are violated
-
-        Example:
-            >>> data = {
-            ...     "name": "helix_pattern",
-            ...     "h": 112.5,
-            ...     "turns": [10.0, 20.0, 15.0],
-            ...     "pitch": [5.0, 5.0, 5.0]
-            ... }
-            >>> model = ModelAxi.from_dict(data)
-            >>> assert model.name == "helix_pattern"
-            >>> assert model.get_Nturns() == 45.0
-        """
-        name = values["name"]
-        h = values["h"]
-        turns = values["turns"]
-        pitch = values["pitch"]
-
-        return cls(name, h, turns, pitch)
-
     def get_Nturns(self) -> float:
         """
         Calculate the total number of turns across all helical sections.
@@ -243,6 +210,37 @@ class ModelAxi(YAMLObjectBase):
         """
         return sum(self.turns)
 
+    def sections(self):
+        """
+        Array view of the helical sections, with their z and theta breakpoints.
+
+        The view is built on first use and cached while h, turns and pitch
+        keep their values (in-place edits of the lists included).
+
+        Returns:
+            Sections: Breakpoints and vectorized point queries
+            (section_of, theta_at, z_at, pitch_at, density_factor)
+
+        Raises:
+            ValueError: If turns and pitch have different lengths
+
+        Example:
+            >>> model = ModelAxi("test", h=100.0, turns=[10.0, 20.0, 10.0],
+            ...                  pitch=[4.0, 6.0, 4.0])
+            >>> view = model.sections()
+            >>> view.z.tolist()                 # [-100.0, -60.0, 60.0, 100.0]
+            >>> view.section_of([-80.0, 0.0, 80.0])   # array([0, 1, 2])
+        """
+        key = (self.h, tuple(self.turns), tuple(self.pitch))
+        cached = self.__dict__.get("_sections")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        from .sections import Sections
+
+        self._sections = (key, Sections(self.h, self.turns, self.pitch))
+        return self._sections[1]
+
     def compact(self, tol: float = 1.0e-6):
         """
         Consolidate consecutive sections with similar pitch values.
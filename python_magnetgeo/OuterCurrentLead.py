@@ -6,6 +6,7 @@ Provides Inner and OuterCurrentLead class
 """
 
 from .base import YAMLObjectBase
+from .schema import Field, is_ascending, is_name, is_positive, numeric_list
 from .validation import GeometryValidator, ValidationError
 
 
@@ -89,6 +90,13 @@ class OuterCurrentLead(YAMLObjectBase):
     """
 
     yaml_tag = "OuterCurrentLead"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("r", list, validators=(numeric_list(2), is_ascending)),
+        Field("h", float, validators=(is_positive,)),
+        Field("bar", list),
+        Field("support", list),
+    )
 
     def __init__(
         self,
@@ -145,10 +153,7 @@ class OuterCurrentLead(YAMLObjectBase):
             - Support provides mechanical stability and alignment
         """
         # General validation
-        GeometryValidator.validate_name(name)
-        GeometryValidator.validate_numeric_list(r, "r", expected_length=2)
-        GeometryValidator.validate_ascending_order(r, "r")
-        GeometryValidator.validate_positive(h, "h")
+        self._validate_fields(name=name, r=r, h=h)
 
         if bar is not None and bar:
             GeometryValidator.validate_numeric_list(bar, "bar", expected_length=4)
@@ -182,42 +187,3 @@ class OuterCurrentLead(YAMLObjectBase):
             "OuterCurrentLead(name='test', r=[50.0, 60.0], h=100.0, bar=[], support=[])"
         """
         return f"{self.__class__.__name__}(name={self.name!r}, r={self.r!r}, h={self.h!r}, bar={self.bar!r}, support={self.support!r})"
-
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create OuterCurrentLead from dictionary representation.
-
-        Args:
-            values: Dictionary with keys matching constructor parameters:
-                - name: Lead identifier (required)
-                - r: Radial bounds (required)
-                - h: Height (required)
-                - bar: Conductor bar geometry (required)
-                - support: Support structure (required)
-            debug: Enable debug output during construction
-
-        Returns:
-            OuterCurrentLead: New instance constructed from dictionary
-
-        Example:
-            >>> data = {
-            ...     'name': 'lead_from_dict',
-            ...     'r': [52.0, 62.0],
-            ...     'h': 105.0,
-            ...     'bar': [57.0, 12.0, 18.0, 88.0],
-            ...     'support': [7.5, 12.5, 35.0, 0.0]
-            ... }
-            >>> lead = OuterCurrentLead.from_dict(data)
-
-        Notes:
-            - All keys shown in example are expected in the dictionary
-            - Uses standard constructor, so all validation applies
-            - Part of the serialization/deserialization infrastructure
-        """
-        name = values["name"]
-        r = values["r"]
-        h = values["h"]
-        bar = values["bar"]
-        support = values["support"]
-        return cls(name, r, h, bar, support)
@@ -11,6 +11,7 @@ Provides definition for Probe:
 """
 
 from .base import YAMLObjectBase
+from .schema import Field
 
 
 class Probe(YAMLObjectBase):
@@ -22,6 +23,12 @@ class Probe(YAMLObjectBase):
     """
 
     yaml_tag = "Probe"
+    _fields = (
+        Field("name", str),
+        Field("type", str),
+        Field("labels", list),
+        Field("points", list),
+    )
 
     def __init__(
         self,
@@ -59,18 +66,6 @@ class Probe(YAMLObjectBase):
         """
         return f"{self.__class__.__name__}(name={self.name!r}, type={self.type!r}, labels={self.labels!r}, points={self.points!r})"
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        create from dict
-        """
-        name = values["name"]
-        type = values["type"]
-        labels = values["labels"]
-        points = values["points"]
-
-        return cls(name, type, labels, points)
-
     def get_probe_count(self) -> int:
         """
         return the number of probes in this collection
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Optional
 
 from .base import YAMLObjectBase
+from .schema import Field
 from .validation import GeometryValidator
 
 # Module logger
@@ -54,6 +55,11 @@ class Profile(YAMLObjectBase):
     """
 
     yaml_tag = "Profile"
+    _fields = (
+        Field("cad", str),
+        Field("points", list),
+        Field("labels", list, default=None),
+    )
 
     def __init__(self, cad: str, points: list[list[float]], labels: Optional[list[int]] = None):
         """
@@ -109,53 +115,6 @@ class Profile(YAMLObjectBase):
             f"points={self.points!r}, labels={self.labels!r})"
         )
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create a Profile object from a dictionary.
-
-        This method is used for deserialization from YAML/JSON formats.
-        Handles both cases where labels are explicitly provided or omitted.
-
-        Args:
-            values: Dictionary containing 'cad' and 'points' keys,
-                   optionally 'labels' key
-            debug: Enable debug output (default: False)
-
-        Returns:
-            Profile: New instance created from the dictionary data
-
-        Raises:
-            KeyError: If required keys ('cad', 'points') are missing
-            ValidationError: If cad or points data is invalid
-            ValueError: If labels length doesn't match points length
-
-        Example:
-            >>> data = {
-            ...     "cad": "AIRFOIL-A",
-            ...     "points": [[0, 0], [5, 2], [10, 0]],
-            ...     "labels": [0, 1, 0]
-            ... }
-            >>> profile = Profile.from_dict(data)
-            >>>
-            >>> # Without labels
-            >>> data_no_labels = {
-            ...     "cad": "AIRFOIL-B",
-            ...     "points": [[0, 0], [5, 2], [10, 0]]
-            ... }
-            >>> profile = Profile.from_dict(data_no_labels)
-        """
-        cad = values["cad"]
-        points = values["points"]
-        labels = values.get("labels", None)
-
-        logger.debug(
-            f"Creating Profile from dict: cad={cad}, "
-            f"points count={len(points)}, labels={labels}"
-        )
-
-        return cls(cad, points, labels)
-
     def generate_dat_file(self, output_dir: str = ".") -> Path:
         """
         Generate a Shape_{cad}.dat file with the profile data.
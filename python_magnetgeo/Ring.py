@@ -6,7 +6,8 @@ Provides definition for Ring
 """
 
 from .base import YAMLObjectBase
-from .validation import GeometryValidator, ValidationError
+from .schema import Field, is_ascending, is_name, is_non_negative_inner, numeric_list
+from .validation import ValidationError
 
 
 class Ring(YAMLObjectBase):
@@ -18,6 +19,16 @@ class Ring(YAMLObjectBase):
     """
 
     yaml_tag = "Ring"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("r", list, validators=(numeric_list(4), is_ascending, is_non_negative_inner)),
+        Field("z", list, validators=(numeric_list(2), is_ascending)),
+        Field("n", int, default=0),
+        Field("angle", float, default=0),
+        Field("bpside", bool, default=True),
+        Field("fillets", bool, default=False),
+        Field("cad", str, default=""),
+    )
 
     def __init__(
         self,
@@ -113,19 +124,8 @@ class Ring(YAMLObjectBase):
             ...     cad=None  # Will be converted to ''
             ... )
         """
-        # General validation
-        GeometryValidator.validate_name(name)
-
-        # Ring-specific validation
-        GeometryValidator.validate_numeric_list(r, "r", expected_length=4)
-        GeometryValidator.validate_ascending_order(r, "r")
-
-        GeometryValidator.validate_numeric_list(z, "z", expected_length=2)
-        GeometryValidator.validate_ascending_order(z, "z")
-
-        # Additional Ring-specific checks
-        if r[0] < 0:
-            raise ValidationError("Inner radius cannot be negative")
+        # Validation declared in _fields
+        self._validate_fields(name=name, r=r, z=z)
 
         # Check ring cooling slits
         if n * angle > 360:
@@ -143,80 +143,6 @@ class Ring(YAMLObjectBase):
         self.fillets = fillets
         self.cad = cad or ""
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create Ring instance from dictionary representation.
-
-        Standard deserialization method with default values for optional parameters.
-        Includes debug output to trace the deserialization process.
-
-        Args:
-            values: Dictionary containing Ring configuration with keys:
-                - name (str): Ring identifier (required)
-                - r (list[float]): Four radial values (required)
-                - z (list[float]): Two axial values (required)
-                - n (int, optional): Number of cooling slits. Default: 0
-                - angle (float, optional): Slit angular width. Default: 0
-                - bpside (bool, optional): Connection side. Default: True
-                - fillets (bool, optional): Include fillets. Default: False
-                - cad (str, optional): CAD identifier. Default: ''
-            debug: Enable debug output showing dictionary values
-
-        Returns:
-            Ring: New Ring instance created from dictionary
-
-        Raises:
-            KeyError: If required keys ('name', 'r', 'z') are missing
-            ValidationError: If validation constraints are violated
-
-        Notes:
-            - Debug mode prints the input dictionary values
-            - All optional parameters have sensible defaults
-            - CAD value defaults to empty string if not provided or None
-
-        Example:
-            >>> # Full specification
-            >>> data = {
-            ...     "name": "Ring-H1H2",
-            ...     "r": [100.0, 120.0, 110.0, 130.0],
-            ...     "z": [250.0, 280.0],
-            ...     "n": 8,
-            ...     "angle": 20.0,
-            ...     "bpside": True,
-            ...     "fillets": True,
-            ...     "cad": "SALOME"
-            ... }
-            >>> ring = Ring.from_dict(data)
-
-            >>> # Minimal specification (uses defaults)
-            >>> minimal = {
-            ...     "name": "SimpleRing",
-            ...     "r": [95.0, 115.0, 100.0, 120.0],
-            ...     "z": [300.0, 325.0]
-            ... }
-            >>> ring2 = Ring.from_dict(minimal)
-            >>> assert ring2.n == 0
-            >>> assert ring2.angle == 0
-            >>> assert ring2.bpside == True
-            >>> assert ring2.fillets == False
-            >>> assert ring2.cad == ''
-
-            >>> # With debug output
-            >>> ring3 = Ring.from_dict(data, debug=True)
-            >>> # Prints: Ring.fromdict: values={...}
-        """
-        return cls(
-            name=values["name"],
-            r=values["r"],
-            z=values["z"],
-            n=values.get("n", 0),
-            angle=values.get("angle", 0),
-            bpside=values.get("bpside", True),
-            fillets=values.get("fillets", False),
-            cad=values.get("cad", ""),
-        )
-
     def get_lc(self) -> float:
         """
         Calculate characteristic mesh length for the ring geometry.
@@ -13,6 +13,7 @@ Classes:
 """
 
 from .base import YAMLObjectBase
+from .schema import Field
 
 
 class Screen(YAMLObjectBase):
@@ -53,6 +54,11 @@ class Screen(YAMLObjectBase):
     """
 
     yaml_tag = "Screen"
+    _fields = (
+        Field("name", str),
+        Field("r", list),
+        Field("z", list),
+    )
 
     def __init__(
         self,
@@ -209,17 +215,6 @@ class Screen(YAMLObjectBase):
         """
         return f"{self.__class__.__name__}(name={self.name!r}, r={self.r!r}, z={self.z!r})"
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        create from dict
-        """
-        name = values["name"]
-        r = values["r"]
-        z = values["z"]
-
-        return cls(name, r, z)
-
     def boundingBox(self) -> tuple:
         """
         return Bounding as r[], z[]
@@ -4,11 +4,12 @@
 """
 Provides definition for Shape with Position enum
 """
-import os
 from enum import Enum
 
 from .base import YAMLObjectBase
 from .Profile import Profile
+from .lazy import load_reference
+from .utils import get_basedir
 from .validation import GeometryValidator, ValidationError
 
 from .logging_config import get_logger
@@ -153,7 +154,7 @@ class Shape(YAMLObjectBase):
         if profile is not None and isinstance(profile, str):
             if not profile.strip():
                 raise ValidationError("Profile name cannot be an empty string")
-            self.profile = Profile.from_yaml(f"{profile}.yaml")
+            self.profile = load_reference(f"{profile}.yaml", Profile)
         else:
             self.profile = profile
 
@@ -178,7 +179,7 @@ class Shape(YAMLObjectBase):
             )
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
 
     def __repr__(self):
         """
@@ -318,3 +319,21 @@ class Shape(YAMLObjectBase):
             onturns=values.get("onturns", [1]),
             position=values.get("position", "ABOVE"),
         )
+
+    @classmethod
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
+        """
+        Analyze nested dependencies specific to Shape class.
+
+        Identifies the file that would be loaded for the profile.
+        Empty profile names are ignored, as in from_dict.
+
+        Args:
+            values: Dictionary containing shape parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
+        """
+        profile = values.get("profile")
+        if isinstance(profile, str) and not profile.strip():
+            return
+        cls._analyze_single_dependency(profile, Profile, required_files, debug=debug)
@@ -8,12 +8,19 @@ Provides definition for Supra:
 * Model Axi: definition of helical cut (provided from MagnetTools)
 * Model 3D: actual 3D CAD
 """
-import os
 
 from .base import YAMLObjectBase
 from .enums import DetailLevel
+from .schema import Field, is_ascending, is_name, numeric_list
 from .SupraStructure import HTSInsert
-from .validation import GeometryValidator
+from .utils import get_basedir
+
+
+def _detail_level(value):
+    """Convert a detail level read from a dictionary (case-insensitive string) to enum."""
+    if isinstance(value, str):
+        return DetailLevel(value.upper())
+    return value
 
 
 class Supra(YAMLObjectBase):
@@ -41,6 +48,14 @@ class Supra(YAMLObjectBase):
     """
 
     yaml_tag = "Supra"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("r", list, validators=(numeric_list(2), is_ascending)),
+        Field("z", list, validators=(numeric_list(2), is_ascending)),
+        Field("n", int, default=0),
+        Field("struct", str, default=None),
+        Field("detail", DetailLevel, default="NONE", convert=_detail_level),
+    )
 
     def __init__(
         self,
@@ -74,14 +89,8 @@ class Supra(YAMLObjectBase):
             - detail attribute is initialized to "None" by default
             - If struct is provided, use check_dimensions() to sync geometry
         """
-        # General validation
-        GeometryValidator.validate_name(name)
-
-        GeometryValidator.validate_numeric_list(r, "r", expected_length=2)
-        GeometryValidator.validate_ascending_order(r, "r")
-
-        GeometryValidator.validate_numeric_list(z, "z", expected_length=2)
-        GeometryValidator.validate_ascending_order(z, "z")
+        # Validation declared in _fields
+        self._validate_fields(name=name, r=r, z=z)
 
         self.name = name
         self.r = r
@@ -92,7 +101,7 @@ class Supra(YAMLObjectBase):
         self.detail = detail
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
 
     def get_magnet_struct(self) -> HTSInsert:
         """
@@ -275,49 +284,6 @@ class Supra(YAMLObjectBase):
         """
         return f"{self.__class__.__name__}(name={self.name!r}, r={self.r!r}, z={self.z!r}, n={self.n}, struct={self.struct!r}, detail={self.detail!r})"
 
-    @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
-        """
-        Create Supra instance from dictionary representation.
-
-        Args:
-            values: Dictionary containing Supra parameters with keys:
-                - name: Component identifier (required)
-                - r: Radial bounds [r_inner, r_outer] (required)
-                - z: Axial bounds [z_bottom, z_top] (required)
-                - n: Number of turns (optional, default 0)
-                - struct: Structure file path (optional, default "")
-            debug: Enable debug output during deserialization
-
-        Returns:
-            Supra: New Supra instance
-
-        Example:
-            >>> data = {
-            ...     'name': 'M1',
-            ...     'r': [10.0, 20.0],
-            ...     'z': [0.0, 50.0],
-            ...     'n': 5,
-            ...     'struct': 'hts_config.yaml'
-            ... }
-            >>> supra = Supra.from_dict(data)
-        """
-        name = values["name"]
-        r = values["r"]
-        z = values["z"]
-        n = values.get("n", 0)
-
-        struct = values.get("struct", None)
-
-        # Handle detail field: convert string to enum
-        detail_value = values.get("detail", "NONE")
-        if isinstance(detail_value, str):
-            detail = DetailLevel(detail_value.upper())
-        else:
-            detail = detail_valueobject = cls(name, r, z, n, struct)
-
-        return cls(name, r, z, n, struct, detail)
-
     def get_Nturns(self) -> int:
         """
         Get the number of turns in the superconducting magnet.
@@ -3,13 +3,14 @@
 
 """defines Supra Insert structure"""
 
-import os
 
 from .base import YAMLObjectBase
+from .schema import Field, is_name
 from .Probe import Probe
 from .Supra import Supra
-from .utils import getObject
-from .validation import GeometryValidator, ValidationError
+from .lazy import load_reference
+from .utils import get_basedir
+from .validation import ValidationError
 
 # Module logger
 from .logging_config import get_logger
@@ -37,6 +38,13 @@ class Supras(YAMLObjectBase):
     """
 
     yaml_tag = "Supras"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("magnets", nested=Supra, many=True, default=None),
+        Field("innerbore", float, default=0),
+        Field("outerbore", float, default=0),
+        Field("probes", nested=Probe, many=True, default=None),
+    )
 
     def __init__(
         self, name: str, magnets: list, innerbore: float, outerbore: float, probes: list = None
@@ -64,7 +72,7 @@ class Supras(YAMLObjectBase):
             from corresponding YAML files (e.g., "magnet_name" → "magnet_name.yaml")
         """
         # Validate inputs
-        GeometryValidator.validate_name(name)
+        self._validate_fields(name=name)
 
         # Validate bore dimensions if not zero (zero means not specified)
         if innerbore != 0 and outerbore != 0:
@@ -77,7 +85,7 @@ class Supras(YAMLObjectBase):
         self.magnets = []
         for magnet in magnets:
             if isinstance(magnet, str):
-                self.magnets.append(getObject(f"{magnet}.yaml"))
+                self.magnets.append(load_reference(f"{magnet}.yaml"))
             else:
                 self.magnets.append(magnet)
         self.innerbore = innerbore
@@ -87,7 +95,7 @@ class Supras(YAMLObjectBase):
         if probes is not None:
             for probe in probes:
                 if isinstance(probe, str):
-                    self.probes.append(Probe.from_yaml(f"{probe}.yaml"))
+                    self.probes.append(load_reference(f"{probe}.yaml", Probe))
                 else:
                     self.probes.append(probe)
 
@@ -133,7 +141,7 @@ class Supras(YAMLObjectBase):
                     )
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
 
     def __repr__(self):
         """
@@ -149,36 +157,19 @@ class Supras(YAMLObjectBase):
         )
 
     @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
-        Create Supras instance from dictionary representation.
+        Analyze nested dependencies specific to Supras class.
 
-        Handles nested Supra and Probe objects properly, supporting both
-        inline objects (dicts) and string references to external files.
+        Identifies files that would be loaded for Supra magnets and probes.
 
         Args:
-            values: Dictionary containing Supras data with keys:
-                - name: Collection identifier (required)
-                - magnets: List of Supra objects/dicts/strings (required)
-                - innerbore: Inner bore radius (optional, default 0)
-                - outerbore: Outer bore radius (optional, default 0)
-                - probes: List of Probe objects/dicts/strings (optional)
-            debug: Enable debug output for nested object loading
-
-        Returns:
-            Supras: New Supras instance
-
-        Notes:
-            Uses helper methods to handle complex nested object loading
+            values: Dictionary containing supras parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
         """
-        magnets = cls._load_nested_list(values.get("magnets"), Supra, debug=debug)
-        probes = cls._load_nested_list(values.get("probes"), Probe, debug=debug)
-
-        name = values["name"]
-        innerbore = values.get("innerbore", 0)
-        outerbore = values.get("outerbore", 0)
-
-        return cls(name, magnets, innerbore, outerbore, probes)
+        cls._analyze_list_dependency(values.get("magnets"), Supra, required_files, debug=debug)
+        cls._analyze_list_dependency(values.get("probes"), Probe, required_files, debug=debug)
 
     def get_channels(self, mname: str, hideIsolant: bool = True, debug: bool = False) -> dict:
         """
@@ -18,20 +18,8 @@ Usage:
 __author__ = "Christophe Trophime"
 __email__ = "christophe.trophime@lncmi.cnrs.fr"
 
-# Version is read from package metadata (defined in pyproject.toml)
-# This ensures a single source of truth for the version number
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:
-    # Fallback for Python < 3.8 (though we require 3.11+)
-    from importlib_metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version("python-magnetgeo")
-except PackageNotFoundError:
-    # Package not installed (e.g., running from source without install)
-    # This is expected during development before running `pip install -e .`
-    __version__ = "0.0.0+unknown"
+import sys
+import types
 
 # Import logging configuration
 from .logging_config import (
@@ -40,6 +28,8 @@ from .logging_config import (
     set_level,
     disable_logging,
     enable_logging,
+    set_production_mode,
+    is_production_mode,
     DEBUG,
     INFO,
     WARNING,
@@ -51,6 +41,10 @@ from .logging_config import (
 from .base import YAMLObjectBase, SerializableMixin
 from .validation import ValidationError, ValidationWarning, GeometryValidator
 from .utils import getObject as load, loadObject, ObjectLoadError, UnsupportedTypeError
+from .cache import enable_cache, disable_cache, clear_cache, cache_info
+from .interning import interning, unshare
+from .lazy import lazy_loading
+from .deferred import deferred_validation, DeferredValidationError
 
 # Define what gets imported with "from python_magnetgeo import *"
 __all__ = [
@@ -59,12 +53,56 @@ __all__ = [
     "loadObject",
     "list_registered_classes",
     "verify_class_registration",
+    # Parse cache
+    "enable_cache",
+    "disable_cache",
+    "clear_cache",
+    "cache_info",
+    # Interning of identical nested objects
+    "interning",
+    "unshare",
+    # Parallel prefetch of nested references
+    "prefetching",
+    # asyncio loading
+    "aload",
+    "aload_many",
+    # Lazy loading of nested references
+    "lazy_loading",
+    # Transitive dependency analysis
+    "dependency_graph",
+    "clear_dependency_cache",
+    # Binary snapshots
+    "save_snapshot",
+    "load_snapshot",
+    "load_with_snapshot",
+    "StaleSnapshotError",
+    # Class dispatch of inline dictionaries
+    "dispatch_stats",
+    "reset_dispatch_stats",
+    # Streaming YAML construction
+    "load_streaming",
+    "iter_components",
+    # Deferred bulk validation
+    "deferred_validation",
+    "DeferredValidationError",
+    # Hot reload of edited files
+    "GeometryWatcher",
+    "ReloadEvent",
+    # One file per nested object
+    "write_tree",
+    "WriteReport",
+    # Array view of the helical sections of a ModelAxi
+    "Sections",
+    # Samples of the helical cut paths
+    "CutSamples",
     # Logging
     "configure_logging",
     "get_logger",
     "set_level",
     "disable_logging",
     "enable_logging",
+    "set_production_mode",
+    "is_production_mode",
     "DEBUG",
     "INFO",
     "WARNING",
@@ -103,39 +141,59 @@ __all__ = [
 ]
 
 # Lazy loading map: maps class names to their module paths
-_LAZY_IMPORTS = {
-    "Insert": "Insert",
-    "Helix": "Helix",
-    "Ring": "Ring",
-    "Bitter": "Bitter",
-    "Supra": "Supra",
-    "Supras": "Supra",
-    "Bitters": "Bitter",
-    "Screen": "Screen",
-    "MSite": "MSite",
-    "Probe": "Probe",
-    "Shape": "Shape",
-    "ModelAxi": "ModelAxi",
-    "Model3D": "Model3D",
-    "InnerCurrentLead": "CurrentLead",
-    "OuterCurrentLead": "CurrentLead",
-    "Contour2D": "Contour2D",
-    "Chamfer": "Chamfer",
-    "Groove": "Groove",
-    "Tierod": "Tierod",
-    "CoolingSlit": "CoolingSlit",
+# (the index also used to register the YAML constructors on first use)
+from .registry import CLASS_MODULES as _LAZY_IMPORTS
+
+# Functions and classes of the optional features, imported on first access
+# so that "import python_magnetgeo" only pays for loading geometry files
+_LAZY_ATTRIBUTES = {
+    "prefetching": "prefetch",
+    "aload": "aio",
+    "aload_many": "aio",
+    "dependency_graph": "dependencies",
+    "clear_dependency_cache": "dependencies",
+    "save_snapshot": "snapshot",
+    "load_snapshot": "snapshot",
+    "load_with_snapshot": "snapshot",
+    "StaleSnapshotError": "snapshot",
+    "dispatch_stats": "dispatch",
+    "reset_dispatch_stats": "dispatch",
+    "load_streaming": "streaming",
+    "iter_components": "streaming",
+    "GeometryWatcher": "watch",
+    "ReloadEvent": "watch",
+    "write_tree": "layout",
+    "WriteReport": "layout",
+    "Sections": "sections",
+    "CutSamples": "trajectory",
 }
 
 # Cache for loaded modules
 _loaded_classes = {}
 
 
+def _version() -> str:
+    # Version is read from package metadata (defined in pyproject.toml)
+    # This ensures a single source of truth for the version number.
+    # importlib.metadata takes longer to import than the whole package:
+    # it is only imported when __version__ is first read
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        return version("python-magnetgeo")
+    except PackageNotFoundError:
+        # Package not installed (e.g., running from source without install)
+        # This is expected during development before running `pip install -e .`
+        return "0.0.0+unknown"
+
+
 def __getattr__(name):
     """
     Lazy loading implementation.
 
     This function is called when an attribute is not found in the module.
-    We use it to lazily import geometry classes only when they're accessed.
+    We use it to lazily import geometry classes only when they're accessed,
+    as well as __version__ and the functions of the optional features.
 
     Args:
         name: Attribute name being accessed
@@ -147,6 +205,15 @@ def __getattr__(name):
         >>> import python_magnetgeo as pmg
         >>> helix = pmg.Helix(...)  # Helix is imported here, not at initial import
     """
+    if name == "__version__":
+        globals()[name] = _version()
+        return globals()[name]
+
+    if name in _LAZY_ATTRIBUTES:
+        module = __import__(f"python_magnetgeo.{_LAZY_ATTRIBUTES[name]}", fromlist=[name])
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+
     # Check if it's a known geometry class
     if name in _LAZY_IMPORTS:
         # Check cache first
@@ -172,6 +239,30 @@ def __getattr__(name):
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
+class _Package(types.ModuleType):
+    """
+    Module type of the package, keeping pmg.Helix the Helix class.
+
+    Importing a submodule (e.g. python_magnetgeo.Helix, by any loader)
+    binds it as an attribute of the package, which would then hide the
+    class of the same name: the class is bound instead. The modules stay
+    available in sys.modules.
+
+    Notes:
+        "import python_magnetgeo.Helix as m" reads the same attribute, so m
+        is the Helix class; use importlib.import_module for the module
+        (see BREAKING_CHANGES.md)
+    """
+
+    def __setattr__(self, name, value):
+        if name in _LAZY_IMPORTS and isinstance(value, types.ModuleType):
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
 def __dir__():
     """
     Return list of available attributes for tab-completion.
@@ -184,6 +275,8 @@ def __dir__():
 
     # Add all lazy-loadable classes
     attrs.extend(_LAZY_IMPORTS.keys())
+    attrs.extend(_LAZY_ATTRIBUTES.keys())
+    attrs.append("__version__")
 
     return sorted(set(attrs))
 
@@ -211,7 +304,9 @@ def verify_class_registration():
     Verify that all expected classes are registered with YAML system.
 
     This is mainly for testing and validation. It imports all classes
-    to ensure they're properly registered as YAML types.
+    to ensure they're properly registered as YAML types. Loading files does
+    not need it: the class of a tag is imported when the tag is first met
+    (see registry module).
 
     Raises:
         AssertionError: If expected classes are missing
@@ -224,28 +319,7 @@ def verify_class_registration():
         >>> pmg.verify_class_registration()
         True
     """
-    expected_classes = [
-        "Insert",
-        "Helix",
-        "Ring",
-        "Bitter",
-        "Supra",
-        "Supras",
-        "Bitters",
-        "Screen",
-        "MSite",
-        "Probe",
-        "Shape",
-        "ModelAxi",
-        "Model3D",
-        "InnerCurrentLead",
-        "OuterCurrentLead",
-        "Contour2D",
-        "Chamfer",
-        "Groove",
-        "Tierod",
-        "CoolingSlit",
-    ]
+    expected_classes = list(_LAZY_IMPORTS)
 
     # Force loading of all classes
     for class_name in expected_classes:
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+asyncio loading API.
+
+aload and aload_many are the coroutine counterparts of getObject (pmg.load)
+for applications running an event loop. The event loop is never blocked:
+
+- the YAML file and every file it references (helices, rings, leads,
+  probes, modelaxi, shapes, ...) are read and parsed in worker threads,
+  all references of a tree being fetched concurrently
+- the tree is then built by getObject in a worker thread, from the
+  pre-parsed documents
+
+Construction and validation run exactly as in the synchronous path, so the
+objects, and the errors raised for invalid or missing files, are the same
+as those of pmg.load.
+
+Example:
+    >>> import asyncio
+    >>> import python_magnetgeo as pmg
+    >>> insert = asyncio.run(pmg.aload("HL-31.yaml"))
+    >>> sites = asyncio.run(pmg.aload_many(["M9.yaml", "M10.yaml"]))
+
+Notes:
+    - JSON files are loaded by getObject in a worker thread, without
+      concurrent resolution of their references
+    - Relative filenames are resolved against the base directory of the
+      calling context (see utils.get_basedir)
+"""
+
+import asyncio
+from typing import Any, Iterable
+
+from .logging_config import get_logger
+from .prefetch import Prefetcher, fetch, using
+from .utils import getObject, resolve_path
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class _Crawler:
+    """
+    Reads and parses files and their references concurrently.
+
+    Documents are shared by all the trees loaded with the same crawler,
+    each file being read once.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def schedule(self, path: str) -> asyncio.Task:
+        task = self._tasks.get(path)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(path))
+            self._tasks[path] = task
+        return task
+
+    async def _fetch(self, path: str):
+        async with self._semaphore:
+            node, references = await asyncio.to_thread(fetch, path)
+        for reference in references:
+            self.schedule(reference)
+        return node, references
+
+    async def tree(self, path: str) -> Prefetcher:
+        """
+        Fetch path and everything it references.
+
+        Returns:
+            Prefetcher: holding the parsed documents (or read/parse errors)
+        """
+        prefetcher = Prefetcher(max_workers=1)
+        pending = [path]
+        while pending:
+            path = pending.pop()
+            if path in prefetcher:
+                continue
+            try:
+                node, references = await self.schedule(path)
+            except Exception as e:
+                # re-raised by loadYaml if and when the file is needed
+                prefetcher.add(path, error=e)
+                continue
+            prefetcher.add(path, node)
+            pending.extend(references)
+        return prefetcher
+
+    def cancel(self) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+
+
+def _build(filename: str, prefetcher: Prefetcher | None) -> Any:
+    if prefetcher is None:
+        return getObject(filename)
+    try:
+        with using(prefetcher):
+            return getObject(filename)
+    finally:
+        prefetcher.close()
+
+
+async def _aload(filename: str, crawler: _Crawler) -> Any:
+    prefetcher = None
+    if filename.endswith(".yaml") or filename.endswith(".yml"):
+        prefetcher = await crawler.tree(resolve_path(filename))
+        logger.debug("aload: %d files fetched for %s", prefetcher.fetched, filename)
+    return await asyncio.to_thread(_build, filename, prefetcher)
+
+
+async def aload(filename: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Any:
+    """
+    Load an object from a YAML or JSON file without blocking the event loop.
+
+    Args:
+        filename: Path to YAML or JSON file
+        max_concurrency: Maximum number of files read at the same time
+
+    Returns:
+        Loaded and updated object, identical to getObject(filename)
+
+    Raises:
+        ObjectLoadError: As getObject
+        ValidationError: As getObject
+    """
+    results = await aload_many([filename], max_concurrency=max_concurrency)
+    return results[0]
+
+
+async def aload_many(
+    filenames: Iterable[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Load several objects concurrently without blocking the event loop.
+
+    Files referenced by several trees are read and parsed only once.
+
+    Args:
+        filenames: Paths to YAML or JSON files
+        max_concurrency: Maximum number of files read at the same time
+        return_exceptions: Return load errors in place of the objects
+                           instead of raising the first one
+
+    Returns:
+        List of loaded objects, in the order of filenames
+
+    Raises:
+        ObjectLoadError: As getObject, unless return_exceptions is True
+        ValidationError: As getObject, unless return_exceptions is True
+
+    Example:
+        >>> sites = await aload_many(glob.glob("sites/*.yaml"))
+    """
+    crawler = _Crawler(max_concurrency)
+    try:
+        return await asyncio.gather(
+            *(_aload(filename, crawler) for filename in filenames),
+            return_exceptions=return_exceptions,
+        )
+    finally:
+        crawler.cancel()
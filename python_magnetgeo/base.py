@@ -44,13 +44,15 @@ Example:
     >>> MyGeometry.from_yaml("test.yaml")  # Loads from YAML
 """
 
-import json
+import os
 from abc import abstractmethod
 from typing import Any, Type, TypeVar
 
 import yaml
 
+from . import interning
 from .logging_config import get_logger
+from .utils import YamlDumper, YamlLoader
 from .visualization import VisualizableMixin
 
 # Get logger for this module
@@ -74,6 +76,8 @@ class SerializableMixin:
         - write_to_json(): Write object to JSON file
         - load_from_yaml(): Load object from YAML file (classmethod)
         - load_from_json(): Load object from JSON file (classmethod)
+        - pack(): Write object and its references to a bundle file
+        - unpack(): Load object from a bundle file (classmethod)
         - from_dict(): Create object from dictionary (must be implemented by subclass)
 
     Notes:
@@ -134,10 +138,15 @@ class SerializableMixin:
 
         Notes:
             - Uses PyYAML's default_flow_style=False for readable output
+            - Uses the libyaml emitter (CDumper) when available
             - Includes custom YAML tag (e.g., !<Ring>)
             - Recursively handles embedded objects with their YAML tags
+            - Memoized per object: unchanged nested objects are not emitted
+              again (see fragments module, and mark_modified)
         """
-        return yaml.dump(self, default_flow_style=False, sort_keys=False)
+        from .fragments import to_yaml
+
+        return to_yaml(self)
 
     def to_json(self) -> str:
         """
@@ -165,10 +174,27 @@ class SerializableMixin:
             - Uses 4-space indentation
             - Keys are sorted alphabetically
             - Delegates to deserialize.serialize_instance for object encoding
+            - Memoized per object like to_yaml
+        """
+        from .fragments import to_json
+
+        return to_json(self)
+
+    def mark_modified(self) -> None:
+        """
+        Drop the memoized to_yaml/to_json output of this object.
+
+        Assigning a public attribute, or editing a list or dict of plain
+        data in place (helix.r[0] = 10.5), is detected automatically; call
+        it after editing any other mutable attribute in place.
+
+        Example:
+            >>> helix.extra.add("tag")   # a set: not compared by value
+            >>> helix.mark_modified()
         """
-        from . import deserialize
+        from .fragments import mark_modified
 
-        return json.dumps(self, default=deserialize.serialize_instance, sort_keys=True, indent=4)
+        mark_modified(self)
 
     def write_to_json(self, filename: str | None = None, directory: str | None = None) -> None:
         """
@@ -213,6 +239,98 @@ class SerializableMixin:
         except Exception as e:
             raise Exception(f"Failed to write {self.__class__.__name__} to {filename}: {e}") from e
 
+    def pack(self, filename: str | None = None, directory: str | None = None) -> str:
+        """
+        Write this object and everything it references to a single bundle file.
+
+        Every nested object loaded from its own YAML file is stored once, under
+        its original file name, so that the original file layout can be
+        restored (see bundle module).
+
+        Args:
+            filename: Optional custom filename. If None, uses "{object.name}.mgpack"
+            directory: Optional directory path where the file should be created.
+                      If None, uses current directory.
+
+        Returns:
+            str: Path of the written bundle
+
+        Example:
+            >>> msite = MSite.from_yaml("M9.yaml")
+            >>> msite.pack()  # Creates M9.mgpack
+            'M9.mgpack'
+        """
+        import os
+
+        from .bundle import BUNDLE_EXTENSION, pack
+
+        if filename is None:
+            name = getattr(self, "name", self.__class__.__name__)
+            filename = f"{name}{BUNDLE_EXTENSION}"
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            filename = os.path.join(directory, filename)
+
+        return pack(self, filename)
+
+    def write_tree(self, directory: str, policy=None, max_workers: int = 8):
+        """
+        Write this object and its nested objects as one YAML file each.
+
+        Nested objects selected by the policy are written to their own
+        {name}.yaml file and referenced by name in their parent; files whose
+        content did not change are left untouched (see layout module).
+
+        Args:
+            directory: Directory where the files are written
+            policy: Classes or class names of the nested objects written to
+                    their own file, or a predicate; None to split every named
+                    nested object
+            max_workers: Number of threads writing files
+
+        Returns:
+            WriteReport: Written and unchanged files
+
+        Example:
+            >>> msite = MSite.from_yaml("M9.yaml")
+            >>> msite.write_tree("M9", policy=["Insert", "Helix", "Ring"]).root
+            'M9/M9.yaml'
+        """
+        from .layout import write_tree
+
+        return write_tree(self, directory, policy, max_workers)
+
+    @classmethod
+    def unpack(
+        cls: Type[T], filename: str, component: str | None = None, directory: str | None = None
+    ) -> T:
+        """
+        Load an object from a bundle file written by pack().
+
+        Args:
+            filename: Path to the bundle file
+            component: Name of a single component to load (its original file
+                      name without extension, e.g. "HL-31_H1"). If None, loads
+                      the whole tree.
+            directory: Optional directory where all components are also
+                      written back as YAML files, with their original names
+
+        Returns:
+            Instance of the class loaded from the bundle
+
+        Raises:
+            ObjectLoadError: If the bundle or component cannot be read
+            UnsupportedTypeError: If the loaded object is of another class
+
+        Example:
+            >>> msite = MSite.unpack("M9.mgpack")
+            >>> helix = Helix.unpack("M9.mgpack", "HL-31_H1")
+        """
+        from .bundle import unpack_as
+
+        return unpack_as(cls, filename, component, directory)
+
     @classmethod
     def load_from_yaml(cls: Type[T], filename: str, debug: bool = True) -> T:
         """
@@ -249,7 +367,7 @@ class SerializableMixin:
         from .utils import loadYaml
 
         logger.debug(
-            f"SerializableMixin.load_from_yaml: Loading {cls.__name__} from {filename}",
+            "SerializableMixin.load_from_yaml: Loading %s from %s", cls.__name__, filename
         )
         return loadYaml(cls.__name__, filename, cls, debug)
 
@@ -341,8 +459,8 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
     All geometry classes (Helix, Ring, Insert, Supra, etc.) inherit from this base.
 
     Class Attributes:
-        yaml_loader: YAML loader class (default: yaml.FullLoader)
-        yaml_dumper: YAML dumper class (default: yaml.Dumper)
+        yaml_loader: YAML loader class (default: utils.YamlLoader, libyaml when available)
+        yaml_dumper: YAML dumper class (default: utils.YamlDumper, libyaml when available)
         yaml_tag: YAML type annotation (e.g., "!<Helix>") - must be set by subclass
 
     Automatic Features:
@@ -356,6 +474,14 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
     # Class registry - shared across all subclasses
     _class_registry = {}
 
+    def __getstate__(self):
+        # memoized output is not worth pickling (parse cache, snapshots, deepcopy)
+        if "_fragments" not in self.__dict__:
+            return self.__dict__
+        state = dict(self.__dict__)
+        del state["_fragments"]
+        return state
+
     def __init_subclass__(cls, **kwargs):
         """
         Automatically register YAML constructors for all subclasses.
@@ -376,6 +502,12 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
         if not hasattr(cls, "yaml_tag") or not cls.yaml_tag:
             raise ValueError(f"Class {cls.__name__} must define a yaml_tag")
 
+        # Generate from_dict and validators from a declared field schema
+        if "_fields" in cls.__dict__:
+            from .schema import build_schema
+
+            build_schema(cls)
+
         # Auto-register YAML constructor
         def constructor(loader, node):
             """
@@ -419,11 +551,10 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
         yaml.add_constructor(cls.yaml_tag, constructor)
         yaml.add_representer(cls, representer)
 
-        # Optional: print confirmation (remove in production)
-        import os
-
-        if os.getenv("SPHINX_BUILD") != "1":
-            logger.info(f"Auto-registered YAML constructor and representer for {cls.__name__}")
+        # yaml.add_constructor/add_representer only target the pure-Python
+        # Loader/Dumper classes, so register on the ones used by utils too
+        yaml.add_constructor(cls.yaml_tag, constructor, Loader=YamlLoader)
+        yaml.add_representer(cls, representer, Dumper=YamlDumper)
 
     @classmethod
     def get_class(cls, name: str):
@@ -440,7 +571,13 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
             >>> Ring_class = YAMLObjectBase.get_class('Ring')
             >>> ring = Ring_class.from_dict(data)
         """
-        return cls._class_registry.get(name)
+        found = cls._class_registry.get(name)
+        if found is None:
+            # not imported yet (see registry module)
+            from .registry import import_class
+
+            found = import_class(name)
+        return found
 
     @classmethod
     def get_all_classes(cls):
@@ -467,7 +604,7 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
         Returns:
             Instance loaded from YAML file
         """
-        logger.debug(f"YAMLObjectBase.from_yaml: Loading {cls.__name__} from {filename}")
+        logger.debug("YAMLObjectBase.from_yaml: Loading %s from %s", cls.__name__, filename)
         return cls.load_from_yaml(filename, debug)
 
     @classmethod
@@ -484,6 +621,35 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
         """
         return cls.load_from_json(filename, debug)
 
+    @classmethod
+    def _from_inline_dict(cls, data: dict, classes_to_try: tuple, debug=False):
+        """
+        Create an object from an inline dictionary.
+
+        With several candidate classes, the class is picked by the dispatch
+        table of the candidate set (see dispatch.py); only ambiguous
+        dictionaries fall back to trying each class in turn.
+
+        Returns:
+            tuple: (True, object, None) on success, (False, None, last error)
+                   otherwise; from_dict may return None on success (e.g. a
+                   Shape without profile)
+        """
+        if len(classes_to_try) > 1:
+            from .dispatch import dispatcher
+
+            selected = dispatcher(classes_to_try).select(data)
+            if selected is not None:
+                classes_to_try = (selected,)
+
+        last_error = None
+        for candidate_class in classes_to_try:
+            try:
+                return True, candidate_class.from_dict(data, debug=debug), None
+            except (KeyError, TypeError, ValueError) as e:
+                last_error = e
+        return False, None, last_error
+
     @classmethod
     def _load_nested_list(cls, data, object_class, debug=False):
         """
@@ -500,7 +666,8 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
             debug: Enable debug output
 
         Returns:
-            List of instantiated objects
+            List of instantiated objects (shared canonical instances
+            inside an interning() scope)
 
         Example:
             helices = cls._load_nested_list(data, Helix, debug)
@@ -522,27 +689,18 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
         for i, item in enumerate(data):
             if isinstance(item, str):
                 # String reference → load from file
-                logger.debug(f"Loading object[{i}] from file: {item}")
-                from .utils import getObject
+                logger.debug("Loading object[%d] from file: %s", i, item)
+                from .lazy import load_reference
 
                 filename = f"{item}.yaml"
-                obj = getObject(filename)
-                objects.append(obj)
+                obj = load_reference(filename, candidates=object_class)
+                objects.append(interning.intern(obj))
 
             elif isinstance(item, dict):
-                # Inline dictionary → try each class until one works
-                logger.debug(f"Creating object[{i}] from inline dict")
+                # Inline dictionary → dispatched class, or each class in turn
+                logger.debug("Creating object[%d] from inline dict", i)
 
-                obj = None
-                last_error = None
-
-                for candidate_class in classes_to_try:
-                    try:
-                        obj = candidate_class.from_dict(item, debug=debug)
-                        break
-                    except (KeyError, TypeError, ValueError) as e:
-                        last_error = e
-                        continue
+                _, obj, last_error = cls._from_inline_dict(item, classes_to_try, debug)
 
                 if obj is None:
                     class_names = [c.__name__ for c in classes_to_try]
@@ -551,11 +709,11 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
                         f"Last error: {last_error}"
                     )
 
-                objects.append(obj)
+                objects.append(interning.intern(obj))
 
             elif item is None:
                 # Skip None values
-                logger.debug(f"Skipping None value at index {i}")
+                logger.debug("Skipping None value at index %d", i)
                 continue
 
             else:
@@ -566,7 +724,7 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
                         f"Expected one of {class_names}, str, or dict, "
                         f"got {type(item).__name__} at index {i}"
                     )
-                objects.append(item)
+                objects.append(interning.intern(item))
 
         return objects
 
@@ -587,7 +745,8 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
             debug: Enable debug output
 
         Returns:
-            Instantiated object or None
+            Instantiated object or None (a shared canonical instance
+            inside an interning() scope)
 
         Example:
             modelaxi = cls._load_nested_single(data, ModelAxi, debug)
@@ -603,25 +762,22 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
 
         if isinstance(data, str):
             # String reference → load from file
-            logger.debug(f"Loading object from file: {data}")
-            from .utils import getObject
+            logger.debug("Loading object from file: %s", data)
+            from .lazy import load_reference
 
             filename = f"{data}.yaml"
-            logger.debug(f"  Loading nested {object_class.__name__} from {filename}")
-            return getObject(filename)
+            logger.debug(
+                "  Loading nested %s from %s", [c.__name__ for c in classes_to_try], filename
+            )
+            return interning.intern(load_reference(filename, candidates=object_class))
 
         elif isinstance(data, dict):
-            # Inline dictionary → try each class until one works
+            # Inline dictionary → dispatched class, or each class in turn
             logger.debug("Creating object from inline dict")
 
-            last_error = None
-
-            for candidate_class in classes_to_try:
-                try:
-                    return candidate_class.from_dict(data, debug=debug)
-                except (KeyError, TypeError, ValueError) as e:
-                    last_error = e
-                    continue
+            found, obj, last_error = cls._from_inline_dict(data, classes_to_try, debug)
+            if found:
+                return interning.intern(obj)
 
             # If we get here, none of the classes worked
             class_names = [c.__name__ for c in classes_to_try]
@@ -637,10 +793,12 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
                     f"Expected one of {class_names}, str, dict, or None, "
                     f"got {type(data).__name__}"
                 )
-            return data
+            return interning.intern(data)
 
     @classmethod
-    def get_required_files(cls: Type[T], values: dict, debug: bool = False) -> set[str]:
+    def get_required_files(
+        cls: Type[T], values: dict, debug: bool = False, transitive: bool = False
+    ) -> set[str]:
         """
         Perform a dry run analysis to identify all files required to create an object.
 
@@ -651,6 +809,9 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
         Args:
             values: Dictionary containing object parameters (as from from_dict)
             debug: Enable debug output showing analysis progress
+            transitive: Also include the files referenced by the referenced
+                        files, recursively (see dependencies.dependency_graph).
+                        Paths are relative to the current base directory.
 
         Returns:
             set[str]: Set of file paths that would be loaded (e.g., {"modelaxi.yaml", "shape.yaml"})
@@ -673,6 +834,8 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
             - Inline dictionaries (nested objects) are analyzed recursively
             - Returns empty set if no files would be loaded
             - Subclasses can override _analyze_nested_dependencies to customize analysis
+            - With transitive=True, referenced files are read (not loaded) to
+              follow their own references; missing files are still reported
         """
         required_files = set()
 
@@ -683,6 +846,17 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
         # Each geometry class should implement this to handle its specific nested objects
         cls._analyze_nested_dependencies(values, required_files, debug)
 
+        if transitive:
+            from .dependencies import dependency_graph
+            from .utils import get_basedir
+
+            basedir = get_basedir()
+            for filename in list(required_files):
+                graph = dependency_graph(filename)
+                required_files.update(os.path.relpath(path, basedir) for path in graph.files)
+                if debug:
+                    print(f"  {filename}: {len(graph.files)} files, depth {graph.depth}")
+
         return required_files
 
     @classmethod
@@ -737,9 +911,9 @@ class YAMLObjectBase(SerializableMixin, VisualizableMixin):
             if debug:
                 print(f"  Found file dependency: {filename}")
 
-            # Try to recursively analyze the referenced file
-            # (This would require loading the file to see its contents,
-            #  which defeats the dry-run purpose, so we skip it)
+            # The referenced file is not read here: use
+            # get_required_files(..., transitive=True) or
+            # dependencies.dependency_graph to follow its references
 
         elif isinstance(data, dict):
             # Inline dictionary → try to recursively analyze it
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Single-file bundles of geometry trees.
+
+An MSite or Insert is usually spread over dozens of small YAML files. pack()
+writes the whole tree to one bundle file (BUNDLE_EXTENSION) that can be
+shipped and loaded as is, and unpack() restores it.
+
+Each object that was loaded from its own file becomes a component of the
+bundle, stored once even when several parents share it, with the YAML text
+of that file: nested components are written as string references, exactly
+as in the original layout. Components keep their original file names
+(relative to the common directory of all the files), so extract() can
+recreate the original set of files.
+
+Layout::
+
+    %MAGNETGEO-BUNDLE 1
+    <component YAML>...
+    <index: JSON {"version", "root", "components": {key: {offset, length, tag}}}>
+    %INDEX <index offset> <index length>
+
+The fixed-size trailer gives the position of the index, and the index the
+position of each component, so a single component can be read without
+parsing the others.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> site = pmg.load("M9.yaml")
+    >>> site.pack("M9.mgpack")
+    >>> site = pmg.load("M9.mgpack")                        # whole tree
+    >>> helix = pmg.MSite.unpack("M9.mgpack", "HL-31_H1")   # one component
+"""
+
+import io
+import json
+import os
+from collections import deque
+from typing import Any
+
+import yaml
+
+from . import cache
+from .logging_config import get_logger
+from .utils import ObjectLoadError, UnsupportedTypeError, YamlDumper, YamlLoader
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+BUNDLE_EXTENSION = ".mgpack"
+BUNDLE_VERSION = 1
+
+_MAGIC = b"%MAGNETGEO-BUNDLE"
+_TRAILER = "%INDEX {:020d} {:020d}\n"
+_TRAILER_SIZE = len(_TRAILER.format(0, 0))
+
+
+class _ComponentDumper(YamlDumper):
+    """Dumper writing the other components of a bundle as string references."""
+
+    component = None
+    references: dict[int, str] | None = None
+
+    def represent_data(self, data):
+        from .lazy import resolve
+
+        data = resolve(data)
+        reference = self.references.get(id(data))
+        if reference is not None and data is not self.component:
+            return self.represent_str(reference)
+        return super().represent_data(data)
+
+
+def _children(obj) -> list:
+    """Geometry objects held by the public attributes of obj."""
+    from .base import YAMLObjectBase
+    from .lazy import resolve
+
+    children = []
+    queue = deque(value for key, value in vars(obj).items() if not key.startswith("_"))
+    while queue:
+        value = resolve(queue.popleft())
+        if isinstance(value, YAMLObjectBase):
+            children.append(value)
+        elif isinstance(value, (list, tuple)):
+            queue.extend(value)
+        elif isinstance(value, dict):
+            queue.extend(value.values())
+    return children
+
+
+def loaded_components(root) -> dict[int, tuple[Any, str | None]]:
+    """
+    Root and the objects of its tree that were loaded from their own file.
+
+    Args:
+        root: Root of the tree (e.g. an MSite)
+
+    Returns:
+        dict: id(object) -> (object, source file); the source of the root
+              is None if it was not loaded from a file
+    """
+    components = {id(root): (root, getattr(root, "_source", None))}
+    visited = {id(root)}
+    queue = deque([root])
+    while queue:
+        for child in _children(queue.popleft()):
+            if id(child) in visited:
+                continue
+            visited.add(id(child))
+            source = getattr(child, "_source", None)
+            if source is not None:
+                components[id(child)] = (child, source)
+            queue.append(child)
+    return components
+
+
+def _key(path: str) -> str:
+    return os.path.splitext(path)[0].replace(os.sep, "/")
+
+
+def pack(obj, filename: str) -> str:
+    """
+    Write a geometry tree to a bundle file.
+
+    Args:
+        obj: Root of the tree (e.g. an MSite)
+        filename: Bundle file to write
+
+    Returns:
+        str: Path of the written bundle
+
+    Notes:
+        Objects loaded from the same file are stored once, as a single
+        component: they are expected not to have been modified since.
+    """
+    components = loaded_components(obj)
+    sources = [source for _, source in components.values() if source is not None]
+    rootdir = os.path.commonpath([os.path.dirname(s) for s in sources]) if sources else ""
+
+    # component keys are the original file names, relative to rootdir
+    keys = {}
+    unique = {}
+    for ident, (component, source) in components.items():
+        if source is None:
+            # root built in memory
+            key = str(getattr(component, "name", type(component).__name__))
+        else:
+            key = _key(os.path.relpath(source, rootdir))
+        keys[ident] = key
+        unique.setdefault(key, component)
+
+    index = {"version": BUNDLE_VERSION, "root": keys[id(obj)], "components": {}}
+    with open(filename, "wb") as ostream:
+        ostream.write(_MAGIC + f" {BUNDLE_VERSION}\n".encode())
+        for key, component in unique.items():
+            # references are relative to the directory of the referencing file
+            base = os.path.dirname(key) or "."
+            references = {
+                ident: os.path.relpath(other, base).replace(os.sep, "/")
+                for ident, other in keys.items()
+            }
+            text = dump_component(component, references).encode()
+            index["components"][key] = {
+                "offset": ostream.tell(),
+                "length": len(text),
+                "tag": type(component).yaml_tag,
+            }
+            ostream.write(text)
+
+        data = json.dumps(index, sort_keys=True).encode()
+        offset = ostream.tell()
+        ostream.write(data + b"\n")
+        ostream.write(_TRAILER.format(offset, len(data)).encode())
+
+    logger.info("Packed %d components of %s into %s", len(unique), index["root"], filename)
+    return filename
+
+
+def dump_component(component, references: dict[int, str]) -> str:
+    """
+    YAML text of one component, with other components as string references.
+
+    Args:
+        component: Object to dump
+        references: id(object) -> reference (file name without extension)
+                    of the objects to write as references
+
+    Returns:
+        str: YAML text, as the component's own file holds it
+    """
+    stream = io.StringIO()
+    dumper = _ComponentDumper(stream, default_flow_style=False, sort_keys=False)
+    dumper.component = component
+    dumper.references = references
+    try:
+        dumper.open()
+        dumper.represent(component)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    return stream.getvalue()
+
+
+class Bundle:
+    """
+    Read access to the components of a bundle file.
+
+    Attributes:
+        path: Absolute path of the bundle
+        root: Key of the root component
+        components: Index of the components by key (offset, length, tag)
+    """
+
+    def __init__(self, filename: str):
+        from .utils import resolve_path
+
+        self.path = resolve_path(filename)
+        with open(self.path, "rb") as istream:
+            header = istream.readline()
+            if not header.startswith(_MAGIC):
+                raise ObjectLoadError(f"{filename} is not a magnetgeo bundle")
+            istream.seek(-_TRAILER_SIZE, os.SEEK_END)
+            _, offset, length = istream.read(_TRAILER_SIZE).split()
+            istream.seek(int(offset))
+            index = json.loads(istream.read(int(length)))
+        if index["version"] > BUNDLE_VERSION:
+            raise ObjectLoadError(f"{filename}: unsupported bundle version {index['version']}")
+        self.root = index["root"]
+        self.components = index["components"]
+        # components are exposed to loadYaml under this virtual directory
+        self.virtual_root = self.path + "!"
+
+    def keys(self) -> list[str]:
+        return list(self.components)
+
+    def read(self, key: str) -> str:
+        """Return the YAML text of a component."""
+        entry = self.components[key]
+        with open(self.path, "rb") as istream:
+            istream.seek(entry["offset"])
+            return istream.read(entry["length"]).decode()
+
+    def virtual_path(self, key: str) -> str:
+        return os.path.join(self.virtual_root, *key.split("/")) + ".yaml"
+
+    def get(self, path: str):
+        """
+        Return the composed YAML node of the component at a virtual path.
+
+        Called by loadYaml, as a prefetcher would be (see prefetch.using).
+        """
+        key = _key(os.path.relpath(path, self.virtual_root))
+        if key not in self.components:
+            raise FileNotFoundError(f"No component {key} in bundle {self.path}")
+        # objects cached under a virtual path depend on the bundle file
+        cache.record_dependency(self.path)
+        return yaml.compose(self.read(key), Loader=YamlLoader)
+
+    def extract(self, directory: str) -> list[str]:
+        """
+        Write every component to its original file name under directory.
+
+        Returns:
+            list[str]: Paths of the written files
+        """
+        written = []
+        for key in self.components:
+            path = os.path.join(directory, *key.split("/")) + ".yaml"
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as ostream:
+                ostream.write(self.read(key))
+            written.append(path)
+        return written
+
+
+def _relocate(obj, virtual_root: str, directory: str) -> None:
+    """Map the private paths of unpacked objects out of the virtual directory."""
+    seen = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        for attribute in ("_basedir", "_source"):
+            value = getattr(item, attribute, None)
+            if isinstance(value, str) and value.startswith(virtual_root):
+                relative = os.path.relpath(value, virtual_root)
+                setattr(item, attribute, os.path.normpath(os.path.join(directory, relative)))
+        stack.extend(_children(item))
+
+
+def unpack(filename: str, component: str | None = None, directory: str | None = None) -> Any:
+    """
+    Load a geometry tree, or one of its components, from a bundle file.
+
+    Args:
+        filename: Bundle file
+        component: Key of the component to load (e.g. "HL-31_H1"),
+                   None for the root
+        directory: Also extract all components as YAML files there,
+                   restoring the original file layout
+
+    Returns:
+        The loaded object, validated as if loaded from the original files
+
+    Raises:
+        ObjectLoadError: If the bundle or the component cannot be read
+    """
+    from .lazy import lazy_loading
+    from .prefetch import using
+    from .utils import loadYaml
+
+    try:
+        bundle = Bundle(filename)
+    except (OSError, ValueError, KeyError) as e:
+        raise ObjectLoadError(f"Failed to read bundle {filename}: {e}")
+
+    key = component if component is not None else bundle.root
+    if key not in bundle.components:
+        raise ObjectLoadError(f"No component {key} in bundle {filename}")
+
+    if directory is not None:
+        bundle.extract(directory)
+
+    # components are read from the bundle through the loadYaml document
+    # hook; lazy references could not be resolved outside of this scope
+    with using(bundle), lazy_loading(False):
+        obj = loadYaml("bundle component", bundle.virtual_path(key))
+
+    _relocate(obj, bundle.virtual_root, directory or os.path.dirname(bundle.path))
+    return obj
+
+
+def unpack_as(cls, filename: str, component: str | None = None, directory: str | None = None):
+    """unpack, checking that the loaded object is an instance of cls."""
+    obj = unpack(filename, component, directory)
+    if not isinstance(obj, cls):
+        raise UnsupportedTypeError(
+            f"{filename}: expected {cls.__name__}, got {type(obj).__name__}"
+        )
+    return obj
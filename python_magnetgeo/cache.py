@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Opt-in in-process parse cache for YAML/JSON geometry files.
+
+Loading the same Insert, Ring or lead definition repeatedly in one process
+re-reads and re-parses the file (and all the files it references) each time.
+When enabled, loadYaml/loadJson keep a pickled snapshot of every object they
+build, keyed by absolute path, and return a fresh clone on the next request.
+
+Because every nested reference goes through loadYaml/loadJson
+(getObject, _load_nested_single/_load_nested_list, and the string
+branches of Helix/Insert/Bitter.__init__), all of them benefit from the
+cache without further changes.
+
+An entry is only reused if none of the files read to build it has changed.
+Each file is checked by absolute path, mtime and size, so editing a
+helix referenced by an Insert also invalidates the cached Insert.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> pmg.enable_cache(max_bytes=32 * 1024 * 1024)
+    >>> insert = pmg.load("HL-31.yaml")   # parsed from disk
+    >>> insert = pmg.load("HL-31.yaml")   # cloned from cache
+    >>> pmg.cache_info()
+    {'enabled': True, 'hits': 1, 'misses': 1, ...}
+
+Notes:
+    - Disabled by default; loading behaves exactly as before
+    - Hits return independent clones: mutating a returned object never
+      affects the cache or other callers
+    - Objects that cannot be pickled are simply not cached
+"""
+
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Signatures of the files read by the load(s) currently in progress
+_dependencies: ContextVar[set | None] = ContextVar("magnetgeo_cache_dependencies", default=None)
+
+# Objects handed out as is by lookup, see reusing()
+_reused: ContextVar[Callable[[str], Any] | None] = ContextVar(
+    "magnetgeo_cache_reused", default=None
+)
+
+
+class _CacheEntry:
+    """Pickled object plus the signatures of every file it was built from."""
+
+    __slots__ = ("payload", "dependencies")
+
+    def __init__(self, payload: bytes, dependencies: frozenset):
+        self.payload = payload
+        self.dependencies = dependencies
+
+
+class ParseCache:
+    """
+    LRU cache of constructed geometry objects with a memory budget.
+
+    Entries are stored as pickled bytes: the budget is accounted exactly and
+    every hit returns a new, independent object without re-running YAML
+    parsing or constructor validation.
+
+    Attributes:
+        max_bytes: Memory budget for stored payloads
+        hits: Number of lookups served from cache
+        misses: Number of lookups that required loading from disk
+        evictions: Number of entries dropped to respect max_bytes
+        invalidations: Number of entries dropped because a file changed
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored payloads."""
+        return self._size
+
+    def get(self, path: str) -> Any | None:
+        """
+        Return a clone of the cached object for path, or None.
+
+        Args:
+            path: Absolute path of the file
+
+        Returns:
+            Fresh copy of the cached object, or None on miss or stale entry
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and not all(
+                file_signature(dep[0]) == dep for dep in entry.dependencies
+            ):
+                logger.debug("Cache entry for %s is stale", path)
+                self._drop(path)
+                self.invalidations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(path)
+            self.hits += 1
+
+        # the parent load (if any) depends on the files behind this entry too
+        _record(entry.dependencies)
+        return pickle.loads(entry.payload)
+
+    def put(self, path: str, obj: Any, dependencies: frozenset) -> None:
+        """
+        Store obj for path.
+
+        Args:
+            path: Absolute path of the file
+            obj: Constructed object
+            dependencies: Signatures of all files read to build obj
+        """
+        try:
+            payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug("Object from %s cannot be cached: %s", path, e)
+            return
+
+        if len(payload) > self.max_bytes:
+            logger.debug("Object from %s exceeds cache budget (%d bytes)", path, len(payload))
+            return
+
+        with self._lock:
+            if path in self._entries:
+                self._drop(path)
+            self._entries[path] = _CacheEntry(payload, dependencies)
+            self._size += len(payload)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def _drop(self, path: str) -> None:
+        entry = self._entries.pop(path)
+        self._size -= len(entry.payload)
+
+
+# Active cache, None when caching is disabled
+_cache: ParseCache | None = None
+
+
+def file_signature(path: str) -> tuple:
+    """
+    Return the (path, mtime_ns, size) signature of a file.
+
+    A missing file gets a signature that never matches an existing one.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _record(signatures) -> None:
+    deps = _dependencies.get()
+    if deps is not None:
+        deps.update(signatures)
+
+
+def record_dependency(filename: str) -> None:
+    """
+    Make the object being loaded depend on filename as well.
+
+    For loaders reading an object from another file than the one it is
+    cached under (e.g. a component of a bundle).
+    """
+    _record({file_signature(os.path.abspath(filename))})
+
+
+def lookup(filename: str) -> Any | None:
+    """
+    Look filename up in the active cache.
+
+    Args:
+        filename: Path to the file, relative to the current directory or absolute
+
+    Returns:
+        Object supplied by an enclosing reusing() scope, clone of the cached
+        object, or None (miss or cache disabled)
+    """
+    find = _reused.get()
+    if find is not None:
+        obj = find(os.path.abspath(filename))
+        if obj is not None:
+            return obj
+    if _cache is None:
+        return None
+    return _cache.get(os.path.abspath(filename))
+
+
+@contextmanager
+def reusing(find: Callable[[str], Any]):
+    """
+    Serve loads from objects already built instead of reading their files.
+
+    Inside the scope, loadYaml/loadJson first call find(path) with the
+    absolute path of each file and use the returned object itself (not a
+    clone) unless it is None. Used to rebuild an edited file while keeping
+    the unchanged objects it references (see watch.GeometryWatcher).
+
+    Objects loaded inside the scope are not stored in the parse cache, as
+    the files behind the reused objects are not recorded as dependencies.
+
+    Args:
+        find: Callable returning the object to reuse for a path, or None
+    """
+    token = _reused.set(find)
+    try:
+        yield
+    finally:
+        _reused.reset(token)
+
+
+@contextmanager
+def track(filename: str):
+    """
+    Record the files read while loading filename and store the result.
+
+    Usage inside a loader::
+
+        with track(filename) as store:
+            obj = parse(filename)
+            store(obj)
+
+    The store callback only caches obj once the whole load succeeded.
+    When the cache is disabled this is a no-op.
+    """
+    if _cache is None:
+        yield lambda obj: None
+        return
+
+    path = os.path.abspath(filename)
+    deps = {file_signature(path)}
+    token = _dependencies.set(deps)
+    result = []
+    try:
+        yield result.append
+    finally:
+        _dependencies.reset(token)
+
+    # nested loads are dependencies of the enclosing load as well
+    _record(deps)
+    if result and _cache is not None and _reused.get() is None:
+        _cache.put(path, result[0], frozenset(deps))
+
+
+def enable_cache(max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+    """
+    Enable the parse cache.
+
+    Args:
+        max_bytes: Memory budget for cached objects (default: 64 MiB).
+                  Least recently used entries are evicted beyond it.
+
+    Notes:
+        Calling it again keeps the existing entries and only updates the budget.
+    """
+    global _cache
+    if _cache is None:
+        _cache = ParseCache(max_bytes)
+    else:
+        _cache.max_bytes = max_bytes
+    logger.debug("Parse cache enabled (max_bytes=%s)", max_bytes)
+
+
+def disable_cache() -> None:
+    """Disable the parse cache and drop all its entries."""
+    global _cache
+    _cache = None
+    logger.debug("Parse cache disabled")
+
+
+def clear_cache() -> None:
+    """Drop all cached entries and reset the counters."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def cache_info() -> dict:
+    """
+    Return cache statistics.
+
+    Returns:
+        Dictionary with keys enabled, hits, misses, evictions,
+        invalidations, entries, size and max_bytes
+    """
+    if _cache is None:
+        return {
+            "enabled": False,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "entries": 0,
+            "size": 0,
+            "max_bytes": 0,
+        }
+    return {
+        "enabled": True,
+        "hits": _cache.hits,
+        "misses": _cache.misses,
+        "evictions": _cache.evictions,
+        "invalidations": _cache.invalidations,
+        "entries": len(_cache),
+        "size": _cache.size,
+        "max_bytes": _cache.max_bytes,
+    }
@@ -4,11 +4,12 @@
 """
 Provides definiton for CoolingSlits:
 """
-import os
 
 from .base import YAMLObjectBase
+from .schema import Field, is_integer, is_positive
 from .Contour2D import Contour2D
-from .validation import GeometryValidator, ValidationError
+from .utils import get_basedir
+from .validation import ValidationError
 
 
 class CoolingSlit(YAMLObjectBase):
@@ -22,6 +23,15 @@ class CoolingSlit(YAMLObjectBase):
     """
 
     yaml_tag = "CoolingSlit"
+    _fields = (
+        Field("name", str, default=""),
+        Field("n", int, validators=(is_integer, is_positive)),
+        Field("r", float, validators=(is_positive,)),
+        Field("angle", float),
+        Field("dh", float, validators=(is_positive,)),
+        Field("sh", float, validators=(is_positive,)),
+        Field("contour2d", nested=Contour2D, default=None),
+    )
 
     def __init__(
         self,
@@ -104,11 +114,7 @@ class CoolingSlit(YAMLObjectBase):
         # GeometryValidator.validate_name(name)
 
         # Ring-specific validation
-        GeometryValidator.validate_integer(n, "n")
-        GeometryValidator.validate_positive(n, "n")
-        GeometryValidator.validate_positive(r, "r")
-        GeometryValidator.validate_positive(dh, "dh")
-        GeometryValidator.validate_positive(sh, "sh")
+        self._validate_fields(n=n, r=r, dh=dh, sh=sh)
 
         # Check ring cooling slits
         if n * angle > 360:
@@ -125,7 +131,7 @@ class CoolingSlit(YAMLObjectBase):
         self.contour2d = contour2d
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
 
     def __repr__(self):
         """
@@ -166,80 +172,17 @@ class CoolingSlit(YAMLObjectBase):
         return f"{self.__class__.__name__}(name={self.name}, r={self.r!r}, angle={self.angle!r}, n={self.n!r}, dh={self.dh!r}, sh={self.sh!r}, contour2d={self.contour2d!r})"
 
     @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
-        Create CoolingSlit instance from dictionary representation.
+        Analyze nested dependencies specific to CoolingSlit class.
 
-        Supports flexible input formats for the nested contour2d object,
-        allowing inline definition, file reference, or pre-instantiated object.
+        Identifies the file that would be loaded for the contour2d.
 
         Args:
-            values: Dictionary containing CoolingSlit configuration with keys:
-                - name (str): Slit identifier
-                - r (float): Radial position in mm
-                - angle (float): Angular width per channel in degrees
-                - n (int): Number of channels
-                - dh (float): Hydraulic diameter in mm
-                - sh (float): Channel cross-section in mm²
-                - contour2d: Contour2D specification (string/dict/object/None)
-            debug: Enable debug output showing object loading process
-
-        Returns:
-            CoolingSlit: New CoolingSlit instance created from dictionary
-
-        Raises:
-            KeyError: If required keys are missing from dictionary
-            ValidationError: If values fail validation checks
-            ValidationError: If contour2d data is malformed
-
-        Example:
-            >>> # With inline contour definition
-            >>> data = {
-            ...     "name": "slit1",
-            ...     "r": 120.0,
-            ...     "angle": 4.5,
-            ...     "n": 10,
-            ...     "dh": 2.0,
-            ...     "sh": 3.0,
-            ...     "contour2d": {
-            ...         "name": "profile",
-            ...         "points": [[0, 0], [2, 0], [2, 1], [0, 1]]
-            ...     }
-            ... }
-            >>> slit = CoolingSlit.from_dict(data)
-
-            >>> # With file reference
-            >>> data2 = {
-            ...     "name": "slit2",
-            ...     "r": 135.0,
-            ...     "angle": 5.0,
-            ...     "n": 12,
-            ...     "dh": 2.5,
-            ...     "sh": 4.0,
-            ...     "contour2d": "channel_profile"  # Load from file
-            ... }
-            >>> slit2 = CoolingSlit.from_dict(data2)
-
-            >>> # Without contour (simplified)
-            >>> data3 = {
-            ...     "name": "slit3",
-            ...     "r": 150.0,
-            ...     "angle": 6.0,
-            ...     "n": 8,
-            ...     "dh": 3.0,
-            ...     "sh": 5.0,
-            ...     "contour2d": None
-            ... }
-            >>> slit3 = CoolingSlit.from_dict(data3)
+            values: Dictionary containing coolingslit parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
         """
-        # Smart nested object handling
-        contour2d = cls._load_nested_single(values.get("contour2d"), Contour2D, debug=debug)
-        return cls(
-            name=values.get("name", ""),
-            r=values["r"],
-            angle=values["angle"],
-            n=values["n"],
-            dh=values["dh"],
-            sh=values["sh"],
-            contour2d=contour2d,
+        cls._analyze_single_dependency(
+            values.get("contour2d"), Contour2D, required_files, debug=debug
         )
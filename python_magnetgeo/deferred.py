@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Deferred bulk validation.
+
+Every constructor validates its own fields (see schema._validate_fields):
+name, numeric lists, ascending order, ... one Python call per check and per
+object. Building thousands of Bitter disks or Helix variants spends most of
+its time there.
+
+Inside a deferred_validation() scope the constructors only record what has
+to be checked. When the scope exits, all recorded values are checked at
+once: r/z lists of the same length are stacked into NumPy arrays and tested
+together (numeric, length, ascending order, non-negative inner radius), then
+the cross-object rules registered with validate_or_defer (e.g. the
+intersection check of Bitters/Supras/MSite) are run. All failures are
+reported together by a single DeferredValidationError naming the offending
+objects.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> with pmg.deferred_validation():
+    ...     disks = [Bitter(f"B{i}", r, z, True, axi) for i, (r, z) in enumerate(bounds)]
+    ...     stack = Bitters("M10", disks, 0, 0)
+    DeferredValidationError: 2 validation errors:
+      Bitter 'B12' (r): r values must be in ascending order: [172.0, 115.0]
+      Bitter 'B40' (z): z must have exactly 2 values, got 3
+
+Notes:
+    - Objects are usable inside the scope but are not validated until it
+      exits; an invalid object may make a later constructor fail, in which
+      case the report is raised from that error
+    - Nested scopes share the outermost one
+    - Scopes are per thread / asyncio task (contextvars)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import chain
+from typing import Callable
+
+from .logging_config import get_logger
+from .validation import ValidationError
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+_collector: ContextVar["_Collector | None"] = ContextVar("deferred_validation", default=None)
+
+_NUMBERS = {int, float, bool}
+
+
+class DeferredValidationError(ValidationError):
+    """
+    Aggregated report of a deferred_validation() scope.
+
+    Attributes:
+        failures: (object, field, message) tuples, in construction order;
+                  field is None for cross-object rules
+    """
+
+    def __init__(self, failures: list[tuple]):
+        self.failures = failures
+        lines = [
+            f"  {_label(obj)}{f' ({field})' if field else ''}: {message}"
+            for obj, field, message in failures
+        ]
+        count = len(failures)
+        super().__init__(
+            "\n".join([f"{count} validation error{'s' if count > 1 else ''}:"] + lines)
+        )
+
+
+def _label(obj) -> str:
+    name = getattr(obj, "name", None)
+    return f"{type(obj).__name__} {name!r}" if name else type(obj).__name__
+
+
+class _Collector:
+    """Checks recorded by the constructors of a deferred_validation() scope."""
+
+    def __init__(self):
+        # checks of a class -> [(sequence, obj, values)], values in checks order
+        self.records: dict[tuple, list] = {}
+        # (sequence, obj, rule)
+        self.rules: list[tuple] = []
+        self.count = 0
+
+    def record(self, obj, checks: tuple, values: tuple) -> None:
+        """Record the values of the fields checked by (field, validators) checks."""
+        records = self.records.get(checks)
+        if records is None:
+            records = self.records[checks] = []
+        records.append((self.count, obj, values))
+        self.count += 1
+
+    def defer(self, obj, rule: Callable) -> None:
+        self.rules.append((self.count, obj, rule))
+        self.count += 1
+
+    def validate(self) -> list[tuple]:
+        """Run all recorded checks, return the (object, field, message) failures."""
+        failures = []
+        for checks, records in self.records.items():
+            for position, (field, validators) in enumerate(checks):
+                column = [values[position] for _, _, values in records]
+                indices = range(len(column))
+                for validator in validators:
+                    kind = getattr(validator, "kind", None)
+                    if kind is None:
+                        failed = _check_call(validator, column, field)
+                    else:
+                        failed = _CHECKS[kind[0]](column, field, kind[1])
+                    if not failed:
+                        continue
+                    # a failed check hides the following ones of the same field
+                    for k, message in failed:
+                        sequence, obj, _ = records[indices[k]]
+                        failures.append(((sequence, position), obj, field, message))
+                    excluded = {k for k, _ in failed}
+                    indices = [i for k, i in enumerate(indices) if k not in excluded]
+                    column = [column[k] for k in range(len(column)) if k not in excluded]
+
+        for sequence, obj, rule in self.rules:
+            try:
+                rule()
+            except ValidationError as e:
+                failures.append(((sequence, 0), obj, None, str(e)))
+            except (TypeError, IndexError, KeyError) as e:
+                # rules over components that already failed their own checks
+                if not failures:
+                    raise
+                logger.debug("Rule of %s skipped: %s", _label(obj), e)
+
+        failures.sort(key=lambda f: f[0])
+        return [f[1:] for f in failures]
+
+
+# Vectorized checks: (values, field, argument) -> [(index, message)] of the
+# failed values, with the messages of the GeometryValidator methods
+
+
+def _check_call(validator, values, field) -> list[tuple]:
+    failed = []
+    for k, value in enumerate(values):
+        try:
+            validator(value, field)
+        except ValidationError as e:
+            failed.append((k, str(e)))
+    return failed
+
+
+def _check_name(values, field, argument) -> list[tuple]:
+    failed = []
+    for k, value in enumerate(values):
+        if not value or not isinstance(value, str):
+            failed.append((k, "Name must be a non-empty string"))
+        elif not value.strip():
+            failed.append((k, "Name cannot be whitespace only"))
+    return failed
+
+
+def _check_integer(values, field, argument) -> list[tuple]:
+    message = f"{field} must be an integer"
+    return [(k, message) for k, value in enumerate(values) if not isinstance(value, int)]
+
+
+def _check_positive(values, field, argument) -> list[tuple]:
+    import numpy as np
+
+    if not set(map(type, values)) <= _NUMBERS:
+        failed = [
+            (k, f"{field} must be either a float or an integer")
+            for k, v in enumerate(values)
+            if not isinstance(v, (int, float))
+        ]
+        if failed:
+            return failed
+    array = np.fromiter(values, dtype=float, count=len(values))
+    return [(int(k), f"{field} must be positive or null") for k in np.flatnonzero(array < 0)]
+
+
+def _check_numeric_list(values, field, length) -> list[tuple]:
+    import numpy as np
+
+    if not set(map(type, values)) <= {list, tuple}:
+        failed = [
+            (k, f"{field} must be a list")
+            for k, v in enumerate(values)
+            if not isinstance(v, (list, tuple))
+        ]
+        if failed:
+            return failed
+
+    if not set(map(type, chain.from_iterable(values))) <= _NUMBERS:
+        failed = [
+            (k, f"All elements in {field} must be numeric")
+            for k, v in enumerate(values)
+            if not all(isinstance(x, (int, float)) for x in v)
+        ]
+        if failed:
+            return failed
+
+    if not length:
+        return []
+    lengths = np.fromiter(map(len, values), dtype=int, count=len(values))
+    return [
+        (int(k), f"{field} must have exactly {length} values, got {int(lengths[k])}")
+        for k in np.flatnonzero(lengths != length)
+    ]
+
+
+def _rows(values) -> dict:
+    """Group lists by length: length -> (indices, float array)."""
+    import numpy as np
+
+    lengths = set(map(len, values))
+    if len(lengths) == 1:
+        return {lengths.pop(): (range(len(values)), np.array(values, dtype=float))}
+    groups = {}
+    for k, value in enumerate(values):
+        groups.setdefault(len(value), []).append(k)
+    return {
+        length: (indices, np.array([values[k] for k in indices], dtype=float))
+        for length, indices in groups.items()
+    }
+
+
+def _check_ascending(values, field, argument) -> list[tuple]:
+    import numpy as np
+
+    failed = []
+    for length, (indices, array) in _rows(values).items():
+        if length < 2:
+            continue
+        for k in np.flatnonzero((np.diff(array, axis=1) <= 0).any(axis=1)):
+            index = indices[k]
+            failed.append((index, f"{field} values must be in ascending order: {values[index]}"))
+    return sorted(failed)
+
+
+def _check_inner(values, field, argument) -> list[tuple]:
+    import numpy as np
+
+    first = np.fromiter((v[0] for v in values), dtype=float, count=len(values))
+    return [(int(k), "Inner radius cannot be negative") for k in np.flatnonzero(first < 0)]
+
+
+_CHECKS = {
+    "name": _check_name,
+    "integer": _check_integer,
+    "positive": _check_positive,
+    "numeric_list": _check_numeric_list,
+    "ascending": _check_ascending,
+    "inner": _check_inner,
+}
+
+
+def current_collector() -> "_Collector | None":
+    """Return the collector of the enclosing deferred_validation() scope, if any."""
+    return _collector.get()
+
+
+def is_deferred() -> bool:
+    """Return True inside a deferred_validation() scope."""
+    return _collector.get() is not None
+
+
+def validate_or_defer(obj, rule: Callable[[], None]) -> None:
+    """
+    Run a cross-object validation rule, or defer it to the end of the scope.
+
+    Args:
+        obj: Object the rule validates (named in the report)
+        rule: Callable raising ValidationError
+    """
+    collector = _collector.get()
+    if collector is None:
+        rule()
+    else:
+        collector.defer(obj, rule)
+
+
+@contextmanager
+def deferred_validation():
+    """
+    Defer the validation of the objects constructed in the block to its end.
+
+    Raises:
+        DeferredValidationError: On exit, listing every failed check
+    """
+    if _collector.get() is not None:
+        # nested scope: checks are run by the outermost one
+        yield
+        return
+
+    collector = _Collector()
+    token = _collector.set(collector)
+    try:
+        yield
+    except Exception as e:
+        _collector.reset(token)
+        # report the invalid objects the error most likely comes from
+        try:
+            failures = collector.validate()
+        except Exception:
+            failures = None
+        if failures:
+            raise DeferredValidationError(failures) from e
+        raise
+    except BaseException:
+        _collector.reset(token)
+        raise
+    _collector.reset(token)
+
+    failures = collector.validate()
+    logger.debug("Deferred validation: %d checks, %d failures", collector.count, len(failures))
+    if failures:
+        raise DeferredValidationError(failures)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Transitive dependency graph of geometry files.
+
+get_required_files only reports the files referenced directly by a
+dictionary. dependency_graph follows these references from file to file
+and returns the whole closure of a geometry file (e.g. an MSite) as a
+graph, without building any geometry object: each file is only parsed into
+plain mappings, which get_required_files analyzes.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> graph = pmg.dependency_graph("M9.yaml")
+    >>> graph.depth
+    3
+    >>> sorted(graph.files)          # every file needed to load M9.yaml
+    ['/data/HL-31.yaml', '/data/HL-31_H1.yaml', ...]
+    >>> graph.missing, graph.cycles
+    (set(), [])
+
+Notes:
+    - The references of each file are cached by (mtime, size), so crawling
+      the same tree again only stats its files
+    - Missing or unreadable files and reference cycles are reported in the
+      graph; use DependencyGraph.check() (or strict=True) to raise instead
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+import yaml
+
+from .cache import file_signature
+from .logging_config import get_logger
+from .utils import ObjectLoadError, YamlLoader, resolve_path
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+
+@dataclass
+class DependencyNode:
+    """
+    A file of a dependency graph.
+
+    Attributes:
+        path: Absolute path of the file
+        tag: Class of the top-level object (e.g. "Insert"), None if unknown
+        depth: Length of the shortest reference chain from the root
+        exists: False when the file is missing
+        error: Read or parse error message, if any
+    """
+
+    path: str
+    tag: str | None
+    depth: int
+    exists: bool = True
+    error: str | None = None
+
+
+@dataclass
+class DependencyGraph:
+    """
+    Files needed to load a geometry file, and their references.
+
+    Attributes:
+        root: Absolute path of the analyzed file
+        nodes: Files of the closure by absolute path
+        edges: (referencing file, referenced file) pairs
+        cycles: Reference cycles, as lists of paths starting and ending
+                with the same file
+    """
+
+    root: str
+    nodes: dict[str, DependencyNode] = field(default_factory=dict)
+    edges: set[tuple[str, str]] = field(default_factory=set)
+    cycles: list[list[str]] = field(default_factory=list)
+
+    @property
+    def files(self) -> set[str]:
+        """Absolute paths of all the files of the closure, root included."""
+        return set(self.nodes)
+
+    @property
+    def missing(self) -> set[str]:
+        """Referenced files that do not exist."""
+        return {path for path, node in self.nodes.items() if not node.exists}
+
+    @property
+    def depth(self) -> int:
+        """Length of the longest shortest reference chain from the root."""
+        return max((node.depth for node in self.nodes.values()), default=0)
+
+    def references(self, path: str) -> set[str]:
+        """Files referenced directly by path."""
+        return {dst for src, dst in self.edges if src == path}
+
+    def topological_order(self) -> list[str]:
+        """
+        Files ordered so that every file comes after the files it references.
+
+        Raises:
+            ObjectLoadError: If the graph has cycles
+        """
+        if self.cycles:
+            raise ObjectLoadError(f"Reference cycle: {' -> '.join(self.cycles[0])}")
+        order = []
+        visited = set()
+
+        def visit(path):
+            visited.add(path)
+            for reference in sorted(self.references(path)):
+                if reference not in visited:
+                    visit(reference)
+            order.append(path)
+
+        visit(self.root)
+        return order
+
+    def check(self) -> None:
+        """
+        Raise if the root file cannot be loaded.
+
+        Raises:
+            ObjectLoadError: On missing or unreadable files, or reference cycles
+        """
+        problems = [f"missing file: {path}" for path in sorted(self.missing)]
+        problems += [
+            f"cannot read {path}: {node.error}"
+            for path, node in sorted(self.nodes.items())
+            if node.exists and node.error
+        ]
+        problems += [f"reference cycle: {' -> '.join(cycle)}" for cycle in self.cycles]
+        if problems:
+            raise ObjectLoadError(f"{self.root}: " + "; ".join(problems))
+
+
+# path -> (file signature, tag, references); references are absolute paths
+_references: dict[str, tuple[tuple, str | None, frozenset[str]]] = {}
+_lock = threading.Lock()
+
+
+def _get_class(tag: str):
+    from .base import YAMLObjectBase
+
+    # classes are imported on first use (see registry module)
+    return YAMLObjectBase.get_class(tag)
+
+
+def _read_top_level(path: str) -> tuple[str | None, dict]:
+    """Return the tag and the plain values of the top-level mapping of path."""
+    if path.endswith(".json"):
+        with open(path, "r") as istream:
+            values = json.load(istream)
+        if not isinstance(values, dict):
+            return None, {}
+        return values.get("__classname__"), values
+
+    from .prefetch import _RawLoader
+
+    with open(path, "r") as istream:
+        node = yaml.compose(istream, Loader=YamlLoader)
+    if node is None:
+        return None, {}
+    loader = _RawLoader("")
+    try:
+        values = loader.construct_document(node)
+    finally:
+        loader.dispose()
+    return node.tag, values if isinstance(values, dict) else {}
+
+
+def file_references(path: str) -> tuple[str | None, frozenset[str]]:
+    """
+    Return the tag of a geometry file and the files it references directly.
+
+    Results are cached by file signature (mtime and size).
+
+    Args:
+        path: Absolute path of the file
+
+    Returns:
+        tuple: (tag, absolute paths of the referenced files)
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError, ValueError: If the file cannot be parsed
+    """
+    signature = file_signature(path)
+    with _lock:
+        cached = _references.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+
+    tag, values = _read_top_level(path)
+    references = frozenset()
+    cls = _get_class(tag) if tag else None
+    if cls is not None:
+        basedir = os.path.dirname(path)
+        files = cls.get_required_files(values)
+        references = frozenset(os.path.normpath(os.path.join(basedir, f)) for f in files)
+
+    with _lock:
+        _references[path] = (signature, tag, references)
+    return tag, references
+
+
+def clear_dependency_cache() -> None:
+    """Forget the cached references of all files."""
+    with _lock:
+        _references.clear()
+
+
+def _find_cycles(graph: DependencyGraph) -> list[list[str]]:
+    cycles = []
+    state = {}  # path -> 1 while on the stack, 2 once done
+    stack = []
+
+    def visit(path):
+        state[path] = 1
+        stack.append(path)
+        for reference in sorted(graph.references(path)):
+            if state.get(reference) == 1:
+                cycles.append(stack[stack.index(reference) :] + [reference])
+            elif reference not in state:
+                visit(reference)
+        stack.pop()
+        state[path] = 2
+
+    visit(graph.root)
+    return cycles
+
+
+def dependency_graph(filename: str, strict: bool = False) -> DependencyGraph:
+    """
+    Crawl the files referenced by a geometry file, transitively.
+
+    Args:
+        filename: YAML or JSON geometry file, relative paths are resolved
+                  against the current base directory (see utils.get_basedir)
+        strict: Raise instead of reporting missing files and cycles
+
+    Returns:
+        DependencyGraph: the closure of filename
+
+    Raises:
+        ObjectLoadError: In strict mode, see DependencyGraph.check
+
+    Example:
+        >>> graph = dependency_graph("HL-31.yaml")
+        >>> for path in graph.topological_order():
+        ...     stage(path)
+    """
+    root = resolve_path(filename)
+    graph = DependencyGraph(root=root)
+
+    queue = deque([(root, 0)])
+    while queue:
+        path, depth = queue.popleft()
+        if path in graph.nodes:
+            continue
+        if not os.path.isfile(path):
+            graph.nodes[path] = DependencyNode(path, None, depth, exists=False)
+            continue
+        try:
+            tag, references = file_references(path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            graph.nodes[path] = DependencyNode(path, None, depth, error=str(e))
+            continue
+        graph.nodes[path] = DependencyNode(path, tag, depth)
+        for reference in sorted(references):
+            graph.edges.add((path, reference))
+            queue.append((reference, depth + 1))
+
+    graph.cycles = _find_cycles(graph)
+    logger.debug(
+        "Dependency graph of %s: %d files, depth %d, %d missing, %d cycles",
+        root,
+        len(graph.nodes),
+        graph.depth,
+        len(graph.missing),
+        len(graph.cycles),
+    )
+    if strict:
+        graph.check()
+    return graph
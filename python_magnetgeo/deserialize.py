@@ -6,41 +6,13 @@ Provides tools to un/serialize data from json
 """
 
 from .base import YAMLObjectBase
-
-# Import all classes to ensure they're registered
-# (importing triggers __init_subclass__ which registers them)
-
-from .Probe import Probe
-from .Shape import Shape
-from .ModelAxi import ModelAxi
-from .Model3D import Model3D
-from .Helix import Helix
-from .Ring import Ring
-from .InnerCurrentLead import InnerCurrentLead
-from .OuterCurrentLead import OuterCurrentLead
-from .Insert import Insert
-from .Bitter import Bitter
-from .Supra import Supra
-from .Screen import Screen
-from .MSite import MSite
-from .Bitters import Bitters
-from .Supras import Supras
-from .Contour2D import Contour2D
-from .Chamfer import Chamfer
-from .Groove import Groove
-from .tierod import Tierod
-from .coolingslit import CoolingSlit
+from .registry import CLASS_MODULES
 
 # Module logger
-from .logging_config import get_logger
+from .logging_config import DEBUG, get_logger
 logger = get_logger(__name__)
 
-# From : http://chimera.labs.oreilly.com/books/1230000000393/ch06.html#_discussion_95
-# Dictionary mapping names to known classes
-
-# Get class registry from base class
-# This is automatically populated by __init_subclass__
-classes = YAMLObjectBase.get_all_classes()
+# Classes are imported on first use by YAMLObjectBase.get_class (see registry module)
 
 
 def serialize_instance(obj):
@@ -59,6 +31,10 @@ def serialize_instance(obj):
     """
     from enum import Enum
 
+    from .lazy import resolve
+
+    # a lazy reference is serialized as the object it refers to
+    obj = resolve(obj)
     d = {"__classname__": type(obj).__name__}
 
     # Get object attributes
@@ -93,11 +69,14 @@ def unserialize_object(d, debug: bool = False):
     Raises:
         ValueError: If __classname__ refers to unknown class
     """
-    logger.debug(f"unserialize_object: d={d}")
+    # checked once: the loop below runs for every key of every object
+    debug_enabled = logger.isEnabledFor(DEBUG)
+    if debug_enabled:
+        logger.debug("unserialize_object: d=%s", d)
 
     # Remove __classname__ key
     clsname = d.pop("__classname__", None)
-    logger.debug(f"clsname: {clsname}")
+    logger.debug("clsname: %s", clsname)
 
     if clsname:
         # Use auto-registered class
@@ -106,7 +85,7 @@ def unserialize_object(d, debug: bool = False):
         if cls is None:
             raise ValueError(
                 f"Unknown class '{clsname}'. "
-                f"Available classes: {list(classes.keys())}"
+                f"Available classes: {list(CLASS_MODULES)}"
             )
 
         # Create instance without calling __init__
@@ -114,16 +93,17 @@ def unserialize_object(d, debug: bool = False):
 
         # Set attributes (lowercase keys for compatibility)
         for key, value in d.items():
-            logger.debug(f"key={key}, value={value} type={type(value)}")
+            if debug_enabled:
+                logger.debug("key=%s, value=%s type=%s", key, value, type(value))
             # Recursively deserialize nested objects
             deserialized_value = _deserialize_value(value)
             setattr(obj, key.lower(), deserialized_value)
 
-        logger.debug(f"obj={obj}")
+        logger.debug("obj=%s", obj)
 
         return obj
     else:
-        logger.debug(f"no classname: {d}")
+        logger.debug("no classname: %s", d)
         return d
 
 
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Class dispatch for inline dictionaries with several candidate classes.
+
+Some nested fields accept more than one class: Insert.currentleads holds
+InnerCurrentLead and OuterCurrentLead objects, MSite.magnets holds Insert,
+Bitters and Supras objects. An inline dictionary gives no YAML tag, so
+_load_nested_list/_load_nested_single used to call from_dict on each
+candidate until one did not raise: every mismatch cost a failed partial
+construction, and a dictionary accepted by the first candidate was built
+with it even when it was meant for another one.
+
+A Dispatcher is built once per candidate set and picks the class of a
+dictionary without constructing anything:
+
+1. explicit tag: "__classname__" naming one of the candidates
+2. discriminating keys: constructor parameters of exactly one candidate
+   (e.g. "holes" -> InnerCurrentLead, "bar" -> OuterCurrentLead,
+   "helices" -> Insert)
+3. required parameters: the only candidate whose required constructor
+   parameters are all present
+
+When none of these gives a single class (e.g. Bitters and Supras share the
+same parameters) the caller falls back to trying each class; these
+fallbacks are counted, see dispatch_stats().
+
+Example:
+    >>> from python_magnetgeo.dispatch import dispatcher
+    >>> dispatcher((InnerCurrentLead, OuterCurrentLead)).select({"name": "o", "bar": [...]})
+    <class 'python_magnetgeo.OuterCurrentLead.OuterCurrentLead'>
+"""
+
+import inspect
+import threading
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+# explicit discriminator key, as written by serialize_instance
+TAG_KEY = "__classname__"
+
+_lock = threading.Lock()
+_dispatchers: dict[tuple, "Dispatcher"] = {}
+_stats = {"tagged": 0, "dispatched": 0, "fallback": 0}
+
+
+def _parameters(cls) -> tuple[set[str], set[str]]:
+    """Return the (all, required) constructor parameter names of cls."""
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    names = {p.name for p in parameters if p.kind is p.POSITIONAL_OR_KEYWORD}
+    required = {p.name for p in parameters if p.default is p.empty and p.name in names}
+    return names, required
+
+
+class Dispatcher:
+    """
+    Dispatch table selecting one class of a candidate set from a dictionary.
+
+    Attributes:
+        classes: Candidate classes, in fallback order
+        tags: Candidate classes by tag (class name)
+        discriminators: Candidate class by discriminating key
+        required: Required constructor parameters of each candidate
+    """
+
+    def __init__(self, classes: tuple):
+        self.classes = tuple(classes)
+        self.tags = {getattr(c, "yaml_tag", c.__name__): c for c in self.classes}
+        self.tags.update({c.__name__: c for c in self.classes})
+
+        parameters = {}
+        self.required = {}
+        for c in self.classes:
+            parameters[c], self.required[c] = _parameters(c)
+
+        self.discriminators = {}
+        for c in self.classes:
+            for key in parameters[c]:
+                if sum(key in parameters[other] for other in self.classes) == 1:
+                    self.discriminators[key] = c
+        logger.debug(
+            "Dispatch table for %s: %s",
+            [c.__name__ for c in self.classes],
+            {k: c.__name__ for k, c in sorted(self.discriminators.items())},
+        )
+
+    def select(self, values: dict):
+        """
+        Pick the class of an inline dictionary.
+
+        Args:
+            values: Inline dictionary
+
+        Returns:
+            The selected class, or None when the dictionary is ambiguous
+            (the caller then tries each class, see dispatch_stats)
+        """
+        tag = values.get(TAG_KEY)
+        if tag is not None and tag in self.tags:
+            _count("tagged")
+            return self.tags[tag]
+
+        matches = {self.discriminators[key] for key in values if key in self.discriminators}
+        if not matches:
+            matches = {c for c in self.classes if self.required[c] <= values.keys()}
+        if len(matches) == 1:
+            _count("dispatched")
+            return matches.pop()
+
+        _count("fallback")
+        logger.debug(
+            "No dispatch for keys %s among %s, trying each class",
+            list(values),
+            [c.__name__ for c in self.classes],
+        )
+        return None
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+def dispatcher(classes: tuple) -> Dispatcher:
+    """Return the (cached) Dispatcher of a candidate set."""
+    classes = tuple(classes)
+    instance = _dispatchers.get(classes)
+    if instance is None:
+        instance = Dispatcher(classes)
+        with _lock:
+            instance = _dispatchers.setdefault(classes, instance)
+    return instance
+
+
+def dispatch_stats() -> dict[str, int]:
+    """
+    Return how inline dictionaries were dispatched since the last reset.
+
+    Returns:
+        dict: "tagged" (explicit __classname__), "dispatched" (discriminating
+              or required keys) and "fallback" (each class tried in turn)
+    """
+    with _lock:
+        return dict(_stats)
+
+
+def reset_dispatch_stats() -> None:
+    """Reset the dispatch counters."""
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
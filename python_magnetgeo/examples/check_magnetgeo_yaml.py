@@ -2,28 +2,35 @@
 # -*- coding:utf-8 -*-
 
 """
-Script to split an Helix YAML file into separate files for modelaxi and shape objects.
+Script to check that magnetgeo YAML files load.
 
-This script:
-1. Loads an Helix YAML file
-2. Writes separate YAML files for:
-   - Helix.modelaxi object (saved as <helix_name>_modelaxi.yaml)
-   - Helix.shape object (saved as <helix_name>_shape.yaml)
-3. Creates a new Helix YAML file where:
-   - modelaxi is the name of the corresponding modelaxi yaml file without extension
-   - shape is the name of the corresponding shape yaml file without extension
+Given a single file, loads it and prints the object. Given directories
+(searched recursively for .yaml/.yml files), glob patterns or several
+files, checks every file in a process pool, each worker keeping a parse
+cache so that files referenced by several roots are parsed once per
+worker, and prints a summary or writes a JSON report with, per file: the
+status, the error, the load time and the number of files loaded.
+
+The exit status is 1 if any file fails to load.
 
 Usage:
-    python split_helix_yaml.py <helix_yaml_file>
+    check-magnetgeo-yaml <yaml_file>
+    check-magnetgeo-yaml <directory|glob|file>... [-j 8] [--report report.json]
 
 Example:
-    python split_helix_yaml.py data/HL-31_H1.yaml
+    check-magnetgeo-yaml data/HL-31_H1.yaml
+    check-magnetgeo-yaml data "magnets/**/*.yaml" --report -
 """
 
 import sys
 import yaml
 import os
 import argparse
+import glob
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import python_magnetgeo as pmg
 
 from python_magnetgeo.logging_config import get_logger
@@ -40,21 +47,8 @@ def check_yaml(input_file):
 
     Returns:
     """
-    # Ensure all YAML constructors are registered
-    # This is needed because lazy loading doesn't import classes until accessed
-    pmg.verify_class_registration()
-
-    # Split input_file into basedir and basename
-    basedir = os.path.dirname(input_file)
-    basename = os.path.basename(input_file)
-
-    # Change to basedir if it's not empty and not '.'
-    if basedir and basedir != '.':
-        print(f"Changing directory to: {basedir}")
-        os.chdir(basedir)
-        input_path = basename
-    else:
-        input_path = input_file
+    # Nested references are resolved relative to input_file by the loader
+    input_path = input_file
 
     print(f"Loading: {input_path}")
 
@@ -66,29 +60,144 @@ def check_yaml(input_file):
     print(f"Object: {object}")
 
 
-def main():
+def _init_worker(verbose):
+    # files referenced by several roots are parsed once per worker
+    pmg.enable_cache()
+    if not verbose:
+        pmg.disable_logging()
+
+
+def check_file(input_file):
+    """
+    Load one magnetgeo YAML file and report the outcome.
+
+    Args:
+        input_file: Path to the YAML file
+
+    Returns:
+        dict: path, status ("ok" or "failed"), type, error, seconds and
+              files (number of files loaded: input_file and its references)
+    """
+    from python_magnetgeo.bundle import loaded_components
+
+    report = {"path": input_file, "status": "ok", "type": None, "error": None, "files": 0}
+    start = time.perf_counter()
+    try:
+        obj = pmg.load(input_file)
+        report["type"] = type(obj).__name__
+        sources = {source for _, source in loaded_components(obj).values() if source is not None}
+        report["files"] = len(sources | {os.path.abspath(input_file)})
+    except Exception as e:
+        report["status"] = "failed"
+        report["error"] = f"{type(e).__name__}: {e}"
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+
+def find_files(inputs):
+    """YAML files designated by files, directories and glob patterns, in order."""
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for dirpath, dirnames, filenames in os.walk(item):
+                dirnames.sort()
+                files += [
+                    os.path.join(dirpath, filename)
+                    for filename in sorted(filenames)
+                    if filename.endswith((".yaml", ".yml"))
+                ]
+        elif os.path.exists(item):
+            files.append(item)
+        else:
+            files += sorted(glob.glob(item, recursive=True))
+    # a file given twice is checked once
+    return list(dict.fromkeys(os.path.normpath(f) for f in files))
+
+
+def check_files(files, jobs=None, verbose=False):
+    """
+    Check files in a process pool.
+
+    Args:
+        files: YAML files to check
+        jobs: Number of worker processes (default: number of CPUs)
+        verbose: Keep the logging of the workers
+
+    Returns:
+        dict: "files" (one check_file report per file, in order) and
+              "summary" (checked, ok, failed, seconds)
+    """
+    start = time.perf_counter()
+    jobs = jobs or os.cpu_count() or 1
+    # files of the same directory, likely to share references, go to the same worker
+    chunksize = max(1, len(files) // (4 * jobs))
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(verbose,)) as pool:
+        reports = list(pool.map(check_file, files, chunksize=chunksize))
+
+    failed = sum(report["status"] != "ok" for report in reports)
+    summary = {
+        "checked": len(reports),
+        "ok": len(reports) - failed,
+        "failed": failed,
+        "seconds": time.perf_counter() - start,
+    }
+    return {"files": reports, "summary": summary}
+
+
+def main(argv=None):
     """Main function to handle command line arguments."""
     parser = argparse.ArgumentParser(
-        description='Check an YAML file.',
-        epilog='Example: %(prog)s data/HL-31_H1.yaml'
+        description='Check magnetgeo YAML files.',
+        epilog='Example: %(prog)s data/HL-31_H1.yaml, %(prog)s data --report -'
     )
     parser.add_argument(
-        'input_file',
-        help='Path to the input Helix YAML file'
+        'inputs',
+        nargs='+',
+        help='YAML files, directories or glob patterns (e.g. "data/**/*.yaml")'
     )
-
-    args = parser.parse_args()
-
-    if not os.path.exists(args.input_file):
-        print(f"Error: File not found: {args.input_file}")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Worker processes')
+    parser.add_argument(
+        '--report',
+        default=None,
+        help='Write a JSON report to this file ("-" for the standard output)'
+    )
+    parser.add_argument('-v', '--verbose', action='store_true', help='Keep worker logging')
+
+    args = parser.parse_args(argv)
+
+    single = len(args.inputs) == 1 and os.path.isfile(args.inputs[0]) and args.report is None
+    if single:
+        try:
+            check_yaml(args.inputs[0])
+        except Exception as e:
+            print(f"Error: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+        return
+
+    files = find_files(args.inputs)
+    if not files:
+        print(f"Error: No YAML file found in: {', '.join(args.inputs)}")
         sys.exit(1)
 
-    try:
-        check_yaml(args.input_file)
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+    result = check_files(files, args.jobs, args.verbose)
+    summary = result["summary"]
+    if args.report == "-":
+        print(json.dumps(result, indent=2))
+    else:
+        if args.report:
+            with open(args.report, "w") as ostream:
+                json.dump(result, ostream, indent=2)
+        for report in result["files"]:
+            if report["status"] != "ok":
+                print(f"FAILED {report['path']}: {report['error']}")
+        print(
+            f"{summary['ok']}/{summary['checked']} files loaded "
+            f"in {summary['seconds']:.2f} s, {summary['failed']} failed"
+        )
+
+    if summary["failed"]:
         sys.exit(1)
 
 
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Convert a directory of magnetgeo files between YAML, JSON and bundles.
+
+Every geometry file found under the source directory (or given on the
+command line) is loaded and written to the output directory under the same
+relative path, with the extension of the target format:
+
+- json: the whole object, nested references included, as write_to_json
+  writes it (the JSON loader does not follow references)
+- yaml: the object with the nested objects loaded from their own YAML file
+  kept as references, relative to the converted file; a bundle is
+  extracted to its original files
+- mgpack: the object and everything it references as a bundle (see pack)
+
+Files are converted by a process pool. An output is up to date when none
+of the files it was converted from changed since (--check mtime, using a
+manifest kept in the output directory) or when its new content is the same
+(--check hash): up-to-date outputs are not rewritten, so their mtime is
+kept. Throughput statistics are printed at the end.
+
+Usage:
+    convert-magnetgeo <source>... -o <output directory> --to json [-j 8]
+
+Example:
+    convert-magnetgeo data -o data-json --to json
+"""
+
+import argparse
+import filecmp
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from python_magnetgeo.logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+FORMATS = {"yaml": ".yaml", "json": ".json", "mgpack": ".mgpack"}
+SOURCE_EXTENSIONS = (".yaml", ".yml", ".json", ".mgpack")
+MANIFEST = ".magnetgeo-convert.json"
+
+
+def _init_worker(verbose: bool) -> None:
+    import python_magnetgeo as pmg
+
+    # files referenced by several converted files are parsed once per worker
+    pmg.enable_cache()
+    if not verbose:
+        pmg.disable_logging()
+
+
+def _inputs(obj, source: str) -> list[str]:
+    """Files obj was loaded from: source and the files of its nested objects."""
+    from python_magnetgeo.bundle import BUNDLE_EXTENSION, loaded_components
+
+    if source.endswith(BUNDLE_EXTENSION):
+        return [source]
+    paths = {path for _, path in loaded_components(obj).values() if path is not None}
+    return sorted(paths | {source})
+
+
+def _replace_if_changed(temporary: str, path: str) -> bool:
+    if os.path.exists(path) and filecmp.cmp(temporary, path, shallow=False):
+        os.unlink(temporary)
+        return False
+    os.replace(temporary, path)
+    return True
+
+
+def _to_yaml(obj, source: str, output: str) -> list[tuple[str, bool]]:
+    from python_magnetgeo.bundle import (
+        BUNDLE_EXTENSION,
+        Bundle,
+        dump_component,
+        loaded_components,
+    )
+    from python_magnetgeo.layout import write_if_changed
+
+    if source.endswith(BUNDLE_EXTENSION):
+        bundle = Bundle(source)
+        directory = os.path.dirname(output)
+        results = []
+        for key in bundle.keys():
+            path = os.path.join(directory, *key.split("/")) + ".yaml"
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            results.append((path, write_if_changed(path, bundle.read(key))))
+        return results
+
+    # references are relative to the converted file, as in the source tree
+    base = os.path.dirname(source)
+    references = {
+        ident: os.path.relpath(os.path.splitext(path)[0], base).replace(os.sep, "/")
+        for ident, (_, path) in loaded_components(obj).items()
+        if path is not None and path.endswith(".yaml")
+    }
+    return [(output, write_if_changed(output, dump_component(obj, references)))]
+
+
+def convert_file(source: str, output: str, target: str) -> dict:
+    """
+    Convert one file.
+
+    Args:
+        source: File to convert
+        output: File to write
+        target: Target format (a key of FORMATS)
+
+    Returns:
+        dict: source, output, outputs {path: written} (several for a bundle
+              extracted to YAML), inputs (file signatures), bytes_in,
+              bytes_out and error (None on success)
+    """
+    import python_magnetgeo as pmg
+    from python_magnetgeo.bundle import pack
+    from python_magnetgeo.cache import file_signature
+    from python_magnetgeo.layout import create_temporary, write_if_changed
+
+    result = {"source": source, "output": output, "outputs": {}, "inputs": []}
+    result.update(bytes_in=0, bytes_out=0)
+    try:
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        obj = pmg.load(source)
+        inputs = _inputs(obj, source)
+
+        if target == "json":
+            outputs = [(output, write_if_changed(output, obj.to_json()))]
+        elif target == "yaml":
+            outputs = _to_yaml(obj, source, output)
+        else:
+            fd, temporary = create_temporary(output)
+            os.close(fd)
+            try:
+                pack(obj, temporary)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+            outputs = [(output, _replace_if_changed(temporary, output))]
+
+        result["inputs"] = [file_signature(path) for path in inputs]
+        result["bytes_in"] = sum(signature[2] or 0 for signature in result["inputs"])
+        result["outputs"] = dict(outputs)
+        result["bytes_out"] = sum(os.path.getsize(path) for path, _ in outputs)
+        result["error"] = None
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def find_sources(paths: list[str], target: str) -> list[tuple[str, str]]:
+    """(root, source) pairs of the files to convert, root being the directory given."""
+    sources = []
+    for path in paths:
+        if os.path.isfile(path):
+            sources.append((os.path.dirname(os.path.abspath(path)), os.path.abspath(path)))
+            continue
+        root = os.path.abspath(path)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                extension = os.path.splitext(filename)[1]
+                if extension in SOURCE_EXTENSIONS and extension != FORMATS[target]:
+                    sources.append((root, os.path.join(dirpath, filename)))
+    return sources
+
+
+def _load_manifest(directory: str) -> dict:
+    try:
+        with open(os.path.join(directory, MANIFEST)) as istream:
+            return json.load(istream)
+    except (OSError, ValueError):
+        return {}
+
+
+def _up_to_date(entry: dict | None) -> bool:
+    """True if the inputs and outputs recorded in a manifest entry did not change."""
+    from python_magnetgeo.cache import file_signature
+
+    if not entry:
+        return False
+    return all(
+        list(file_signature(path)) == [path, *signature]
+        for key in ("inputs", "outputs")
+        for path, signature in entry[key].items()
+    )
+
+
+def convert_tree(
+    paths: list[str],
+    output: str,
+    target: str,
+    check: str = "mtime",
+    jobs: int | None = None,
+    verbose: bool = False,
+) -> dict:
+    """
+    Convert files and directories to target format under output.
+
+    Args:
+        paths: Files or directories to convert
+        output: Output directory
+        target: Target format (a key of FORMATS)
+        check: "mtime" to skip the outputs whose inputs did not change since
+               the last conversion, "hash" to convert everything but only
+               rewrite the outputs whose content changed
+        jobs: Number of worker processes (default: number of CPUs)
+        verbose: Keep the logging of the workers
+
+    Returns:
+        dict: Statistics (converted, unchanged, skipped, failed, errors,
+              bytes_in, bytes_out, seconds)
+    """
+    from python_magnetgeo.cache import file_signature
+
+    start = time.perf_counter()
+    os.makedirs(output, exist_ok=True)
+    output = os.path.abspath(output)
+    manifest = _load_manifest(output) if check == "mtime" else {}
+
+    tasks = []
+    stats = {"converted": 0, "unchanged": 0, "skipped": 0, "failed": 0, "errors": {}}
+    stats.update(bytes_in=0, bytes_out=0)
+    for root, source in find_sources(paths, target):
+        relative = os.path.relpath(source, root)
+        destination = os.path.join(output, os.path.splitext(relative)[0] + FORMATS[target])
+        if check == "mtime" and _up_to_date(manifest.get(destination)):
+            stats["skipped"] += 1
+            continue
+        tasks.append((source, destination, target))
+
+    if tasks:
+        jobs = jobs or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (4 * jobs))
+        with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(verbose,)) as pool:
+            for result in pool.map(convert_file, *zip(*tasks), chunksize=chunksize):
+                if result["error"] is not None:
+                    stats["failed"] += 1
+                    stats["errors"][result["source"]] = result["error"]
+                    continue
+                written = any(result["outputs"].values())
+                stats["converted" if written else "unchanged"] += 1
+                stats["bytes_in"] += result["bytes_in"]
+                stats["bytes_out"] += result["bytes_out"]
+                manifest[result["output"]] = {
+                    "inputs": {path: [mtime, size] for path, mtime, size in result["inputs"]},
+                    "outputs": {
+                        path: list(file_signature(path)[1:]) for path in result["outputs"]
+                    },
+                }
+
+    if check == "mtime":
+        from python_magnetgeo.layout import write_if_changed
+
+        write_if_changed(
+            os.path.join(output, MANIFEST), json.dumps(manifest, indent=1, sort_keys=True)
+        )
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Convert magnetgeo files between YAML, JSON and bundles.",
+        epilog="Example: %(prog)s data -o data-json --to json",
+    )
+    parser.add_argument("sources", nargs="+", help="Files or directories to convert")
+    parser.add_argument("-o", "--output", required=True, help="Output directory")
+    parser.add_argument("--to", choices=sorted(FORMATS), required=True, help="Target format")
+    parser.add_argument(
+        "--check",
+        choices=["mtime", "hash"],
+        default="mtime",
+        help="Skip outputs whose inputs are unchanged (mtime), or whose content is (hash)",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Keep worker logging")
+    args = parser.parse_args(argv)
+
+    missing = [path for path in args.sources if not os.path.exists(path)]
+    if missing:
+        print(f"Error: File not found: {', '.join(missing)}")
+        return 1
+
+    stats = convert_tree(args.sources, args.output, args.to, args.check, args.jobs, args.verbose)
+
+    for source, error in stats["errors"].items():
+        print(f"Failed: {source}: {error}")
+    files = stats["converted"] + stats["unchanged"]
+    seconds = stats["seconds"]
+    print(
+        f"{stats['converted']} converted, {stats['unchanged']} unchanged, "
+        f"{stats['skipped']} up to date, {stats['failed']} failed in {seconds:.2f} s"
+    )
+    if files:
+        print(
+            f"{files / seconds:.1f} files/s, "
+            f"{stats['bytes_in'] / seconds / 1e6:.2f} MB/s read "
+            f"({stats['bytes_in'] / 1e6:.2f} MB), "
+            f"{stats['bytes_out'] / 1e6:.2f} MB written"
+        )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -54,15 +54,9 @@ def demo_yaml_loading():
     print("Demo 2: YAML Loading Pattern")
     print("=" * 60)
 
-    import python_magnetgeo as pmg
-
-    print("Step 1: Register YAML constructors")
-    pmg.verify_class_registration()
-    print("✓ All geometry classes registered for YAML parsing")
-
-    print("\nStep 2: Load YAML file (example)")
+    print("Load YAML file (example)")
     print("  helix = pmg.load('data/HL-31_H1.yaml')")
-    print("  # This would load the Helix from YAML")
+    print("  # The Helix class is imported when its tag is first met")
 
     print("\nAlternative: Type-specific loading (no registration needed)")
     print("  helix = pmg.Helix.from_yaml('data/HL-31_H1.yaml')")
@@ -112,7 +106,6 @@ def demo_package_utilities():
     print()
 
     print("2. Class registration:")
-    print("   - pmg.verify_class_registration()")
     print("   - pmg.list_registered_classes()")
     print()
 
@@ -142,7 +135,6 @@ def demo_best_practices():
 
     print("\n✓ RECOMMENDED: Import package once")
     print("   import python_magnetgeo as pmg")
-    print("   pmg.verify_class_registration()  # For YAML loading")
     print("   obj = pmg.load('config.yaml')")
     print()
 
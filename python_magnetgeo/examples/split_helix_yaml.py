@@ -46,17 +46,9 @@ def split_helix_yaml(input_file, output_dir='.'):
     Returns:
         tuple: (helix_file, modelaxi_file, shape_file) - paths to the created files
     """
-    # Split input_file into basedir and basename
-    basedir = os.path.dirname(input_file)
+    # Nested references are resolved relative to input_file by the loader
     basename = os.path.basename(input_file)
-
-    # Change to basedir if it's not empty and not '.'
-    if basedir and basedir != '.':
-        print(f"Changing directory to: {basedir}")
-        os.chdir(basedir)
-        input_path = basename
-    else:
-        input_path = input_file
+    input_path = input_file
 
     print(f"Loading Helix from: {input_path}")
 
@@ -41,21 +41,8 @@ def check_yaml(input_file):
 
     Returns:
     """
-    # Ensure all YAML constructors are registered
-    # This is needed because lazy loading doesn't import classes until accessed
-    pmg.verify_class_registration()
-
-    # Split input_file into basedir and basename
-    basedir = os.path.dirname(input_file)
-    basename = os.path.basename(input_file)
-
-    # Change to basedir if it's not empty and not '.'
-    if basedir and basedir != '.':
-        print(f"Changing directory to: {basedir}")
-        os.chdir(basedir)
-        input_path = basename
-    else:
-        input_path = input_file
+    # Nested references are resolved relative to input_file by the loader
+    input_path = input_file
 
     print(f"Loading: {input_path}")
 
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Memoized YAML/JSON serialization of geometry trees.
+
+to_yaml/to_json used to represent and emit the whole object graph on every
+call, although pipelines serialize the same MSite many times (hashing,
+logging, IPC). Each object now keeps the text of its own fields as a
+fragment in which every nested geometry object is a placeholder, and the
+text of the object is assembled by splicing the (themselves memoized)
+texts of its children in place of the placeholders, indented as the
+emitter would have indented them. The output is identical to a full dump.
+
+A fragment is reused as long as the public attributes of its object are
+the very objects it was emitted from: assigning an attribute replaces the
+value, so that the fragment is emitted again. Lists of plain data (r, z,
+turns, probe labels and points, ...) are also compared by value with a
+copy taken when the fragment was emitted, so that in-place edits such as
+helix.r[0] = 10.0 or Probe.add_probe are detected. These checks cost a
+few attribute reads and short list comparisons per object on each call,
+and nothing while objects are built or edited (a __setattr__ hook would
+double the construction time of a Helix, and would miss list edits).
+Fragments are also emitted again when the number of nested objects has
+changed (e.g. a helix appended to insert.helices), while replacing a
+nested object (insert.helices[3] = helix) only re-splices the parents:
+serializing an Insert with one changed helix re-emits that helix only.
+
+Example:
+    >>> insert = pmg.load("HL-31.yaml")
+    >>> text = insert.to_yaml()          # fragments emitted and stored
+    >>> text = insert.to_yaml()          # assembled from stored fragments
+    >>> insert.helices[3].cutwidth = 0.3
+    >>> text = insert.to_yaml()          # helix 3 re-emitted, spliced in
+
+Notes:
+    - In-place edits of mutable values other than lists and dicts of plain
+      data are not detected: call mark_modified() on the edited object
+    - A YAML child whose lines would exceed the emitter width once indented
+      could be folded differently; such trees are dumped in full instead
+"""
+
+import io
+import json
+import re
+from enum import Enum
+from typing import Any
+
+import yaml
+
+from .base import YAMLObjectBase
+from .lazy import resolve
+from .logging_config import get_logger
+from .utils import YamlDumper
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+# Placeholder of the i-th nested object in a fragment
+_TOKEN = "magnetgeo-fragment-"
+_YAML_TOKEN = re.compile(_TOKEN + r"(\d+)$", re.M)
+_JSON_TOKEN = re.compile(f'"{_TOKEN}' + r'(\d+)"')
+_ITEM_PREFIX = re.compile(r"(?:\s*- )*\s*")
+_INDENT = re.compile(" *")
+
+# PyYAML emitter width: longer lines may be folded depending on their indentation
+_YAML_WIDTH = 80
+
+
+class _Unsplicable(Exception):
+    pass
+
+
+class _Fragment:
+    """Memoized text of one object for one format."""
+
+    __slots__ = ("template", "count", "own_width", "state", "attributes", "text", "width", "parts")
+
+    def __init__(self, template: list, count: int, own_width: int = 0):
+        # literal strings and (child index, indentation) pairs
+        self.template = template
+        self.count = count
+        # longest line of the object's own fields
+        self.own_width = own_width
+        # (name, value, copy) of the public attributes the fragment was emitted from
+        self.state = ()
+        # attributes that hold, or may receive, nested objects
+        self.attributes = ()
+        # text of the object with the children spliced, and the child fragments used
+        self.text = None
+        self.width = 0
+        self.parts = ()
+
+
+_SCALARS = (str, int, float, bool, type(None), Enum)
+
+
+def _is_data(value) -> bool:
+    """True for scalars and non-empty (nested) lists of scalars, e.g. r or z."""
+    if isinstance(value, _SCALARS):
+        return True
+    if type(value) in (list, tuple) and value:
+        return all(isinstance(item, _SCALARS) or _is_data(item) for item in value)
+    return False
+
+
+# Copy of the values that are compared by identity only
+_SAME = object()
+
+
+def _plain(value) -> bool:
+    """True for lists, tuples and dicts holding plain data only (scalars, at any depth)."""
+    items = value.values() if type(value) is dict else value
+    return all(
+        isinstance(item, _SCALARS) or (type(item) in (list, tuple, dict) and _plain(item))
+        for item in items
+    )
+
+
+def _deepcopy(value):
+    if type(value) is dict:
+        return {k: _deepcopy(v) for k, v in value.items()}
+    if type(value) in (list, tuple):
+        return type(value)(_deepcopy(item) for item in value)
+    return value
+
+
+def _identical(value, copy) -> bool:
+    """Same data with the same types (1, 1.0 and True are equal but not dumped alike)."""
+    if type(value) is not type(copy):
+        return False
+    if type(value) is dict:
+        return value.keys() == copy.keys() and all(_identical(value[k], copy[k]) for k in value)
+    if type(value) in (list, tuple):
+        return len(value) == len(copy) and all(map(_identical, value, copy))
+    return value == copy
+
+
+class _Data:
+    """Copy of a list, tuple or dict of plain data, taken when a fragment is emitted."""
+
+    __slots__ = ("value", "types")
+
+    def __init__(self, value):
+        self.value = _deepcopy(value)
+        # types of the items of a flat list, checked along with the items
+        flat = type(value) is not dict and all(isinstance(item, _SCALARS) for item in value)
+        self.types = tuple(map(type, value)) if flat else None
+
+    def matches(self, value) -> bool:
+        if value != self.value:
+            return False
+        if self.types is not None:
+            return tuple(map(type, value)) == self.types
+        return _identical(value, self.value)
+
+
+def _state(values: dict) -> tuple:
+    """(name, value, copy) of the public attributes in values (see _unchanged)."""
+    return tuple(
+        (k, v, _Data(v) if type(v) in (list, tuple, dict) and _plain(v) else _SAME)
+        for k, v in values.items()
+        if k[0] != "_"
+    )
+
+
+def _unchanged(state: tuple, values: dict) -> bool:
+    """True if the public attributes in values are still the objects (and data) of state."""
+    position = 0
+    for key, value in values.items():
+        if key[0] == "_":
+            continue
+        if position == len(state):
+            return False
+        name, previous, copy = state[position]
+        if name != key or previous is not value:
+            return False
+        if copy is not _SAME and not copy.matches(value):
+            return False
+        position += 1
+    return position == len(state)
+
+
+def _children(obj, attributes) -> list:
+    """Geometry objects held by attributes of obj, in the order the representers visit them."""
+    children = []
+
+    def visit(value):
+        value = resolve(value)
+        if isinstance(value, YAMLObjectBase):
+            children.append(value)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                visit(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                visit(item)
+
+    values = vars(obj)
+    for key in attributes:
+        visit(values.get(key))
+    return children
+
+
+class _FragmentDumper(YamlDumper):
+    """Dumper writing the nested geometry objects of root as placeholders."""
+
+    def represent_data(self, data):
+        data = resolve(data)
+        if data is not self.root and isinstance(data, YAMLObjectBase):
+            self.children.append(data)
+            token = f"{_TOKEN}{len(self.children) - 1}"
+            return self.represent_scalar("tag:yaml.org,2002:str", token)
+        return super().represent_data(data)
+
+
+def _yaml_fragment(obj) -> _Fragment:
+    stream = io.StringIO()
+    dumper = _FragmentDumper(stream, default_flow_style=False, sort_keys=False)
+    dumper.root = obj
+    dumper.children = []
+    try:
+        dumper.open()
+        dumper.represent(obj)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    text = stream.getvalue()
+
+    template = []
+    position = 0
+    for match in _YAML_TOKEN.finditer(text):
+        start = text.rfind("\n", 0, match.start()) + 1
+        column = _ITEM_PREFIX.match(text, start).end() - start
+        # list items are indented at the item, mapping values below their key
+        indent = column if start + column == match.start() else column + 2
+        template += [text[position : match.start()], (int(match.group(1)), indent)]
+        position = match.end()
+    template.append(text[position:])
+    own_width = max(map(len, text.split("\n")))
+    return _Fragment(template, len(dumper.children), own_width)
+
+
+def _json_fragment(obj) -> _Fragment:
+    from . import deserialize
+
+    count = 0
+
+    def substitute(value):
+        nonlocal count
+        value = resolve(value)
+        if isinstance(value, YAMLObjectBase):
+            count += 1
+            return f"{_TOKEN}{count - 1}"
+        if isinstance(value, (list, tuple)):
+            return [substitute(item) for item in value]
+        if isinstance(value, dict):
+            return {key: substitute(item) for key, item in value.items()}
+        return value
+
+    values = {key: substitute(value) for key, value in deserialize.serialize_instance(obj).items()}
+    text = json.dumps(values, default=deserialize.serialize_instance, sort_keys=True, indent=4)
+
+    template = []
+    position = 0
+    for match in _JSON_TOKEN.finditer(text):
+        start = text.rfind("\n", 0, match.start()) + 1
+        indent = _INDENT.match(text, start).end() - start
+        template += [text[position : match.start()], (int(match.group(1)), indent)]
+        position = match.end()
+    template.append(text[position:])
+    return _Fragment(template, count)
+
+
+_BUILDERS = {"yaml": _yaml_fragment, "json": _json_fragment}
+
+
+def _render(obj, kind: str) -> _Fragment:
+    """Return the fragment of obj with an up to date text."""
+    fragments = obj.__dict__.get("_fragments")
+    if fragments is None:
+        fragments = obj.__dict__["_fragments"] = {}
+    fragment = fragments.get(kind)
+    values = vars(obj)
+    stale = fragment is None or not _unchanged(fragment.state, values)
+    if not stale:
+        children = _children(obj, fragment.attributes)
+        stale = fragment.count != len(children)
+    if stale:
+        fragment = fragments[kind] = _BUILDERS[kind](obj)
+        fragment.state = _state(values)
+        fragment.attributes = tuple(k for k, v, _ in fragment.state if not _is_data(v))
+        children = _children(obj, fragment.attributes)
+
+    parts = tuple(_render(child, kind) for child in children)
+    if fragment.text is not None and all(
+        new is old and new.text is text
+        for new, (old, text) in zip(parts, fragment.parts)
+    ):
+        return fragment
+
+    pieces = []
+    width = 0
+    for piece in fragment.template:
+        if isinstance(piece, str):
+            pieces.append(piece)
+            continue
+        index, indent = piece
+        child = parts[index]
+        if kind == "yaml" and child.width + indent > _YAML_WIDTH:
+            raise _Unsplicable(f"nested object lines would exceed {_YAML_WIDTH} columns")
+        pieces.append(child.text.removesuffix("\n").replace("\n", "\n" + " " * indent))
+        width = max(width, child.width + indent)
+    fragment.text = "".join(pieces)
+    fragment.width = max(width, fragment.own_width)
+    fragment.parts = tuple((part, part.text) for part in parts)
+    return fragment
+
+
+def to_yaml(obj: Any) -> str:
+    """YAML text of obj, as yaml.dump with the YamlDumper writes it."""
+    try:
+        return _render(obj, "yaml").text
+    except _Unsplicable as e:
+        logger.debug("Dumping %s in full: %s", type(obj).__name__, e)
+        return yaml.dump(obj, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+def to_json(obj: Any) -> str:
+    """JSON text of obj, as json.dumps with deserialize.serialize_instance writes it."""
+    return _render(obj, "json").text
+
+
+def mark_modified(obj: Any) -> None:
+    """Drop the memoized texts of obj, e.g. after an in-place edit of one of its lists."""
+    obj.__dict__.pop("_fragments", None)
@@ -70,7 +70,7 @@ def lncmi_cut(object, filename: str, append: bool = False, z0: float = 0):
         MagnetTools/MagnetField/Stack.cc write_lncmi_paramfile L136
     """
     print(f'lncmi_cut: filename={filename}')
-    from math import pi
+    import numpy as np
 
     sign = 1
     if not object.odd:
@@ -107,12 +107,14 @@ def lncmi_cut(object, filename: str, append: bool = False, z0: float = 0):
         f.write("G0X-0.000\n")
         f.write("G0A0.\n")
 
-        # Generate toolpath points from helix geometry
-        for i, (turn, pitch) in enumerate(zip(object.modelaxi.turns, object.modelaxi.pitch)):
-            theta += turn * (2 * pi) * sign
-            z -= turn * pitch
+        # Generate toolpath points from the section breakpoints, top to bottom
+        sections = object.modelaxi.sections()
+        thetas = sections.theta[1:] * sign
+        # z0 - turns[0]*pitch[0] - turns[1]*pitch[1] ..., subtracted in turn
+        zs = np.subtract.accumulate(np.concatenate(([z0], sections.turns * sections.pitch)))[1:]
+        for i, (theta, z) in enumerate(zip(thetas.tolist(), zs.tolist())):
             f.write(f"N{i+1}")
-            if i == len(object.modelaxi.turns)-1:
+            if i == sections.nsections - 1:
                 f.write("G01")
 
             f.write("\t");
@@ -178,7 +180,6 @@ def salome_cut(object, filename: str, append: bool = False, z0: float = 0):
         MagnetTools/MagnetField/Stack.cc write_salome_paramfile L1011
     """
     print(f'salome_cut: filename={filename}')
-    from math import pi
 
     sign = 1
     if object.odd:
@@ -201,10 +202,11 @@ def salome_cut(object, filename: str, append: bool = False, z0: float = 0):
         # Write initial point
         f.write(f"{theta*(-sign):12.8f}{tab}{shape_id:8}{tab}{z:12.8f}\n")
 
-        # Generate subsequent points from helix geometry
-        for i, (turn, pitch) in enumerate(zip(object.modelaxi.turns, object.modelaxi.pitch)):
-            theta += turn * (2 * pi) * sign
-            z -= turn * pitch
+        # Generate subsequent points from the section breakpoints, top to bottom
+        sections = object.modelaxi.sections()
+        thetas = sections.theta[1:] * sign
+        zs = -sections.z[1:]
+        for theta, z in zip(thetas.tolist(), zs.tolist()):
             f.write(f"{theta*(-sign):12.8f}{tab}{shape_id:8}{tab}{z:12.8f}\n")
 
 
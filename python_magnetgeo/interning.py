@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Interning of structurally identical nested geometry objects.
+
+In large Insert/MSite/Bitters trees many parents reference the same Model3D,
+Shape, Chamfer or ModelAxi definitions, and each reference normally becomes a
+separate object. Inside an interning() scope, every object returned by
+_load_nested_single/_load_nested_list is looked up by content: the first
+occurrence becomes the canonical instance and later identical objects are
+replaced by a reference to it.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> with pmg.interning() as stats:
+    ...     msite = pmg.load("M9.yaml")
+    >>> stats.shared, stats.bytes_saved
+    (42, 18240)
+
+Notes:
+    - Content keys are exact (no hashing collisions): two objects are only
+      shared when their class and every public attribute compare equal,
+      and when they are inline objects or were loaded from the same file
+    - Serialization is unchanged: shared objects are written inline, not as
+      YAML aliases
+    - Shared objects are aliased, so they must not be mutated in place.
+      Use unshare(parent, attribute) to give a parent its own private copy
+      first (copy on write)
+"""
+
+import copy
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class InternStats:
+    """
+    Bookkeeping of an interning() scope.
+
+    Attributes:
+        unique: Number of canonical objects kept
+        shared: Number of duplicates replaced by a canonical instance
+        bytes_saved: Estimated memory of the duplicates that were dropped
+    """
+
+    def __init__(self):
+        self.unique = 0
+        self.shared = 0
+        self.bytes_saved = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"InternStats(unique={self.unique}, shared={self.shared}, "
+            f"bytes_saved={self.bytes_saved})"
+        )
+
+
+class _InternTable:
+    """Canonical objects of one interning() scope, keyed by content."""
+
+    def __init__(self):
+        self.objects: dict[tuple, Any] = {}
+        # id(canonical object) -> content key, to avoid re-walking shared subtrees
+        self.keys: dict[int, tuple] = {}
+        self.stats = InternStats()
+
+    def content_key(self, value: Any) -> tuple:
+        if isinstance(value, _SCALARS):
+            return (type(value).__name__, value)
+        if isinstance(value, Enum):
+            return (type(value).__name__, value.value)
+        if isinstance(value, (list, tuple)):
+            return (type(value).__name__, tuple(self.content_key(v) for v in value))
+        if isinstance(value, dict):
+            return ("dict", tuple((k, self.content_key(v)) for k, v in value.items()))
+
+        key = self.keys.get(id(value))
+        if key is not None:
+            return key
+        if hasattr(type(value), "yaml_tag"):
+            return (
+                type(value).__name__,
+                # objects loaded from different files stay distinct, each
+                # file being watched, packed or snapshotted on its own
+                getattr(value, "_source", None),
+                tuple(
+                    (k, self.content_key(v))
+                    for k, v in value.__dict__.items()
+                    if not k.startswith("_")
+                ),
+            )
+        # unknown objects are never considered identical
+        return ("id", id(value))
+
+    def intern(self, obj: Any) -> Any:
+        key = self.content_key(obj)
+        canonical = self.objects.get(key)
+        if canonical is None:
+            self.objects[key] = obj
+            self.keys[id(obj)] = key
+            self.stats.unique += 1
+            return obj
+        if canonical is not obj:
+            self.stats.shared += 1
+            self.stats.bytes_saved += deep_sizeof(obj, exclude=self.keys)
+        return canonical
+
+
+# Active intern table, None outside interning() scopes
+_table: ContextVar[_InternTable | None] = ContextVar("magnetgeo_intern_table", default=None)
+
+
+def deep_sizeof(obj: Any, exclude=None) -> int:
+    """
+    Estimate the memory used by obj and everything it references.
+
+    Args:
+        obj: Object to measure
+        exclude: Optional collection of object ids not to count
+                 (e.g. objects already shared elsewhere)
+
+    Returns:
+        Size in bytes (sum of sys.getsizeof over the reachable objects)
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or (exclude and item is not obj and id(item) in exclude):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not isinstance(item, (type, Enum)):
+            stack.append(item.__dict__)
+    return total
+
+
+def intern(obj: Any) -> Any:
+    """
+    Return the canonical instance for obj in the current interning scope.
+
+    Outside an interning() scope, or for None and non-geometry values,
+    obj is returned unchanged.
+    """
+    table = _table.get()
+    if table is None or obj is None or not hasattr(type(obj), "yaml_tag"):
+        return obj
+    return table.intern(obj)
+
+
+@contextmanager
+def interning():
+    """
+    Share structurally identical nested objects loaded inside this scope.
+
+    Yields:
+        InternStats updated as objects are loaded
+
+    Example:
+        >>> with interning() as stats:
+        ...     insert = Insert.from_yaml("HL-31.yaml")
+        >>> print(stats.bytes_saved)
+    """
+    table = _InternTable()
+    token = _table.set(table)
+    try:
+        yield table.stats
+    finally:
+        _table.reset(token)
+        logger.debug("Interning scope closed: %s", table.stats)
+
+
+def unshare(parent: Any, attribute: str, index: int | None = None) -> Any:
+    """
+    Replace a (possibly shared) child of parent by a private deep copy.
+
+    Call this before mutating a nested object in place when it may be
+    shared with other parents.
+
+    Args:
+        parent: Object holding the reference
+        attribute: Name of the attribute holding the child (or a list of children)
+        index: Position in the list when the attribute is a list
+
+    Returns:
+        The private copy now held by parent
+
+    Example:
+        >>> axi = unshare(helix, "modelaxi")
+        >>> axi.pitch[0] = 12.0   # other helices are not affected
+    """
+    value = getattr(parent, attribute)
+    if index is None:
+        private = copy.deepcopy(value)
+        setattr(parent, attribute, private)
+    else:
+        private = copy.deepcopy(value[index])
+        value = list(value)
+        value[index] = private
+        setattr(parent, attribute, value)
+    return private
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Multi-file layout of geometry trees.
+
+write_to_yaml writes a whole tree to one file, with every nested object
+inline. write_tree writes it the way geometry directories are organized
+instead: each nested object selected by a policy (e.g. helices, rings and
+current leads) goes to its own {name}.yaml file, and its parent refers to
+it by name, as in data/HL-31.yaml.
+
+Files are written by a thread pool, and a file whose content did not change
+is left untouched (same size and SHA-256 digest), so rewriting a large MSite
+after editing one helix only rewrites that helix's file, keeping the mtime
+of the others for the parse cache, the snapshots and the watchers. The text
+of each file is memoized on its object, as to_yaml does (see fragments
+module): a file whose objects were not edited since it was written is
+neither dumped nor read again.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> site = pmg.load("M9.yaml")
+    >>> report = site.write_tree("out", policy=["Insert", "Helix", "Ring"])
+    >>> report.root
+    'out/M9.yaml'
+    >>> site.magnets[0].helices[3].cutwidth = 0.3
+    >>> site.write_tree("out", policy=["Insert", "Helix", "Ring"]).written
+    ['out/HL-31_H4.yaml']
+
+Notes:
+    - Only objects held by nested fields of their parent (see schema.Field)
+      and named with a valid file name are split: the loaders turn these
+      references back into objects
+    - Objects sharing a name and content are written once; objects sharing
+      a name with different contents get a _2, _3, ... suffix
+    - As for to_yaml, in-place edits of mutable values other than lists and
+      dicts of plain data are not detected: call mark_modified() on the
+      edited object afterwards
+"""
+
+import hashlib
+import os
+import secrets
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class WriteReport:
+    """
+    Files of a tree written by write_tree.
+
+    Attributes:
+        root: Path of the file of the root object
+        written: Files created or rewritten
+        unchanged: Files left untouched, their content being the same
+    """
+
+    root: str
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    @property
+    def files(self) -> list[str]:
+        """All the files of the layout."""
+        return sorted(self.written + self.unchanged)
+
+
+def _selector(policy) -> Callable[[Any], bool]:
+    """Predicate telling whether an object gets its own file."""
+    if policy is None:
+        return lambda obj: True
+    if callable(policy) and not isinstance(policy, type):
+        return policy
+    if isinstance(policy, (str, type)):
+        policy = [policy]
+    classes = tuple(p for p in policy if isinstance(p, type))
+    names = {p for p in policy if isinstance(p, str)}
+    return lambda obj: isinstance(obj, classes) or type(obj).__name__ in names
+
+
+def _valid_name(name) -> bool:
+    return (
+        isinstance(name, str)
+        and name.strip() == name
+        and name not in ("", ".", "..")
+        and not any(separator in name for separator in ("/", "\\", os.sep))
+    )
+
+
+def _nested(obj) -> Iterable:
+    """Objects held by the nested fields of obj, i.e. loadable from a reference."""
+    from .lazy import resolve
+
+    values = vars(obj)
+    for f in getattr(type(obj), "_fields", ()):
+        if f.nested is None:
+            continue
+        value = values.get(f.name)
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            if item is not None and not isinstance(item, str):
+                yield resolve(item)
+
+
+def _assign_files(root, select) -> tuple[dict, dict]:
+    """
+    Split objects of the tree (root included).
+
+    Returns:
+        ({id: (object, file key)}, {component id: (members, links)}) where
+        members are the objects written inline in the file of the component
+        (itself first) and links the file keys it refers to
+    """
+    from .interning import _InternTable
+
+    table = _InternTable()
+    # name -> [[object, content key computed on a name clash, file key]]
+    taken: dict[str, list[list]] = {}
+    used = set()
+    files = {}
+    layout = {}
+
+    def assign(obj):
+        name = str(getattr(obj, "name", None) or type(obj).__name__)
+        variants = taken.setdefault(name, [])
+        content = None
+        for variant in variants:
+            if content is None:
+                content = table.content_key(obj)
+            if variant[1] is None:
+                variant[1] = table.content_key(variant[0])
+            if variant[1] == content:
+                return variant[2]
+        key = name
+        suffix = 1
+        while key in used:
+            suffix += 1
+            key = f"{name}_{suffix}"
+        variants.append([obj, content, key])
+        used.add(key)
+        return key
+
+    files[id(root)] = (root, assign(root))
+    layout[id(root)] = ([root], [])
+    queue = deque([(root, root)])
+    while queue:
+        obj, component = queue.popleft()
+        members, links = layout[id(component)]
+        for child in _nested(obj):
+            if id(child) not in files:
+                if not (select(child) and _valid_name(getattr(child, "name", None))):
+                    # written inline: walked once per parent
+                    members.append(child)
+                    queue.append((child, component))
+                    continue
+                files[id(child)] = (child, assign(child))
+                layout[id(child)] = ([child], [])
+                queue.append((child, child))
+            links.append(files[id(child)][1])
+    return files, layout
+
+
+class _Written:
+    """Text last written for a component, and the files it was written to."""
+
+    __slots__ = ("states", "links", "text", "signatures")
+
+    def __init__(self, members: list, links: list, text: str):
+        self.states = [(obj, _state(obj)) for obj in members]
+        self.links = links
+        self.text = text
+        # path -> file signature once written or found identical
+        self.signatures = {}
+
+    def valid(self, members: list, links: list) -> bool:
+        from .fragments import _unchanged
+
+        return (
+            self.links == links
+            and len(self.states) == len(members)
+            and all(
+                obj is member and _unchanged(state, vars(obj))
+                for (obj, state), member in zip(self.states, members)
+            )
+        )
+
+
+def _state(obj) -> tuple:
+    from .fragments import _state
+
+    return _state(vars(obj))
+
+
+def write_if_changed(path: str, text: str) -> bool:
+    """
+    Write text to path atomically, unless path already holds it.
+
+    Args:
+        path: File to write
+        text: Content of the file
+
+    Returns:
+        bool: True if the file was written, False if it was left untouched
+    """
+    data = text.encode()
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as istream:
+                if hashlib.sha256(istream.read()).digest() == hashlib.sha256(data).digest():
+                    return False
+    except OSError:
+        pass
+
+    # readers (e.g. a GeometryWatcher) never see a partially written file
+    fd, temporary = create_temporary(path)
+    try:
+        with os.fdopen(fd, "wb") as ostream:
+            ostream.write(data)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return True
+
+
+def create_temporary(path: str) -> tuple[int, str]:
+    """
+    Create a temporary file next to path, to be renamed over it (os.replace).
+
+    Unlike tempfile.mkstemp (mode 0600), the file gets the mode of the file
+    it replaces, or the mode of a newly created file (0666 minus the umask).
+
+    Args:
+        path: File the temporary file will replace
+
+    Returns:
+        tuple: (file descriptor open for writing, temporary file path)
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    directory, name = os.path.split(path)
+    while True:
+        temporary = os.path.join(directory or ".", f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+    if mode is not None:
+        try:
+            os.fchmod(fd, mode)
+        except BaseException:
+            os.close(fd)
+            os.unlink(temporary)
+            raise
+    return fd, temporary
+
+
+def write_tree(
+    obj: Any,
+    directory: str,
+    policy: Iterable[str | type] | Callable[[Any], bool] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> WriteReport:
+    """
+    Write a geometry tree as one YAML file per selected object.
+
+    Args:
+        obj: Root of the tree (e.g. an MSite), written to {name}.yaml
+        directory: Target directory, created if needed
+        policy: Classes or class names of the nested objects written to
+                their own file, or a predicate on the objects; None to
+                split every named nested object
+        max_workers: Number of threads writing files
+
+    Returns:
+        WriteReport: Written and unchanged files
+
+    Example:
+        >>> insert.write_tree("HL-31", policy=[Helix, Ring, InnerCurrentLead, OuterCurrentLead])
+    """
+    from .bundle import dump_component
+    from .cache import file_signature
+
+    os.makedirs(directory, exist_ok=True)
+    files, layout = _assign_files(obj, _selector(policy))
+    references = {ident: key for ident, (_, key) in files.items()}
+
+    # objects sharing a file are identical: write each file once
+    components = {}
+    for component, key in files.values():
+        components.setdefault(key, component)
+
+    def write(item):
+        key, component = item
+        path = os.path.join(directory, f"{key}.yaml")
+        members, links = layout[id(component)]
+        memo = component.__dict__.get("_fragments", {}).get("tree")
+        if memo is not None and memo.valid(members, links):
+            if memo.signatures.get(path) == file_signature(path):
+                return path, False
+        else:
+            memo = _Written(members, links, dump_component(component, references))
+            component.__dict__.setdefault("_fragments", {})["tree"] = memo
+        written = write_if_changed(path, memo.text)
+        memo.signatures[path] = file_signature(path)
+        return path, written
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="magnetgeo-write") as pool:
+        results = list(pool.map(write, components.items()))
+
+    report = WriteReport(os.path.join(directory, f"{files[id(obj)][1]}.yaml"))
+    for path, written in sorted(results):
+        (report.written if written else report.unchanged).append(path)
+    logger.info(
+        "Wrote %d files of %s (%d unchanged)",
+        len(report.written),
+        report.root,
+        len(report.unchanged),
+    )
+    return report
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Lazy loading of nested file references.
+
+By default, string references in a geometry file (helices, rings,
+currentleads, probes, magnets, screens, modelaxi, shape, ...) are loaded
+as soon as the parent object is built, recursively. Inside a lazy_loading()
+scope they become LazyRef proxies instead: the referenced YAML file is only
+read when an attribute of the proxy is first accessed.
+
+Validation is unchanged. A constructor that checks a nested object (e.g.
+Insert checking ring radii against the helices) forces the proxies it
+touches, and only those. Reading the name of an MSite thus reads a
+single file.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> with pmg.lazy_loading():
+    ...     msite = pmg.load("M9.yaml")       # reads M9.yaml only
+    >>> msite.name
+    'M9'
+    >>> msite.magnets[0].name                # reads HL-31.yaml and what
+    'HL-31'                                  # its validation needs
+
+Notes:
+    - Proxies are transparent: attribute access, isinstance checks,
+      YAML/JSON serialization and pickling behave as for the loaded object;
+      type(proxy) is LazyRef and an unloaded proxy prints as
+      LazyRef('file.yaml', not loaded)
+    - A proxy remembers the directory it was created in, so it can be
+      forced from anywhere
+    - References met while forcing a proxy are lazy as well
+    - Errors (missing file, validation) are raised on first access
+"""
+
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Type
+
+import yaml
+
+from .logging_config import get_logger
+from .utils import YamlDumper, base_directory, get_basedir, getObject, resolve_path
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+# True inside lazy_loading() scopes
+_lazy: ContextVar[bool] = ContextVar("magnetgeo_lazy", default=False)
+
+_SLOTS = (
+    "_lazy_filename",
+    "_lazy_basedir",
+    "_lazy_class",
+    "_lazy_type",
+    "_lazy_target",
+    "_lazy_lock",
+)
+
+# explicit tag on the first line of a geometry file, e.g. "!<Insert>"
+_TAG = re.compile(r"(?:---\s*)?!<?([\w.:-]+)>?")
+
+
+def _peek_class(path: str) -> Type | None:
+    """Return the class tagged on the first line of a YAML file, if any."""
+    from .base import YAMLObjectBase
+
+    try:
+        with open(path, "r") as istream:
+            for line in istream:
+                line = line.strip()
+                if not line or line.startswith(("#", "%")) or line == "---":
+                    continue
+                match = _TAG.match(line)
+                return YAMLObjectBase.get_class(match.group(1)) if match else None
+    except OSError:
+        return None
+    return None
+
+
+class LazyRef:
+    """
+    Proxy for a geometry object stored in a YAML file, loaded on first access.
+
+    Attributes:
+        _lazy_filename: Referenced file, relative to _lazy_basedir
+        _lazy_basedir: Base directory at creation time
+        _lazy_class: Expected class, or tuple of candidate classes
+                     (None: any class)
+        _lazy_type: Class of the referenced object when known before loading
+        _lazy_target: Loaded object, None until forced
+
+    Notes:
+        A single expected class is enforced (the file is loaded with
+        _lazy_class.from_yaml); with a tuple of candidates, or None, the
+        file is loaded with getObject and its class is peeked from the tag
+        on its first line when isinstance needs it.
+    """
+
+    __slots__ = _SLOTS
+
+    def __init__(
+        self,
+        filename: str,
+        object_class: Type | tuple[Type, ...] | None = None,
+        basedir: str | None = None,
+    ):
+        object.__setattr__(self, "_lazy_filename", filename)
+        object.__setattr__(self, "_lazy_basedir", basedir if basedir is not None else get_basedir())
+        object.__setattr__(self, "_lazy_class", object_class)
+        object.__setattr__(
+            self, "_lazy_type", object_class if isinstance(object_class, type) else None
+        )
+        object.__setattr__(self, "_lazy_target", None)
+        object.__setattr__(self, "_lazy_lock", threading.RLock())
+
+    def _force(self) -> Any:
+        target = self._lazy_target
+        if target is not None:
+            return target
+        with self._lazy_lock:
+            if self._lazy_target is None:
+                logger.debug("Forcing lazy reference %s", self._lazy_filename)
+                token = _lazy.set(True)
+                try:
+                    with base_directory(self._lazy_basedir):
+                        if not isinstance(self._lazy_class, type):
+                            target = getObject(self._lazy_filename)
+                        else:
+                            target = self._lazy_class.from_yaml(self._lazy_filename)
+                finally:
+                    _lazy.reset(token)
+                object.__setattr__(self, "_lazy_target", target)
+            return self._lazy_target
+
+    # isinstance() falls back on __class__ when type() does not match, so
+    # answer it without loading when possible: checks like isinstance(x, str)
+    # in constructors must not force the reference
+    @property
+    def __class__(self):
+        target = self._lazy_target
+        if target is not None:
+            return type(target)
+        if self._lazy_type is None:
+            with base_directory(self._lazy_basedir):
+                cls = _peek_class(resolve_path(self._lazy_filename))
+            candidates = self._lazy_class
+            if cls is None or (candidates is not None and not issubclass(cls, candidates)):
+                return type(self._force())
+            object.__setattr__(self, "_lazy_type", cls)
+        return self._lazy_type
+
+    def __getattr__(self, name: str) -> Any:
+        # protocol lookups (__deepcopy__, __getstate__, ...) must not load
+        if name in _SLOTS or (name.startswith("__") and name.endswith("__")):
+            raise AttributeError(name)
+        return getattr(self._force(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._force(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._force(), name)
+
+    def __dir__(self):
+        return dir(self._force())
+
+    # printing (e.g. in debug logs) does not load the reference
+    def __repr__(self) -> str:
+        if self._lazy_target is None:
+            return f"LazyRef({self._lazy_filename!r}, not loaded)"
+        return repr(self._lazy_target)
+
+    def __str__(self) -> str:
+        if self._lazy_target is None:
+            return repr(self)
+        return str(self._lazy_target)
+
+    def __eq__(self, other: Any) -> bool:
+        return self._force() == resolve(other)
+
+    def __hash__(self) -> int:
+        return hash(self._force())
+
+    def __reduce_ex__(self, protocol):
+        # a loaded proxy is copied/pickled as the object itself
+        if self._lazy_target is not None:
+            return self._lazy_target.__reduce_ex__(protocol)
+        return (LazyRef, (self._lazy_filename, self._lazy_class, self._lazy_basedir))
+
+
+def _represent(dumper, proxy):
+    return dumper.represent_data(proxy._force())
+
+
+yaml.add_representer(LazyRef, _represent)
+yaml.add_representer(LazyRef, _represent, Dumper=YamlDumper)
+
+
+def resolve(obj: Any) -> Any:
+    """Return the object behind a LazyRef (loading it), or obj itself."""
+    if type(obj) is LazyRef:
+        return obj._force()
+    return obj
+
+
+def is_loaded(obj: Any) -> bool:
+    """Return False for a LazyRef that has not been forced yet, True otherwise."""
+    return type(obj) is not LazyRef or obj._lazy_target is not None
+
+
+def load_reference(
+    filename: str,
+    object_class: Type | None = None,
+    candidates: Type | tuple[Type, ...] | None = None,
+) -> Any:
+    """
+    Load a referenced file, or return a LazyRef to it in a lazy_loading() scope.
+
+    Args:
+        filename: Referenced file (e.g. "H1.yaml")
+        object_class: Expected class, loaded with object_class.from_yaml;
+                      None to load with getObject
+        candidates: Class or classes the object may have when object_class
+                    is None. Not checked by eager loading; a LazyRef uses
+                    them to answer isinstance without loading the file
+                    (a single candidate class is enforced on loading)
+
+    Returns:
+        Loaded object or LazyRef
+    """
+    if _lazy.get():
+        return LazyRef(filename, object_class or candidates)
+    if object_class is None:
+        return getObject(filename)
+    return object_class.from_yaml(filename)
+
+
+@contextmanager
+def lazy_loading(enabled: bool = True):
+    """
+    Load nested file references on first access within this scope.
+
+    Args:
+        enabled: False to force eager loading inside an enclosing lazy scope
+
+    Example:
+        >>> with lazy_loading():
+        ...     insert = Insert.from_yaml("HL-31.yaml")
+    """
+    token = _lazy.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
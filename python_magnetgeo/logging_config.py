@@ -21,11 +21,25 @@ Usage:
     logger.debug("Detailed debug information")
     logger.warning("Something unexpected happened")
     logger.error("An error occurred", exc_info=True)
+
+Performance:
+    Log calls on hot paths (validators, deserialization, loadYaml) pass
+    their arguments %-style so that messages are only formatted when a
+    handler will emit them, and expensive arguments are guarded with
+    logger.isEnabledFor(). The package logger level follows the configured
+    handler levels, so disabled calls return after a cached level check.
+
+    In production mode (set_production_mode(), or the
+    PYTHON_MAGNETGEO_PRODUCTION environment variable) DEBUG and INFO calls
+    of the package loggers are replaced by a no-op:
+
+        from python_magnetgeo.logging_config import set_production_mode
+        set_production_mode()
 """
 
 import logging
+import os
 import sys
-from pathlib import Path
 from typing import Optional, Union
 
 
@@ -42,6 +56,26 @@ _configured = False
 _log_level = logging.INFO
 _handlers = []
 
+# Production mode: DEBUG and INFO calls of package loggers are no-ops
+_production = os.environ.get("PYTHON_MAGNETGEO_PRODUCTION", "") not in ("", "0")
+_production_saved_level = None
+_loggers = {}
+
+
+def _discard(*args, **kwargs) -> None:
+    """Replacement of Logger.debug/info in production mode."""
+    return None
+
+
+def _strip(logger: logging.Logger) -> None:
+    logger.debug = _discard
+    logger.info = _discard
+
+
+def _restore(logger: logging.Logger) -> None:
+    vars(logger).pop("debug", None)
+    vars(logger).pop("info", None)
+
 
 def get_logger(name: str = PACKAGE_NAME) -> logging.Logger:
     """
@@ -67,12 +101,17 @@ def get_logger(name: str = PACKAGE_NAME) -> logging.Logger:
     if not _configured:
         configure_logging()
     
+    if name == PACKAGE_NAME or name.startswith(PACKAGE_NAME + "."):
+        _loggers[name] = logger
+        if _production:
+            _strip(logger)
+
     return logger
 
 
 def configure_logging(
     level: Union[str, int] = logging.INFO,
-    log_file: Optional[Union[str, Path]] = None,
+    log_file: Optional[Union[str, os.PathLike]] = None,
     log_format: str = DEFAULT_FORMAT,
     console: bool = True,
     file_level: Optional[Union[str, int]] = None,
@@ -112,7 +151,7 @@ def configure_logging(
         ...     log_file='debug.log'
         ... )
     """
-    global _configured, _log_level, _handlers
+    global _configured, _log_level, _handlers, _production_saved_level
     
     # Convert string levels to logging constants
     if isinstance(level, str):
@@ -132,7 +171,13 @@ def configure_logging(
     
     # Get the root logger for this package
     logger = logging.getLogger(PACKAGE_NAME)
-    logger.setLevel(logging.DEBUG)  # Set to DEBUG to allow handlers to filter
+    # Handlers filter by their own level; the logger level is the lowest of
+    # them, so that calls below it return before building a record
+    levels = ([console_level] if console else []) + ([file_level] if log_file else [])
+    logger.setLevel(min(levels, default=level))
+    if _production:
+        _production_saved_level = logger.level
+        logger.setLevel(max(logger.level, logging.WARNING))
     logger.propagate = propagate
     
     # Remove existing handlers to avoid duplicates on reconfiguration
@@ -153,6 +198,8 @@ def configure_logging(
     
     # Add file handler if log_file is specified
     if log_file:
+        from pathlib import Path
+
         log_path = Path(log_file)
         # Create parent directories if they don't exist
         log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -219,6 +266,51 @@ def enable_logging() -> None:
     logger.disabled = False
 
 
+def set_production_mode(enabled: bool = True) -> None:
+    """
+    Turn DEBUG and INFO logging of the package into no-ops.
+
+    Disabled log calls are already cheap (a cached level check); production
+    mode also removes that check and raises the package level to WARNING,
+    so that guarded blocks (logger.isEnabledFor(DEBUG)) are skipped.
+    Warnings and errors are still emitted.
+
+    Args:
+        enabled: Enable (True) or leave (False) production mode
+
+    Example:
+        >>> set_production_mode()
+        >>> site = load("M9.yaml")      # no DEBUG/INFO overhead
+        >>> set_production_mode(False)
+    """
+    global _production, _production_saved_level
+
+    logger = logging.getLogger(PACKAGE_NAME)
+    if enabled and not _production:
+        _production_saved_level = logger.level
+        logger.setLevel(max(logger.level, logging.WARNING))
+    elif not enabled and _production and _production_saved_level is not None:
+        logger.setLevel(_production_saved_level)
+        _production_saved_level = None
+    _production = enabled
+
+    for instance in _loggers.values():
+        if enabled:
+            _strip(instance)
+        else:
+            _restore(instance)
+
+
+def is_production_mode() -> bool:
+    """
+    Check if production mode is enabled.
+
+    Returns:
+        True if DEBUG and INFO calls of the package are no-ops
+    """
+    return _production
+
+
 def get_log_level() -> int:
     """
     Get current logging level.
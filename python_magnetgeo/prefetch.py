@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Parallel prefetch of nested file references.
+
+An Insert like HL-31 references about 30 sibling YAML files which are
+normally opened and parsed one after another while the tree is built. On
+network filesystems this is dominated by I/O latency.
+
+Inside a prefetching() scope, each YAML file requested by loadYaml is read
+and parsed by a bounded thread pool. Its string references (helices, rings,
+current leads, probes, nested modelaxi/shape/chamfers, ...) are found with
+get_required_files and scheduled on the pool as well. The tree is then
+assembled as usual from the pre-parsed documents.
+
+Only reading and parsing (YAML composition) happen in the worker threads.
+Objects are still constructed and validated in the calling thread, in the
+usual order, so validation order and error messages are exactly those of
+a sequential load.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> with pmg.prefetching(max_workers=8):
+    ...     insert = pmg.load("HL-31.yaml")
+
+Notes:
+    - Prefetching is best effort: a reference that cannot be analyzed is
+      simply loaded on demand
+    - Parse failures (missing file, invalid YAML) are re-raised when, and
+      only if, the sequential load would have read that file
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.nodes import MappingNode, SequenceNode
+
+from .logging_config import get_logger
+from .utils import YamlLoader
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class _RawLoader(YamlLoader):
+    """Loader building plain dicts/lists, whatever the tags of the nodes."""
+
+    yaml_constructors = dict(SafeConstructor.yaml_constructors)
+    yaml_multi_constructors = {}
+
+
+def _construct_untagged(loader, suffix, node):
+    if isinstance(node, MappingNode):
+        return loader.construct_mapping(node, deep=True)
+    if isinstance(node, SequenceNode):
+        return loader.construct_sequence(node, deep=True)
+    return loader.construct_scalar(node)
+
+
+_RawLoader.add_multi_constructor("", _construct_untagged)
+
+
+def construct_node(node):
+    """
+    Build the object described by a composed YAML node.
+
+    Equivalent to yaml.load on the document the node was composed from.
+    """
+    if node is None:
+        return None
+    loader = YamlLoader("")
+    try:
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def node_references(node, basedir: str) -> set[str]:
+    """
+    Return the absolute paths of the files referenced by a YAML document.
+
+    Every mapping tagged with a registered geometry class is analyzed
+    with that class' get_required_files.
+
+    Args:
+        node: Root node of the document
+        basedir: Directory references are relative to
+
+    Returns:
+        Set of absolute file paths
+    """
+    from .base import YAMLObjectBase
+
+    references = set()
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, MappingNode):
+            cls = YAMLObjectBase.get_class(item.tag)
+            if cls is not None:
+                loader = _RawLoader("")
+                try:
+                    values = loader.construct_document(item)
+                    files = cls.get_required_files(values)
+                except Exception as e:
+                    logger.debug("Cannot analyze references of %s: %s", item.tag, e)
+                    files = set()
+                finally:
+                    loader.dispose()
+                references.update(os.path.join(basedir, f) for f in files)
+            for key, value in item.value:
+                stack.append(value)
+        elif isinstance(item, SequenceNode):
+            stack.extend(item.value)
+    return references
+
+
+class Prefetcher:
+    """
+    Reads and parses YAML files on a bounded thread pool.
+
+    Attributes:
+        max_workers: Maximum number of worker threads
+        fetched: Number of files scheduled so far
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="magnetgeo-prefetch"
+        )
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def fetched(self) -> int:
+        return len(self._futures)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._futures
+
+    def schedule(self, path: str) -> Future | None:
+        """Start reading and parsing path if not already done."""
+        with self._lock:
+            future = self._futures.get(path)
+            if future is None and not self._closed:
+                future = self._executor.submit(self._fetch, path)
+                self._futures[path] = future
+            return future
+
+    def get(self, path: str):
+        """
+        Return the composed root node of path.
+
+        Raises:
+            The exception raised while reading or parsing path, if any
+        """
+        future = self.schedule(path)
+        if future is None:
+            # scope already closed: read in the calling thread
+            return self._compose(path)
+        return future.result()
+
+    def add(self, path: str, node=None, error: BaseException | None = None) -> None:
+        """
+        Register a document read and parsed elsewhere (see aio.aload).
+
+        Args:
+            path: Absolute path of the file
+            node: Composed root node of the file
+            error: Exception raised while reading or parsing it, if any
+        """
+        future = Future()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(node)
+        with self._lock:
+            self._futures.setdefault(path, future)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _compose(path: str):
+        with open(path, "r") as istream:
+            return yaml.compose(istream, Loader=YamlLoader)
+
+    def _fetch(self, path: str):
+        node, references = fetch(path)
+        for reference in references:
+            self.schedule(reference)
+        return node
+
+
+def fetch(path: str):
+    """
+    Read and parse a YAML file and find the files it references.
+
+    Args:
+        path: Absolute path of the file
+
+    Returns:
+        tuple: (composed root node, set of absolute paths of references)
+    """
+    node = Prefetcher._compose(path)
+    if node is None:
+        return node, set()
+    return node, node_references(node, os.path.dirname(path))
+
+
+# Active prefetcher, None outside prefetching() scopes
+_prefetcher: ContextVar[Prefetcher | None] = ContextVar("magnetgeo_prefetcher", default=None)
+
+
+def get_prefetcher() -> Prefetcher | None:
+    """Return the prefetcher of the current scope, if any."""
+    return _prefetcher.get()
+
+
+@contextmanager
+def prefetching(max_workers: int = DEFAULT_MAX_WORKERS):
+    """
+    Read and parse nested file references in parallel within this scope.
+
+    Args:
+        max_workers: Size of the thread pool (default: 8)
+
+    Yields:
+        Prefetcher: the active prefetcher
+
+    Example:
+        >>> with prefetching(max_workers=16) as prefetcher:
+        ...     msite = getObject("M9.yaml")
+        >>> prefetcher.fetched
+        31
+    """
+    prefetcher = Prefetcher(max_workers)
+    try:
+        with using(prefetcher):
+            yield prefetcher
+    finally:
+        prefetcher.close()
+        logger.debug("Prefetching scope closed: %d files fetched", prefetcher.fetched)
+
+
+@contextmanager
+def using(prefetcher: Prefetcher):
+    """Make prefetcher the active one within this scope, without closing it."""
+    token = _prefetcher.set(prefetcher)
+    try:
+        yield prefetcher
+    finally:
+        _prefetcher.reset(token)
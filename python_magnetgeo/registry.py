@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Index of the geometry classes by YAML tag, for lazy registration.
+
+A geometry class registers its YAML constructor when its module is
+imported (see YAMLObjectBase.__init_subclass__), so loading a file used to
+require importing every class first (verify_class_registration, or
+deserialize importing them all). This module maps each tag to the module
+of its class instead, and registers a fallback constructor for unknown
+tags on the loaders: the first time a tag of the index is met while
+parsing, the module of its class is imported, which registers the class,
+and the node is constructed with it. YAMLObjectBase.get_class, used for
+JSON __classname__ and by the dependency, prefetch and streaming loaders,
+resolves classes the same way.
+
+Loading a Ring therefore imports the Ring module only.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> ring = pmg.load("R.yaml")   # imports python_magnetgeo.Ring
+"""
+
+import importlib
+
+import yaml
+
+from .utils import YamlLoader
+
+# YAML tag (also the class name) -> module of the class
+CLASS_MODULES = {
+    "Insert": "Insert",
+    "Helix": "Helix",
+    "Ring": "Ring",
+    "Bitter": "Bitter",
+    "Supra": "Supra",
+    "Supras": "Supras",
+    "Bitters": "Bitters",
+    "Screen": "Screen",
+    "MSite": "MSite",
+    "Probe": "Probe",
+    "Shape": "Shape",
+    "Profile": "Profile",
+    "ModelAxi": "ModelAxi",
+    "Model3D": "Model3D",
+    "InnerCurrentLead": "InnerCurrentLead",
+    "OuterCurrentLead": "OuterCurrentLead",
+    "Contour2D": "Contour2D",
+    "Chamfer": "Chamfer",
+    "Groove": "Groove",
+    "Tierod": "tierod",
+    "CoolingSlit": "coolingslit",
+}
+
+
+def import_class(name: str):
+    """
+    Import the module of a geometry class of the index.
+
+    Args:
+        name: Class name or YAML tag
+
+    Returns:
+        The registered class, or None if name is not in the index
+    """
+    module = CLASS_MODULES.get(name)
+    if module is None:
+        return None
+    importlib.import_module(f"{__package__}.{module}")
+
+    from .base import YAMLObjectBase
+
+    return YAMLObjectBase._class_registry.get(name)
+
+
+def _construct_indexed(loader, node):
+    """Constructor of the tags without one: registers their class on first use."""
+    if import_class(node.tag) is not None:
+        constructor = type(loader).yaml_constructors.get(node.tag)
+        if constructor is not None and constructor is not _construct_indexed:
+            return constructor(loader, node)
+    return loader.construct_undefined(node)
+
+
+# Same loaders as the class constructors (see YAMLObjectBase.__init_subclass__)
+yaml.add_constructor(None, _construct_indexed)
+yaml.add_constructor(None, _construct_indexed, Loader=YamlLoader)
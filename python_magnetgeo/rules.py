@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Dependency-tracked consistency rules of assemblies.
+
+An assembly such as Insert checks rules spanning several of its
+components: helix ordering, match of each ring with its two helices, bores
+against the first and last helices, current leads against the helices.
+Declaring each rule with the components it reads lets an edited assembly
+re-run only the rules touching the edited components instead of all of
+them.
+
+Components are identified by keys: (field, index) for list items, e.g.
+("helices", 3), or an attribute name, e.g. "innerbore".
+
+Example:
+    >>> rules = RuleSet([
+    ...     Rule("helix order 1", {("helices", 0), ("helices", 1)}, check_order_1),
+    ...     Rule("ring 0", {("rings", 0), ("helices", 0), ("helices", 1)}, check_ring_0),
+    ... ])
+    >>> rules.check()                       # all rules, in declaration order
+    >>> rules.check({("helices", 1)})       # rules reading helix 1 only
+"""
+
+from collections.abc import Iterable
+from typing import Callable, Hashable, NamedTuple
+
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+
+class Rule(NamedTuple):
+    """
+    One consistency rule.
+
+    Attributes:
+        name: Description used in debug logs
+        dependencies: Keys of the components the rule reads
+        check: Callable raising ValidationError when the rule is violated
+    """
+
+    name: str
+    dependencies: frozenset
+    check: Callable[[], None]
+
+
+class RuleSet:
+    """
+    Ordered rules indexed by the components they depend on.
+
+    Rules run in declaration order, so that the first violated rule, hence
+    the error raised, is the same whether all rules or only some run.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = [Rule(r.name, frozenset(r.dependencies), r.check) for r in rules]
+        self.index: dict[Hashable, list[int]] = {}
+        for position, rule in enumerate(self.rules):
+            for key in rule.dependencies:
+                self.index.setdefault(key, []).append(position)
+
+    def affected(self, keys: Iterable[Hashable]) -> list[Rule]:
+        """Return the rules depending on any of the keys, in declaration order."""
+        positions = set()
+        for key in keys:
+            positions.update(self.index.get(key, ()))
+        return [self.rules[p] for p in sorted(positions)]
+
+    def check(self, keys: Iterable[Hashable] | None = None) -> int:
+        """
+        Run the rules depending on keys, or all rules.
+
+        Args:
+            keys: Keys of the changed components, None for all rules
+
+        Returns:
+            int: Number of rules run
+
+        Raises:
+            ValidationError: From the first violated rule
+        """
+        rules = self.rules if keys is None else self.affected(keys)
+        for rule in rules:
+            logger.debug("Checking rule: %s", rule.name)
+            rule.check()
+        return len(rules)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Declarative field schemas for geometry classes.
+
+A geometry class declares the fields of its dictionary representation once,
+in a _fields tuple:
+
+    >>> class Ring(YAMLObjectBase):
+    ...     yaml_tag = "Ring"
+    ...     _fields = (
+    ...         Field("name", str, validators=(is_name,)),
+    ...         Field("r", list, validators=(numeric_list(4), is_ascending)),
+    ...         Field("z", list, validators=(numeric_list(2), is_ascending)),
+    ...         Field("n", int, default=0),
+    ...     )
+
+and YAMLObjectBase.__init_subclass__ generates from it (see build_schema):
+
+- from_dict: straight-line code compiled once per class, with required keys
+  read with values[key], optional ones with values.get(key, default) and
+  nested objects loaded with _load_nested_single/_load_nested_list (objects
+  already built by the YAML loader skip the generic loader)
+- _validate_fields: a method running the declared validators, in field
+  order, that the constructor calls with keyword arguments (inside a
+  deferred_validation() scope it only records them, see deferred.py)
+- _field_names: the names of the fields, in declaration order
+
+A class that defines its own from_dict keeps it.
+"""
+
+import copy
+from typing import Any, Callable
+
+from .logging_config import get_logger
+from .validation import GeometryValidator, ValidationError
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+
+class _Required:
+    """Marker of fields without default value."""
+
+    def __repr__(self) -> str:
+        return "REQUIRED"
+
+
+REQUIRED = _Required()
+
+
+class Field:
+    """
+    Declaration of one field of a geometry class.
+
+    Attributes:
+        name: Constructor parameter name
+        type: Expected type (documentation only, not enforced)
+        default: Value used when the key is missing; REQUIRED makes the key
+                 mandatory (KeyError when missing, as values[key])
+        nested: Class, or tuple of candidate classes, of nested objects
+        many: The field holds a list of nested objects
+        validators: Callables (value, label) run by _validate_fields
+        key: Dictionary key when different from name
+        convert: Callable applied to the value read from the dictionary
+    """
+
+    __slots__ = ("name", "type", "default", "nested", "many", "validators", "key", "convert")
+
+    def __init__(
+        self,
+        name: str,
+        type: Any = None,
+        default: Any = REQUIRED,
+        nested: Any = None,
+        many: bool = False,
+        validators: tuple[Callable, ...] = (),
+        key: str | None = None,
+        convert: Callable | None = None,
+    ):
+        self.name = name
+        self.type = type
+        self.default = default
+        self.nested = nested
+        self.many = many
+        self.validators = tuple(validators)
+        self.key = key or name
+        self.convert = convert
+
+    @property
+    def required(self) -> bool:
+        return self.default is REQUIRED
+
+    def __repr__(self) -> str:
+        return f"Field({self.name!r}, default={self.default!r})"
+
+
+# Validators: GeometryValidator is looked up at call time; kind identifies
+# the check for the vectorized pass of deferred_validation()
+
+
+def is_name(value, label: str) -> None:
+    GeometryValidator.validate_name(value)
+
+
+def is_positive(value, label: str) -> None:
+    GeometryValidator.validate_positive(value, label)
+
+
+def is_integer(value, label: str) -> None:
+    GeometryValidator.validate_integer(value, label)
+
+
+def is_ascending(value, label: str) -> None:
+    GeometryValidator.validate_ascending_order(value, label)
+
+
+def is_non_negative_inner(value, label: str) -> None:
+    """Validator of the inner radius (first value) of a list of radii."""
+    if value[0] < 0:
+        raise ValidationError("Inner radius cannot be negative")
+
+
+is_name.kind = ("name", None)
+is_positive.kind = ("positive", None)
+is_integer.kind = ("integer", None)
+is_ascending.kind = ("ascending", None)
+is_non_negative_inner.kind = ("inner", None)
+
+
+def numeric_list(length: int | None = None) -> Callable:
+    """Validator of a list of numbers, of the given length if any."""
+
+    def check(value, label: str) -> None:
+        GeometryValidator.validate_numeric_list(value, label, expected_length=length)
+
+    check.__name__ = f"numeric_list_{length}"
+    check.kind = ("numeric_list", length)
+    return check
+
+
+def _classes(nested) -> tuple:
+    return tuple(nested) if isinstance(nested, (list, tuple)) else (nested,)
+
+
+def _generate_from_dict(cls, fields: tuple[Field, ...]) -> Callable:
+    """Compile the from_dict classmethod of cls."""
+    from .interning import intern
+
+    namespace = {"_intern": intern, "_copy": copy.copy}
+    lines = ["def from_dict(cls, values, debug=False):", "    _get = values.get"]
+
+    # nested objects are loaded first, as the hand-written loaders did
+    ordered = [f for f in fields if f.nested is not None] + [f for f in fields if f.nested is None]
+    for i, field in enumerate(ordered):
+        var = f"_v{i}"
+        key = repr(field.key)
+        if field.required:
+            read = f"values[{key}]"
+        elif isinstance(field.default, (list, dict, set)):
+            namespace[f"_d{i}"] = field.default
+            read = f"(values[{key}] if {key} in values else _copy(_d{i}))"
+        else:
+            namespace[f"_d{i}"] = field.default
+            read = f"_get({key}, _d{i})"
+
+        if field.nested is None:
+            lines.append(f"    {var} = {read}")
+        elif field.many:
+            namespace[f"_c{i}"] = field.nested
+            lines.append(f"    {var} = cls._load_nested_list({read}, _c{i}, debug=debug)")
+        else:
+            classes = _classes(field.nested)
+            namespace[f"_c{i}"] = field.nested
+            lines.append(f"    {var} = {read}")
+            if len(classes) == 1:
+                # objects already built by the YAML loader skip the generic loader
+                namespace[f"_t{i}"] = classes[0]
+                lines.append(f"    if {var} is not None:")
+                lines.append(f"        if type({var}) is _t{i}:")
+                lines.append(f"            {var} = _intern({var})")
+                lines.append("        else:")
+                lines.append(
+                    f"            {var} = cls._load_nested_single({var}, _c{i}, debug=debug)"
+                )
+            else:
+                lines.append(f"    {var} = cls._load_nested_single({var}, _c{i}, debug=debug)")
+
+        if field.convert is not None:
+            namespace[f"_cv{i}"] = field.convert
+            lines.append(f"    {var} = _cv{i}({var})")
+
+    lines.append(f"    return cls({_arguments(cls, fields, ordered)})")
+    if not any("_get(" in line for line in lines[2:]):
+        del lines[1]
+
+    source = "\n".join(lines)
+    exec(compile(source, f"<generated {cls.__name__}.from_dict>", "exec"), namespace)
+    function = namespace["from_dict"]
+    function.__qualname__ = f"{cls.__name__}.from_dict"
+    function.__module__ = cls.__module__
+    function.__doc__ = _from_dict_doc(cls, fields)
+    function._source = source
+    return function
+
+
+def _arguments(cls, fields: tuple[Field, ...], ordered: list[Field]) -> str:
+    """
+    Constructor arguments of the generated from_dict.
+
+    Fields matching the leading positional parameters of __init__ are passed
+    positionally (cheaper to bind), the others by keyword.
+    """
+    variables = {field.name: f"_v{ordered.index(field)}" for field in fields}
+    # positional-or-keyword parameters after self, read from the code object
+    # (inspect.signature: inspect would be the slowest import of the package)
+    code = getattr(cls.__init__, "__code__", None)
+    parameters = ()
+    if code is not None and code.co_posonlyargcount <= 1:
+        parameters = code.co_varnames[1 : code.co_argcount]
+    positional = []
+    for name in parameters:
+        if name not in variables:
+            break
+        positional.append(name)
+    keywords = [name for name in variables if name not in positional]
+    arguments = [variables[name] for name in positional]
+    arguments += [f"{name}={variables[name]}" for name in keywords]
+    return ", ".join(arguments)
+
+
+def _from_dict_doc(cls, fields: tuple[Field, ...]) -> str:
+    keys = []
+    for field in fields:
+        kind = "required" if field.required else f"default {field.default!r}"
+        if field.nested is not None:
+            names = "/".join(c.__name__ for c in _classes(field.nested))
+            kind += f", {'list of ' if field.many else ''}{names}"
+        keys.append(f"            - {field.key} ({kind})")
+    return "\n".join(
+        [
+            f"Create {cls.__name__} instance from dictionary representation.",
+            "",
+            "        Generated from the _fields schema of the class.",
+            "",
+            "        Args:",
+            "            values: Dictionary with keys:",
+            *keys,
+            "            debug: Enable debug output",
+            "",
+            "        Returns:",
+            f"            {cls.__name__}: New instance",
+        ]
+    )
+
+
+def _generate_validator(cls, fields: tuple[Field, ...]) -> Callable | None:
+    """Compile the _validate_fields method of cls, None without validators."""
+    from .deferred import current_collector
+
+    checked = [field for field in fields if field.validators]
+    if not checked:
+        return None
+
+    names = [field.name for field in checked]
+    namespace = {
+        "_collector": current_collector,
+        "_checks": tuple((field.name, field.validators) for field in checked),
+    }
+    lines = [
+        f"def _validate_fields(self, *, {', '.join(names)}, **_):",
+        "    _deferred = _collector()",
+        "    if _deferred is not None:",
+        f"        _deferred.record(self, _checks, ({', '.join(names)},))",
+        "        return",
+    ]
+    for field in checked:
+        for j, validator in enumerate(field.validators):
+            check = f"_{field.name}_{j}"
+            namespace[check] = validator
+            lines.append(f"    {check}({field.name}, {field.name!r})")
+
+    source = "\n".join(lines)
+    exec(compile(source, f"<generated {cls.__name__}._validate_fields>", "exec"), namespace)
+    function = namespace["_validate_fields"]
+    function.__qualname__ = f"{cls.__name__}._validate_fields"
+    function.__module__ = cls.__module__
+    function.__doc__ = (
+        "Run the validators declared in the _fields schema, in field order "
+        "(recorded for later inside a deferred_validation() scope)."
+    )
+    function._source = source
+    return function
+
+
+def build_schema(cls) -> None:
+    """
+    Generate from_dict, _validate_fields and _field_names from cls._fields.
+
+    Called by YAMLObjectBase.__init_subclass__ for classes declaring their
+    own _fields.
+    """
+    fields = cls.__dict__["_fields"]
+    cls._field_names = tuple(field.name for field in fields)
+
+    if "from_dict" not in cls.__dict__:
+        cls.from_dict = classmethod(_generate_from_dict(cls, fields))
+
+    validator = _generate_validator(cls, fields)
+    if validator is not None and "_validate_fields" not in cls.__dict__:
+        cls._validate_fields = validator
+    logger.debug("Generated schema of %s: %s", cls.__name__, cls._field_names)
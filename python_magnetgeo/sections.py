@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Array view of the helical sections of a ModelAxi.
+
+A ModelAxi describes its helical cut as lists of turns and pitches, and
+every consumer (get_params of Insert and Bitter, the cut files of hcuts)
+used to walk these lists to rebuild the z breakpoints of the sections.
+Sections holds them once as numpy arrays, with the angular breakpoints,
+and answers point queries with binary searches over the breakpoints:
+the cut is a straight line in the (z, theta) plane within each section,
+so theta(z) and z(theta) are piecewise linear interpolations.
+
+Queries accept scalars or arrays of any size (e.g. the millions of nodes
+of a mesh) and return arrays of the same shape.
+
+Conventions:
+    - Section i spans z[i] <= z <= z[i + 1], from z[0] = -h to z[n] = h
+    - theta is the angle of the cut in radians, 0 at z = -h, increasing
+      by 2*pi*turns[i] over section i (the handedness is left to the
+      consumers)
+
+Example:
+    >>> view = modelaxi.sections()            # cached on the ModelAxi
+    >>> view.z                                # n + 1 breakpoints
+    >>> view.section_of(np.linspace(-h, h, 1_000_000))
+    >>> view.z_at(view.theta_at(z))           # == z within [-h, h]
+"""
+
+import math
+
+import numpy as np
+
+
+class Sections:
+    """
+    Breakpoints of the helical sections of a ModelAxi.
+
+    Attributes:
+        h: Half-height of the helical cut
+        turns: Turns of the sections
+        pitch: Pitch of the sections
+        z: Axial breakpoints of the sections (n + 1 values, -h to h)
+        theta: Angular breakpoints of the sections in radians (n + 1 values, from 0)
+
+    Raises:
+        ValueError: If turns and pitch have different lengths
+    """
+
+    __slots__ = ("h", "turns", "pitch", "z", "theta")
+
+    def __init__(self, h: float, turns: list[float], pitch: list[float]) -> None:
+        if len(turns) != len(pitch):
+            raise ValueError(
+                f"turns and pitch must have the same length, got {len(turns)} and {len(pitch)}"
+            )
+        self.h = float(h)
+        self.turns = np.asarray(turns, dtype=float)
+        self.pitch = np.asarray(pitch, dtype=float)
+        # accumulated left to right, as the former loops over the sections did
+        self.z = np.add.accumulate(np.concatenate(([-self.h], self.turns * self.pitch)))
+        self.theta = np.add.accumulate(np.concatenate(([0.0], self.turns * (2 * math.pi))))
+        for array in (self.turns, self.pitch, self.z, self.theta):
+            array.flags.writeable = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(h={self.h!r}, sections={self.nsections})"
+
+    @property
+    def nsections(self) -> int:
+        """Number of sections."""
+        return len(self.turns)
+
+    def section_of(self, z):
+        """
+        Index of the section containing each z.
+
+        Args:
+            z: Axial position(s)
+
+        Returns:
+            Section index of each position, -1 outside [-h, h]; a breakpoint
+            belongs to the section above it, h to the last section
+        """
+        z = np.asarray(z, dtype=float)
+        index = np.searchsorted(self.z, z, side="right") - 1
+        index = np.minimum(index, self.nsections - 1)
+        return np.where((z < self.z[0]) | (z > self.z[-1]), -1, index)[()]
+
+    def theta_at(self, z):
+        """
+        Angle of the cut at each z, in radians (clamped outside [-h, h]).
+        """
+        return np.interp(z, self.z, self.theta)
+
+    def z_at(self, theta):
+        """
+        Axial position of the cut at each angle (clamped outside [0, theta[-1]]).
+        """
+        return np.interp(theta, self.theta, self.z)
+
+    def pitch_at(self, z):
+        """
+        Local pitch at each z (nan outside [-h, h]).
+        """
+        # index -1 (outside) picks the trailing nan
+        return np.append(self.pitch, np.nan)[self.section_of(z)]
+
+    def density_factor(self, z, cutwidth: float = 0.0):
+        """
+        Local current density relative to a uniform cut, at each z.
+
+        The same current flows through every turn, across an axial width of
+        pitch - cutwidth: the density at z is scaled by (p - w) / (pitch(z) - w),
+        p being the pitch of a uniform cut with the same number of turns.
+
+        Args:
+            z: Axial position(s)
+            cutwidth: Width of the cut, in the unit of the pitch. Default: 0.0
+
+        Returns:
+            Density factor at each position (nan outside [-h, h])
+        """
+        uniform = (self.z[-1] - self.z[0]) / self.turns.sum()
+        return (uniform - cutwidth) / (self.pitch_at(z) - cutwidth)
+
+    def boundaries(self, tol: float = 1.0e-6) -> list[float]:
+        """
+        Breakpoints where the pitch changes, with -h and h.
+
+        Consecutive sections whose pitches are similar are merged as by
+        ModelAxi.compact, and the breakpoints accumulated from its result
+        (total turns times first pitch of each merged group), as
+        Insert.get_params always did.
+
+        Args:
+            tol: Relative tolerance on the pitch. Default: 1e-6
+
+        Returns:
+            list[float]: Axial breakpoints of the merged sections
+        """
+        turns, pitch = self.turns.tolist(), self.pitch.tolist()
+        groups = []
+        for n, p in zip(turns, pitch):
+            if groups:
+                first = groups[-1][1]
+                if (abs(1 - p / first) <= tol) if first != 0 else (abs(p) <= tol):
+                    groups[-1][0] += n
+                    continue
+            groups.append([n, p])
+
+        z = -self.h
+        breakpoints = [z]
+        for n, p in groups:
+            z += n * p
+            breakpoints.append(z)
+        return breakpoints
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Binary snapshots of constructed geometry objects.
+
+Loading a large tree from YAML parses every file and runs every
+GeometryValidator check and nested from_dict again. A snapshot stores an
+already validated object graph with pickle (protocol 5) and restores it
+without calling any constructor, hence without re-validation.
+
+Numeric lists (ModelAxi turns/pitch, Probe and Contour2D/Profile points,
+...) are written as raw float64 buffers out of band, after the pickle
+stream, and read back from the file without going through the unpickler
+opcodes (one memoryview cast per list).
+
+A snapshot records the SHA-256 of every source file of the tree (the file
+it was loaded from and everything it references, see
+dependencies.dependency_graph). It is stale as soon as one of them
+changes, or when it was written by another version of the package.
+
+Layout::
+
+    %MAGNETGEO-SNAPSHOT 1
+    <header: JSON {"version", "package", "sources", "pickle", "buffers"}>
+    <pickle stream><padding><buffer 0><padding><buffer 1>...
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> insert = pmg.load("HL-31.yaml")
+    >>> pmg.save_snapshot(insert, "HL-31.mgsnap")
+    >>> insert = pmg.load_snapshot("HL-31.mgsnap")   # StaleSnapshotError if outdated
+
+    >>> # or, in one call: use the snapshot when fresh, rebuild it otherwise
+    >>> insert = pmg.load_with_snapshot("HL-31.yaml")
+"""
+
+import hashlib
+import io
+import json
+import os
+import pickle
+from array import array
+from typing import Any
+
+from .logging_config import DEBUG, get_logger
+from .utils import ObjectLoadError, resolve_path
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+SNAPSHOT_EXTENSION = ".mgsnap"
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b"%MAGNETGEO-SNAPSHOT"
+_ALIGN = 8
+
+# shorter numeric lists are cheaper to keep in the pickle stream
+MIN_BUFFER_LENGTH = 16
+
+
+class StaleSnapshotError(ObjectLoadError):
+    """Raised when a snapshot no longer matches its source files."""
+
+    pass
+
+
+def _is_floats(values: list) -> bool:
+    return all(type(v) is float for v in values)
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Pickler moving float lists and lists of float rows out of band.
+
+    The C pickler never calls reducer_override for plain lists, so they are
+    intercepted with persistent_id and written as float64 buffers, each
+    referenced in the stream by ("floats", index, ncols).
+    """
+
+    def __init__(self, file):
+        super().__init__(file, protocol=5)
+        self.buffers: list[array] = []
+
+    def _out_of_band(self, values: array, ncols: int) -> tuple:
+        self.buffers.append(values)
+        return ("floats", len(self.buffers) - 1, ncols)
+
+    def persistent_id(self, obj):
+        if type(obj) is not list or not obj:
+            return None
+        first = obj[0]
+        if type(first) is float:
+            if len(obj) >= MIN_BUFFER_LENGTH and _is_floats(obj):
+                return self._out_of_band(array("d", obj), 0)
+        elif type(first) is list and first:
+            ncols = len(first)
+            if len(obj) * ncols >= MIN_BUFFER_LENGTH and all(
+                type(row) is list and len(row) == ncols and _is_floats(row) for row in obj
+            ):
+                flat = array("d")
+                for row in obj:
+                    flat.extend(row)
+                return self._out_of_band(flat, ncols)
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler reading the out-of-band buffers written by _Pickler."""
+
+    def __init__(self, data, buffers: list[memoryview]):
+        super().__init__(io.BytesIO(data))
+        self.buffers = buffers
+
+    def persistent_load(self, pid):
+        kind, index, ncols = pid
+        if kind != "floats":
+            raise pickle.UnpicklingError(f"unsupported persistent id {kind!r}")
+        values = self.buffers[index].cast("d").tolist()
+        if not ncols:
+            return values
+        return [values[i : i + ncols] for i in range(0, len(values), ncols)]
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as istream:
+        for chunk in iter(lambda: istream.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sources(obj) -> list[str]:
+    """Files the object graph was built from."""
+    from .bundle import loaded_components
+    from .dependencies import dependency_graph
+
+    source = getattr(obj, "_source", None)
+    if source is not None:
+        files = dependency_graph(source).files
+    else:
+        files = {s for _, s in loaded_components(obj).values() if s is not None}
+    # objects restored from a bundle refer to files that may not exist
+    return sorted(path for path in files if os.path.isfile(path))
+
+
+def _package_version() -> str:
+    from . import __version__
+
+    return __version__
+
+
+def save_snapshot(obj: Any, filename: str) -> str:
+    """
+    Write a binary snapshot of an object graph.
+
+    Args:
+        obj: Object to save (typically loaded with pmg.load)
+        filename: Snapshot file to write
+
+    Returns:
+        str: Path of the written snapshot
+    """
+    sources = {}
+    for path in _sources(obj):
+        st = os.stat(path)
+        sources[path] = [st.st_mtime_ns, st.st_size, _sha256(path)]
+    if not sources:
+        logger.warning("Snapshot %s: no source file, it will never be invalidated", filename)
+
+    stream = io.BytesIO()
+    pickler = _Pickler(stream)
+    pickler.dump(obj)
+    data = stream.getbuffer()
+    raw = [memoryview(buffer).cast("B") for buffer in pickler.buffers]
+
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "package": _package_version(),
+        "sources": sources,
+        "pickle": len(data),
+        "buffers": [len(r) for r in raw],
+    }
+    with open(filename, "wb") as ostream:
+        ostream.write(_MAGIC + f" {SNAPSHOT_VERSION}\n".encode())
+        ostream.write(json.dumps(header, sort_keys=True).encode() + b"\n")
+        for chunk in [data] + raw:
+            ostream.write(b"\0" * (-ostream.tell() % _ALIGN))
+            ostream.write(chunk)
+
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            "Snapshot %s: %d bytes pickled, %d buffers (%d bytes), %d sources",
+            filename,
+            len(data),
+            len(raw),
+            sum(len(r) for r in raw),
+            len(sources),
+        )
+    return filename
+
+
+def _stale_sources(sources: dict) -> list[str]:
+    stale = []
+    for path, (mtime_ns, size, sha256) in sources.items():
+        try:
+            st = os.stat(path)
+        except OSError:
+            stale.append(path)
+            continue
+        if st.st_size != size:
+            stale.append(path)
+        elif st.st_mtime_ns != mtime_ns and _sha256(path) != sha256:
+            # touched files are only stale if their content changed
+            stale.append(path)
+    return stale
+
+
+def load_snapshot(filename: str, verify: bool = True) -> Any:
+    """
+    Restore an object graph from a snapshot, without re-validation.
+
+    Args:
+        filename: Snapshot file
+        verify: Check that the source files did not change
+
+    Returns:
+        The restored object
+
+    Raises:
+        StaleSnapshotError: If a source file changed, or if the snapshot was
+                            written by another version of the package
+        ObjectLoadError: If the file is not a readable snapshot
+    """
+    path = resolve_path(filename)
+    try:
+        with open(path, "rb") as istream:
+            content = istream.read()
+    except OSError as e:
+        raise ObjectLoadError(f"Failed to read snapshot {filename}: {e}")
+
+    view = memoryview(content)
+    magic_end = content.find(b"\n")
+    header_end = content.find(b"\n", magic_end + 1)
+    if not content.startswith(_MAGIC) or header_end < 0:
+        raise ObjectLoadError(f"{filename} is not a magnetgeo snapshot")
+    try:
+        header = json.loads(view[magic_end + 1 : header_end].tobytes())
+        version, package = header["version"], header["package"]
+        if version != SNAPSHOT_VERSION or package != _package_version():
+            raise StaleSnapshotError(
+                f"Snapshot {filename} was written by python_magnetgeo {package} "
+                f"(format {version})"
+            )
+        if verify:
+            stale = _stale_sources(header["sources"])
+            if stale:
+                raise StaleSnapshotError(
+                    f"Snapshot {filename} is stale: {', '.join(stale)} changed"
+                )
+
+        position = header_end + 1
+        chunks = []
+        for length in [header["pickle"]] + header["buffers"]:
+            position += -position % _ALIGN
+            chunks.append(view[position : position + length])
+            position += length
+    except (ValueError, KeyError, TypeError) as e:
+        # damaged header: json error, missing or malformed entries
+        raise ObjectLoadError(f"Invalid snapshot header in {filename}: {e}")
+
+    try:
+        return _Unpickler(chunks[0], chunks[1:]).load()
+    except Exception as e:
+        raise ObjectLoadError(f"Failed to restore snapshot {filename}: {e}")
+
+
+def load_with_snapshot(filename: str, snapshot: str | None = None) -> Any:
+    """
+    Load a geometry file through a snapshot kept next to it.
+
+    The snapshot is used when it is fresh; otherwise the file is loaded
+    (and validated) with getObject and the snapshot is rewritten.
+
+    Args:
+        filename: YAML or JSON geometry file
+        snapshot: Snapshot file (default: filename + ".mgsnap")
+
+    Returns:
+        The loaded object
+    """
+    from .utils import getObject
+
+    if snapshot is None:
+        snapshot = f"{filename}{SNAPSHOT_EXTENSION}"
+    if os.path.exists(resolve_path(snapshot)):
+        try:
+            return load_snapshot(snapshot)
+        except ObjectLoadError as e:
+            logger.info("Rebuilding snapshot: %s", e)
+
+    obj = getObject(filename)
+    try:
+        save_snapshot(obj, resolve_path(snapshot))
+    except OSError as e:
+        logger.warning("Cannot write snapshot %s: %s", snapshot, e)
+    return obj
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Streaming construction of large YAML geometry documents.
+
+yaml.load composes the node tree of the whole document before the
+auto-registered constructors run (construct_mapping(node, deep=True)), so a
+measurement site with inline Bitters stacks and probes is held twice in
+memory: once as nodes, once as objects.
+
+load_streaming() builds the same objects directly from the parser event
+stream, bottom-up: a tagged mapping becomes an object (through from_dict,
+hence with the usual validation) as soon as its end event is read, and the
+events and intermediate values it was built from are released. No node tree
+is ever built.
+
+iter_components() goes further for documents whose size comes from a list
+of components: it yields the items of the top-level magnets/probes/...
+lists one at a time and drops each of them once consumed, so peak memory is
+that of the largest component rather than that of the document.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> site = pmg.load_streaming("M10.yaml")          # same as pmg.load
+    >>> for field, magnet in pmg.iter_components("M10.yaml", fields=("magnets",)):
+    ...     process(magnet)
+
+Notes:
+    - Nested string references are loaded as usual, relative to the
+      directory of the document
+    - Anchors and aliases are supported; an anchored value is kept until
+      the end of the document
+"""
+
+import os
+from collections.abc import Iterator
+from typing import Any
+
+from yaml import events
+from yaml.constructor import ConstructorError
+from yaml.nodes import ScalarNode
+
+from .logging_config import get_logger
+from .utils import ObjectLoadError, YamlLoader, base_directory, resolve_path
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+# classes of the untagged inline items of the lists iter_components can yield
+_ITEM_CLASSES = {
+    ("MSite", "magnets"): ("Insert", "Bitters", "Supras"),
+    ("MSite", "screens"): ("Screen",),
+    ("Insert", "helices"): ("Helix",),
+    ("Insert", "rings"): ("Ring",),
+    ("Insert", "currentleads"): ("InnerCurrentLead", "OuterCurrentLead"),
+    ("Insert", "probes"): ("Probe",),
+    ("Bitters", "magnets"): ("Bitter",),
+    ("Bitters", "probes"): ("Probe",),
+    ("Supras", "magnets"): ("Supra",),
+    ("Supras", "probes"): ("Probe",),
+}
+
+
+class _Container:
+    """A mapping or sequence being built from the event stream."""
+
+    __slots__ = ("tag", "anchor", "items", "is_mapping", "key", "has_key", "merges")
+
+    def __init__(self, tag, anchor, is_mapping):
+        self.tag = tag
+        self.anchor = anchor
+        self.is_mapping = is_mapping
+        self.items = {} if is_mapping else []
+        self.key = None
+        self.has_key = False
+        self.merges = []
+
+    def add(self, value, is_merge_key=False):
+        if not self.is_mapping:
+            self.items.append(value)
+        elif not self.has_key:
+            self.key = _MERGE_TAG if is_merge_key else value
+            self.has_key = True
+        else:
+            if self.key is _MERGE_TAG:
+                self.merges.extend(value if isinstance(value, list) else [value])
+            else:
+                self.items[self.key] = value
+            self.key = None
+            self.has_key = False
+
+    def value(self):
+        if self.merges:
+            # explicit keys take precedence over merged ones, as in PyYAML
+            merged = {}
+            for mapping in self.merges:
+                merged.update(mapping)
+            merged.update(self.items)
+            return merged
+        return self.items
+
+
+class _EventBuilder:
+    """Construct values bottom-up from the events of a YamlLoader."""
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.anchors = {}
+        self.stack: list[_Container] = []
+
+    def scalar(self, event) -> tuple[Any, bool]:
+        """Return the value of a scalar event and whether it is a merge key."""
+        loader = self.loader
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(ScalarNode, event.value, event.implicit)
+        if tag == _MERGE_TAG:
+            return None, True
+        constructor = loader.yaml_constructors.get(tag)
+        if constructor is None:
+            raise ConstructorError(
+                None,
+                None,
+                f"could not determine a constructor for the tag {tag!r}",
+                event.start_mark,
+            )
+        node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style)
+        return constructor(loader, node), False
+
+    def finish(self, container: _Container) -> Any:
+        """Build the value of a completed mapping or sequence."""
+        from .base import YAMLObjectBase
+
+        value = container.value()
+        tag = container.tag
+        if tag is not None and tag not in ("!", _MAP_TAG, _SEQ_TAG):
+            cls = YAMLObjectBase.get_class(tag)
+            if cls is None or not container.is_mapping:
+                raise ConstructorError(
+                    None, None, f"could not determine a constructor for the tag {tag!r}", None
+                )
+            value = cls.from_dict(value)
+        if container.anchor is not None:
+            self.anchors[container.anchor] = value
+        return value
+
+    def feed(self, event) -> tuple[int, Any] | None:
+        """
+        Process one event.
+
+        Returns:
+            (depth, value) when a value is completed, depth being the
+            number of enclosing containers, None otherwise
+        """
+        if isinstance(event, events.ScalarEvent):
+            value, is_merge_key = self.scalar(event)
+            if event.anchor is not None:
+                self.anchors[event.anchor] = value
+            return self._complete(value, is_merge_key)
+        if isinstance(event, events.AliasEvent):
+            if event.anchor not in self.anchors:
+                raise ConstructorError(
+                    None, None, f"found undefined alias {event.anchor!r}", event.start_mark
+                )
+            return self._complete(self.anchors[event.anchor])
+        if isinstance(event, events.MappingStartEvent):
+            self.stack.append(_Container(event.tag, event.anchor, True))
+        elif isinstance(event, events.SequenceStartEvent):
+            self.stack.append(_Container(event.tag, event.anchor, False))
+        elif isinstance(event, (events.MappingEndEvent, events.SequenceEndEvent)):
+            return self._complete(self.finish(self.stack.pop()))
+        return None
+
+    def _complete(self, value, is_merge_key=False) -> tuple[int, Any]:
+        if self.stack:
+            self.stack[-1].add(value, is_merge_key)
+        return len(self.stack), value
+
+
+def _events(path: str) -> Iterator:
+    with open(path, "r") as istream:
+        loader = YamlLoader(istream)
+        try:
+            while loader.check_event():
+                yield loader, loader.get_event()
+        finally:
+            loader.dispose()
+
+
+def load_streaming(filename: str) -> Any:
+    """
+    Load a YAML geometry file without building its node tree.
+
+    Returns the same object as loadYaml, validated the same way: objects
+    are built bottom-up with from_dict, each one as soon as its mapping has
+    been read.
+
+    Args:
+        filename: YAML file, relative paths are resolved against the current
+                  base directory (see utils.get_basedir)
+
+    Returns:
+        The loaded object
+
+    Raises:
+        ObjectLoadError: If the file cannot be read, parsed or constructed
+    """
+    path = resolve_path(filename)
+    basedir = os.path.dirname(path)
+    logger.debug("Streaming YAML: %s", path)
+
+    obj = None
+    try:
+        with base_directory(basedir):
+            builder = None
+            for loader, event in _events(path):
+                if builder is None:
+                    builder = _EventBuilder(loader)
+                completed = builder.feed(event)
+                if completed is not None and completed[0] == 0:
+                    obj = completed[1]
+    except ObjectLoadError:
+        raise
+    except Exception as e:
+        raise ObjectLoadError(f"Failed to stream {filename}: {e}")
+
+    if hasattr(obj, "__dict__"):
+        obj._basedir = basedir
+        obj._source = path
+        if hasattr(obj, "update"):
+            obj.update()
+    logger.info("Successfully streamed %s", filename)
+    return obj
+
+
+def _build_item(parent_tag: str | None, field: str, item) -> Any:
+    """Build a list item yielded by iter_components."""
+    from .base import YAMLObjectBase
+
+    if not isinstance(item, (str, dict)):
+        return item
+    names = _ITEM_CLASSES.get((parent_tag, field))
+    if names is None:
+        if isinstance(item, str):
+            from .lazy import load_reference
+
+            return load_reference(f"{item}.yaml")
+        raise ObjectLoadError(
+            f"Cannot build untagged {field} item of {parent_tag}: unknown class"
+        )
+    classes = tuple(YAMLObjectBase.get_class(name) for name in names)
+    return YAMLObjectBase._load_nested_single(item, classes)
+
+
+def iter_components(
+    filename: str, fields: tuple[str, ...] = ("magnets", "probes")
+) -> Iterator[tuple[str, Any]]:
+    """
+    Yield the items of top-level lists of a YAML geometry file one at a time.
+
+    Only the item being built is held in memory: each item of the selected
+    top-level lists (e.g. the magnets of an MSite, the probes of an Insert)
+    is constructed from the event stream, yielded, then released. The
+    top-level object itself is not built.
+
+    Args:
+        filename: YAML file
+        fields: Top-level list fields to yield the items of
+
+    Yields:
+        tuple: (field, object); string references are loaded from their file
+
+    Raises:
+        ObjectLoadError: If the file cannot be read, parsed or constructed
+    """
+    path = resolve_path(filename)
+    basedir = os.path.dirname(path)
+    fields = tuple(fields)
+
+    try:
+        builder = None
+        for loader, event in _events(path):
+            if builder is None:
+                builder = _EventBuilder(loader)
+            stack = builder.stack
+            if len(stack) == 1 and isinstance(event, events.MappingEndEvent):
+                # end of the root mapping: the root object is not built
+                break
+            # references resolve against the file's directory while building
+            # only: the consumer of the items keeps its own base directory
+            with base_directory(basedir):
+                completed = builder.feed(event)
+            if completed is None or completed[0] != 2:
+                continue
+            # direct item of a top-level list of the root mapping
+            root, current = stack
+            if root.is_mapping and not current.is_mapping and root.key in fields:
+                item = current.items.pop()
+                with base_directory(basedir):
+                    component = _build_item(root.tag, root.key, item)
+                yield root.key, component
+    except ObjectLoadError:
+        raise
+    except Exception as e:
+        raise ObjectLoadError(f"Failed to stream {filename}: {e}")
@@ -1,12 +1,20 @@
-import os
 
 from .base import YAMLObjectBase
+from .schema import Field, is_integer, is_positive
 from .Contour2D import Contour2D
-from .validation import GeometryValidator
+from .utils import get_basedir
 
 
 class Tierod(YAMLObjectBase):
     yaml_tag = "Tierod"
+    _fields = (
+        Field("name", str, default=""),
+        Field("n", int, validators=(is_integer, is_positive)),
+        Field("r", float, validators=(is_positive,)),
+        Field("dh", float, default=0.0, validators=(is_positive,)),
+        Field("sh", float, default=0.0, validators=(is_positive,)),
+        Field("contour2d", nested=Contour2D, default=None),
+    )
 
     def __init__(
         self, name: str, r: float, n: int, dh: float, sh: float, contour2d: str | Contour2D
@@ -90,11 +98,7 @@ class Tierod(YAMLObjectBase):
         # GeometryValidator.validate_name(name)
 
         # Ring-specific validation
-        GeometryValidator.validate_integer(n, "n")
-        GeometryValidator.validate_positive(n, "n")
-        GeometryValidator.validate_positive(r, "r")
-        GeometryValidator.validate_positive(dh, "dh")
-        GeometryValidator.validate_positive(sh, "sh")
+        self._validate_fields(n=n, r=r, dh=dh, sh=sh)
 
         self.name = name
         self.r = r
@@ -104,7 +108,7 @@ class Tierod(YAMLObjectBase):
         self.contour2d = contour2d
 
         # Store the directory context for resolving struct paths
-        self._basedir = os.getcwd()
+        self._basedir = get_basedir()
 
     def __repr__(self):
         """
@@ -149,78 +153,17 @@ class Tierod(YAMLObjectBase):
         )
 
     @classmethod
-    def from_dict(cls, values: dict, debug: bool = False):
+    def _analyze_nested_dependencies(cls, values: dict, required_files: set, debug: bool = False):
         """
-        Create Tierod instance from dictionary representation.
+        Analyze nested dependencies specific to Tierod class.
 
-        Supports flexible input formats for the nested contour2d object,
-        allowing inline definition, file reference, or pre-instantiated object.
+        Identifies the file that would be loaded for the contour2d.
 
         Args:
-            values: Dictionary containing Tierod configuration with keys:
-                - name (str): Tie rod identifier
-                - r (float): Radial position in mm
-                - n (int): Number of holes
-                - dh (float, optional): Hydraulic diameter in mm (default: 0.0)
-                - sh (float, optional): Hole cross-section in mm² (default: 0.0)
-                - contour2d: Contour2D specification (string/dict/object/None)
-            debug: Enable debug output showing object loading process
-
-        Returns:
-            Tierod: New Tierod instance created from dictionary
-
-        Raises:
-            KeyError: If required keys ('name', 'r', 'n') are missing from dictionary
-            ValidationError: If values fail validation checks
-            ValidationError: If contour2d data is malformed
-
-        Notes:
-            - dh and sh default to 0.0 if not provided (structural only)
-            - contour2d is optional (can be None)
-
-        Example:
-            >>> # With inline contour definition
-            >>> data = {
-            ...     "name": "support_rods",
-            ...     "r": 95.0,
-            ...     "n": 6,
-            ...     "dh": 0.0,
-            ...     "sh": 0.0,
-            ...     "contour2d": {
-            ...         "name": "circle",
-            ...         "points": [[0, 0], [10, 0]]
-            ...     }
-            ... }
-            >>> tierod = Tierod.from_dict(data)
-
-            >>> # With file reference
-            >>> data2 = {
-            ...     "name": "cooling_rods",
-            ...     "r": 110.0,
-            ...     "n": 8,
-            ...     "dh": 12.0,
-            ...     "sh": 113.1,
-            ...     "contour2d": "rod_profile"  # Load from rod_profile.yaml
-            ... }
-            >>> tierod2 = Tierod.from_dict(data2)
-
-            >>> # Minimal (structural only, no contour)
-            >>> data3 = {
-            ...     "name": "simple_rods",
-            ...     "r": 100.0,
-            ...     "n": 12
-            ...     # dh, sh default to 0.0
-            ...     # contour2d defaults to None
-            ... }
-            >>> tierod3 = Tierod.from_dict(data3)
+            values: Dictionary containing tierod parameters
+            required_files: Set to populate with file paths (modified in place)
+            debug: Enable debug output
         """
-        # Smart nested object handling
-        contour2d = cls._load_nested_single(values.get("contour2d"), Contour2D, debug=debug)
-        return cls(
-            name=values.get("name", ""),
-            r=values["r"],
-            n=values["n"],
-            dh=values.get("dh", 0.0),
-            sh=values.get("sh", 0.0),
-            contour2d=contour2d,
+        cls._analyze_single_dependency(
+            values.get("contour2d"), Contour2D, required_files, debug=debug
         )
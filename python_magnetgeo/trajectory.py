@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Dense samples of the helical cut path of Helix and Bitter objects.
+
+CAM verification and visual overlays need the cut path at a fine angular
+resolution, over tens of turns and all the helices of an Insert. The
+samples are computed with numpy from the section breakpoints of the
+modelaxi (see sections module): the angle is sampled uniformly and the
+axial position is interpolated, by chunks of at most `chunk` points, so
+that no Python object is allocated per point.
+
+Conventions:
+    - theta is the signed angle of the cut in radians, 0 at z = -h; odd
+      objects are left handed (theta decreases with z), as in the LNCMI
+      cut files ("gauche")
+    - the samples lie on a cylinder of radius `radius`, by default the
+      mean radius of the conductor (r[0] + r[1]) / 2
+    - edge selects the centre line of the cut (0) or its lower (-1) or
+      upper (+1) edge, cutwidth / 2 away along z (Bitter disks have no
+      cutwidth: the three lines coincide)
+
+Example:
+    >>> samples = helix.sample_cut(points_per_turn=3600)
+    >>> samples.x.shape                       # one value per point
+    >>> for chunk in helix.iter_cut(points_per_turn=360_000):
+    ...     check(chunk.theta, chunk.z)       # bounded memory
+    >>> cuts = insert.sample_cuts()           # {helix name: CutSamples}
+"""
+
+import math
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+import numpy as np
+
+# Points per chunk of the streaming mode (4 arrays of 512 KiB)
+DEFAULT_CHUNK = 65536
+
+
+class CutSamples(NamedTuple):
+    """Samples of a cut path, as arrays of the same length."""
+
+    theta: np.ndarray
+    z: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+
+
+class _Path:
+    """Sampling parameters of the cut path of a Helix or Bitter."""
+
+    __slots__ = ("sections", "sign", "radius", "offset", "count", "step")
+
+    def __init__(self, obj, points_per_turn: int, radius: float | None, edge: int) -> None:
+        if obj.modelaxi is None or not obj.modelaxi.sections().nsections:
+            raise ValueError(f"{type(obj).__name__} {obj.name}: no helical cut to sample")
+        if points_per_turn < 1:
+            raise ValueError(f"points_per_turn must be positive, got {points_per_turn}")
+        if edge not in (-1, 0, 1):
+            raise ValueError(f"edge must be -1, 0 or 1, got {edge}")
+
+        self.sections = obj.modelaxi.sections()
+        self.sign = -1.0 if obj.odd else 1.0
+        self.radius = (obj.r[0] + obj.r[1]) / 2 if radius is None else float(radius)
+        self.offset = edge * getattr(obj, "cutwidth", 0.0) / 2
+        turns = float(self.sections.turns.sum())
+        self.count = max(math.ceil(turns * points_per_turn), 1) + 1
+        self.step = float(self.sections.theta[-1]) / (self.count - 1)
+
+    def samples(self, start: int, stop: int) -> CutSamples:
+        """Samples start to stop (excluded) of the path."""
+        angle = np.arange(start, stop, dtype=float)
+        angle *= self.step
+        z = self.sections.z_at(angle)
+        if self.offset:
+            z += self.offset
+        angle *= self.sign
+        return CutSamples(angle, z, self.radius * np.cos(angle), self.radius * np.sin(angle))
+
+
+def sample_cut(
+    obj, points_per_turn: int = 360, radius: float | None = None, edge: int = 0
+) -> CutSamples:
+    """
+    Sample the cut path of a Helix or Bitter in one batch.
+
+    Args:
+        obj: Helix or Bitter with a modelaxi
+        points_per_turn: Angular resolution (points per turn). Default: 360
+        radius: Radius of the samples. Default: mean radius of the conductor
+        edge: 0 for the centre line of the cut, -1/+1 for its lower/upper edge
+
+    Returns:
+        CutSamples: theta, z, x and y of every point, from z = -h to z = h
+
+    Raises:
+        ValueError: If obj has no helical cut, or on invalid arguments
+    """
+    path = _Path(obj, points_per_turn, radius, edge)
+    return path.samples(0, path.count)
+
+
+def iter_cut(
+    obj,
+    points_per_turn: int = 360,
+    radius: float | None = None,
+    edge: int = 0,
+    chunk: int | None = None,
+) -> Iterator[CutSamples]:
+    """
+    Stream the cut path of a Helix or Bitter by chunks of at most chunk points.
+
+    Same arguments and samples as sample_cut: concatenating the chunks gives
+    the arrays of sample_cut, while the memory used is bounded by chunk
+    (default: DEFAULT_CHUNK).
+
+    Yields:
+        CutSamples: Consecutive chunks of the path, from z = -h to z = h
+    """
+    if chunk is None:
+        chunk = DEFAULT_CHUNK
+    if chunk < 1:
+        raise ValueError(f"chunk must be positive, got {chunk}")
+    path = _Path(obj, points_per_turn, radius, edge)
+    for start in range(0, path.count, chunk):
+        yield path.samples(start, min(start + chunk, path.count))
+
+
+def sample_cuts(objects: Iterable, points_per_turn: int = 360, edge: int = 0) -> dict:
+    """
+    Sample the cut paths of several helices or disks (e.g. Insert.helices).
+
+    Objects without a helical cut are skipped; each path is sampled at the
+    mean radius of its conductor.
+
+    Args:
+        objects: Helix or Bitter objects
+        points_per_turn: Angular resolution (points per turn). Default: 360
+        edge: 0 for the centre line of the cuts, -1/+1 for their lower/upper edge
+
+    Returns:
+        dict: CutSamples by object name
+    """
+    cuts = {}
+    for obj in objects:
+        if obj.modelaxi is not None and obj.modelaxi.sections().nsections:
+            cuts[obj.name] = sample_cut(obj, points_per_turn, edge=edge)
+    return cuts
@@ -9,14 +9,89 @@ Fixed version compatible with both original and refactored classes
 import os
 import yaml
 import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Iterable
 from typing import Any, Type
-from pathlib import Path
 
-from .logging_config import get_logger
+from . import cache
+from .logging_config import DEBUG, get_logger
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Prefer the libyaml C bindings when PyYAML was built against libyaml,
+# otherwise fall back to the pure-Python implementation.
+# Both produce the same objects and byte-identical output.
+try:
+    from yaml import CSafeLoader as YamlLoader
+    from yaml import CDumper as _BaseDumper
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as YamlLoader
+    from yaml import Dumper as _BaseDumper
+
+
+class YamlDumper(_BaseDumper):
+    """
+    Dumper used for geometry objects.
+
+    Objects shared by several parents (see interning) are written inline at
+    each place they are used instead of as YAML anchors/aliases, so the output
+    does not depend on whether objects are shared. Geometry trees are acyclic,
+    so aliases are never needed.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+# Directory against which relative file references are resolved while
+# loading. Carried per thread/task instead of changing the process cwd.
+_basedir: ContextVar[str | None] = ContextVar("magnetgeo_basedir", default=None)
+
+
+def get_basedir() -> str:
+    """
+    Return the directory relative file references are resolved against.
+
+    While a file is being loaded this is the directory of that file,
+    otherwise the current working directory.
+    """
+    basedir = _basedir.get()
+    return basedir if basedir is not None else os.getcwd()
+
+
+def resolve_path(filename: str) -> str:
+    """
+    Return the absolute path of filename, resolved against get_basedir().
+
+    Args:
+        filename: Absolute path or path relative to the current base directory
+
+    Returns:
+        Normalized absolute path
+    """
+    return os.path.normpath(os.path.join(get_basedir(), os.path.expanduser(filename)))
+
+
+@contextmanager
+def base_directory(directory: str):
+    """
+    Resolve relative file references against directory within this context.
+
+    Only affects the current thread (or asyncio task); the process working
+    directory is left untouched.
+
+    Example:
+        >>> with base_directory("/data/M9"):
+        ...     insert = getObject("HL-31.yaml")   # loads /data/M9/HL-31.yaml
+    """
+    token = _basedir.set(resolve_path(directory))
+    try:
+        yield
+    finally:
+        _basedir.reset(token)
+
 
 class ObjectLoadError(Exception):
     """Raised when object loading fails"""
@@ -60,7 +135,7 @@ def writeYaml(
     try:
         logger.debug(f"Writing {comment} to {filename}")
         with open(filename, "w") as ostream:
-            yaml.dump(obj, stream=ostream, default_flow_style=False)
+            yaml.dump(obj, stream=ostream, Dumper=YamlDumper, default_flow_style=False)
 
         logger.info(f"Successfully wrote {comment} to {filename}")
 
@@ -106,7 +181,8 @@ def loadYaml(comment: str, filename: str, supported_type: Type = None, debug: bo
 
     Args:
         comment: Comment/description for the operation
-        filename: Path to YAML file
+        filename: Path to YAML file, relative paths are resolved against
+                  the current base directory (see get_basedir)
         supported_type: Expected object type for validation
         debug: Enable debug output
 
@@ -116,33 +192,47 @@ def loadYaml(comment: str, filename: str, supported_type: Type = None, debug: bo
     Raises:
         ObjectLoadError: When file loading fails
         UnsupportedTypeError: When object type is not supported
-    """
-    cwd = os.getcwd()
 
-    # Handle path splitting
-    basedir, basename = os.path.split(filename)
+    Notes:
+        Nested references are resolved relative to the directory of filename
+        without changing the process working directory, so several files can
+        be loaded concurrently from different threads.
+        Inside a prefetch.prefetching() scope, the file and its references
+        are read and parsed by a thread pool, construction stays here.
+        When the parse cache is enabled (see cache.enable_cache), a clone of
+        a previously loaded object is returned if neither the file nor any
+        file it references has changed.
+    """
+    from .prefetch import construct_node, get_prefetcher
 
-    logger.debug(
-        f"Loading YAML: comment={comment}, filename={filename}, basedir={basedir}, cwd={cwd}"
-    )
+    path = resolve_path(filename)
+    basedir = os.path.dirname(path)
 
-    # Change to target directory if needed
-    if basedir and basedir != ".":
-        os.chdir(basedir)
-        logger.debug(f"Changed directory: {cwd} -> {basedir}")
+    logger.debug("Loading YAML: comment=%s, filename=%s, basedir=%s", comment, filename, basedir)
 
     try:
-        # Load YAML file
-        logger.debug(f"looking for file: {basename}, supported_type={supported_type}")
-        with open(basename, "r") as istream:  # Potential FileNotFoundError happens here
-            obj = yaml.load(stream=istream, Loader=yaml.FullLoader)
-            obj._basedir = cwd
-            if basedir and basedir != ".":
-                obj._basedir = os.getcwd()
-
-        logger.debug(f"Loaded object type: {type(obj).__name__}")
-        if hasattr(obj, "name"):
-            logger.debug(f"  Object name: {obj.name}")
+        obj = cache.lookup(path)
+        if obj is not None:
+            logger.debug("Parse cache hit for %s", path)
+        else:
+            with cache.track(path) as store, base_directory(basedir):
+                # Load YAML file
+                logger.debug("looking for file: %s, supported_type=%s", path, supported_type)
+                prefetcher = get_prefetcher()
+                if prefetcher is not None:
+                    # read and parsed in the prefetch pool, constructed here
+                    obj = construct_node(prefetcher.get(path))
+                else:
+                    with open(path, "r") as istream:  # Potential FileNotFoundError happens here
+                        obj = yaml.load(stream=istream, Loader=YamlLoader)
+                obj._basedir = basedir
+                obj._source = path
+                store(obj)
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Loaded object type: %s", type(obj).__name__)
+            if hasattr(obj, "name"):
+                logger.debug("  Object name: %s", obj.name)
 
         # Type validation if expected_type provided
         if supported_type and not isinstance(obj, supported_type):
@@ -153,11 +243,11 @@ def loadYaml(comment: str, filename: str, supported_type: Type = None, debug: bo
 
         # Auto-update if object supports it
         if hasattr(obj, "update"):
-            logger.debug(f"Calling update() on {type(obj).__name__}")
+            logger.debug("Calling update() on %s", type(obj).__name__)
             obj.update()
 
-        logger.info(f"Successfully loaded {comment} from {filename}")
-        logger.debug(f"  loadYaml: {comment} from {filename} completed successfully")
+        logger.info("Successfully loaded %s from %s", comment, filename)
+        logger.debug("  loadYaml: %s from %s completed successfully", comment, filename)
 
         return obj
 
@@ -176,11 +266,6 @@ def loadYaml(comment: str, filename: str, supported_type: Type = None, debug: bo
         error_msg = f"Failed to load {comment} data from {filename} due to an unexpected error: {e}"
         logger.error(error_msg, exc_info=True)
         raise ObjectLoadError(error_msg)
-    finally:
-        # Always restore original directory
-        if basedir and basedir != ".":
-            os.chdir(cwd)
-            logger.debug(f"Restored directory: {basedir} -> {cwd}")
 
 
 def loadJson(comment: str, filename: str, debug: bool = False) -> Any:
@@ -189,7 +274,8 @@ def loadJson(comment: str, filename: str, debug: bool = False) -> Any:
 
     Args:
         comment: Comment/description for the operation
-        filename: Path to JSON file
+        filename: Path to JSON file, relative paths are resolved against
+                  the current base directory (see get_basedir)
         debug: Enable debug output
 
     Returns:
@@ -197,30 +283,33 @@ def loadJson(comment: str, filename: str, debug: bool = False) -> Any:
 
     Raises:
         ObjectLoadError: When file loading fails
+
+    Notes:
+        Does not change the process working directory and is served from
+        the parse cache when enabled, like loadYaml.
     """
     from . import deserialize
 
-    cwd = os.getcwd()
-    basedir, basename = os.path.split(filename)
-
-    logger.debug(
-        f"Loading JSON: comment={comment}, filename={filename}, basedir={basedir}, cwd={cwd}"
-    )
+    path = resolve_path(filename)
+    basedir = os.path.dirname(path)
 
-    if basedir and basedir != ".":
-        os.chdir(basedir)
-        logger.debug(f"Changed directory: {cwd} -> {basedir}")
+    logger.debug("Loading JSON: comment=%s, filename=%s, basedir=%s", comment, filename, basedir)
 
     try:
-        logger.debug(f"Loading JSON from: {basename}")
+        obj = cache.lookup(path)
+        if obj is not None:
+            logger.debug("Parse cache hit for %s", path)
+        else:
+            with cache.track(path) as store, base_directory(basedir):
+                logger.debug("Loading JSON from: %s", path)
 
-        with open(basename, "r") as istream:
-            obj = json.loads(istream.read(), object_hook=deserialize.unserialize_object)
-            obj._basedir = cwd
-            if basedir and basedir != ".":
-                obj._basedir = os.getcwd()
+                with open(path, "r") as istream:
+                    obj = json.loads(istream.read(), object_hook=deserialize.unserialize_object)
+                    obj._basedir = basedir
+                    obj._source = path
+                store(obj)
 
-        logger.info(f"Successfully loaded {comment} from {filename}")
+        logger.info("Successfully loaded %s from %s", comment, filename)
 
         return obj
 
@@ -232,10 +321,6 @@ def loadJson(comment: str, filename: str, debug: bool = False) -> Any:
         error_msg = f"{error_type}: {filename}. Details: {e}"
         logger.error(error_msg)
         raise ObjectLoadError(error_msg)
-    finally:
-        if basedir and basedir != ".":
-            os.chdir(cwd)
-            logger.debug(f"Restored directory: {basedir} -> {cwd}")
 
 
 def check_objects(objects, supported_type):
@@ -388,28 +473,51 @@ def getObject(filename: str) -> Any:
     """
     Load an object from a YAML or JSON file and update it if necessary.
     By default, loads from YAML unless from_json is True.
+    Bundles written by pack() (.mgpack) are loaded with bundle.unpack.
 
     Args:
-        filename: Path to YAML or JSON file
+        filename: Path to YAML, JSON or bundle file
     Returns:
         Loaded and updated object
 
     Raises:
-        ObjectLoadError: When file extension is not .json, .yaml, or .yml
+        ObjectLoadError: When file extension is not .json, .yaml, .yml or .mgpack
     """
+    from .bundle import BUNDLE_EXTENSION
+
     obj = None
     if filename.endswith(".json"):
         obj = loadJson("object", filename)
     elif filename.endswith(".yaml") or filename.endswith(".yml"):
         obj = loadYaml("object", filename)
+    elif filename.endswith(BUNDLE_EXTENSION):
+        from .bundle import unpack
+
+        obj = unpack(filename)
     else:
         raise ObjectLoadError(
-            f"Unsupported file extension for {filename}. Only .json, .yaml, and .yml files are supported."
+            f"Unsupported file extension for {filename}. "
+            f"Only .json, .yaml, .yml and {BUNDLE_EXTENSION} files are supported."
         )
     return obj
 
 
 def flatten(S: list) -> list:
-    from pandas.core.common import flatten as pd_flatten
+    """
+    Flatten nested iterables into a list, strings being kept whole.
 
-    return list(pd_flatten(S))
+    Example:
+        >>> flatten([1, [2, [3, "ab"]], (4,)])
+        [1, 2, 3, 'ab', 4]
+    """
+    flat = []
+    stack = [iter(S)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, Iterable) and not isinstance(item, str):
+                stack.append(iter(item))
+                break
+            flat.append(item)
+        else:
+            stack.pop()
+    return flat
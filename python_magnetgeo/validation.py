@@ -119,7 +119,7 @@ class GeometryValidator:
             logger.error("Validation failed: Name cannot be whitespace only")
             raise ValidationError("Name cannot be whitespace only")
         
-        logger.debug(f"Name validation passed: '{name}'")
+        logger.debug("Name validation passed: '%s'", name)
 
     @staticmethod
     def validate_positive(r: float, name: str) -> None:
@@ -131,7 +131,7 @@ class GeometryValidator:
             logger.error(f"Validation failed: {name}={r} must be positive or null")
             raise ValidationError(f"{name} must be positive or null")
         
-        logger.debug(f"Positive validation passed: {name}={r}")
+        logger.debug("Positive validation passed: %s=%s", name, r)
 
     @staticmethod
     def validate_integer(n: int, name: str) -> None:
@@ -140,7 +140,7 @@ class GeometryValidator:
             logger.error(f"Validation failed: {name} must be an integer, got {type(n)}")
             raise ValidationError(f"{name} must be an integer")
         
-        logger.debug(f"Integer validation passed: {name}={n}")
+        logger.debug("Integer validation passed: %s=%s", name, n)
 
     @staticmethod
     def validate_numeric(n: int | float, name: str) -> None:
@@ -149,7 +149,7 @@ class GeometryValidator:
             logger.error(f"Validation failed: {name} must be numeric, got {type(n)}")
             raise ValidationError(f"{name} must be an integer or a float")
         
-        logger.debug(f"Numeric validation passed: {name}={n}")
+        logger.debug("Numeric validation passed: %s=%s", name, n)
 
     @staticmethod
     def validate_numeric_list(values: list[float], name: str, expected_length: int = None) -> None:
@@ -168,7 +168,7 @@ class GeometryValidator:
                 f"{name} must have exactly {expected_length} values, got {len(values)}"
             )
         
-        logger.debug(f"Numeric list validation passed: {name} with {len(values)} elements")
+        logger.debug("Numeric list validation passed: %s with %d elements", name, len(values))
 
     @staticmethod
     def validate_ascending_order(values: list[float], name: str) -> None:
@@ -178,4 +178,113 @@ class GeometryValidator:
                 logger.error(f"Validation failed: {name} values not in ascending order at index {i}: {values}")
                 raise ValidationError(f"{name} values must be in ascending order: {values}")
         
-        logger.debug(f"Ascending order validation passed: {name}={values}")
+        logger.debug("Ascending order validation passed: %s=%s", name, values)
+
+    @staticmethod
+    def validate_no_intersection(magnets: list, chunk: int = 256, changed=None) -> None:
+        """
+        Validate that the bounding boxes of a stack of magnets do not intersect.
+
+        Each magnet i-1 is checked against the magnets i+1, i+2, ... (the
+        rule of Bitters, Supras and MSite) with NumPy, by blocks of chunk
+        magnets compared with the magnets overlapping the bounding box of
+        the block only.
+
+        Args:
+            magnets: Objects with a boundingBox() method returning (r, z)
+            chunk: Number of magnets compared per block
+            changed: Indices of the magnets edited since the stack was last
+                     validated; only the pairs involving them are checked
+
+        Raises:
+            ValidationError: For the first intersecting pair, in stack order
+        """
+        if len(magnets) < 3:
+            return
+        import numpy as np
+
+        def overlap(rows, columns):
+            r_overlap = np.maximum(rows[:, None, 0], columns[:, 0]) < np.minimum(
+                rows[:, None, 1], columns[:, 1]
+            )
+            z_overlap = np.maximum(rows[:, None, 2], columns[:, 2]) < np.minimum(
+                rows[:, None, 3], columns[:, 3]
+            )
+            return r_overlap & z_overlap
+
+        def fail(i):
+            logger.error(f"Validation failed: magnet[{i}] intersect magnet[{i - 1}]")
+            raise ValidationError(
+                f"magnets intersect: magnet[{i}] intersect magnet[{i-1}]: "
+                f"/n{magnets[i]} /n{magnets[i-1]}"
+            )
+
+        boxes = np.array([[*r, *z] for r, z in (m.boundingBox() for m in magnets)], dtype=float)
+        n = len(boxes)
+        if changed is not None:
+            failures = []
+            for k in changed:
+                hits = overlap(boxes[k : k + 1], boxes)[0]
+                # k as the later magnet of a pair (i - 1, j >= i + 1), then as the earlier one
+                before = np.flatnonzero(hits[: max(k - 1, 0)])
+                if before.size:
+                    failures.append(int(before[0]) + 1)
+                if hits[k + 2 :].any():
+                    failures.append(k + 1)
+            if failures:
+                fail(min(failures))
+            logger.debug("Intersection validation passed: %d magnets", len(changed))
+            return
+
+        for start in range(0, n - 2, chunk):
+            rows = boxes[start : start + chunk]
+            # candidates: magnets after the block's first one overlapping the block envelope
+            candidates = np.flatnonzero(
+                (boxes[:, 0] < rows[:, 1].max())
+                & (boxes[:, 1] > rows[:, 0].min())
+                & (boxes[:, 2] < rows[:, 3].max())
+                & (boxes[:, 3] > rows[:, 2].min())
+            )
+            candidates = candidates[candidates >= start + 2]
+            if not candidates.size:
+                continue
+            # magnet start+k is compared with magnets start+k+2, start+k+3, ...
+            after = candidates[None, :] >= np.arange(start + 2, start + 2 + len(rows))[:, None]
+            hits = np.flatnonzero((overlap(rows, boxes[candidates]) & after).any(axis=1))
+            if hits.size:
+                fail(start + int(hits[0]) + 1)
+
+        logger.debug("Intersection validation passed: %d magnets", n)
+
+    @staticmethod
+    def revalidate_no_intersection(magnets: list, components: tuple, field: str = "magnets") -> int:
+        """
+        Re-run validate_no_intersection for the edited magnets of a stack.
+
+        Shared by the revalidate() methods of the assemblies holding a
+        stack of magnets (Bitters, MSite).
+
+        Args:
+            magnets: Magnets of the assembly
+            components: Edited magnets (objects of the stack) or keys such
+                        as (field, 3); empty to check all pairs
+            field: Name of the attribute holding the stack
+
+        Returns:
+            int: Number of consistency rules run (0 if no edited magnet
+                 belongs to the stack)
+
+        Raises:
+            ValidationError: If two magnets intersect
+        """
+        changed = None
+        if components:
+            changed = [
+                i
+                for i, magnet in enumerate(magnets)
+                if (field, i) in components or any(magnet is c for c in components)
+            ]
+            if not changed:
+                return 0
+        GeometryValidator.validate_no_intersection(magnets, changed=changed)
+        return 1
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Hot reload of loaded geometry trees when their files change.
+
+Reloading an MSite because one helix file was edited re-reads, rebuilds and
+revalidates the whole assembly. A GeometryWatcher keeps a loaded tree up to
+date instead: it maps every file to the objects built from it (each object
+loaded from a file carries its _source, relative references being resolved
+against the _basedir of the referencing file) and to where these objects
+are held in the tree. When a file changes, only the object built from that
+file is rebuilt, the unchanged objects it references being reused as is,
+and spliced in place of the previous one. The assemblies above it then
+re-run the rules reading that component only (Insert.revalidate), and the
+registered callbacks are notified.
+
+Changes are detected with inotify through the optional watchdog package
+when it is installed, and by polling file signatures (mtime, size)
+otherwise. Both backends confirm candidate changes by signature before
+reloading anything.
+
+Example:
+    >>> import python_magnetgeo as pmg
+    >>> site = pmg.load("M9.yaml")
+    >>> def reloaded(event):
+    ...     print(event.path, event.error or "ok")
+    >>> with pmg.GeometryWatcher(site, reloaded, interval=0.5) as watcher:
+    ...     ...                      # edit HL-31_H3.yaml: only H3 is rebuilt
+    >>> site = watcher.root          # new object if M9.yaml itself changed
+
+Notes:
+    - A change that cannot be loaded or breaks a rule of an assembly is
+      reported to the callbacks with its error, and leaves the tree as it was
+    - Reloads, hence callbacks, run in the watcher thread when started, or
+      in the caller thread with poll()/reload(); the tree must not be
+      edited concurrently
+    - References that are not loaded yet (lazy_loading) are not watched:
+      they read the current file when forced
+    - A watcher cannot be started again once stopped: stop() releases the
+      backend
+"""
+
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from .cache import file_signature, reusing
+from .logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
+
+DEFAULT_INTERVAL = 0.5
+
+
+class PollingBackend:
+    """
+    Detects file changes by comparing signatures at each poll.
+
+    Each poll stats every watched file, which is cheap compared to reading
+    and parsing, but proportional to the number of files.
+    """
+
+    def __init__(self):
+        self._signatures: dict[str, tuple] = {}
+        self._wakeup = threading.Event()
+
+    def watch(self, paths: Iterable[str]) -> None:
+        """Start watching files, taking their current state as reference."""
+        for path in paths:
+            if path not in self._signatures:
+                self._signatures[path] = file_signature(path)
+
+    def unwatch(self, paths: Iterable[str]) -> None:
+        """Stop watching files."""
+        for path in paths:
+            self._signatures.pop(path, None)
+
+    def _confirm(self, candidates: Iterable[str]) -> set[str]:
+        changed = set()
+        for path in candidates:
+            signature = file_signature(path)
+            if path in self._signatures and signature != self._signatures[path]:
+                self._signatures[path] = signature
+                changed.add(path)
+        return changed
+
+    def changes(self, timeout: float = 0.0) -> set[str]:
+        """
+        Return the watched files changed since the previous call.
+
+        Args:
+            timeout: Seconds to wait before checking, interrupted by close()
+        """
+        if timeout:
+            self._wakeup.wait(timeout)
+        return self._confirm(list(self._signatures))
+
+    def close(self) -> None:
+        self._wakeup.set()
+
+
+class WatchdogBackend(PollingBackend):
+    """
+    Detects file changes from filesystem events (inotify on Linux).
+
+    Requires the watchdog package. Only the files named by events are
+    checked, so a poll costs nothing while no file changes.
+    """
+
+    def __init__(self):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        super().__init__()
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._directories: dict[str, Any] = {}
+
+        backend = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # editors often save by renaming a temporary file over the target
+                backend._notify(event.src_path, getattr(event, "dest_path", ""))
+
+        self._handler = _Handler()
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.start()
+
+    def _notify(self, *paths) -> None:
+        with self._lock:
+            for path in paths:
+                path = os.fsdecode(path)
+                if path in self._signatures:
+                    self._pending.add(path)
+            if self._pending:
+                self._wakeup.set()
+
+    def watch(self, paths: Iterable[str]) -> None:
+        with self._lock:
+            paths = list(paths)
+            super().watch(paths)
+            for directory in {os.path.dirname(path) for path in paths}:
+                if directory not in self._directories and os.path.isdir(directory):
+                    self._directories[directory] = self._observer.schedule(
+                        self._handler, directory, recursive=False
+                    )
+
+    def unwatch(self, paths: Iterable[str]) -> None:
+        with self._lock:
+            super().unwatch(paths)
+            used = {os.path.dirname(path) for path in self._signatures}
+            for directory in set(self._directories) - used:
+                self._observer.unschedule(self._directories.pop(directory))
+
+    def changes(self, timeout: float = 0.0) -> set[str]:
+        if timeout:
+            self._wakeup.wait(timeout)
+        with self._lock:
+            candidates, self._pending = self._pending, set()
+            self._wakeup.clear()
+            return self._confirm(candidates)
+
+    def close(self) -> None:
+        super().close()
+        self._observer.stop()
+        self._observer.join()
+
+
+def make_backend(backend: str = "auto") -> PollingBackend:
+    """
+    Create a change detection backend.
+
+    Args:
+        backend: "watchdog", "polling", or "auto" for watchdog when installed
+                 and polling otherwise
+
+    Raises:
+        ValueError: For an unknown backend name
+        ImportError: For "watchdog" when the package is not installed
+    """
+    if backend == "polling":
+        return PollingBackend()
+    if backend == "watchdog":
+        return WatchdogBackend()
+    if backend == "auto":
+        try:
+            return WatchdogBackend()
+        except ImportError:
+            logger.debug("watchdog is not installed, polling watched files")
+            return PollingBackend()
+    raise ValueError(f"Unknown watch backend: {backend!r} (expected auto, watchdog or polling)")
+
+
+@dataclass
+class ReloadEvent:
+    """
+    Outcome of the reload of one changed file.
+
+    Attributes:
+        path: Absolute path of the changed file
+        old: Object previously built from the file
+        new: Object now in the tree, None if the reload failed
+        error: Load or validation error, None on success
+    """
+
+    path: str
+    old: Any
+    new: Any = None
+    error: Exception | None = None
+
+
+def _slots(obj):
+    """Yield (attribute, index, child) for the geometry objects held by obj."""
+    from .base import YAMLObjectBase
+    from .lazy import is_loaded, resolve
+
+    for attribute, value in list(vars(obj).items()):
+        if attribute.startswith("_"):
+            continue
+        if isinstance(value, (list, dict)):
+            items = value.items() if isinstance(value, dict) else enumerate(value)
+        else:
+            items = [(None, value)]
+        for index, item in items:
+            if is_loaded(item) and isinstance(item, YAMLObjectBase):
+                yield attribute, index, resolve(item)
+
+
+class GeometryWatcher:
+    """
+    Keeps a loaded geometry tree in sync with its files.
+
+    Attributes:
+        root: Watched tree; replaced by a new object when its own file changes
+        interval: Seconds between two polls of the watcher thread
+    """
+
+    def __init__(
+        self,
+        root: Any,
+        *callbacks: Callable[[ReloadEvent], None],
+        backend: str | PollingBackend = "auto",
+        interval: float = DEFAULT_INTERVAL,
+    ):
+        """
+        Args:
+            root: Object loaded from a file (pmg.load, from_yaml, ...)
+            *callbacks: Called with a ReloadEvent after each reloaded file
+            backend: Backend name (see make_backend) or instance
+            interval: Seconds between two polls of the watcher thread
+        """
+        self.root = root
+        self.interval = interval
+        self._callbacks = list(callbacks)
+        self._backend = make_backend(backend) if isinstance(backend, str) else backend
+        # id -> object, for every object of the tree
+        self._objects: dict[int, Any] = {}
+        # id -> [(parent, attribute, index)] places holding the object
+        self._parents: dict[int, list[tuple[Any, str, Any]]] = {}
+        # source path -> ids of the objects built from it
+        self._files: dict[str, set[int]] = {}
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._closed = False
+        self._index(root)
+
+    @property
+    def files(self) -> set[str]:
+        """Absolute paths of the watched files."""
+        return set(self._files)
+
+    def add_callback(self, callback: Callable[[ReloadEvent], None]) -> None:
+        self._callbacks.append(callback)
+
+    # Map of the tree
+
+    def _index(self, obj, parent=None, attribute=None, index=None) -> list:
+        """
+        Register obj held at parent.attribute[index], and its subtree if new.
+
+        Returns:
+            list: Objects registered for the first time
+        """
+        queue = deque([(obj, parent, attribute, index)])
+        added = []
+        while queue:
+            obj, parent, attribute, index = queue.popleft()
+            key = id(obj)
+            if parent is not None:
+                self._parents.setdefault(key, []).append((parent, attribute, index))
+            if key in self._objects:
+                continue
+            self._objects[key] = obj
+            self._parents.setdefault(key, [])
+            source = getattr(obj, "_source", None)
+            if source is not None:
+                self._files.setdefault(source, set()).add(key)
+            added.append(obj)
+            queue.extend((child, obj, a, i) for a, i, child in _slots(obj))
+        self._backend.watch(
+            obj._source for obj in added if getattr(obj, "_source", None) is not None
+        )
+        return added
+
+    def _unbind(self, obj, parent) -> None:
+        """Drop the places of obj inside parent, and obj with its subtree if unused."""
+        queue = deque([(obj, parent)])
+        unwatched = []
+        while queue:
+            obj, parent = queue.popleft()
+            key = id(obj)
+            if key not in self._objects:
+                continue
+            places = [p for p in self._parents[key] if p[0] is not parent]
+            self._parents[key] = places
+            if places or obj is self.root:
+                continue
+            del self._objects[key], self._parents[key]
+            source = getattr(obj, "_source", None)
+            if source is not None:
+                self._files[source].discard(key)
+                if not self._files[source]:
+                    del self._files[source]
+                    unwatched.append(source)
+            queue.extend((child, obj) for _, _, child in _slots(obj))
+        self._backend.unwatch(unwatched)
+
+    def _depth(self, path: str) -> int:
+        depth = 0
+        obj = self._objects[next(iter(self._files[path]))]
+        while self._parents[id(obj)]:
+            obj = self._parents[id(obj)][0][0]
+            depth += 1
+        return depth
+
+    # Reload
+
+    def poll(self, timeout: float = 0.0) -> list[ReloadEvent]:
+        """
+        Reload the files changed since the previous poll.
+
+        Args:
+            timeout: Seconds to wait for changes
+
+        Returns:
+            list[ReloadEvent]: One event per reloaded file
+        """
+        return self.reload(self._backend.changes(timeout))
+
+    def reload(self, paths: Iterable[str]) -> list[ReloadEvent]:
+        """
+        Rebuild the objects built from the given files and splice them in.
+
+        Files are processed from the root down, so that a file changed
+        together with a file referencing it is only loaded once.
+
+        Args:
+            paths: Changed files; files that are not part of the tree are ignored
+
+        Returns:
+            list[ReloadEvent]: One event per reloaded file
+        """
+        changed = {os.path.abspath(path) for path in paths} & set(self._files)
+        fresh: dict[str, Any] = {}
+
+        def find(path):
+            if path in fresh:
+                return fresh[path]
+            if path in changed or path not in self._files:
+                return None
+            return self._objects[next(iter(self._files[path]))]
+
+        events = []
+        for path in sorted(changed, key=self._depth):
+            olds = [
+                self._objects[key]
+                for key in self._files.get(path, ())
+                if self._objects[key] is not fresh.get(path)
+            ]
+            if olds:
+                # otherwise rebuilt with a file referencing it, or no longer used
+                events.append(self._reload(path, olds, changed, fresh, find))
+        return events
+
+    def _reload(self, path: str, olds: list, changed: set, fresh: dict, find) -> ReloadEvent:
+        from .utils import getObject
+
+        event = ReloadEvent(path, olds[0])
+        logger.info("Reloading %s", path)
+        root = self.root
+        done = []
+        try:
+            new = fresh.get(path)
+            if new is None:
+                with reusing(find):
+                    new = getObject(path)
+            for old in olds:
+                if old is self.root:
+                    self.root = new
+                else:
+                    self._splice(old, new)
+                done.append(old)
+        except Exception as e:
+            logger.error("Cannot reload %s: %s", path, e)
+            for old in reversed(done):
+                if old is root:
+                    self.root = root
+                else:
+                    self._splice(new, old, self._parents[id(old)])
+            event.error = e
+            self._notify(event)
+            return event
+
+        for obj in self._index(new):
+            source = getattr(obj, "_source", None)
+            if source in changed:
+                fresh.setdefault(source, obj)
+        for old in olds:
+            for parent, attribute, index in self._parents[id(old)]:
+                self._index(new, parent, attribute, index)
+            self._parents[id(old)] = []
+            self._unbind(old, None)
+        event.new = new
+        self._notify(event)
+        return event
+
+    def _splice(self, old, new, places=None) -> None:
+        """Put new in the places of old, then revalidate the assemblies above."""
+        if places is None:
+            places = self._parents[id(old)]
+        for parent, attribute, index in places:
+            self._put(parent, attribute, index, new)
+        try:
+            self._revalidate(places)
+        except Exception:
+            for parent, attribute, index in places:
+                self._put(parent, attribute, index, old)
+            # restore the state derived from the components (e.g. Insert bounding box)
+            self._revalidate(places)
+            raise
+
+    @staticmethod
+    def _put(parent, attribute, index, value) -> None:
+        if index is None:
+            setattr(parent, attribute, value)
+        else:
+            getattr(parent, attribute)[index] = value
+
+    def _revalidate(self, places) -> None:
+        """Re-run the validation of the ancestors reading the given places."""
+        visited = set()
+        queue = deque(places)
+        while queue:
+            parent, attribute, index = queue.popleft()
+            if id(parent) in visited:
+                continue
+            visited.add(id(parent))
+            revalidate = getattr(parent, "revalidate", None)
+            if revalidate is not None:
+                revalidate(attribute if index is None else (attribute, index))
+            queue.extend(self._parents.get(id(parent), ()))
+
+    def _notify(self, event: ReloadEvent) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Reload callback %r failed", callback)
+
+    # Watcher thread
+
+    def start(self) -> "GeometryWatcher":
+        """
+        Poll for changes in a background thread every interval seconds.
+
+        Raises:
+            RuntimeError: If the watcher was stopped
+        """
+        if self._closed:
+            raise RuntimeError("A stopped GeometryWatcher cannot be started again")
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="magnetgeo-watch", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.poll(self.interval)
+            except Exception:
+                # an unexpected error must not end the watcher thread
+                logger.exception("Polling watched files failed")
+                self._stopping.wait(self.interval)
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the backend."""
+        self._closed = True
+        self._stopping.set()
+        self._backend.close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "GeometryWatcher":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -11,6 +11,9 @@ import os
 # Add the parent directory to Python path so we can import from python_magnetgeo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import python_magnetgeo as pmg
+from python_magnetgeo.utils import ObjectLoadError
+
 # Import all classes for testing
 from python_magnetgeo.Insert import Insert
 from python_magnetgeo.Helix import Helix
@@ -144,4 +147,48 @@ def temp_json_file():
     """Fixture providing a temporary JSON file"""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
         yield f.name
-    Path(f.name).unlink(missing_ok=True)
\ No newline at end of file
+    Path(f.name).unlink(missing_ok=True)
+
+
+# Small tree with one YAML file per object: MSite M > Insert I > helices
+# H0 and H1 (with their ModelAxi axi0 and axi1), ring R and current lead
+TREE_FILES = {
+    "axi0": "!<ModelAxi>\nname: axi0\nh: 20.0\nturns: [2.0, 2.0]\npitch: [10.0, 10.0]\n",
+    "axi1": "!<ModelAxi>\nname: axi1\nh: 25.0\nturns: [2.5, 2.5]\npitch: [10.0, 10.0]\n",
+    "H0": "!<Helix>\nname: H0\nr: [10.0, 20.0]\nz: [-50.0, 50.0]\ncutwidth: 0.2\n"
+    "odd: true\ndble: false\nmodelaxi: axi0\n",
+    "H1": "!<Helix>\nname: H1\nr: [30.0, 40.0]\nz: [-50.0, 50.0]\ncutwidth: 0.2\n"
+    "odd: false\ndble: false\nmodelaxi: axi1\n",
+    "R": "!<Ring>\nname: R\nr: [10.0, 20.0, 30.0, 40.0]\nz: [0.0, 20.0]\n",
+    "lead": "!<InnerCurrentLead>\nname: lead\nr: [9.0, 20.0]\nh: 480.0\n"
+    "holes: []\nsupport: []\nfillet: false\n",
+    "insert": "!<Insert>\nname: I\nhelices: [H0, H1]\nrings: [R]\ncurrentleads: [lead]\n"
+    "hangles: []\nrangles: []\ninnerbore: 9.5\nouterbore: 45.0\n",
+    "site": "!<MSite>\nname: M\nmagnets: [insert]\nscreens: null\n",
+}
+
+
+@pytest.fixture
+def tree_files():
+    """Fixture providing the YAML texts of the test tree, by file name without extension"""
+    return dict(TREE_FILES)
+
+
+@pytest.fixture
+def tree(tmp_path, tree_files):
+    """Fixture providing a directory holding the files of the test tree"""
+    for name, text in tree_files.items():
+        (tmp_path / f"{name}.yaml").write_text(text)
+    return tmp_path
+
+
+@pytest.fixture
+def load_error():
+    """Fixture providing a function returning the ObjectLoadError message of pmg.load"""
+
+    def load_error(path):
+        with pytest.raises(ObjectLoadError) as excinfo:
+            pmg.load(path)
+        return str(excinfo.value)
+
+    return load_error
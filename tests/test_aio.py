@@ -0,0 +1,85 @@
+"""
+Tests for the asyncio loading API (pmg.aload / pmg.aload_many).
+"""
+
+import asyncio
+import os
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.MSite import MSite
+from python_magnetgeo.utils import ObjectLoadError
+
+
+def test_aload_matches_load(tree):
+    path = str(tree / "site.yaml")
+    expected = pmg.load(path)
+
+    site = asyncio.run(pmg.aload(path))
+
+    assert isinstance(site, MSite)
+    assert isinstance(site.magnets[0], Insert)
+    assert site.to_yaml() == expected.to_yaml()
+    assert site.magnets[0]._basedir == str(tree)
+
+
+def test_aload_many_keeps_order(tree, tmp_path_factory, tree_files):
+    other = tmp_path_factory.mktemp("other")
+    for name, text in tree_files.items():
+        (other / f"{name}.yaml").write_text(text.replace("name: I\n", "name: J\n"))
+    paths = [str(tree / "insert.yaml"), str(other / "insert.yaml"), str(tree / "H0.yaml")]
+
+    objects = asyncio.run(pmg.aload_many(paths, max_concurrency=2))
+
+    assert [obj.name for obj in objects] == ["I", "J", "H0"]
+    for path, obj in zip(paths, objects):
+        assert obj.to_yaml() == pmg.load(path).to_yaml()
+
+
+def test_aload_json(tree):
+    insert = pmg.load(str(tree / "insert.yaml"))
+    path = tree / "insert.json"
+    path.write_text(insert.to_json())
+
+    assert asyncio.run(pmg.aload(str(path))).to_yaml() == pmg.load(str(path)).to_yaml()
+
+
+def test_aload_errors_match_load(tree, load_error):
+    os.remove(tree / "axi1.yaml")
+    path = str(tree / "site.yaml")
+    expected = load_error(path)
+
+    with pytest.raises(ObjectLoadError) as excinfo:
+        asyncio.run(pmg.aload(path))
+    assert str(excinfo.value) == expected
+
+    objects = asyncio.run(
+        pmg.aload_many([path, str(tree / "H0.yaml")], return_exceptions=True)
+    )
+    assert isinstance(objects[0], ObjectLoadError)
+    assert str(objects[0]) == expected
+    assert objects[1].name == "H0"
+
+
+def test_aload_does_not_block_event_loop(tree):
+    path = str(tree / "site.yaml")
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        site = await pmg.aload(path)
+        task.cancel()
+        return site, ticks
+
+    site, ticks = asyncio.run(main())
+    assert site.name == "M"
+    assert ticks > 1
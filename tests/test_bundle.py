@@ -0,0 +1,83 @@
+"""
+Tests for single-file bundles (pack/unpack, python_magnetgeo.bundle).
+"""
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.bundle import Bundle
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.MSite import MSite
+from python_magnetgeo.utils import ObjectLoadError, UnsupportedTypeError
+
+
+def test_roundtrip(tree, tmp_path_factory):
+    site = pmg.load(str(tree / "site.yaml"))
+    path = site.pack(directory=str(tmp_path_factory.mktemp("packed")))
+    assert path.endswith("M.mgpack")
+
+    restored = pmg.load(path)
+    assert isinstance(restored, MSite)
+    assert restored.to_yaml() == site.to_yaml()
+    assert MSite.unpack(path).to_yaml() == site.to_yaml()
+
+
+def test_shared_components_stored_once(tree, tree_files):
+    (tree / "H1.yaml").write_text(tree_files["H1"].replace("modelaxi: axi1", "modelaxi: axi0"))
+    insert = pmg.load(str(tree / "insert.yaml"))
+    assert insert.helices[0].modelaxi is not insert.helices[1].modelaxi
+
+    bundle = Bundle(insert.pack(str(tree / "I.mgpack")))
+    assert sorted(bundle.keys()) == ["H0", "H1", "R", "axi0", "insert", "lead"]
+    assert bundle.root == "insert"
+    assert bundle.components["axi0"]["tag"] == "ModelAxi"
+    assert bundle.read("H1").startswith("!<Helix>")
+    assert "modelaxi: axi0" in bundle.read("H1")
+
+
+def test_single_component(tree):
+    path = pmg.load(str(tree / "site.yaml")).pack(str(tree / "M.mgpack"))
+
+    helix = Helix.unpack(path, "H1")
+    assert helix.name == "H1"
+    assert helix.modelaxi.name == "axi1"
+    assert helix._basedir == str(tree)
+
+    with pytest.raises(UnsupportedTypeError):
+        Insert.unpack(path, "H1")
+    with pytest.raises(ObjectLoadError, match="No component"):
+        Insert.unpack(path, "H9")
+
+
+def test_extract_restores_layout(tmp_path, tree_files):
+    source = tmp_path / "source"
+    (source / "helices").mkdir(parents=True)
+    for name, text in tree_files.items():
+        if name in ("H0", "H1"):
+            text = text.replace("modelaxi: axi", "modelaxi: ../axi")
+            (source / "helices" / f"{name}.yaml").write_text(text)
+        elif name == "insert":
+            text = text.replace("[H0, H1]", "[helices/H0, helices/H1]")
+            (source / f"{name}.yaml").write_text(text)
+        else:
+            (source / f"{name}.yaml").write_text(text)
+    site = pmg.load(str(source / "site.yaml"))
+
+    path = site.pack(str(tmp_path / "M.mgpack"))
+    restored = MSite.unpack(path, directory=str(tmp_path / "restored"))
+    assert restored.to_yaml() == site.to_yaml()
+
+    restored_dir = tmp_path / "restored"
+    files = sorted(p.relative_to(restored_dir).as_posix() for p in restored_dir.rglob("*.yaml"))
+    assert files == sorted(
+        f"helices/{name}.yaml" if name in ("H0", "H1") else f"{name}.yaml" for name in tree_files
+    )
+    extracted = pmg.load(str(restored_dir / "site.yaml"))
+    assert extracted.to_yaml() == site.to_yaml()
+
+
+def test_not_a_bundle(tree):
+    (tree / "bad.mgpack").write_text("name: M\n")
+    with pytest.raises(ObjectLoadError, match="not a magnetgeo bundle"):
+        pmg.load(str(tree / "bad.mgpack"))
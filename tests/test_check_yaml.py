@@ -0,0 +1,52 @@
+"""
+Tests for the directory mode of check-magnetgeo-yaml.
+"""
+
+import json
+
+import pytest
+
+from python_magnetgeo.examples.check_magnetgeo_yaml import check_files, find_files, main
+
+
+def test_find_files(tree, tree_files):
+    (tree / "sub").mkdir()
+    (tree / "sub" / "other.yml").write_text(tree_files["R"])
+    (tree / "notes.txt").write_text("")
+
+    files = find_files([str(tree), str(tree / "H*.yaml")])
+    assert len(files) == len(tree_files) + 1
+    assert files[-1] == str(tree / "sub" / "other.yml")
+    assert find_files([str(tree / "sub" / "*.yaml")]) == []
+
+
+def test_check_files(tree, tree_files):
+    result = check_files(find_files([str(tree)]), jobs=2)
+
+    assert result["summary"]["checked"] == len(tree_files)
+    assert result["summary"]["failed"] == 0
+    reports = {report["path"]: report for report in result["files"]}
+    site = reports[str(tree / "site.yaml")]
+    assert site["status"] == "ok" and site["type"] == "MSite" and site["error"] is None
+    assert site["files"] == len(tree_files)
+    assert reports[str(tree / "axi0.yaml")]["files"] == 1
+
+
+def test_report_and_exit_status(tree, tmp_path, capsys, tree_files):
+    (tree / "broken.yaml").write_text("!<Helix>\nname: broken\n")
+    report = tmp_path / "report.json"
+
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(tree), "-j", "2", "--report", str(report)])
+    assert excinfo.value.code == 1
+    assert f"FAILED {tree / 'broken.yaml'}" in capsys.readouterr().out
+
+    result = json.loads(report.read_text())
+    assert result["summary"]["failed"] == 1 and result["summary"]["ok"] == len(tree_files)
+    (broken,) = [item for item in result["files"] if item["path"].endswith("broken.yaml")]
+    assert broken["status"] == "failed" and "broken" in broken["error"]
+    assert broken["seconds"] >= 0
+
+    # no failure, JSON report on the standard output
+    main([str(tree / "H*.yaml"), "--report", "-"])
+    assert json.loads(capsys.readouterr().out)["summary"]["checked"] == 2
@@ -0,0 +1,87 @@
+"""
+Concurrent loading of different geometry trees from several threads.
+
+Loaders resolve nested references against a per-thread base directory
+instead of changing the process working directory, so parallel loads of
+trees living in different directories must not interfere.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.utils import base_directory, get_basedir, resolve_path
+
+
+def write_tree(directory, index):
+    """Insert with 2 helices, a ring and a lead, all referenced by filename."""
+    os.makedirs(directory)
+    h = 20.0 + index  # make every tree distinguishable
+    r = [(10.0, 20.0), (30.0, 40.0)]
+    for i, (r0, r1) in enumerate(r):
+        with open(os.path.join(directory, f"axi{i}.yaml"), "w") as f:
+            f.write(f"!<ModelAxi>\nname: axi{i}\nh: {h}\nturns: [2.0, 2.0]\npitch: [{h / 2}, {h / 2}]\n")
+        with open(os.path.join(directory, f"H{i}.yaml"), "w") as f:
+            f.write(
+                f"!<Helix>\nname: H{i}_{index}\nr: [{r0}, {r1}]\nz: [-50.0, 50.0]\n"
+                f"cutwidth: 0.2\nodd: true\ndble: false\nmodelaxi: axi{i}\n"
+            )
+    with open(os.path.join(directory, "R.yaml"), "w") as f:
+        f.write("!<Ring>\nname: R\nr: [10.0, 20.0, 30.0, 40.0]\nz: [0.0, 20.0]\n")
+    with open(os.path.join(directory, "lead.yaml"), "w") as f:
+        f.write(
+            "!<InnerCurrentLead>\nname: lead\nr: [9.0, 20.0]\nh: 480.0\n"
+            "holes: []\nsupport: []\nfillet: false\n"
+        )
+    with open(os.path.join(directory, "insert.yaml"), "w") as f:
+        f.write(
+            f"!<Insert>\nname: I{index}\nhelices: [H0, H1]\nrings: [R]\n"
+            "currentleads: [lead]\nhangles: []\nrangles: []\n"
+            "innerbore: 9.5\nouterbore: 45.0\n"
+        )
+    return os.path.join(directory, "insert.yaml")
+
+
+@pytest.fixture
+def trees(tmp_path):
+    return [write_tree(str(tmp_path / f"site{i}"), i) for i in range(8)]
+
+
+def test_parallel_loads_do_not_interfere(trees):
+    cwd = os.getcwd()
+
+    def load(index):
+        insert = pmg.load(trees[index])
+        return index, insert
+
+    jobs = [i % len(trees) for i in range(200)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(load, jobs))
+
+    assert os.getcwd() == cwd
+    for index, insert in results:
+        directory = os.path.dirname(trees[index])
+        assert isinstance(insert, Insert)
+        assert insert.name == f"I{index}"
+        assert insert._basedir == directory
+        for i, helix in enumerate(insert.helices):
+            assert helix.name == f"H{i}_{index}"
+            assert helix.modelaxi.h == 20.0 + index
+            assert helix._basedir == directory
+
+
+def test_relative_path_resolved_against_base_directory(trees, tmp_path):
+    with base_directory(str(tmp_path)):
+        assert get_basedir() == str(tmp_path)
+        insert = pmg.load(os.path.join("site3", "insert.yaml"))
+    assert insert.name == "I3"
+    assert get_basedir() == os.getcwd()
+
+
+def test_resolve_path_keeps_absolute_paths(tmp_path):
+    path = str(tmp_path / "a.yaml")
+    with base_directory("/"):
+        assert resolve_path(path) == path
@@ -0,0 +1,98 @@
+"""
+Tests for the batch converter (python_magnetgeo.examples.convert_magnetgeo).
+"""
+
+import json
+import os
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.examples.convert_magnetgeo import MANIFEST, convert_tree, main
+
+
+@pytest.fixture
+def tree(tmp_path, tree_files):
+    source = tmp_path / "src"
+    (source / "insert").mkdir(parents=True)
+    for name, text in tree_files.items():
+        directory = source if name == "site" else source / "insert"
+        (directory / f"{name}.yaml").write_text(text.replace("[insert]", "[insert/insert]"))
+    return source
+
+
+def test_yaml_to_json(tree, tmp_path, tree_files):
+    out = tmp_path / "json"
+    stats = convert_tree([str(tree)], str(out), "json", jobs=2)
+
+    assert stats["converted"] == len(tree_files) and stats["failed"] == 0
+    assert (out / "insert" / "H0.json").exists() and (out / MANIFEST).exists()
+    site = pmg.load(str(tree / "site.yaml"))
+    assert (out / "site.json").read_text() == site.to_json()
+    assert pmg.load(str(out / "site.json")).to_json() == site.to_json()
+
+
+def test_up_to_date_outputs_are_skipped(tree, tmp_path, tree_files):
+    out = tmp_path / "json"
+    convert_tree([str(tree)], str(out), "json", jobs=2)
+    mtime = os.stat(out / "site.json").st_mtime_ns
+
+    stats = convert_tree([str(tree)], str(out), "json", jobs=2)
+    assert stats["skipped"] == len(tree_files) and stats["converted"] == 0
+
+    # the content of a referenced file is part of the outputs depending on it
+    helix = tree / "insert" / "H1.yaml"
+    helix.write_text(helix.read_text().replace("cutwidth: 0.2", "cutwidth: 0.3"))
+    stats = convert_tree([str(tree)], str(out), "json", jobs=2)
+    assert stats["converted"] == 3 and stats["skipped"] == len(tree_files) - 3
+    assert '"cutwidth": 0.3' in (out / "site.json").read_text()
+
+    # hash: everything is converted, unchanged outputs are not rewritten
+    stats = convert_tree([str(tree)], str(out), "json", check="hash", jobs=2)
+    assert stats["unchanged"] == len(tree_files) and stats["converted"] == 0
+    assert os.stat(out / "insert" / "H0.json").st_mtime_ns <= mtime
+
+
+def test_bundle_round_trip(tree, tmp_path, tree_files):
+    packed = tmp_path / "packed"
+    stats = convert_tree([str(tree / "site.yaml")], str(packed), "mgpack", jobs=1)
+    assert stats["converted"] == 1
+
+    # a bundle is extracted to its original layout
+    out = tmp_path / "yaml"
+    stats = convert_tree([str(packed)], str(out), "yaml", jobs=1)
+    assert stats["converted"] == 1
+    names = sorted(f"{name}.yaml" for name in tree_files if name != "site")
+    assert sorted(os.listdir(out / "insert")) == names
+    site = pmg.load(str(tree / "site.yaml"))
+    assert pmg.load(str(out / "site.yaml")).to_yaml() == site.to_yaml()
+
+    # JSON outputs are self-contained, and so are their YAML conversions
+    convert_tree([str(tree / "site.yaml")], str(tree), "json", jobs=1)
+    convert_tree([str(tree / "site.json")], str(tmp_path / "back"), "yaml", jobs=1)
+    assert sorted(os.listdir(tmp_path / "back")) == sorted([MANIFEST, "site.yaml"])
+    assert pmg.load(str(tmp_path / "back" / "site.yaml")).to_yaml() == site.to_yaml()
+
+
+def test_failures_are_reported(tree, tmp_path, capsys, tree_files):
+    (tree / "broken.yaml").write_text("!<Helix>\nname: broken\n")
+    code = main([str(tree), "-o", str(tmp_path / "json"), "--to", "json", "-j", "2"])
+
+    output = capsys.readouterr().out
+    assert code == 1
+    assert f"Failed: {tree / 'broken.yaml'}" in output
+    assert f"{len(tree_files)} converted, 0 unchanged, 0 up to date, 1 failed" in output
+    manifest = json.loads((tmp_path / "json" / MANIFEST).read_text())
+    assert len(manifest) == len(tree_files)
+
+
+def test_file_modes(tree, tmp_path):
+    umask = os.umask(0o022)
+    try:
+        for target in ("json", "mgpack"):
+            out = tmp_path / target
+            convert_tree([str(tree / "site.yaml")], str(out), target, jobs=1)
+            modes = {os.stat(path).st_mode & 0o777 for path in out.iterdir()}
+            assert modes == {0o644}
+    finally:
+        os.umask(umask)
@@ -0,0 +1,148 @@
+"""
+Tests for deferred bulk validation (python_magnetgeo.deferred).
+"""
+
+import random
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Bitter import Bitter
+from python_magnetgeo.Bitters import Bitters
+from python_magnetgeo.Ring import Ring
+from python_magnetgeo.tierod import Tierod
+from python_magnetgeo.validation import GeometryValidator, ValidationError
+
+
+def disk(i, r=None, z=None):
+    return Bitter(f"B{i}", r or [100.0, 150.0], z or [2.0 * i, 2.0 * i + 1.0], True, None)
+
+
+def message(function):
+    with pytest.raises(ValidationError) as info:
+        function()
+    return str(info.value)
+
+
+def test_checks_run_on_exit(monkeypatch):
+    def fail(*args):
+        raise AssertionError("validated inside the scope")
+
+    with pmg.deferred_validation():
+        monkeypatch.setattr(GeometryValidator, "validate_name", fail)
+        disks = [disk(i) for i in range(100)]
+        stack = Bitters("M", disks, 0, 0)
+    assert len(stack.magnets) == 100
+
+
+def test_aggregated_report():
+    bad = {
+        3: dict(r=[150.0, 100.0]),
+        7: dict(z=[1.0, 2.0, 3.0]),
+        9: dict(r=[-1.0, 100.0]),
+        12: dict(r=[100.0, "150"]),
+    }
+    with pytest.raises(pmg.DeferredValidationError) as info:
+        with pmg.deferred_validation():
+            disks = [disk(i, **bad.get(i, {})) for i in range(20)]
+            Ring(" ", [1.0, 2.0, 3.0, 4.0], [0.0, 1.0])
+            Tierod("", 1.0, 0, -2.0, 1.0, None)
+
+    failures = [(obj.name, field, text) for obj, field, text in info.value.failures]
+    assert [f[:2] for f in failures] == [
+        ("B3", "r"),
+        ("B7", "z"),
+        ("B9", "r"),
+        ("B12", "r"),
+        (" ", "name"),
+        ("", "dh"),
+    ]
+    # same messages as immediate validation
+    for i, kwargs in bad.items():
+        assert message(lambda: disk(i, **kwargs)) in [f[2] for f in failures]
+    assert failures[-1][2] == "dh must be positive or null"
+    assert "Bitter 'B3' (r): r values must be in ascending order" in str(info.value)
+    assert str(info.value).startswith("6 validation errors:")
+    assert disks[3].r == [150.0, 100.0]
+
+
+def test_cross_object_rules():
+    disks = [disk(i) for i in range(10)]
+    disks[6].z = [0.5, 1.5]
+    expected = message(lambda: Bitters("M", disks, 0, 0))
+    assert expected.startswith("magnets intersect: magnet[1] intersect magnet[0]")
+
+    with pytest.raises(pmg.DeferredValidationError) as info:
+        with pmg.deferred_validation():
+            stack = Bitters("M", disks, 0, 0)
+    assert info.value.failures == [(stack, None, expected)]
+
+
+def test_vectorized_intersection_matches_pairwise_rule():
+    def pairwise(magnets):
+        for i in range(1, len(magnets)):
+            rb, zb = magnets[i - 1].boundingBox()
+            for j in range(i + 1, len(magnets)):
+                if magnets[j].intersect(rb, zb):
+                    return i
+        return None
+
+    rng = random.Random(4)
+    for _ in range(50):
+        disks = [disk(i) for i in range(40)]
+        for d in rng.sample(disks, 3):
+            z0 = rng.uniform(0.0, 80.0)
+            d.z = [z0, z0 + rng.uniform(0.1, 3.0)]
+        i = pairwise(disks)
+        if i is None:
+            GeometryValidator.validate_no_intersection(disks, chunk=7)
+        else:
+            pattern = rf"magnet\[{i}\] intersect magnet\[{i - 1}\]"
+            with pytest.raises(ValidationError, match=pattern):
+                GeometryValidator.validate_no_intersection(disks, chunk=7)
+
+
+def test_intersection_of_edited_magnets():
+    rng = random.Random(5)
+    for _ in range(100):
+        disks = [disk(i) for i in range(30)]
+        k = rng.randrange(30)
+        z0 = rng.uniform(0.0, 60.0)
+        disks[k].z = [z0, z0 + rng.uniform(0.1, 3.0)]
+        try:
+            GeometryValidator.validate_no_intersection(disks)
+            expected = None
+        except ValidationError as e:
+            expected = str(e)
+        if expected is None:
+            GeometryValidator.validate_no_intersection(disks, changed=[k])
+        else:
+            assert message(
+                lambda: GeometryValidator.validate_no_intersection(disks, changed=[k])
+            ) == expected
+
+
+def test_errors_inside_scope_are_chained():
+    with pytest.raises(pmg.DeferredValidationError) as info:
+        with pmg.deferred_validation():
+            disk(0, r="abc")
+            raise RuntimeError("later failure")
+    assert isinstance(info.value.__cause__, RuntimeError)
+    assert info.value.failures[0][2] == "r must be a list"
+
+    with pytest.raises(RuntimeError):
+        with pmg.deferred_validation():
+            disk(0)
+            raise RuntimeError("unrelated")
+
+
+def test_nested_scopes():
+    with pytest.raises(pmg.DeferredValidationError) as info:
+        with pmg.deferred_validation():
+            with pmg.deferred_validation():
+                disk(0, r=[2.0, 1.0])
+            disk(1, r=[3.0, 1.0])
+    assert len(info.value.failures) == 2
+
+    with pytest.raises(ValidationError):
+        disk(0, r=[2.0, 1.0])
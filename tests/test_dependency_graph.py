@@ -0,0 +1,92 @@
+"""
+Tests for the transitive dependency crawler (python_magnetgeo.dependencies).
+"""
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo import dependencies
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.utils import ObjectLoadError, base_directory
+
+
+@pytest.fixture
+def tree(tree):
+    pmg.clear_dependency_cache()
+    return tree
+
+
+def test_msite_closure(tree, tree_files):
+    graph = pmg.dependency_graph(str(tree / "site.yaml"))
+
+    assert graph.files == {str(tree / f"{name}.yaml") for name in tree_files}
+    assert graph.depth == 3
+    assert graph.missing == set()
+    assert graph.cycles == []
+    assert graph.nodes[str(tree / "insert.yaml")].tag == "Insert"
+    assert graph.nodes[str(tree / "axi1.yaml")].depth == 3
+    assert graph.references(str(tree / "H1.yaml")) == {str(tree / "axi1.yaml")}
+
+    order = graph.topological_order()
+    assert order[-1] == str(tree / "site.yaml")
+    assert order.index(str(tree / "axi0.yaml")) < order.index(str(tree / "H0.yaml"))
+
+
+def test_missing_files(tree):
+    (tree / "axi1.yaml").unlink()
+    graph = pmg.dependency_graph(str(tree / "site.yaml"))
+
+    assert graph.missing == {str(tree / "axi1.yaml")}
+    with pytest.raises(ObjectLoadError, match="missing file: .*axi1.yaml"):
+        graph.check()
+    with pytest.raises(ObjectLoadError):
+        pmg.dependency_graph(str(tree / "site.yaml"), strict=True)
+
+
+def test_cycles(tree, tree_files):
+    (tree / "H0.yaml").write_text(tree_files["H0"] + "model3d: site\n")
+    graph = pmg.dependency_graph(str(tree / "site.yaml"))
+
+    assert graph.cycles == [
+        [str(tree / f"{name}.yaml") for name in ("site", "insert", "H0", "site")]
+    ]
+    with pytest.raises(ObjectLoadError, match="cycle"):
+        graph.topological_order()
+
+
+def test_references_cached_by_mtime(tree, monkeypatch, tree_files):
+    reads = []
+    read_top_level = dependencies._read_top_level
+
+    def counting(path):
+        reads.append(path)
+        return read_top_level(path)
+
+    monkeypatch.setattr(dependencies, "_read_top_level", counting)
+    path = str(tree / "site.yaml")
+
+    pmg.dependency_graph(path)
+    assert len(reads) == len(tree_files)
+
+    reads.clear()
+    pmg.dependency_graph(path)
+    assert reads == []
+
+    (tree / "H1.yaml").write_text(tree_files["H1"].replace("modelaxi: axi1", "modelaxi: axi0"))
+    graph = pmg.dependency_graph(path)
+    assert reads == [str(tree / "H1.yaml")]
+    assert str(tree / "axi1.yaml") not in graph.files
+
+
+def test_transitive_required_files(tree):
+    values = {"helices": ["H0", "H1"], "rings": ["R"], "currentleads": ["lead"]}
+    assert Insert.get_required_files(values) == {"H0.yaml", "H1.yaml", "R.yaml", "lead.yaml"}
+    with base_directory(str(tree)):
+        assert Insert.get_required_files(values, transitive=True) == {
+            "H0.yaml",
+            "H1.yaml",
+            "R.yaml",
+            "lead.yaml",
+            "axi0.yaml",
+            "axi1.yaml",
+        }
@@ -0,0 +1,91 @@
+"""
+Tests for the class dispatch of inline dictionaries (python_magnetgeo.dispatch).
+"""
+
+import pytest
+
+from python_magnetgeo import dispatch
+from python_magnetgeo.Bitters import Bitters
+from python_magnetgeo.InnerCurrentLead import InnerCurrentLead
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.OuterCurrentLead import OuterCurrentLead
+from python_magnetgeo.Supras import Supras
+
+LEADS = (InnerCurrentLead, OuterCurrentLead)
+
+INNER = {
+    "name": "inner",
+    "r": [19.3, 24.2],
+    "h": 480.0,
+    "holes": [123, 12, 90, 60, 45, 3],
+    "support": [24.2, 0],
+    "fillet": False,
+}
+OUTER = {
+    "name": "outer",
+    "r": [171.0, 180.0],
+    "h": 452.0,
+    "bar": [10, 18, 15, 496],
+    "support": [48.2, 10, 18, 45],
+}
+
+
+@pytest.fixture(autouse=True)
+def stats():
+    dispatch.reset_dispatch_stats()
+    yield
+    dispatch.reset_dispatch_stats()
+
+
+def test_discriminators():
+    table = dispatch.dispatcher(LEADS)
+    assert table.discriminators == {
+        "holes": InnerCurrentLead,
+        "fillet": InnerCurrentLead,
+        "bar": OuterCurrentLead,
+    }
+    assert dispatch.dispatcher(LEADS) is table
+
+    magnets = dispatch.dispatcher((Insert, Bitters, Supras))
+    assert magnets.discriminators["helices"] is Insert
+    # Bitters and Supras take the same parameters
+    assert magnets.select({"name": "B", "magnets": [], "innerbore": 1, "outerbore": 2}) is None
+
+
+def test_leads_dispatched_without_trying(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("wrong class tried")
+
+    monkeypatch.setattr(InnerCurrentLead, "from_dict", classmethod(fail))
+    leads = Insert._load_nested_list([OUTER], LEADS)
+    assert type(leads[0]) is OuterCurrentLead
+    assert dispatch.dispatch_stats() == {"tagged": 0, "dispatched": 1, "fallback": 0}
+
+
+def test_explicit_tag():
+    lead = Insert._load_nested_single(dict(INNER, __classname__="InnerCurrentLead"), LEADS)
+    assert type(lead) is InnerCurrentLead
+    assert dispatch.dispatch_stats()["tagged"] == 1
+
+
+def test_dispatched_class_errors_are_not_masked():
+    broken = dict(OUTER, bar=[10, 18])
+    # InnerCurrentLead is not tried: the error is the one of OuterCurrentLead
+    with pytest.raises(TypeError, match="Last error: bar must have exactly 4 values"):
+        Insert._load_nested_single(broken, LEADS)
+
+
+def test_fallback_is_counted():
+    # only parameters both leads share: each class is tried in turn
+    with pytest.raises(TypeError, match="InnerCurrentLead', 'OuterCurrentLead"):
+        Insert._load_nested_single({"name": "lead", "r": [1.0, 2.0]}, LEADS)
+    assert dispatch.dispatch_stats()["fallback"] == 1
+
+
+def test_inline_dict_building_none():
+    # Shape.from_dict returns None for an empty profile ("ignore shape")
+    from python_magnetgeo.Helix import Helix
+    from python_magnetgeo.Shape import Shape
+
+    shape = {"name": "", "angle": 0, "position": "ABOVE", "length": 0, "profile": "", "onturns": 0}
+    assert Helix._load_nested_single(shape, Shape) is None
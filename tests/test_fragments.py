@@ -0,0 +1,147 @@
+"""
+Tests for the memoized to_yaml/to_json output (python_magnetgeo.fragments).
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+import yaml
+
+import python_magnetgeo as pmg
+from python_magnetgeo import deserialize, fragments
+from python_magnetgeo.Chamfer import Chamfer
+from python_magnetgeo.Groove import Groove
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.Model3D import Model3D
+from python_magnetgeo.ModelAxi import ModelAxi
+from python_magnetgeo.utils import YamlDumper
+
+
+def full_yaml(obj):
+    return yaml.dump(obj, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+def full_json(obj):
+    return json.dumps(obj, default=deserialize.serialize_instance, sort_keys=True, indent=4)
+
+
+def assert_same_output(obj):
+    for _ in range(2):
+        assert obj.to_yaml() == full_yaml(obj)
+        assert obj.to_json() == full_json(obj)
+
+
+@pytest.fixture
+def site(tree):
+    return pmg.load(str(tree / "site.yaml"))
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    """Names of the objects whose own YAML fragment is emitted."""
+    names = []
+    build = fragments._yaml_fragment
+
+    def counting(obj):
+        names.append(obj.name)
+        return build(obj)
+
+    monkeypatch.setitem(fragments._BUILDERS, "yaml", counting)
+    return names
+
+
+def test_same_output_as_full_dump(site):
+    assert_same_output(site)
+
+    helix = Helix(
+        "H",
+        [19.0, 39.0],
+        [9.0, 109.0],
+        3.2,
+        True,
+        True,
+        modelaxi=ModelAxi("axi", 46.125, [2.5, 3.0, 2.5], [11.0, 12.0, 11.5]),
+        model3d=Model3D("m3d", "GMSH", True, True),
+        chamfers=[
+            Chamfer(name="c1", side="HP", rside="rint", alpha=45.0, dr=None, l=1.0),
+            Chamfer(name="c2", side="BP", rside="rext", alpha=None, dr=0.5, l=1.0),
+        ],
+        grooves=Groove(name="g", gtype="rint", n=4, eps=1.5),
+    )
+    assert_same_output(helix)
+
+
+def test_unchanged_objects_are_not_emitted_again(site, emitted):
+    insert = site.magnets[0]
+    text = site.to_yaml()
+    assert len(emitted) == 8
+    assert site.to_yaml() is text
+
+    emitted.clear()
+    insert.helices[1].cutwidth = 0.3
+    text = site.to_yaml()
+    assert emitted == ["H1"]
+    assert text == full_yaml(site) and "cutwidth: 0.3" in text
+
+    # replacing a nested object re-splices its parents only
+    emitted.clear()
+    insert.helices[1] = copy.deepcopy(insert.helices[0])
+    assert site.to_yaml() == full_yaml(site)
+    assert emitted == ["H0", "axi0"]
+
+    # so does a new number of nested objects, re-emitting the parent
+    emitted.clear()
+    insert.probes.append(copy.deepcopy(insert.helices[0].modelaxi))
+    assert site.to_yaml() == full_yaml(site)
+    assert emitted == ["I", "axi0"]
+
+
+def test_in_place_edits_are_detected(site, emitted):
+    helix = site.magnets[0].helices[0]
+    site.to_json()
+    site.to_yaml()
+    emitted.clear()
+    helix.r[1] = 21.0
+    assert site.to_json() == full_json(site)
+    assert "21.0" in site.to_json()
+    assert site.to_yaml() == full_yaml(site)
+    assert emitted == [helix.name]
+    # equal values of another type are dumped differently
+    helix.r[0] = int(helix.r[0])
+    assert_same_output(site)
+
+
+def test_in_package_mutators(emitted):
+    from python_magnetgeo.Probe import Probe
+
+    probe = Probe("probes", "voltage_taps", [], [])
+    assert_same_output(probe)
+    probe.add_probe("V2", [4, 5, 6])
+    assert "V2" in probe.to_yaml() and "V2" in probe.to_json()
+    assert_same_output(probe)
+    probe.points[0][2] = 7
+    assert_same_output(probe)
+    probe.remove_probe("V2")
+    assert "V2" not in probe.to_yaml() and "V2" not in probe.to_json()
+    assert_same_output(probe)
+
+    # unchanged data is not emitted again
+    emitted.clear()
+    probe.to_yaml()
+    assert emitted == []
+
+
+def test_long_lines_are_dumped_in_full():
+    helix = Helix("H", [10.0, 20.0], [-50.0, 50.0], 0.2, True, False)
+    helix.model3d = Model3D("m3d", "a long CAD description " * 4, False, False)
+    assert_same_output(helix)
+
+
+def test_memoized_output_is_not_copied(site):
+    site.to_yaml()
+    insert = site.magnets[0]
+    assert "_fragments" in vars(insert)
+    assert "_fragments" not in vars(copy.deepcopy(insert))
+    assert "_fragments" not in vars(pickle.loads(pickle.dumps(insert)))
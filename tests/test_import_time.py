@@ -0,0 +1,103 @@
+"""
+Import-time budget of the package, measured with python -X importtime.
+
+Short-lived command line jobs pay the import of the package on every run:
+importing a geometry class must not import the optional dependencies and
+features, and must stay within a budget relative to the import of its own
+dependencies (yaml and logging) on the same machine.
+
+The budget is a wall-clock measurement, which a loaded machine can exceed:
+it is only checked when MAGNETGEO_IMPORT_BUDGET is set, e.g.
+
+    MAGNETGEO_IMPORT_BUDGET=1 python -m pytest tests/test_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must not be imported by "import python_magnetgeo.Insert"
+FORBIDDEN = (
+    "pandas",
+    "numpy",
+    "matplotlib",
+    "asyncio",
+    "importlib.metadata",
+    "inspect",
+    "python_magnetgeo.dependencies",
+    "python_magnetgeo.snapshot",
+    "python_magnetgeo.watch",
+    "python_magnetgeo.layout",
+    "python_magnetgeo.sections",
+    "python_magnetgeo.trajectory",
+)
+
+# Cumulative import time of python_magnetgeo.Insert, relative to yaml and logging
+BUDGET = 2.5
+
+
+def importtime(statement: str) -> tuple[dict[str, int], str]:
+    """Cumulative import times (us) of the modules imported by statement, and its stderr."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times, process.stderr
+
+
+def best(statement: str, module: str, repeat: int = 5) -> int:
+    return min(importtime(statement)[0][module] for _ in range(repeat))
+
+
+def test_no_heavy_imports():
+    times, stderr = importtime("import python_magnetgeo.Insert")
+    assert "python_magnetgeo.Insert" in times
+    assert [module for module in FORBIDDEN if module in times] == []
+    # classes are registered silently
+    assert "Auto-registered" not in stderr
+
+
+def test_lazy_attributes():
+    statement = (
+        "import python_magnetgeo as pmg, python_magnetgeo.Helix, sys;"
+        "assert isinstance(pmg.Helix, type) and pmg.Helix.__name__ == 'Helix';"
+        "assert pmg.Tierod.__module__ == 'python_magnetgeo.tierod';"
+        "assert 'asyncio' not in sys.modules;"
+        "pmg.aload; pmg.__version__;"
+        "assert 'asyncio' in sys.modules"
+    )
+    times, _ = importtime(statement)
+    assert "python_magnetgeo.aio" in times
+
+
+def test_submodule_import_as_binds_the_class():
+    statement = (
+        "import importlib, python_magnetgeo as pmg;"
+        "import python_magnetgeo.Helix as m;"
+        "assert m is pmg.Helix and isinstance(m, type);"
+        "module = importlib.import_module('python_magnetgeo.Helix');"
+        "assert module.__name__ == 'python_magnetgeo.Helix' and module.Helix is m"
+    )
+    importtime(statement)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MAGNETGEO_IMPORT_BUDGET"), reason="set MAGNETGEO_IMPORT_BUDGET to measure"
+)
+def test_import_time_budget():
+    package = best("import python_magnetgeo.Insert", "python_magnetgeo.Insert")
+    reference = best("import yaml", "yaml") + best("import logging", "logging")
+    assert package <= BUDGET * reference, (
+        f"import python_magnetgeo.Insert takes {package / 1e3:.1f} ms, "
+        f"over {BUDGET} x {reference / 1e3:.1f} ms (yaml and logging)"
+    )
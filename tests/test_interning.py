@@ -0,0 +1,103 @@
+"""
+Tests for interning of identical nested objects (python_magnetgeo.interning).
+"""
+
+import yaml
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.Ring import Ring
+from python_magnetgeo.InnerCurrentLead import InnerCurrentLead
+
+
+def helix_dict(name, r, cad="HL-MC"):
+    return {
+        "name": name,
+        "r": r,
+        "z": [-50.0, 50.0],
+        "cutwidth": 0.2,
+        "odd": True,
+        "dble": False,
+        "modelaxi": {"name": "axi", "h": 20.0, "turns": [2.0, 2.0], "pitch": [10.0, 10.0]},
+        "model3d": {"cad": cad, "with_shapes": False, "with_channels": False},
+    }
+
+
+def test_no_sharing_outside_scope():
+    h1 = Helix.from_dict(helix_dict("H1", [10.0, 20.0]))
+    h2 = Helix.from_dict(helix_dict("H2", [30.0, 40.0]))
+    assert h1.modelaxi is not h2.modelaxi
+    assert h1.model3d is not h2.model3d
+
+
+def test_identical_nested_objects_are_shared():
+    with pmg.interning() as stats:
+        h1 = Helix.from_dict(helix_dict("H1", [10.0, 20.0]))
+        h2 = Helix.from_dict(helix_dict("H2", [30.0, 40.0]))
+        h3 = Helix.from_dict(helix_dict("H3", [50.0, 60.0], cad="OTHER"))
+
+    assert h1.modelaxi is h2.modelaxi is h3.modelaxi
+    assert h1.model3d is h2.model3d
+    assert h3.model3d is not h1.model3d
+    assert stats.shared == 3
+    assert stats.bytes_saved > 0
+
+
+def test_serialization_unchanged_by_sharing():
+    plain = [Helix.from_dict(helix_dict(f"H{i}", [10.0 + 20 * i, 20.0 + 20 * i])) for i in range(2)]
+    with pmg.interning():
+        shared = [
+            Helix.from_dict(helix_dict(f"H{i}", [10.0 + 20 * i, 20.0 + 20 * i])) for i in range(2)
+        ]
+    insert_plain = _insert(plain)
+    insert_shared = _insert(shared)
+
+    text = insert_shared.to_yaml()
+    assert "&id" not in text and "*id" not in text
+    assert text == insert_plain.to_yaml()
+    assert insert_shared.to_json() == insert_plain.to_json()
+    assert isinstance(yaml.load(text, Loader=yaml.FullLoader), Insert)
+
+
+def test_unshare_gives_private_copy():
+    with pmg.interning():
+        h1 = Helix.from_dict(helix_dict("H1", [10.0, 20.0]))
+        h2 = Helix.from_dict(helix_dict("H2", [30.0, 40.0]))
+
+    axi = pmg.unshare(h1, "modelaxi")
+    axi.name = "private"
+    assert h1.modelaxi is axi
+    assert h2.modelaxi.name == "axi"
+
+
+def _insert(helices):
+    ring = Ring(
+        name="R1", r=helices[0].r + helices[1].r, z=[0.0, 20.0]
+    )
+    lead = InnerCurrentLead(
+        name="inner", r=[9.0, helices[0].r[1]], h=480.0, holes=[], support=[], fillet=False
+    )
+    return Insert(
+        name="I",
+        helices=helices,
+        rings=[ring],
+        currentleads=[lead],
+        hangles=[],
+        rangles=[],
+        innerbore=9.5,
+        outerbore=45.0,
+    )
+
+
+def test_objects_from_different_files_are_not_shared(tree, tree_files):
+    (tree / "axi1.yaml").write_text(tree_files["axi0"])
+
+    with pmg.interning():
+        site = pmg.load(str(tree / "site.yaml"))
+
+    h0, h1 = site.magnets[0].helices
+    assert h1.modelaxi is not h0.modelaxi
+    assert h0.modelaxi._source == str(tree / "axi0.yaml")
+    assert h1.modelaxi._source == str(tree / "axi1.yaml")
+    assert str(tree / "axi1.yaml") in pmg.GeometryWatcher(site, backend="polling").files
@@ -0,0 +1,98 @@
+"""
+Tests for lazy loading of nested references (python_magnetgeo.lazy).
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.lazy import LazyRef, is_loaded
+from python_magnetgeo.Model3D import Model3D
+from python_magnetgeo.ModelAxi import ModelAxi
+from python_magnetgeo.utils import ObjectLoadError
+
+
+def test_msite_reads_only_its_own_file(tree, tree_files):
+    # a broken Insert is only noticed when accessed
+    broken = tree_files["insert"].replace("innerbore: 9.5", "innerbore: 50.0")
+    (tree / "insert.yaml").write_text(broken)
+
+    with pmg.lazy_loading():
+        site = pmg.load(str(tree / "site.yaml"))
+
+    assert site.name == "M"
+    insert = site.magnets[0]
+    assert type(insert) is LazyRef
+    assert not is_loaded(insert)
+    with pytest.raises(ObjectLoadError, match="innerbore"):
+        insert.name
+
+
+def test_forcing_is_transparent(tree, tmp_path_factory, monkeypatch):
+    path = str(tree / "site.yaml")
+    expected = pmg.load(path)
+
+    with pmg.lazy_loading():
+        site = pmg.load(path)
+
+    # forced from another directory: the proxy remembers its own
+    monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+    insert = site.magnets[0]
+    assert isinstance(insert, Insert)
+    assert insert.name == "I"
+    assert is_loaded(insert)
+    assert site.to_yaml() == expected.to_yaml()
+    assert json.loads(site.to_json()) == json.loads(expected.to_json())
+
+
+def test_validation_forces_only_what_it_touches(tree, tree_files):
+    # Insert validation reads the helices (and their modelaxi), not their shapes
+    (tree / "H0.yaml").write_text(tree_files["H0"] + "shape: missing\n")
+
+    with pmg.lazy_loading():
+        insert = pmg.load(str(tree / "insert.yaml"))
+
+    helix = insert.helices[0]
+    assert is_loaded(helix)
+    assert isinstance(helix.modelaxi, ModelAxi)
+    assert not is_loaded(helix.shape)
+    with pytest.raises(ObjectLoadError, match="missing.yaml"):
+        helix.shape.profile
+
+
+def test_validation_errors_are_unchanged(tree, tree_files):
+    (tree / "H1.yaml").write_text(tree_files["H1"].replace("r: [30.0, 40.0]", "r: [5.0, 8.0]"))
+    path = str(tree / "insert.yaml")
+    with pytest.raises(ObjectLoadError) as excinfo:
+        pmg.load(path)
+
+    with pmg.lazy_loading():
+        with pytest.raises(ObjectLoadError) as lazy_excinfo:
+            pmg.load(path)
+    assert str(lazy_excinfo.value) == str(excinfo.value)
+
+
+def test_pickle_and_copy(tree, tree_files):
+    (tree / "H0.yaml").write_text(tree_files["H0"] + "model3d: cad\n")
+    with pmg.lazy_loading():
+        helix = pmg.load(str(tree / "H0.yaml"))
+
+    for clone in (pickle.loads(pickle.dumps(helix)), copy.deepcopy(helix)):
+        assert type(clone.model3d) is LazyRef
+        assert not is_loaded(clone.model3d)
+
+    (tree / "cad.yaml").write_text("!<Model3D>\nname: cad\ncad: SALOME\n")
+    assert helix.model3d.cad == "SALOME"
+    clone = copy.deepcopy(helix)
+    assert type(clone.model3d) is Model3D
+    assert isinstance(clone, Helix)
+
+
+def test_eager_outside_scope(tree):
+    insert = pmg.load(str(tree / "insert.yaml"))
+    assert all(type(helix) is Helix for helix in insert.helices)
@@ -0,0 +1,81 @@
+"""
+Tests for the logging fast paths (python_magnetgeo.logging_config).
+"""
+
+import logging
+
+import pytest
+
+from python_magnetgeo import logging_config
+from python_magnetgeo.logging_config import (
+    PACKAGE_NAME,
+    configure_logging,
+    get_logger,
+    is_production_mode,
+    set_production_mode,
+)
+from python_magnetgeo.validation import GeometryValidator
+
+
+class Counting(str):
+    formatted = 0
+
+    def __str__(self):
+        Counting.formatted += 1
+        return str.__str__(self)
+
+    def __format__(self, spec):
+        Counting.formatted += 1
+        return str.__format__(self, spec)
+
+
+@pytest.fixture
+def package_logger():
+    logger = logging.getLogger(PACKAGE_NAME)
+    level = logger.level
+    yield logger
+    set_production_mode(False)
+    configure_logging()
+    logger.setLevel(level)
+
+
+def test_level_follows_handlers(package_logger):
+    configure_logging(level="INFO")
+    assert package_logger.level == logging.INFO
+    assert not get_logger("python_magnetgeo.validation").isEnabledFor(logging.DEBUG)
+
+    configure_logging(console_level="WARNING", file_level="DEBUG", console=True)
+    # no file handler: only the console level counts
+    assert package_logger.level == logging.WARNING
+
+
+def test_disabled_messages_are_not_formatted(package_logger):
+    configure_logging(level="INFO")
+    Counting.formatted = 0
+    GeometryValidator.validate_name(Counting("H1"))
+    GeometryValidator.validate_positive(1.0, Counting("r"))
+    assert Counting.formatted == 0
+
+    configure_logging(level="DEBUG")
+    GeometryValidator.validate_name(Counting("H1"))
+    assert Counting.formatted > 0
+
+
+def test_production_mode(package_logger, caplog):
+    configure_logging(level="DEBUG")
+    logger = get_logger("python_magnetgeo.validation")
+
+    set_production_mode()
+    assert is_production_mode()
+    assert logger.debug is logging_config._discard
+    assert not logger.isEnabledFor(logging.DEBUG)
+    # loggers created afterwards are stripped too
+    assert get_logger("python_magnetgeo.test_production").info is logging_config._discard
+    with caplog.at_level(logging.WARNING, logger=PACKAGE_NAME):
+        logger.warning("still emitted")
+    assert "still emitted" in caplog.text
+
+    set_production_mode(False)
+    assert not is_production_mode()
+    assert logger.debug == logging.Logger.debug.__get__(logger)
+    assert package_logger.level == logging.DEBUG
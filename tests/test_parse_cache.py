@@ -0,0 +1,134 @@
+"""
+Tests for the opt-in in-process parse cache (python_magnetgeo.cache).
+"""
+
+import os
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.ModelAxi import ModelAxi
+from python_magnetgeo.Ring import Ring
+
+
+AXI_YAML = """!<ModelAxi>
+name: axi
+h: 20.0
+turns: [2.0, 2.0]
+pitch: [10.0, 10.0]
+"""
+
+HELIX_YAML = """!<Helix>
+name: H1
+r: [15.0, 25.0]
+z: [-50.0, 50.0]
+cutwidth: 0.2
+odd: true
+dble: false
+modelaxi: axi
+"""
+
+RING_YAML = """!<Ring>
+name: {name}
+r: [10.0, 20.0, 30.0, 40.0]
+z: [0.0, 10.0]
+"""
+
+
+@pytest.fixture
+def cached():
+    pmg.enable_cache()
+    yield
+    pmg.disable_cache()
+
+
+@pytest.fixture
+def helix_files(tmp_path):
+    (tmp_path / "axi.yaml").write_text(AXI_YAML)
+    (tmp_path / "H1.yaml").write_text(HELIX_YAML)
+    return tmp_path
+
+
+def test_disabled_by_default(helix_files):
+    pmg.load(str(helix_files / "H1.yaml"))
+    info = pmg.cache_info()
+    assert info["enabled"] is False
+    assert info["hits"] == 0 and info["misses"] == 0
+
+
+def test_hits_and_misses(cached, helix_files):
+    first = pmg.load(str(helix_files / "H1.yaml"))
+    info = pmg.cache_info()
+    # H1.yaml and the nested axi.yaml
+    assert info["misses"] == 2
+    assert info["hits"] == 0
+
+    second = pmg.load(str(helix_files / "H1.yaml"))
+    info = pmg.cache_info()
+    assert info["hits"] == 1
+    assert info["entries"] == 2
+
+    assert isinstance(second, Helix)
+    assert second.modelaxi.pitch == first.modelaxi.pitch
+    assert second._basedir == str(helix_files)
+
+
+def test_hits_are_independent_clones(cached, helix_files):
+    first = pmg.load(str(helix_files / "H1.yaml"))
+    first.modelaxi.pitch[0] = 99.0
+
+    second = pmg.load(str(helix_files / "H1.yaml"))
+    assert second is not first
+    assert second.modelaxi.pitch == [10.0, 10.0]
+
+
+def test_nested_change_invalidates_parent(cached, helix_files):
+    pmg.load(str(helix_files / "H1.yaml"))
+
+    axi = helix_files / "axi.yaml"
+    axi.write_text(AXI_YAML.replace("h: 20.0", "h: 10.0").replace("10.0, 10.0", "5.0, 5.0"))
+    st = os.stat(axi)
+    os.utime(axi, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    helix = pmg.load(str(helix_files / "H1.yaml"))
+    assert helix.modelaxi.h == 10.0
+    assert pmg.cache_info()["invalidations"] >= 1
+
+
+def test_string_branch_in_init_uses_cache(cached, helix_files, monkeypatch):
+    monkeypatch.chdir(helix_files)
+    args = dict(name="H2", r=[15.0, 25.0], z=[-50.0, 50.0], cutwidth=0.2, odd=True, dble=False)
+
+    Helix(modelaxi="axi", **args)
+    helix = Helix(modelaxi="axi", **args)
+
+    assert isinstance(helix.modelaxi, ModelAxi)
+    assert pmg.cache_info()["hits"] == 1
+
+
+def test_lru_eviction_respects_budget(helix_files):
+    for i in range(3):
+        (helix_files / f"R{i}.yaml").write_text(RING_YAML.format(name=f"R{i}"))
+
+    pmg.enable_cache()
+    try:
+        pmg.load(str(helix_files / "R0.yaml"))
+        entry_size = pmg.cache_info()["size"]
+        pmg.clear_cache()
+
+        pmg.enable_cache(max_bytes=2 * entry_size)
+        for i in range(3):
+            pmg.load(str(helix_files / f"R{i}.yaml"))
+
+        info = pmg.cache_info()
+        assert info["entries"] == 2
+        assert info["evictions"] == 1
+        assert info["size"] <= info["max_bytes"]
+
+        # R0 was least recently used and has been evicted
+        ring = pmg.load(str(helix_files / "R0.yaml"))
+        assert isinstance(ring, Ring)
+        assert pmg.cache_info()["hits"] == 0
+    finally:
+        pmg.disable_cache()
@@ -0,0 +1,70 @@
+"""
+Tests for parallel prefetch of nested file references (python_magnetgeo.prefetch).
+"""
+
+import os
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Bitters import Bitters
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.MSite import MSite
+
+
+def test_prefetch_matches_sequential_load(tree):
+    path = str(tree / "insert.yaml")
+    expected = pmg.load(path)
+
+    with pmg.prefetching(max_workers=4) as prefetcher:
+        insert = pmg.load(path)
+
+    assert isinstance(insert, Insert)
+    assert insert.to_yaml() == expected.to_yaml()
+    assert insert._basedir == str(tree)
+    # the insert, its 4 direct references and the 2 ModelAxi of the helices
+    assert prefetcher.fetched == 7
+
+
+def test_prefetch_msite(tree):
+    path = str(tree / "site.yaml")
+    expected = pmg.load(path)
+
+    with pmg.prefetching() as prefetcher:
+        site = pmg.load(path)
+
+    assert isinstance(site, MSite)
+    assert site.to_yaml() == expected.to_yaml()
+    assert prefetcher.fetched == 8
+
+
+def test_missing_reference_error_is_deterministic(tree, load_error):
+    os.remove(tree / "axi1.yaml")
+    path = str(tree / "insert.yaml")
+    expected = load_error(path)
+
+    with pmg.prefetching():
+        assert load_error(path) == expected
+
+
+def test_validation_error_is_deterministic(tree, tree_files, load_error):
+    # both helices are invalid: the first one in file order must be reported
+    (tree / "axi0.yaml").write_text(tree_files["axi0"].replace("h: 20.0", "h: 21.0"))
+    (tree / "H1.yaml").write_text(tree_files["H1"].replace("r: [30.0, 40.0]", "r: [40.0, 30.0]"))
+    path = str(tree / "insert.yaml")
+    expected = load_error(path)
+    assert "axi0" in expected or "pitch" in expected
+
+    for _ in range(5):
+        with pmg.prefetching(max_workers=8):
+            assert load_error(path) == expected
+
+
+def test_container_dependencies():
+    assert Insert.get_required_files(
+        {"helices": ["H0", "H1"], "rings": ["R"], "currentleads": ["lead"], "probes": []}
+    ) == {"H0.yaml", "H1.yaml", "R.yaml", "lead.yaml"}
+    assert Bitters.get_required_files({"magnets": ["B0", "B1"], "probes": ["P"]}) == {
+        "B0.yaml",
+        "B1.yaml",
+        "P.yaml",
+    }
+    assert MSite.get_required_files({"magnets": ["insert"], "screens": None}) == {"insert.yaml"}
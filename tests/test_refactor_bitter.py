@@ -16,6 +16,7 @@ from python_magnetgeo.ModelAxi import ModelAxi
 from python_magnetgeo.coolingslit import CoolingSlit
 from python_magnetgeo.tierod import Tierod
 from python_magnetgeo.Contour2D import Contour2D
+from python_magnetgeo.utils import base_directory
 from python_magnetgeo.validation import ValidationError
 
 
@@ -363,6 +364,19 @@ def test_yaml_round_trip():
 #            os.unlink(temp_file)
 
 
+def test_tierod_reference(tmp_path):
+    """A tierod given as a file reference is loaded into bitter.tierod"""
+    (tmp_path / "tierod.yaml").write_text(
+        "!<Tierod>\nr: 1.0\nn: 2\ndh: 0.1\nsh: 0.2\ncontour2d: null\n"
+    )
+    with base_directory(str(tmp_path)):
+        bitter = Bitter("B", r=[0.10, 0.15], z=[-0.05, 0.05], odd=True, modelaxi=None,
+                        tierod="tierod")
+    assert isinstance(bitter.tierod, Tierod)
+    assert bitter.tierod.n == 2
+    assert "tierod=" in repr(bitter)
+
+
 def main():
     """Run all Bitter refactor validation tests"""
     print("=" * 60)
@@ -0,0 +1,65 @@
+"""
+Tests for the lazy registration of the geometry classes (python_magnetgeo.registry).
+
+Each test runs in a fresh interpreter, the classes imported by the other
+tests being registered for the whole session.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parents[1])
+
+
+def run(statement: str, cwd) -> str:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+    process = subprocess.run(
+        [sys.executable, "-c", statement], capture_output=True, text=True, cwd=cwd, env=env
+    )
+    assert process.returncode == 0, process.stderr
+    return process.stdout
+
+
+def test_load_imports_the_class_of_the_tag_only(tmp_path, tree_files):
+    (tmp_path / "R.yaml").write_text(tree_files["R"])
+    statement = (
+        "import sys, python_magnetgeo as pmg;"
+        "ring = pmg.load('R.yaml');"
+        "print(type(ring).__name__);"
+        "print(sorted(name for name in sys.modules if name.split('.')[-1] in pmg._LAZY_IMPORTS))"
+    )
+    assert run(statement, tmp_path).split("\n")[:2] == ["Ring", "['python_magnetgeo.Ring']"]
+
+
+def test_nested_tags_are_registered_on_first_use(tree):
+    (tree / "tierod.yaml").write_text(
+        "!<Tierod>\nr: 1.0\nn: 2\ndh: 0.1\nsh: 0.2\ncontour2d: null\n"
+    )
+    statement = (
+        "import python_magnetgeo as pmg;"
+        "site = pmg.load('site.yaml');"
+        "print(type(site.magnets[0].helices[0]).__name__);"
+        "print(type(pmg.load('tierod.yaml')).__module__)"
+    )
+    assert run(statement, tree).split() == ["Helix", "python_magnetgeo.tierod"]
+
+
+def test_json_classname_and_unknown_tags(tmp_path, tree_files):
+    (tmp_path / "R.yaml").write_text(tree_files["R"])
+    (tmp_path / "unknown.yaml").write_text("!<Unknown>\nname: x\n")
+    statement = (
+        "import json, python_magnetgeo as pmg;"
+        "from python_magnetgeo.base import YAMLObjectBase;"
+        "text = pmg.load('R.yaml').to_json();"
+        "from python_magnetgeo.deserialize import unserialize_object;"
+        "print(type(unserialize_object(json.loads(text))).__name__);"
+        "print(YAMLObjectBase.get_class('Chamfer').__name__);"
+        "print(YAMLObjectBase.get_class('Unknown'))\n"
+        "try:\n"
+        "    pmg.load('unknown.yaml')\n"
+        "except Exception as error:\n"
+        "    print('Unknown' in str(error))"
+    )
+    assert run(statement, tmp_path).split() == ["Ring", "Chamfer", "None", "True"]
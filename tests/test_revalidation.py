@@ -0,0 +1,139 @@
+"""
+Tests for the incremental revalidation of Insert (python_magnetgeo.rules).
+"""
+
+import copy
+
+import pytest
+
+from python_magnetgeo.Bitter import Bitter
+from python_magnetgeo.Bitters import Bitters
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.InnerCurrentLead import InnerCurrentLead
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.Ring import Ring
+from python_magnetgeo.rules import Rule, RuleSet
+from python_magnetgeo.validation import ValidationError
+
+NHELICES = 5
+
+
+def helix(i, dr=0.0):
+    return Helix(f"H{i}", [10.0 + 20 * i + dr, 20.0 + 20 * i], [-50.0, 50.0], 0.2, True, False)
+
+
+def ring(i):
+    r0 = 10.0 + 20 * i
+    return Ring(f"R{i}", [r0, r0 + 10.0, r0 + 20.0, r0 + 30.0], [50.0, 60.0])
+
+
+@pytest.fixture
+def insert():
+    return Insert(
+        "I",
+        [helix(i) for i in range(NHELICES)],
+        [ring(i) for i in range(NHELICES - 1)],
+        [InnerCurrentLead("lead", [9.0, 20.0], 480.0, [], [], False)],
+        [],
+        [],
+        9.5,
+        200.0,
+    )
+
+
+def rebuild_error(insert):
+    """Error of a new Insert built from the (edited) components."""
+    with pytest.raises(ValidationError) as info:
+        Insert(
+            insert.name,
+            list(insert.helices),
+            list(insert.rings),
+            list(insert.currentleads),
+            [],
+            [],
+            insert.innerbore,
+            insert.outerbore,
+        )
+    return str(info.value)
+
+
+def test_only_neighbor_rules_run(insert):
+    total = len(insert.consistency_rules().rules)
+    assert insert.revalidate() == total
+    # helix order 2 and 3, rings 1 and 2 radius
+    assert insert.revalidate(insert.helices[2]) == 4
+    # bores, helix order 1, ring 0 radius, current leads
+    assert insert.revalidate(insert.helices[0]) == 4
+    assert insert.revalidate(("rings", 3)) == 2
+    assert insert.revalidate("outerbore") == 1
+
+
+def test_same_errors_as_construction(insert):
+    # ring 1 no longer matches helix 2
+    insert.helices[2] = helix(2, dr=0.5)
+    with pytest.raises(ValidationError) as info:
+        insert.revalidate(insert.helices[2])
+    assert str(info.value) == rebuild_error(insert)
+    assert str(info.value).startswith("Ring[1] (R1) radius")
+
+    # helices out of order
+    insert.helices[2] = helix(0)
+    with pytest.raises(ValidationError) as info:
+        insert.revalidate(insert.helices[2])
+    assert str(info.value) == rebuild_error(insert)
+
+
+def test_edited_fields_are_validated(insert):
+    insert.helices[1].r = [40.0, 30.0]
+    with pytest.raises(ValidationError, match="ascending order"):
+        insert.revalidate(insert.helices[1])
+
+
+def test_replace(insert):
+    before = copy.deepcopy(insert.r)
+    with pytest.raises(ValidationError, match="does not match"):
+        insert.replace_helix(-1, helix(NHELICES - 1, dr=1.0))
+    assert insert.helices[-1].r[0] == 10.0 + 20 * (NHELICES - 1)
+    assert insert.r == before
+
+    assert insert.replace_ring(1, ring(1)) == 3
+    z = list(insert.z)
+    longer = Helix("H4", [90.0, 100.0], [-60.0, 60.0], 0.2, True, False)
+    insert.replace_helix(4, longer)
+    assert insert.helices[4] is longer
+    assert insert.z == [z[0] - 10.0, z[1] + 10.0]
+
+
+def test_unknown_component(insert):
+    with pytest.raises(ValueError, match="not a component"):
+        insert.revalidate(helix(1))
+
+
+def test_magnet_stacks():
+    def disk(name, r):
+        return Bitter(name, r, [0.0, 10.0], False, None)
+
+    disks = [disk(f"B{i}", [10.0 * i + 1, 10.0 * i + 9]) for i in range(4)]
+    bitters = Bitters("B", disks, 0.5, 50.0)
+    assert bitters.revalidate() == 1
+    assert bitters.revalidate(disks[2]) == 1
+    assert bitters.revalidate(disk("other", [1.0, 2.0])) == 0
+
+    disks[3].r = [1.0, 5.0]
+    with pytest.raises(ValidationError, match="intersect"):
+        bitters.revalidate(disks[3])
+    with pytest.raises(ValidationError, match="intersect"):
+        bitters.revalidate(("magnets", 3))
+    # only the pairs involving the edited disks are checked
+    assert bitters.revalidate(disks[1]) == 1
+
+
+def test_rule_set_order():
+    calls = []
+    rules = RuleSet(
+        Rule(name, dependencies, lambda name=name: calls.append(name))
+        for name, dependencies in (("a", {"x"}), ("b", {"y"}), ("c", {"x", "y"}))
+    )
+    assert rules.check({"y", "x"}) == 3
+    assert calls == ["a", "b", "c"]
+    assert [rule.name for rule in rules.affected(["y"])] == ["b", "c"]
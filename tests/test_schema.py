@@ -0,0 +1,94 @@
+"""
+Tests for the declarative field schemas (python_magnetgeo.schema).
+"""
+
+import pytest
+
+from python_magnetgeo.base import YAMLObjectBase
+from python_magnetgeo.enums import DetailLevel
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.ModelAxi import ModelAxi
+from python_magnetgeo.Ring import Ring
+from python_magnetgeo.schema import Field, is_name, is_positive
+from python_magnetgeo.Shape import Shape
+from python_magnetgeo.Supra import Supra
+from python_magnetgeo.validation import ValidationError
+
+HELIX = {
+    "name": "H1",
+    "r": [19.3, 24.2],
+    "z": [-226.0, 108.0],
+    "cutwidth": 0.22,
+    "odd": True,
+    "dble": True,
+    "modelaxi": {
+        "name": "H1.d",
+        "h": 10.0,
+        "turns": [2.0, 3.0],
+        "pitch": [4.0, 4.0],
+    },
+}
+
+
+class Widget(YAMLObjectBase):
+    yaml_tag = "SchemaTestWidget"
+    _fields = (
+        Field("name", str, validators=(is_name,)),
+        Field("width", float, default=1.0, validators=(is_positive,)),
+        Field("tags", list, default=[]),
+    )
+
+    def __init__(self, name: str, width: float = 1.0, tags: list = None) -> None:
+        self._validate_fields(name=name, width=width)
+        self.name = name
+        self.width = width
+        self.tags = tags
+
+
+def test_generated_from_dict_defaults():
+    ring = Ring.from_dict({"name": "R", "r": [1.0, 2.0, 3.0, 4.0], "z": [0.0, 1.0]})
+    assert (ring.n, ring.angle, ring.bpside, ring.fillets, ring.cad) == (0, 0, True, False, "")
+    assert Ring._field_names == ("name", "r", "z", "n", "angle", "bpside", "fillets", "cad")
+    assert "bpside (default True)" in Ring.from_dict.__doc__
+
+    with pytest.raises(KeyError):
+        Ring.from_dict({"name": "R", "r": [1.0, 2.0, 3.0, 4.0]})
+
+
+def test_mutable_defaults_are_copied():
+    first = Widget.from_dict({"name": "a"})
+    first.tags.append("x")
+    assert Widget.from_dict({"name": "b"}).tags == []
+
+
+def test_declared_validators():
+    with pytest.raises(ValidationError, match="width must be positive"):
+        Widget.from_dict({"name": "a", "width": -1.0})
+    with pytest.raises(ValidationError, match="r must have exactly 4 values"):
+        Ring.from_dict({"name": "R", "r": [1.0, 2.0], "z": [0.0, 1.0]})
+    with pytest.raises(ValidationError, match="ascending"):
+        Ring("R", [1.0, 2.0, 3.0, 4.0], [1.0, 0.0])
+
+
+def test_nested_fields():
+    helix = Helix.from_dict(dict(HELIX, start_diameter_hole=2.5))
+    assert isinstance(helix.modelaxi, ModelAxi)
+    assert helix.start_hole_diameter == 2.5
+    assert helix.chamfers == []
+
+    # objects already constructed are used as is
+    modelaxi = helix.modelaxi
+    assert Helix.from_dict(dict(HELIX, modelaxi=modelaxi)).modelaxi is modelaxi
+
+
+def test_convert():
+    supra = Supra.from_dict({"name": "S", "r": [1.0, 2.0], "z": [0.0, 1.0], "detail": "dblpancake"})
+    assert supra.detail == DetailLevel.DBLPANCAKE
+
+    values = {"name": "S", "r": [1.0, 2.0], "z": [0.0, 1.0], "detail": DetailLevel.NONE}
+    assert Supra.from_dict(values).detail == DetailLevel.NONE
+
+
+def test_handwritten_from_dict_is_kept():
+    assert "_fields" not in Shape.__dict__
+    assert Shape.from_dict.__func__ is Shape.__dict__["from_dict"].__func__
@@ -0,0 +1,106 @@
+"""
+Tests for the array view of the helical sections (ModelAxi.sections).
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from python_magnetgeo.Bitter import Bitter
+from python_magnetgeo.ModelAxi import ModelAxi
+
+
+@pytest.fixture
+def modelaxi():
+    return ModelAxi("axi", h=100.0, turns=[10.0, 20.0, 10.0], pitch=[4.0, 6.0, 4.0])
+
+
+def test_breakpoints(modelaxi):
+    view = modelaxi.sections()
+
+    assert view.nsections == 3
+    assert view.z.tolist() == [-100.0, -60.0, 60.0, 100.0]
+    assert np.allclose(view.theta, 2 * math.pi * np.array([0.0, 10.0, 30.0, 40.0]))
+    assert view.boundaries() == [-100.0, -60.0, 60.0, 100.0]
+    assert not view.z.flags.writeable
+
+    # sections of similar pitch are merged, as by compact
+    merged = ModelAxi("merged", h=37.5, turns=[5.0, 5.0, 10.0], pitch=[5.0, 5.0, 2.5])
+    assert merged.sections().boundaries() == [-37.5, 12.5, 37.5]
+
+
+def test_point_queries(modelaxi):
+    view = modelaxi.sections()
+    z = np.array([-120.0, -100.0, -80.0, -60.0, 0.0, 100.0, 120.0])
+
+    assert view.section_of(z).tolist() == [-1, 0, 0, 1, 1, 2, -1]
+    assert view.section_of(-80.0) == 0
+    assert np.isnan(view.pitch_at(z)[[0, -1]]).all()
+    assert view.pitch_at(z)[1:-1].tolist() == [4.0, 4.0, 6.0, 6.0, 4.0]
+    # uniform pitch of 40 turns over 200: 5
+    assert view.density_factor(-80.0) == pytest.approx(5.0 / 4.0)
+    assert view.density_factor(0.0, cutwidth=1.0) == pytest.approx(4.0 / 5.0)
+
+    # theta is linear in z within a section, and z_at inverts it
+    assert view.theta_at(-80.0) == pytest.approx(2 * math.pi * 5.0)
+    assert view.theta_at(0.0) == pytest.approx(2 * math.pi * 20.0)
+    points = np.random.default_rng(0).uniform(-100.0, 100.0, 1_000_000)
+    assert np.allclose(view.z_at(view.theta_at(points)), points)
+
+
+def test_view_is_cached_until_the_sections_change(modelaxi):
+    view = modelaxi.sections()
+    assert modelaxi.sections() is view
+
+    modelaxi.turns[1] = 15.0
+    modelaxi.turns.append(5.0)
+    modelaxi.pitch.append(6.0)
+    changed = modelaxi.sections()
+    assert changed is not view
+    assert changed.z.tolist() == [-100.0, -60.0, 30.0, 70.0, 100.0]
+    # no consecutive sections share their pitch (see compact)
+    turns, pitch = modelaxi.compact()
+    assert len(changed.boundaries()) == len(turns) + 1 == 5
+
+
+def test_bitter_params(modelaxi):
+    bitter = Bitter(
+        "B", r=[100.0, 150.0], z=[-110.0, 100.0], odd=True, modelaxi=modelaxi,
+        innerbore=90.0, outerbore=160.0,
+    )
+    _, _, _, Zh, _ = bitter.get_params()
+    assert Zh == [-110.0, -100.0, -60.0, 60.0, 100.0]
+
+    empty = ModelAxi("empty", h=50.0, turns=[], pitch=[])
+    assert empty.sections().boundaries() == [-50.0]
+    assert empty.sections().section_of([0.0]).tolist() == [-1]
+
+    # ModelAxi does not check the lengths when a list is empty
+    bitter.modelaxi = ModelAxi("e", h=50.0, turns=[10.0], pitch=[])
+    with pytest.raises(ValueError, match="same length"):
+        bitter.get_params()
+
+
+def test_cut_files_accumulate_sections_in_turn(tmp_path):
+    from types import SimpleNamespace
+
+    from python_magnetgeo.hcuts import lncmi_cut, salome_cut
+
+    rng = np.random.default_rng(3)
+    turns = rng.uniform(0.5, 20, 12).round(3).tolist()
+    pitch = rng.uniform(1, 30, 12).round(4).tolist()
+    h = sum(t * p for t, p in zip(turns, pitch)) / 2
+    helix = SimpleNamespace(odd=True, modelaxi=ModelAxi("axi", h, turns, pitch))
+
+    lncmi_cut(helix, str(tmp_path / "cut.iso"), z0=12.3)
+    salome_cut(helix, str(tmp_path / "cut.dat"))
+    lncmi = [line for line in (tmp_path / "cut.iso").read_text().split("\n") if "\tX " in line]
+    salome = (tmp_path / "cut.dat").read_text().split("\n")[2:-1]
+
+    z_lncmi, z_salome = 12.3, h
+    for t, p, line, row in zip(turns, pitch, lncmi, salome, strict=True):
+        z_lncmi -= t * p
+        z_salome -= t * p
+        assert f"X {-z_lncmi * 1e3:12.4f}" in line
+        assert row.endswith(f"{z_salome:12.8f}")
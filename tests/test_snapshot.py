@@ -0,0 +1,132 @@
+"""
+Tests for binary snapshots (python_magnetgeo.snapshot).
+"""
+
+import os
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo import snapshot
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.ModelAxi import ModelAxi
+from python_magnetgeo.utils import ObjectLoadError
+from python_magnetgeo.validation import GeometryValidator
+
+NSECTIONS = 24
+AXI = "!<ModelAxi>\nname: axi0\nh: 12.0\nturns: {}\npitch: {}\n".format(
+    [1.0] * NSECTIONS, [1.0] * NSECTIONS
+)
+
+
+@pytest.fixture
+def tree(tree):
+    pmg.clear_dependency_cache()
+    (tree / "axi0.yaml").write_text(AXI)
+    return tree
+
+
+def test_roundtrip(tree):
+    insert = pmg.load(str(tree / "insert.yaml"))
+    path = pmg.save_snapshot(insert, str(tree / "insert.mgsnap"))
+
+    restored = pmg.load_snapshot(path)
+    assert isinstance(restored, Insert)
+    assert restored.to_yaml() == insert.to_yaml()
+    assert restored.helices[0].modelaxi.turns == [1.0] * NSECTIONS
+    assert restored._source == insert._source
+
+
+def test_numeric_lists_out_of_band(tree, monkeypatch):
+    recorded = []
+    persistent_load = snapshot._Unpickler.persistent_load
+
+    def recording(self, pid):
+        recorded.append(len(self.buffers[pid[1]]))
+        return persistent_load(self, pid)
+
+    monkeypatch.setattr(snapshot._Unpickler, "persistent_load", recording)
+    axi = pmg.load(str(tree / "axi0.yaml"))
+    restored = pmg.load_snapshot(pmg.save_snapshot(axi, str(tree / "axi.mgsnap")))
+
+    # turns and pitch, 8 bytes per float; short lists stay in the pickle stream
+    assert recorded == [8 * NSECTIONS, 8 * NSECTIONS]
+    assert restored.pitch == axi.pitch
+
+
+def test_point_rows_out_of_band(tree):
+    from python_magnetgeo.Contour2D import Contour2D
+
+    points = [[float(i), 0.5 * i] for i in range(10)]
+    path = pmg.save_snapshot(Contour2D("c", points), str(tree / "c.mgsnap"))
+    assert pmg.load_snapshot(path).points == points
+
+
+def test_no_validation_on_load(tree, monkeypatch):
+    path = pmg.save_snapshot(pmg.load(str(tree / "site.yaml")), str(tree / "site.mgsnap"))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validation called")
+
+    monkeypatch.setattr(GeometryValidator, "validate_name", fail)
+    monkeypatch.setattr(ModelAxi, "__init__", fail)
+    assert pmg.load_snapshot(path).name == "M"
+
+
+def test_stale_on_source_change(tree, tree_files):
+    path = pmg.save_snapshot(pmg.load(str(tree / "site.yaml")), str(tree / "site.mgsnap"))
+
+    # same content, new mtime: still fresh
+    stat = os.stat(tree / "axi1.yaml")
+    os.utime(tree / "axi1.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    pmg.load_snapshot(path)
+
+    (tree / "axi1.yaml").write_text(tree_files["axi1"].replace("h: ", "h:  "))
+    with pytest.raises(pmg.StaleSnapshotError, match="axi1.yaml changed"):
+        pmg.load_snapshot(path)
+    assert pmg.load_snapshot(path, verify=False).name == "M"
+
+
+def test_stale_on_version_change(tree, monkeypatch):
+    path = pmg.save_snapshot(pmg.load(str(tree / "R.yaml")), str(tree / "R.mgsnap"))
+    monkeypatch.setattr(snapshot, "_package_version", lambda: "0.0.0")
+    with pytest.raises(pmg.StaleSnapshotError, match="written by python_magnetgeo"):
+        pmg.load_snapshot(path)
+
+
+def test_not_a_snapshot(tree):
+    with pytest.raises(ObjectLoadError, match="not a magnetgeo snapshot"):
+        pmg.load_snapshot(str(tree / "R.yaml"))
+
+
+@pytest.mark.parametrize("header", [b"{not json", b'{"package": "1.0.0"}', b"[]"])
+def test_corrupted_header(tree, header):
+    filename = str(tree / "insert.yaml")
+    insert = pmg.load_with_snapshot(filename)
+    path = tree / "insert.yaml.mgsnap"
+    magic, _, rest = path.read_bytes().split(b"\n", 2)
+    path.write_bytes(b"\n".join([magic, header, rest]))
+
+    with pytest.raises(ObjectLoadError, match="Invalid snapshot header"):
+        pmg.load_snapshot(str(path))
+    # the snapshot is rebuilt
+    assert pmg.load_with_snapshot(filename).to_yaml() == insert.to_yaml()
+    assert pmg.load_snapshot(str(path)).to_yaml() == insert.to_yaml()
+
+
+def test_load_with_snapshot_rebuilds(tree, monkeypatch, tree_files):
+    filename = str(tree / "insert.yaml")
+    insert = pmg.load_with_snapshot(filename)
+    assert os.path.exists(filename + ".mgsnap")
+
+    built = []
+    get_object = pmg.utils.getObject
+    monkeypatch.setattr(pmg.utils, "getObject", lambda f: built.append(f) or get_object(f))
+
+    assert pmg.load_with_snapshot(filename).to_yaml() == insert.to_yaml()
+    assert built == []
+
+    (tree / "H0.yaml").write_text(tree_files["H0"].replace("odd: true", "odd: false"))
+    assert pmg.load_with_snapshot(filename).helices[0].odd is False
+    assert built == [filename]
+    assert pmg.load_snapshot(filename + ".mgsnap").helices[0].odd is False
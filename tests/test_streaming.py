@@ -0,0 +1,100 @@
+"""
+Tests for the streaming YAML loaders (python_magnetgeo.streaming).
+"""
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.InnerCurrentLead import InnerCurrentLead
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.Probe import Probe
+from python_magnetgeo.utils import ObjectLoadError
+
+PROBES = """
+probes:
+  - !<Probe>
+    name: V1
+    type: voltage_taps
+    labels: [V1, V2]
+    points: [[10.0, 0.0, 0.0], [20.0, 0.0, 0.0]]
+  - name: T1
+    type: temperature
+    labels: [T1]
+    points: [[15.0, 0.0, 5.0]]
+"""
+
+
+@pytest.fixture
+def tree(tree, tree_files):
+    (tree / "insert.yaml").write_text(tree_files["insert"] + PROBES)
+    return tree
+
+
+def test_same_object_as_load(tree, tree_files):
+    for name in tree_files:
+        path = str(tree / f"{name}.yaml")
+        expected = pmg.load(path)
+        streamed = pmg.load_streaming(path)
+        assert type(streamed) is type(expected)
+        assert streamed.to_yaml() == expected.to_yaml()
+    assert streamed._source == str(tree / "site.yaml")
+
+
+def test_inline_objects_and_anchors(tmp_path):
+    (tmp_path / "H.yaml").write_text(
+        "!<Helix>\nname: H\nr: &radii [10.0, 20.0]\nz: [-50.0, 50.0]\ncutwidth: 0.2\n"
+        "odd: true\ndble: false\nmodelaxi: !<ModelAxi>\n"
+        "  <<: {name: axi, h: 20.0}\n  turns: [2.0, 2.0]\n  pitch: [10.0, 10.0]\n"
+        "chamfers: []\ngrooves: null\nshape: null\nmodel3d: null\n"
+    )
+    helix = pmg.load_streaming(str(tmp_path / "H.yaml"))
+    assert isinstance(helix, Helix)
+    assert helix.r == [10.0, 20.0]
+    assert helix.modelaxi.name == "axi"
+    assert helix.to_yaml() == pmg.load(str(tmp_path / "H.yaml")).to_yaml()
+
+
+def test_iter_components(tree):
+    items = list(pmg.iter_components(str(tree / "insert.yaml"), fields=("probes", "currentleads")))
+    assert [field for field, _ in items] == ["currentleads", "probes", "probes"]
+    assert isinstance(items[0][1], InnerCurrentLead)
+    # untagged inline items are built with the class of the field
+    assert all(isinstance(probe, Probe) for _, probe in items[1:])
+    assert items[2][1].name == "T1"
+
+
+def test_iter_components_keeps_the_caller_base_directory(tree, tmp_path):
+    from python_magnetgeo.utils import base_directory, get_basedir
+
+    caller = tmp_path / "caller"
+    caller.mkdir()
+    with base_directory(str(caller)):
+        for _ in pmg.iter_components(str(tree / "insert.yaml"), fields=("helices",)):
+            assert get_basedir() == str(caller)
+        assert get_basedir() == str(caller)
+
+    # a stream finalized in another context does not reset the base directory
+    stream = pmg.iter_components(str(tree / "insert.yaml"), fields=("helices",))
+    next(stream)
+    with base_directory(str(caller)):
+        stream.close()
+        assert get_basedir() == str(caller)
+
+
+def test_iter_components_does_not_build_root(tree, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("root built")
+
+    monkeypatch.setattr(Insert, "from_dict", classmethod(fail))
+    helices = [obj.name for _, obj in pmg.iter_components(str(tree / "insert.yaml"), ("helices",))]
+    assert helices == ["H0", "H1"]
+
+
+def test_errors(tree):
+    (tree / "bad.yaml").write_text("!<Helix>\nname: H\nr: [20.0, 10.0]\n")
+    with pytest.raises(ObjectLoadError):
+        pmg.load_streaming(str(tree / "bad.yaml"))
+    (tree / "unknown.yaml").write_text("!<Unknown>\nname: U\n")
+    with pytest.raises(ObjectLoadError, match="Unknown"):
+        pmg.load_streaming(str(tree / "unknown.yaml"))
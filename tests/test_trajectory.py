@@ -0,0 +1,69 @@
+"""
+Tests for the helical cut path sampler (python_magnetgeo.trajectory).
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Bitter import Bitter
+from python_magnetgeo.ModelAxi import ModelAxi
+
+
+@pytest.fixture
+def insert(tree):
+    return pmg.load(str(tree / "insert.yaml"))
+
+
+@pytest.fixture
+def bitter():
+    modelaxi = ModelAxi("axi", h=100.0, turns=[10.0, 20.0, 10.0], pitch=[4.0, 6.0, 4.0])
+    return Bitter("B", r=[100.0, 150.0], z=[-110.0, 110.0], odd=False, modelaxi=modelaxi)
+
+
+def test_sample_cut(bitter):
+    samples = bitter.sample_cut(points_per_turn=36)
+
+    assert len(samples.theta) == 40 * 36 + 1
+    assert samples.z[0] == -100.0 and samples.z[-1] == pytest.approx(100.0)
+    assert samples.theta[-1] == pytest.approx(40 * 2 * math.pi)
+    # right handed, on the mean radius, through the section breakpoints
+    assert np.all(np.diff(samples.theta) > 0) and np.all(np.diff(samples.z) > 0)
+    assert np.allclose(np.hypot(samples.x, samples.y), 125.0)
+    assert samples.z[10 * 36] == pytest.approx(-60.0)
+    assert np.allclose(np.diff(samples.z[: 10 * 36]), 4.0 / 36)
+
+    bitter.odd = True
+    left = bitter.sample_cut(points_per_turn=36, radius=100.0)
+    assert np.array_equal(left.theta, -samples.theta) and np.array_equal(left.z, samples.z)
+    assert np.allclose(np.hypot(left.x, left.y), 100.0)
+
+
+def test_iter_cut_matches_the_batch(bitter):
+    samples = bitter.sample_cut(points_per_turn=100)
+    chunks = list(bitter.iter_cut(points_per_turn=100, chunk=999))
+
+    assert max(len(chunk.z) for chunk in chunks) == 999
+    for field in samples._fields:
+        joined = np.concatenate([getattr(chunk, field) for chunk in chunks])
+        assert np.array_equal(joined, getattr(samples, field))
+
+
+def test_insert_sample_cuts(insert):
+    cuts = insert.sample_cuts(points_per_turn=90, edge=1)
+
+    assert sorted(cuts) == sorted(helix.name for helix in insert.helices)
+    for helix in insert.helices:
+        centre = helix.sample_cut(points_per_turn=90)
+        assert np.allclose(cuts[helix.name].z - centre.z, helix.cutwidth / 2)
+
+
+def test_invalid_arguments(bitter):
+    with pytest.raises(ValueError, match="no helical cut"):
+        Bitter("B", r=[100.0, 150.0], z=[-110.0, 110.0], odd=False, modelaxi=None).sample_cut()
+    with pytest.raises(ValueError, match="edge"):
+        bitter.sample_cut(edge=2)
+    with pytest.raises(ValueError, match="chunk"):
+        next(bitter.iter_cut(chunk=0))
@@ -0,0 +1,160 @@
+"""
+Tests for the hot reload of loaded trees (python_magnetgeo.watch).
+"""
+
+import os
+import threading
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Insert import Insert
+from python_magnetgeo.MSite import MSite
+from python_magnetgeo.utils import ObjectLoadError
+from python_magnetgeo.validation import ValidationError
+
+
+def edit(path, old, new):
+    """Replace text in a file, making sure its signature changes."""
+    mtime = os.stat(path).st_mtime_ns
+    path.write_text(path.read_text().replace(old, new))
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+@pytest.fixture
+def watched(tree):
+    insert = pmg.load(str(tree / "insert.yaml"))
+    events = []
+    watcher = pmg.GeometryWatcher(insert, events.append, backend="polling")
+    yield insert, watcher, events
+    watcher.stop()
+
+
+def test_files(tree, watched, tree_files):
+    insert, watcher, events = watched
+    assert watcher.files == {str(tree / f"{name}.yaml") for name in tree_files if name != "site"}
+    assert watcher.poll() == []
+
+
+def test_only_changed_file_is_rebuilt(tree, watched):
+    insert, watcher, events = watched
+    h0, h1, ring = insert.helices[0], insert.helices[1], insert.rings[0]
+    axi1 = h1.modelaxi
+
+    edit(tree / "H1.yaml", "cutwidth: 0.2", "cutwidth: 0.3")
+    assert watcher.poll() == events
+    assert [(e.path, e.old, e.error) for e in events] == [(str(tree / "H1.yaml"), h1, None)]
+    assert insert.helices[1] is events[0].new
+    assert insert.helices[1].cutwidth == 0.3
+    # unchanged objects are reused, not reloaded
+    assert insert.helices[0] is h0 and insert.rings[0] is ring
+    assert insert.helices[1].modelaxi is axi1
+
+    # the new helix is watched in place of the previous one
+    edit(tree / "axi1.yaml", "h: 25.0", "h: 25.00")
+    events.clear()
+    watcher.poll()
+    assert events[0].old is axi1
+    assert insert.helices[1].modelaxi is events[0].new
+
+
+def test_invalid_change_keeps_tree(tree, watched):
+    insert, watcher, events = watched
+    h1, bounds = insert.helices[1], (list(insert.r), list(insert.z))
+
+    # ring R no longer matches H1
+    edit(tree / "H1.yaml", "r: [30.0, 40.0]", "r: [31.0, 40.0]")
+    (event,) = watcher.poll()
+    assert isinstance(event.error, ValidationError)
+    assert "does not match" in str(event.error)
+    assert insert.helices[1] is h1
+    assert (insert.r, insert.z) == bounds
+
+    edit(tree / "H1.yaml", "r: [31.0, 40.0]", "r: [30.0, 40.0]")
+    edit(tree / "H1.yaml", "z: [-50.0, 50.0]", "z: [-60.0, 60.0]")
+    (event,) = watcher.poll()
+    assert event.error is None
+    assert insert.z == [bounds[1][0] - 10.0, bounds[1][1] + 10.0]
+
+    edit(tree / "H1.yaml", "r:", "r: [")
+    (event,) = watcher.poll()
+    assert isinstance(event.error, ObjectLoadError)
+    assert insert.helices[1] is not h1 and insert.helices[1].z == [-60.0, 60.0]
+
+
+def test_root_and_nested_change_together(tree, watched):
+    insert, watcher, events = watched
+    h1 = insert.helices[1]
+
+    edit(tree / "insert.yaml", "innerbore: 9.5", "innerbore: 9.25")
+    edit(tree / "H0.yaml", "cutwidth: 0.2", "cutwidth: 0.3")
+    watcher.poll()
+    # H0 is rebuilt with the insert referencing it
+    assert [e.path for e in events] == [str(tree / "insert.yaml")]
+    root = watcher.root
+    assert isinstance(root, Insert) and root is not insert
+    assert root.innerbore == 9.25
+    assert root.helices[0].cutwidth == 0.3
+    assert root.helices[1] is h1
+
+    edit(tree / "H1.yaml", "cutwidth: 0.2", "cutwidth: 0.3")
+    watcher.poll()
+    assert root.helices[1] is events[-1].new
+
+
+def test_assemblies_above_are_revalidated(tree, monkeypatch):
+    calls = []
+    monkeypatch.setattr(Insert, "revalidate", lambda self, *keys: calls.append(("I", keys)))
+    monkeypatch.setattr(MSite, "revalidate", lambda self, *keys: calls.append(("M", keys)))
+    site = pmg.load(str(tree / "site.yaml"))
+
+    watcher = pmg.GeometryWatcher(site, backend="polling")
+    edit(tree / "axi1.yaml", "h: 25.0", "h: 25.00")
+    (event,) = watcher.poll()
+    assert event.error is None
+    assert calls == [("I", (("helices", 1),)), ("M", (("magnets", 0),))]
+
+
+def test_watcher_thread(tree, watched):
+    insert, watcher, events = watched
+    reloaded = threading.Event()
+    watcher.add_callback(lambda event: event.new.z == [0.0, 25.0] and reloaded.set())
+    watcher.interval = 0.01
+
+    with watcher:
+        edit(tree / "R.yaml", "z: [0.0, 20.0]", "z: [0.0, 25.0]")
+        assert reloaded.wait(10)
+    assert insert.rings[0].z == [0.0, 25.0]
+
+
+def test_watcher_thread_survives_poll_errors(watched, monkeypatch, caplog):
+    insert, watcher, events = watched
+    polled = threading.Event()
+    calls = []
+
+    def poll(timeout=0.0):
+        calls.append(timeout)
+        if len(calls) == 1:
+            raise OSError("unreadable")
+        polled.set()
+        return []
+
+    monkeypatch.setattr(watcher, "poll", poll)
+    watcher.interval = 0.01
+    with watcher:
+        assert polled.wait(10)
+    assert "Polling watched files failed" in caplog.text
+
+
+def test_stopped_watcher_cannot_restart(watched):
+    insert, watcher, events = watched
+    watcher.start()
+    watcher.stop()
+    with pytest.raises(RuntimeError, match="cannot be started again"):
+        watcher.start()
+
+
+def test_unknown_backend(watched):
+    insert, watcher, events = watched
+    with pytest.raises(ValueError, match="Unknown watch backend"):
+        pmg.GeometryWatcher(insert, backend="fsevents")
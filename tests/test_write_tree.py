@@ -0,0 +1,116 @@
+"""
+Tests for writing geometry trees as one file per object (python_magnetgeo.layout).
+"""
+
+import copy
+import os
+
+import pytest
+
+import python_magnetgeo as pmg
+from python_magnetgeo.Helix import Helix
+from python_magnetgeo.ModelAxi import ModelAxi
+from python_magnetgeo.Ring import Ring
+
+
+@pytest.fixture
+def site(tree):
+    return pmg.load(str(tree / "site.yaml"))
+
+
+def test_round_trip(site, tmp_path):
+    out = tmp_path / "out"
+    report = site.write_tree(str(out))
+
+    assert report.root == str(out / "M.yaml")
+    assert sorted(os.listdir(out)) == [
+        f"{name}.yaml" for name in ("H0", "H1", "I", "M", "R", "axi0", "axi1", "lead")
+    ]
+    assert report.written == report.files and report.unchanged == []
+    assert "- I\n" in (out / "M.yaml").read_text()
+    assert "modelaxi: axi0\n" in (out / "H0.yaml").read_text()
+
+    assert pmg.load(report.root).to_yaml() == site.to_yaml()
+
+
+def test_policy_selects_split_classes(site, tmp_path):
+    out = tmp_path / "out"
+    report = pmg.write_tree(site, str(out), policy=["Insert", Helix])
+
+    assert [os.path.basename(path) for path in report.files] == [
+        "H0.yaml",
+        "H1.yaml",
+        "I.yaml",
+        "M.yaml",
+    ]
+    insert = (out / "I.yaml").read_text()
+    assert "- H0\n" in insert and "!<Ring>" in insert and "!<InnerCurrentLead>" in insert
+    assert "!<ModelAxi>" in (out / "H0.yaml").read_text()
+    assert pmg.load(report.root).to_yaml() == site.to_yaml()
+
+    # a predicate works as well
+    report = site.write_tree(str(tmp_path / "rings"), policy=lambda obj: isinstance(obj, Ring))
+    assert [os.path.basename(path) for path in report.files] == ["M.yaml", "R.yaml"]
+
+
+def test_unchanged_files_are_not_rewritten(site, tmp_path):
+    out = tmp_path / "out"
+    site.write_tree(str(out))
+    for path in out.iterdir():
+        os.utime(path, ns=(0, 0))
+
+    report = site.write_tree(str(out))
+    assert report.written == []
+    assert all(os.stat(path).st_mtime_ns == 0 for path in report.unchanged)
+
+    site.magnets[0].helices[1].cutwidth = 0.3
+    report = site.write_tree(str(out))
+    assert report.written == [str(out / "H1.yaml")]
+    assert "cutwidth: 0.3" in (out / "H1.yaml").read_text()
+
+    # in-place edits of data lists are detected
+    ring = site.magnets[0].rings[0]
+    ring.r[0] = 11.0
+    assert site.write_tree(str(out)).written == [str(out / "R.yaml")]
+    assert site.write_tree(str(out)).written == []
+    assert not [name for name in os.listdir(out) if name.endswith(".tmp")]
+
+
+def test_same_name_objects(site, tmp_path):
+    insert = site.magnets[0]
+    # identical objects share a file
+    insert.helices[1].modelaxi = copy.deepcopy(insert.helices[0].modelaxi)
+    report = site.write_tree(str(tmp_path / "same"), policy=[Helix, ModelAxi])
+    names = [os.path.basename(path) for path in report.files]
+    assert names == ["H0.yaml", "H1.yaml", "M.yaml", "axi0.yaml"]
+
+    # different ones get a suffix
+    axi = insert.helices[0].modelaxi
+    insert.helices[1].modelaxi = ModelAxi("axi0", axi.h, [1.0], [2.0 * axi.h])
+    out = tmp_path / "out"
+    report = site.write_tree(str(out), policy=[Helix, ModelAxi])
+    names = [os.path.basename(path) for path in report.files]
+    assert names == ["H0.yaml", "H1.yaml", "M.yaml", "axi0.yaml", "axi0_2.yaml"]
+    assert "modelaxi: axi0\n" in (out / "H0.yaml").read_text()
+    assert "modelaxi: axi0_2\n" in (out / "H1.yaml").read_text()
+
+    loaded = pmg.load(report.root).magnets[0]
+    assert loaded.helices[1].modelaxi.turns == [1.0]
+    assert loaded.helices[0].modelaxi.turns == axi.turns
+
+
+def test_file_modes(site, tmp_path):
+    out = tmp_path / "out"
+    umask = os.umask(0o022)
+    try:
+        site.write_tree(str(out))
+        assert {os.stat(path).st_mode & 0o777 for path in out.iterdir()} == {0o644}
+
+        # rewritten files keep their mode
+        helix = out / "H1.yaml"
+        os.chmod(helix, 0o640)
+        site.magnets[0].helices[1].cutwidth = 0.3
+        assert site.write_tree(str(out)).written == [str(helix)]
+        assert os.stat(helix).st_mode & 0o777 == 0o640
+    finally:
+        os.umask(umask)